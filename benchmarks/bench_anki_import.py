@@ -0,0 +1,75 @@
+"""Імпорт колоди Anki на 50 000 нотаток: час, пікове використання памʼяті та час утримання блокування запису БД.
+
+Запуск з головної директорії проєкту:
+    python -m benchmarks.bench_anki_import
+"""
+import logging
+import resource
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import event
+
+from benchmarks.bench_utils import create_bench_user, format_time, temp_database
+from lingoro_bot.db.database import Session
+from lingoro_bot.handlers.import_vocab import _import_anki_package
+from lingoro_bot.tools.anki_utils import write_anki_package
+
+NOTES_COUNT = 50_000
+NOTES_CHUNK_SIZE = 1000
+INVALID_NOTE_STEP = 50  # Кожна N-на нотатка колоди не валідна (порожній переклад)
+
+
+def iter_bench_notes_chunks() -> Iterator[list[tuple[int, list[str]]]]:
+    """Повертає частинами поля нотаток колоди (з HTML-розміткою, як у колодах Anki)"""
+    for chunk_start in range(0, NOTES_COUNT, NOTES_CHUNK_SIZE):
+        yield [(num, [f'<b>word{num}</b> | wɜːd{num}',
+                      '' if num % INVALID_NOTE_STEP == 0 else f'translation{num}<br>переклад{num}',
+                      f'annotation&nbsp;{num}' if num % 3 == 0 else ''])
+               for num in range(chunk_start, min(chunk_start + NOTES_CHUNK_SIZE, NOTES_COUNT))]
+
+
+def main() -> None:
+    logging.disable(logging.WARNING)  # Попередження валідатора для кожної не валідної нотатки
+
+    with tempfile.TemporaryDirectory() as temp_dir, temp_database() as bench_engine:
+        apkg_path = Path(temp_dir, 'deck.apkg')
+        write_anki_package(apkg_path, 'deck', iter_bench_notes_chunks())
+        print(f'Нотаток у колоді: {NOTES_COUNT}, розмір Anki-пакета: {apkg_path.stat().st_size // 1024} КБ')
+
+        with Session() as session:
+            user_db_id: int = create_bench_user(session, 111)
+
+        # Блокування запису утримується від першого INSERT до фіксації транзакції
+        write_started_at: list[float] = []
+        committed_at: list[float] = []
+
+        def on_statement(*args: Any) -> None:
+            if args[2].startswith('INSERT') and len(write_started_at) == len(committed_at):
+                write_started_at.append(time.perf_counter())
+
+        event.listen(bench_engine, 'before_cursor_execute', on_statement)
+        event.listen(bench_engine, 'commit', lambda _: committed_at.append(time.perf_counter()))
+
+        start: float = time.perf_counter()
+        imported_count, skipped_count = _import_anki_package(apkg_path, user_db_id, 'deck')
+        import_time: float = time.perf_counter() - start
+        lock_time: float = committed_at[-1] - write_started_at[-1]
+        print(f'Імпорт: {format_time(import_time)} (додано: {imported_count}, пропущено: {skipped_count}), '
+              f'утримання блокування запису: {format_time(lock_time)}')
+
+        tracemalloc.start()
+        _import_anki_package(apkg_path, user_db_id, 'deck2')
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        max_rss_kb: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(f'Пікове використання памʼяті під час імпорту (tracemalloc): {peak_memory / 1024 / 1024:.1f} МБ, '
+              f'максимальний RSS процесу: {max_rss_kb / 1024:.1f} МБ')
+
+
+if __name__ == '__main__':
+    main()
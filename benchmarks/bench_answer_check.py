@@ -0,0 +1,59 @@
+"""Перевірка відповіді з описками: обмежена відстань Левенштейна проти повної на випадкових рядках.
+
+Запуск з головної директорії проєкту:
+    python -m benchmarks.bench_answer_check
+"""
+import random
+
+from benchmarks.bench_utils import format_time, measure_best
+from lingoro_bot.tools.answer_utils import check_answer, get_answer_keys, get_bounded_edit_distance
+
+CASES_COUNT = 20_000
+TRANSLATIONS_COUNT = 30  # Кількість перекладів словникової пари у перевірці неправильної відповіді
+ALPHABET = 'абвгдеєжзиіїйклмнопрстуфхцчшщьюя'
+
+
+def get_edit_distance(source: str, target: str) -> int:
+    """Повна (без обмеження) відстань Левенштейна між рядками"""
+    previous_row: list[int] = list(range(len(target) + 1))
+    for source_idx, source_char in enumerate(source, start=1):
+        current_row: list[int] = [source_idx]
+        for target_idx, target_char in enumerate(target, start=1):
+            current_row.append(min(previous_row[target_idx] + 1,
+                                   current_row[target_idx - 1] + 1,
+                                   previous_row[target_idx - 1] + (source_char != target_char)))
+        previous_row = current_row
+    return previous_row[-1]
+
+
+def get_random_word(rnd: random.Random) -> str:
+    """Повертає випадкове слово довжиною від 3 до 16 символів"""
+    return ''.join(rnd.choice(ALPHABET) for _ in range(rnd.randint(3, 16)))
+
+
+def main() -> None:
+    rnd = random.Random(0)
+    cases: list[tuple[str, str]] = [(get_random_word(rnd), get_random_word(rnd)) for _ in range(CASES_COUNT)]
+
+    mismatches_count: int = 0
+    for source, target in cases:
+        expected_distance: int = get_edit_distance(source, target)
+        for max_distance in range(3):
+            bounded_distance: int | None = get_bounded_edit_distance(source, target, max_distance)
+            if bounded_distance != (expected_distance if expected_distance <= max_distance else None):
+                mismatches_count += 1
+    print(f'Розбіжностей з повною відстанню: {mismatches_count} з {CASES_COUNT * 3}')
+
+    full_time, _ = measure_best(lambda: [get_edit_distance(source, target) for source, target in cases])
+    bounded_time, _ = measure_best(lambda: [get_bounded_edit_distance(source, target, 2) for source, target in cases])
+    print(f'Повна відстань: {format_time(full_time / CASES_COUNT)} на пару, '
+          f'обмежена (max_distance=2): {format_time(bounded_time / CASES_COUNT)} на пару')
+
+    answer_keys: list[str] = get_answer_keys([get_random_word(rnd) for _ in range(TRANSLATIONS_COUNT)])
+    wrong_answer: str = get_random_word(rnd)
+    check_time, verdict = measure_best(lambda: check_answer(wrong_answer, answer_keys), repeats=1000)
+    print(f'Неправильна відповідь проти {TRANSLATIONS_COUNT} перекладів: {format_time(check_time)} ({verdict})')
+
+
+if __name__ == '__main__':
+    main()
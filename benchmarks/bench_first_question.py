@@ -0,0 +1,117 @@
+"""Час до першого питання тренування та до кожного наступного питання (з урахуванням завантаження словникових пар).
+
+Запуск з головної директорії проєкту:
+    python -m benchmarks.bench_first_question
+"""
+import asyncio
+import random
+import statistics
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage
+from sqlalchemy import event
+from sqlalchemy.orm import Session as SessionType
+
+from benchmarks.bench_utils import create_bench_user, create_bench_vocab, format_time, temp_database
+from lingoro_bot.db.database import Session
+from lingoro_bot.handlers import vocab_trainer
+from lingoro_bot.tools.training_cache import mistake_sampler_cache
+
+WORDPAIRS_COUNT = 50_000
+TURNS_COUNT = 200
+CORRECT_ANSWER_SHARE = 0.7
+TRAINING_MODES: tuple[str, ...] = ('direct_translation', 'focus_mistakes')
+LOAD_STATEMENT_MARKER = 'WHERE wordpairs.id IN'  # Завантаження даних словникових пар тренування
+
+
+class BenchMessage:
+    """Повідомлення, яке запамʼятовує час відправлення відповідей бота (замість Telegram)"""
+
+    def __init__(self, text: str | None = None) -> None:
+        self.text: str | None = text
+        self.from_user = SimpleNamespace(id=111, username='user111', first_name='User', last_name=None)
+        self.answer_texts: list[str | None] = []
+        self.answered_at: list[float] = []
+
+    async def answer(self, text: str | None = None, **_: Any) -> None:
+        await asyncio.sleep(0)
+        self.answer_texts.append(text)
+        self.answered_at.append(time.perf_counter())
+
+    async def delete(self) -> None:
+        await asyncio.sleep(0)
+
+
+class BenchCallback:
+    """Натискання на кнопку з повідомленням BenchMessage"""
+
+    def __init__(self, data: str) -> None:
+        self.data: str = data
+        self.from_user = SimpleNamespace(id=111, username='user111', first_name='User', last_name=None)
+        self.message = BenchMessage()
+
+
+def is_loaded_between(load_times: list[float], start: float, end: float) -> bool:
+    """Перевіряє, чи завантажувалися дані словникових пар з БД у проміжку часу"""
+    return any(start <= load_time < end for load_time in load_times)
+
+
+async def run_training(session: SessionType, user_db_id: int, vocab_id: int, training_mode: str,
+                       load_times: list[float]) -> tuple[float, list[float], int]:
+    """Проходить тренування та повертає час до першого питання, час до кожного наступного питання
+    та кількість питань, перед якими дані словникової пари завантажувалися з БД.
+    """
+    state = FSMContext(MemoryStorage(), StorageKey(bot_id=1, chat_id=111, user_id=111))
+    await state.update_data(vocab_id=vocab_id, vocab_name='vocab', mixed_vocab_ids=None, last_session_mistake_ids=[])
+
+    callback = BenchCallback(training_mode)
+    start: float = time.perf_counter()
+    await getattr(vocab_trainer, f'process_{training_mode}')(callback, state, session, user_db_id)
+    first_question_time: float = callback.message.answered_at[-1] - start
+    loaded_before_count: int = int(is_loaded_between(load_times, start, callback.message.answered_at[-1]))
+
+    rnd = random.Random(0)
+    question_times: list[float] = []
+    for _ in range(TURNS_COUNT):
+        data_fsm: dict[str, Any] = await state.get_data()
+        training_data: dict[str, Any] = vocab_trainer.get_current_training_data(data_fsm)
+        is_correct: bool = rnd.random() < CORRECT_ANSWER_SHARE
+        message = BenchMessage(training_data.get('answer_keys')[0] if is_correct else '-')
+
+        start = time.perf_counter()
+        await vocab_trainer.process_check_user_translation(message, state, session, user_db_id)
+        question_times.append(message.answered_at[-1] - start)
+        loaded_before_count += is_loaded_between(load_times, start, message.answered_at[-1])
+
+    mistake_sampler_cache.pop((user_db_id, (await state.get_data()).get('start_time_training')))
+    return first_question_time, question_times, loaded_before_count
+
+
+def main() -> None:
+    with temp_database() as bench_engine, Session() as session:
+        user_db_id: int = create_bench_user(session, 111)
+        vocab_id: int = create_bench_vocab(session, user_db_id, 'vocab', WORDPAIRS_COUNT)
+
+        load_times: list[float] = []
+
+        def on_statement(*args: Any) -> None:
+            if LOAD_STATEMENT_MARKER in args[2]:
+                load_times.append(time.perf_counter())
+
+        event.listen(bench_engine, 'before_cursor_execute', on_statement)
+        print(f'Словникових пар у словнику: {WORDPAIRS_COUNT}, питань у тренуванні: {TURNS_COUNT + 1}')
+        for training_mode in TRAINING_MODES:
+            first_question_time, question_times, loaded_before_count = asyncio.run(
+                run_training(session, user_db_id, vocab_id, training_mode, load_times))
+            print(f'{training_mode}: перше питання {format_time(first_question_time)}, '
+                  f'наступні — медіана {format_time(statistics.median(question_times))}, '
+                  f'максимум {format_time(max(question_times))}; '
+                  f'завантаження з БД перед питанням: {loaded_before_count}/{TURNS_COUNT + 1}')
+
+
+if __name__ == '__main__':
+    main()
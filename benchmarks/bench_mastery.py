@@ -0,0 +1,112 @@
+"""Огляд засвоєння словників: векторне обчислення (build_mastery_overview) проти циклу Python за словниковими парами.
+
+Запуск з головної директорії проєкту:
+    python -m benchmarks.bench_mastery
+"""
+import math
+import random
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+from benchmarks.bench_utils import create_bench_user, create_bench_vocab, format_time, measure_best, temp_database
+from lingoro_bot.config import MASTERY_ATTEMPTS_SCALE, MASTERY_HALF_LIFE_DAYS, MASTERY_WEAK_THRESHOLD
+from lingoro_bot.custom_types.vocab_types import VocabDataType
+from lingoro_bot.db.crud import VocabCRUD, WordpairStatCRUD
+from lingoro_bot.db.database import Session
+from lingoro_bot.db.models import WordpairStat
+from lingoro_bot.tools.mastery_utils import build_mastery_overview
+
+WORDPAIRS_COUNT = 500_000
+VOCABS_COUNT = 200
+WEAKEST_COUNT = 10
+SQL_WORDPAIRS_COUNT = 100_000  # Кількість словникових пар у перевірці завантаження статистики з БД
+
+
+def build_mastery_overview_loop(mastery_rows: list[tuple[int, int, int, int, float]],
+                                weakest_count: int) -> tuple[dict[int, list[float]], list[int]]:
+    """Обчислює суми рівнів засвоєння словників та найслабші словникові пари циклом Python (для порівняння)"""
+    vocabs_sums: dict[int, list[float]] = {}  # Сума рівнів засвоєння, кількість натренованих та слабких пар
+    scored_wordpairs: list[tuple[float, int]] = []
+
+    for wordpair_id, vocab_id, attempts, failures, days_since_seen in mastery_rows:
+        mastery: float = ((1 - failures / max(attempts, 1))
+                          * (1 - math.exp(-attempts / MASTERY_ATTEMPTS_SCALE))
+                          * 2 ** (-max(days_since_seen, 0) / MASTERY_HALF_LIFE_DAYS))
+        vocab_sums: list[float] = vocabs_sums.setdefault(vocab_id, [0.0, 0, 0])
+        vocab_sums[0] += mastery
+        vocab_sums[1] += 1
+        vocab_sums[2] += mastery < MASTERY_WEAK_THRESHOLD
+        scored_wordpairs.append((mastery, wordpair_id))
+
+    scored_wordpairs.sort()
+    return vocabs_sums, [wordpair_id for _, wordpair_id in scored_wordpairs[:weakest_count]]
+
+
+def get_random_mastery_rows(rnd: random.Random, count: int) -> list[tuple[int, int, int, int, float]]:
+    """Повертає випадкову статистику словникових пар у форматі WordpairStatCRUD.get_user_mastery_rows"""
+    mastery_rows: list[tuple[int, int, int, int, float]] = []
+    for wordpair_id in range(1, count + 1):
+        attempts: int = rnd.randint(1, 30)
+        mastery_rows.append((wordpair_id, rnd.randint(1, VOCABS_COUNT), attempts,
+                             rnd.randint(0, attempts), rnd.random() * 60))
+    return mastery_rows
+
+
+def main() -> None:
+    rnd = random.Random(0)
+    mastery_rows: list[tuple[int, int, int, int, float]] = get_random_mastery_rows(rnd, WORDPAIRS_COUNT)
+    vocabs_data: list[VocabDataType] = [{'id': vocab_id,
+                                         'name': f'vocab{vocab_id}',
+                                         'description': None,
+                                         'number_errors': 0,
+                                         'created_at': datetime.now(),
+                                         'wordpairs_count': WORDPAIRS_COUNT // VOCABS_COUNT,
+                                         'last_trained_at': None,
+                                         'best_accuracy': None}
+                                        for vocab_id in range(1, VOCABS_COUNT + 1)]
+
+    vectorised_time, mastery_overview = measure_best(
+        lambda: build_mastery_overview(mastery_rows, vocabs_data, WEAKEST_COUNT))
+    loop_time, (vocabs_sums, weakest_ids) = measure_best(
+        lambda: build_mastery_overview_loop(mastery_rows, WEAKEST_COUNT))
+
+    # Результати обох способів мають збігатися
+    assert [wordpair['wordpair_id'] for wordpair in mastery_overview['weakest_wordpairs']] == weakest_ids
+    for vocab_mastery in mastery_overview['vocabs']:
+        mastery_sum, trained_count, weak_count = vocabs_sums[vocab_mastery['vocab_id']]
+        assert math.isclose(vocab_mastery['mastery'] * vocab_mastery['wordpairs_count'], mastery_sum)
+        assert (vocab_mastery['trained_count'], vocab_mastery['weak_count']) == (trained_count, weak_count)
+
+    print(f'Словникових пар: {WORDPAIRS_COUNT}, словників: {VOCABS_COUNT} (результати однакові)')
+    print(f'build_mastery_overview: {format_time(vectorised_time)}, цикл Python: {format_time(loop_time)} '
+          f'(x{loop_time / vectorised_time:.1f})')
+
+    # Завантаження статистики з БД (WordpairStatCRUD.get_user_mastery_rows) для порівняння з обчисленням
+    with temp_database(), Session() as session:
+        user_db_id: int = create_bench_user(session, 111)
+        vocab_ids: list[int] = [create_bench_vocab(session, user_db_id, f'vocab{vocab_num}', 1)
+                                for vocab_num in range(VOCABS_COUNT)]
+        now: datetime = datetime.now()
+        session.execute(insert(WordpairStat), [{'user_id': user_db_id,
+                                                'wordpair_id': wordpair_id,
+                                                'direction': 'direct',
+                                                'vocabulary_id': vocab_ids[vocab_id - 1],
+                                                'attempts': attempts,
+                                                'number_errors': failures,
+                                                'error_rate': failures / attempts,
+                                                'last_seen_at': now - timedelta(days=days_since_seen)}
+                                               for wordpair_id, vocab_id, attempts, failures, days_since_seen
+                                               in mastery_rows[:SQL_WORDPAIRS_COUNT]])
+        session.commit()
+
+        stat_crud = WordpairStatCRUD(session)
+        load_time, loaded_rows = measure_best(lambda: stat_crud.get_user_mastery_rows(user_db_id), repeats=3)
+        user_vocabs_data: list[VocabDataType] = VocabCRUD(session).get_all_vocabs_data(user_db_id)
+        overview_time, _ = measure_best(lambda: build_mastery_overview(loaded_rows, user_vocabs_data, WEAKEST_COUNT))
+    print(f'БД, {SQL_WORDPAIRS_COUNT} пар: get_user_mastery_rows {format_time(load_time)}, '
+          f'build_mastery_overview {format_time(overview_time)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""Автодоповнення в inline-режимі: індекс префіксів (PrefixIndex) проти запиту до FTS5 на кожне натискання клавіші.
+
+Запуск з головної директорії проєкту:
+    python -m benchmarks.bench_prefix_index
+"""
+import random
+import time
+
+from benchmarks.bench_utils import create_bench_user, create_bench_vocab, format_time, measure_best, temp_database
+from lingoro_bot.config import INLINE_RESULTS_LIMIT
+from lingoro_bot.custom_types.wordpair_types import WordpairSearchResultType
+from lingoro_bot.db.crud import SearchCRUD
+from lingoro_bot.db.database import Session
+from lingoro_bot.tools.search_utils import PrefixIndex, build_search_match_query
+
+VOCABS_COUNT = 10
+WORDPAIRS_PER_VOCAB = 10_000
+TYPED_ITEMS_COUNT = 1000  # Кількість слів та перекладів, які "вводяться" по одному символу
+
+
+def get_percentile(sorted_times: list[float], percentile: float) -> float:
+    """Повертає перцентиль відсортованих значень"""
+    return sorted_times[min(len(sorted_times) - 1, int(len(sorted_times) * percentile))]
+
+
+def main() -> None:
+    with temp_database(), Session() as session:
+        user_db_id: int = create_bench_user(session, 111)
+        for vocab_num in range(VOCABS_COUNT):
+            create_bench_vocab(session, user_db_id, f'vocab{vocab_num}', WORDPAIRS_PER_VOCAB)
+
+        search_crud = SearchCRUD(session)
+
+        def build_prefix_index() -> PrefixIndex:
+            return PrefixIndex(search_crud.get_user_wordpairs(user_db_id))
+
+        build_time, prefix_index = measure_best(build_prefix_index, repeats=1)
+        print(f'Словникових пар: {VOCABS_COUNT * WORDPAIRS_PER_VOCAB}, ключів індексу: {len(prefix_index)}, '
+              f'побудова: {format_time(build_time)}')
+
+        # Префікси, які надходять під час введення випадкових слів та перекладів користувача
+        rnd = random.Random(0)
+        typed_items: list[str] = [rnd.choice((*entry['words'].split(', '), *entry['translations'].split(', ')))
+                                  for entry in rnd.sample(prefix_index.entries, TYPED_ITEMS_COUNT)]
+        prefixes: list[str] = [item[:length] for item in typed_items for length in range(1, len(item) + 1)]
+
+        for search_name, search in (('PrefixIndex', lambda prefix: prefix_index.search(prefix, INLINE_RESULTS_LIMIT)),
+                                    ('FTS5', lambda prefix: search_crud.search_wordpairs(
+                                        user_db_id, build_search_match_query(prefix), cursor_id=0,
+                                        is_backward=False, limit=INLINE_RESULTS_LIMIT))):
+            query_times: list[float] = []
+            for prefix in prefixes:
+                start: float = time.perf_counter()
+                search_results: list[WordpairSearchResultType] = search(prefix)
+                query_times.append(time.perf_counter() - start)
+                assert search_results, prefix
+
+            query_times.sort()
+            average_time: float = sum(query_times) / len(prefixes)
+            print(f'{search_name}: {len(prefixes)} префіксів, в середньому {format_time(average_time)}, '
+                  f'p99 {format_time(get_percentile(query_times, 0.99))}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""Завантаження тренування "Повторення": пари, час повторення яких настав, проти завантаження всього словника.
+
+Запуск з головної директорії проєкту:
+    python -m benchmarks.bench_review_due
+"""
+import random
+from datetime import datetime, timedelta
+
+from benchmarks.bench_utils import create_bench_user, create_bench_vocab, format_time, measure_best, temp_database
+from lingoro_bot.config import REVIEW_DUE_SESSION_SIZE
+from lingoro_bot.db.crud import ReviewCRUD, WordpairCRUD
+from lingoro_bot.db.database import Session
+
+WORDPAIRS_COUNT = 5000
+REVIEWED_COUNT = 4000  # Кількість словникових пар, які вже мають стан повторення
+REVIEW_DAYS = 60  # Кількість днів, за які розподілені відповіді
+
+
+def main() -> None:
+    with temp_database(), Session() as session:
+        user_db_id: int = create_bench_user(session, 111)
+        vocab_id: int = create_bench_vocab(session, user_db_id, 'review', WORDPAIRS_COUNT)
+
+        wordpair_crud = WordpairCRUD(session)
+        review_crud = ReviewCRUD(session)
+        wordpair_ids: list[int] = wordpair_crud.get_wordpair_ids(vocab_id)
+
+        # Відповіді розподілені за днями, тому частина пар вже потребує повторення, а частина — ще ні
+        rnd = random.Random(0)
+        now: datetime = datetime.now()
+        reviewed_ids: list[int] = rnd.sample(wordpair_ids, REVIEWED_COUNT)
+        for day in range(REVIEW_DAYS):
+            day_ids: list[int] = reviewed_ids[day::REVIEW_DAYS]
+            review_crud.update_wordpair_reviews(user_db_id=user_db_id,
+                                                qualities={wordpair_id: rnd.randint(2, 5) for wordpair_id in day_ids},
+                                                reviewed_at=now - timedelta(days=REVIEW_DAYS - day))
+
+        def load_due_wordpairs() -> int:
+            due_ids: list[int] = review_crud.get_due_wordpair_ids(user_db_id, vocab_id, now, REVIEW_DUE_SESSION_SIZE)
+            return len(wordpair_crud.get_wordpairs_by_ids(due_ids))
+
+        due_time, due_count = measure_best(load_due_wordpairs)
+        full_time, full_count = measure_best(lambda: len(wordpair_crud.get_wordpairs(vocab_id)), repeats=1)
+
+    print(f'Словник: {WORDPAIRS_COUNT} пар, зі станом повторення: {REVIEWED_COUNT}')
+    print(f'Пари для повторення (get_due_wordpair_ids + get_wordpairs_by_ids): '
+          f'{format_time(due_time)} ({due_count} пар)')
+    print(f'Весь словник (get_wordpairs): {format_time(full_time)} ({full_count} пар)')
+
+
+if __name__ == '__main__':
+    main()
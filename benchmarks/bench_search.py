@@ -0,0 +1,65 @@
+"""Повнотекстовий пошук словникових пар (FTS5) проти пошуку через LIKE '%...%' по таблицях слів та перекладів.
+
+Запуск з головної директорії проєкту:
+    python -m benchmarks.bench_search
+"""
+import time
+
+from sqlalchemy import text
+
+from benchmarks.bench_utils import create_bench_user, create_bench_vocab, format_time, measure_best, temp_database
+from lingoro_bot.config import SEARCH_PAGE_SIZE
+from lingoro_bot.db.crud import SearchCRUD
+from lingoro_bot.db.database import Session, create_search_index
+from lingoro_bot.tools.search_utils import build_search_match_query
+
+USERS_COUNT = 20
+VOCABS_PER_USER = 5
+WORDPAIRS_PER_VOCAB = 2000
+QUERIES = ('word123', 'translation77', 'annotation 9')
+
+# Перша сторінка результатів пошуку без повнотекстового індексу
+LIKE_SEARCH_SQL = (
+    'SELECT DISTINCT wp.id FROM vocabularies AS v '
+    'JOIN wordpairs AS wp ON wp.vocabulary_id = v.id '
+    'LEFT JOIN wordpair_words AS ww ON ww.wordpair_id = wp.id LEFT JOIN words AS w ON w.id = ww.word_id '
+    'LEFT JOIN wordpair_translations AS wt ON wt.wordpair_id = wp.id '
+    'LEFT JOIN translations AS t ON t.id = wt.translation_id '
+    'WHERE v.user_id = :user_db_id AND NOT v.is_deleted '
+    'AND (w.word LIKE :pattern OR t.translation LIKE :pattern OR wp.annotation LIKE :pattern) '
+    'ORDER BY wp.id LIMIT :limit')
+
+
+def main() -> None:
+    with temp_database() as bench_engine, Session() as session:
+        user_db_ids: list[int] = []
+        for user_num in range(USERS_COUNT):
+            user_db_id: int = create_bench_user(session, 1000 + user_num)
+            user_db_ids.append(user_db_id)
+            for vocab_num in range(VOCABS_PER_USER):
+                create_bench_vocab(session, user_db_id, f'vocab{vocab_num}', WORDPAIRS_PER_VOCAB)
+
+        # Одноразова побудова індексу для наявних словникових пар (як під час першого запуску бота)
+        with bench_engine.begin() as connection:
+            connection.execute(text('DROP TABLE wordpair_search'))
+        start: float = time.perf_counter()
+        create_search_index()
+        build_time: float = time.perf_counter() - start
+
+        search_crud = SearchCRUD(session)
+        user_db_id = user_db_ids[USERS_COUNT // 2]
+        print(f'Словникових пар: {USERS_COUNT * VOCABS_PER_USER * WORDPAIRS_PER_VOCAB}, '
+              f'побудова індексу: {format_time(build_time)}')
+
+        for query in QUERIES:
+            match_query: str = build_search_match_query(query)
+            fts_time, fts_results = measure_best(lambda match_query=match_query: search_crud.search_wordpairs(
+                user_db_id, match_query, cursor_id=0, is_backward=False, limit=SEARCH_PAGE_SIZE))
+            like_time, like_rows = measure_best(lambda query=query: session.execute(text(LIKE_SEARCH_SQL), {
+                'user_db_id': user_db_id, 'pattern': f'%{query}%', 'limit': SEARCH_PAGE_SIZE}).all())
+            print(f'"{query}": FTS5 {format_time(fts_time)} ({len(fts_results)} пар), '
+                  f'LIKE {format_time(like_time)} ({len(like_rows)} пар)')
+
+
+if __name__ == '__main__':
+    main()
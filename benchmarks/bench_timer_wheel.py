@@ -0,0 +1,113 @@
+"""Порівняння колеса таймерів (TimerWheel) з loop.call_later на 50 тис. активних таймерів.
+
+Запуск з головної директорії проєкту:
+    python -m benchmarks.bench_timer_wheel
+"""
+import asyncio
+import random
+import time
+
+from lingoro_bot.tools.timer_wheel import TimerHandle, TimerWheel
+
+TIMERS_COUNT = 50_000
+REPEATS = 5  # Кількість повторів (виводиться найкращий час)
+RUN_DURATION = 3.0  # Максимальна затримка таймерів під час реальної роботи колеса (у секундах)
+
+
+async def noop(*_: object) -> None:
+    """Виклик таймера, який нічого не робить"""
+
+
+def get_delays(count: int) -> list[float]:
+    """Повертає випадкові затримки таймерів від 1 до 60 секунд"""
+    rnd = random.Random(0)
+    return [rnd.uniform(1, 60) for _ in range(count)]
+
+
+def bench_wheel(delays: list[float]) -> tuple[float, float, float]:
+    """Повертає час додавання та скасування таймерів колеса, а також проходу колеса через 600 тактів"""
+    best: list[float] = [float('inf')] * 3
+    for _ in range(REPEATS):
+        wheel = TimerWheel(resolution=0.1, slot_bits=6, levels=4)
+
+        start: float = time.perf_counter()
+        timer_handles: list[TimerHandle] = [wheel.schedule(delay, noop) for delay in delays]
+        schedule_time: float = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for timer_handle in timer_handles[::2]:
+            timer_handle.cancel()
+        cancel_time: float = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(600):
+            wheel.advance()
+        advance_time: float = time.perf_counter() - start
+
+        best = [min(best[0], schedule_time), min(best[1], cancel_time), min(best[2], advance_time)]
+    return best[0], best[1], best[2]
+
+
+async def bench_call_later(delays: list[float]) -> tuple[float, float]:
+    """Повертає час додавання та скасування таймерів через loop.call_later"""
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    best: list[float] = [float('inf')] * 2
+    for _ in range(REPEATS):
+        start: float = time.perf_counter()
+        timer_handles: list[asyncio.TimerHandle] = [loop.call_later(delay, lambda: None) for delay in delays]
+        schedule_time: float = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for timer_handle in timer_handles[::2]:
+            timer_handle.cancel()
+        cancel_time: float = time.perf_counter() - start
+
+        for timer_handle in timer_handles:
+            timer_handle.cancel()
+        await asyncio.sleep(0)
+        best = [min(best[0], schedule_time), min(best[1], cancel_time)]
+    return best[0], best[1]
+
+
+async def bench_wheel_run() -> list[float]:
+    """Повертає відсортовані запізнення (у секундах) спрацювання таймерів під час реальної роботи колеса"""
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    wheel = TimerWheel(resolution=0.1, slot_bits=6, levels=4)
+    lags: list[float] = []
+
+    async def on_timer(due_time: float) -> None:
+        await asyncio.sleep(0)
+        lags.append(loop.time() - due_time)
+
+    wheel_task: asyncio.Task = asyncio.create_task(wheel.run())
+    await asyncio.sleep(0)
+
+    rnd = random.Random(1)
+    for _ in range(TIMERS_COUNT):
+        delay: float = rnd.uniform(0.1, RUN_DURATION)
+        wheel.schedule(delay, on_timer, loop.time() + delay)
+
+    await asyncio.sleep(RUN_DURATION + 0.3)
+    wheel_task.cancel()
+    return sorted(lags)
+
+
+async def main() -> None:
+    delays: list[float] = get_delays(TIMERS_COUNT)
+    per_timer_us: float = 1e6 / TIMERS_COUNT
+
+    schedule_time, cancel_time, advance_time = bench_wheel(delays)
+    print(f'TimerWheel: додавання {schedule_time * 1e3:.1f} мс ({schedule_time * per_timer_us:.2f} мкс/таймер), '
+          f'скасування половини {cancel_time * 1e3:.1f} мс, 600 тактів {advance_time * 1e3:.1f} мс')
+
+    schedule_time, cancel_time = await bench_call_later(delays)
+    print(f'call_later: додавання {schedule_time * 1e3:.1f} мс ({schedule_time * per_timer_us:.2f} мкс/таймер), '
+          f'скасування половини {cancel_time * 1e3:.1f} мс')
+
+    lags: list[float] = await bench_wheel_run()
+    print(f'TimerWheel.run: спрацювало {len(lags)}/{TIMERS_COUNT}, запізнення p50 {lags[len(lags) // 2] * 1e3:.0f} мс, '
+          f'p99 {lags[int(len(lags) * 0.99)] * 1e3:.0f} мс, макс. {lags[-1] * 1e3:.0f} мс')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+"""Сторінка статистики тренувань: денні підсумки (user_daily_stats, vocab_daily_stats) проти агрегації всіх сесій.
+
+Запуск з головної директорії проєкту:
+    python -m benchmarks.bench_training_stats
+"""
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session as SessionType
+
+from benchmarks.bench_utils import create_bench_user, create_bench_vocab, format_time, measure_best, temp_database
+from lingoro_bot.config import STATS_VOCABS_LIMIT
+from lingoro_bot.db.database import Session, backfill_training_stats
+from lingoro_bot.db.models import TrainingSession
+from lingoro_bot.handlers.stats import get_stats_page
+from lingoro_bot.tools.stats_utils import get_period_bounds
+
+SESSIONS_COUNT = 20_000
+HISTORY_DAYS = 515
+VOCABS_COUNT = 20
+
+# Запити сторінки статистики безпосередньо до сесій тренувань (без денних підсумків)
+SESSIONS_TOTALS_SQL = (
+    'SELECT count(*), coalesce(sum(number_correct_answers), 0), coalesce(sum(number_wrong_answers), 0), '
+    "coalesce(sum(strftime('%s', end_time) - strftime('%s', start_time)), 0) FROM training_sessions "
+    'WHERE user_id = :user_db_id AND end_time IS NOT NULL AND date(end_time) BETWEEN :start_day AND :end_day')
+SESSIONS_VOCABS_SQL = (
+    'SELECT vocabulary_id, sum(date(end_time) >= :start_day) AS sessions_count, '
+    'sum(CASE WHEN date(end_time) >= :start_day THEN number_correct_answers ELSE 0 END), '
+    'sum(CASE WHEN date(end_time) >= :start_day THEN number_wrong_answers ELSE 0 END), '
+    'sum(CASE WHEN date(end_time) < :start_day THEN number_correct_answers ELSE 0 END), '
+    'sum(CASE WHEN date(end_time) < :start_day THEN number_wrong_answers ELSE 0 END) FROM training_sessions '
+    'WHERE user_id = :user_db_id AND date(end_time) BETWEEN :prev_start_day AND :end_day '
+    'GROUP BY vocabulary_id HAVING sessions_count > 0 ORDER BY sessions_count DESC LIMIT :limit')
+SESSIONS_DAYS_SQL = ('SELECT DISTINCT date(end_time) FROM training_sessions '
+                     'WHERE user_id = :user_db_id AND end_time IS NOT NULL ORDER BY 1')
+
+
+def get_sessions_page_data(session: SessionType, user_db_id: int, period: str) -> int:
+    """Виконує запити сторінки статистики за період до сесій тренувань та повертає кількість прочитаних рядків"""
+    today: date = date.today()
+    start_day, prev_start_day = get_period_bounds(period, today)
+    params: dict[str, object] = {'user_db_id': user_db_id,
+                                 'start_day': start_day.isoformat(),
+                                 'prev_start_day': prev_start_day.isoformat(),
+                                 'end_day': today.isoformat(),
+                                 'limit': STATS_VOCABS_LIMIT}
+
+    rows_count: int = len(session.execute(text(SESSIONS_TOTALS_SQL), params).all())
+    rows_count += len(session.execute(text(SESSIONS_TOTALS_SQL), {
+        **params,
+        'start_day': prev_start_day.isoformat(),
+        'end_day': (start_day - timedelta(days=1)).isoformat()}).all())
+    rows_count += len(session.execute(text(SESSIONS_VOCABS_SQL), params).all())
+    rows_count += len(session.execute(text(SESSIONS_DAYS_SQL), params).all())
+    return rows_count
+
+
+def main() -> None:
+    with temp_database() as bench_engine, Session() as session:
+        user_db_id: int = create_bench_user(session, 111)
+        vocab_ids: list[int] = [create_bench_vocab(session, user_db_id, f'vocab{vocab_num}', 1)
+                                for vocab_num in range(VOCABS_COUNT)]
+
+        # Історія сесій тренувань додається напряму, а денні підсумки будуються з неї (як під час міграції)
+        rnd = random.Random(0)
+        now: datetime = datetime.now()
+        training_sessions: list[dict[str, object]] = []
+        for _ in range(SESSIONS_COUNT):
+            end_time: datetime = now - timedelta(days=rnd.randrange(HISTORY_DAYS), seconds=rnd.randrange(80_000))
+            training_sessions.append({'training_mode': 'direct_translation',
+                                      'start_time': end_time - timedelta(seconds=rnd.randint(30, 900)),
+                                      'end_time': end_time,
+                                      'number_correct_answers': rnd.randint(0, 30),
+                                      'number_wrong_answers': rnd.randint(0, 10),
+                                      'is_completed': True,
+                                      'user_id': user_db_id,
+                                      'vocabulary_id': rnd.choice(vocab_ids)})
+        session.execute(insert(TrainingSession), training_sessions)
+        session.commit()
+
+        start: float = time.perf_counter()
+        with bench_engine.begin() as connection:
+            backfill_training_stats(connection)
+        backfill_time: float = time.perf_counter() - start
+        print(f'Сесій тренувань: {SESSIONS_COUNT} за {HISTORY_DAYS} днів, '
+              f'побудова денних підсумків: {format_time(backfill_time)}')
+
+        for period in ('day', 'week', 'month'):
+            rollup_time, _ = measure_best(lambda period=period: get_stats_page(session, user_db_id, period))
+            sessions_time, _ = measure_best(lambda period=period: get_sessions_page_data(session, user_db_id, period))
+            print(f'{period}: сторінка з денних підсумків {format_time(rollup_time)}, '
+                  f'запити до сесій тренувань {format_time(sessions_time)}')
+
+
+if __name__ == '__main__':
+    main()
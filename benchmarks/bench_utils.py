@@ -0,0 +1,83 @@
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import Session
+
+from lingoro_bot.custom_types.wordpair_types import WordpairComponentsType
+from lingoro_bot.db import (
+    database,
+    models,  # noqa: F401 (моделі потрібні для створення таблиць)
+)
+from lingoro_bot.db.crud import UserCRUD, VocabCRUD
+
+BENCH_CHUNK_SIZE = 5000  # Кількість словникових пар, які додаються до БД за один раз
+
+
+@contextmanager
+def temp_database() -> Iterator[Engine]:
+    """Створює тимчасову БД з усіма таблицями та індексами і використовує її замість database.db"""
+    original_engine: Engine = database.engine
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        bench_engine: Engine = create_engine(f'sqlite:///{Path(temp_dir, "bench.db")}')
+        database.engine = bench_engine
+        database.Session.configure(bind=bench_engine)
+        try:
+            database.create_database_tables()
+            yield bench_engine
+        finally:
+            database.engine = original_engine
+            database.Session.configure(bind=original_engine)
+            bench_engine.dispose()
+
+
+def create_bench_user(session: Session, user_id: int) -> int:
+    """Реєструє користувача з telegram ID "user_id" та повертає його ID в БД"""
+    user_crud = UserCRUD(session)
+    user_crud.register_user(user_id, {'username': f'user{user_id}', 'first_name': 'User', 'last_name': None})
+    return user_crud.get_user_db_id(user_id)
+
+
+def make_wordpair(num: int, translations_count: int = 1) -> WordpairComponentsType:
+    """Повертає словникову пару "word<num>" з перекладами "translation<num>_<i>" (з транскрипцією першого слова)"""
+    return {'words': [{'word': f'word{num}', 'transcription': f'wɜːd{num}'}],
+            'translations': [{'translation': f'translation{num}_{idx}', 'transcription': None}
+                             for idx in range(translations_count)],
+            'annotation': f'annotation {num}' if num % 3 == 0 else None}
+
+
+def create_bench_vocab(session: Session, user_db_id: int, vocab_name: str, wordpairs_count: int) -> int:
+    """Створює словник з "wordpairs_count" словникових пар (див. make_wordpair) та повертає його ID"""
+    def iter_wordpair_chunks() -> Iterator[list[WordpairComponentsType]]:
+        for chunk_start in range(0, wordpairs_count, BENCH_CHUNK_SIZE):
+            chunk_end: int = min(chunk_start + BENCH_CHUNK_SIZE, wordpairs_count)
+            yield [make_wordpair(num) for num in range(chunk_start, chunk_end)]
+
+    VocabCRUD(session).create_new_vocab_from_chunks(user_db_id, vocab_name, None, iter_wordpair_chunks())
+    return session.query(models.Vocabulary.id).filter(models.Vocabulary.user_id == user_db_id,
+                                                      models.Vocabulary.name == vocab_name).scalar()
+
+
+def measure_best(func: Callable[[], Any], repeats: int = 5) -> tuple[float, Any]:
+    """Викликає функцію "repeats" разів та повертає найкращий час виклику (у секундах) і останній результат"""
+    best_time: float = float('inf')
+    result: Any = None
+    for _ in range(repeats):
+        start: float = time.perf_counter()
+        result = func()
+        best_time = min(best_time, time.perf_counter() - start)
+    return best_time, result
+
+
+def format_time(seconds: float) -> str:
+    """Форматує час у мкс, мс або с (залежно від величини)"""
+    if seconds < 1e-3:
+        return f'{seconds * 1e6:.1f} мкс'
+    if seconds < 1:
+        return f'{seconds * 1e3:.1f} мс'
+    return f'{seconds:.2f} с'
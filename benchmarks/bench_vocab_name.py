@@ -0,0 +1,74 @@
+"""Перевірка унікальності назви словника: пошук за індексом "uq_vocabularies_user_id_normalized_name" проти ILIKE.
+
+Запуск з головної директорії проєкту:
+    python -m benchmarks.bench_vocab_name
+"""
+from datetime import datetime
+
+from sqlalchemy import insert, text
+
+from benchmarks.bench_utils import create_bench_user, create_bench_vocab, format_time, measure_best, temp_database
+from lingoro_bot.db.database import Session
+from lingoro_bot.db.models import Vocabulary
+from lingoro_bot.exceptions import VocabNameNotUniqueError
+from lingoro_bot.validators.vocab.vocab_name_validator import VocabNameValidator
+
+USERS_COUNT = 5
+VOCABS_PER_USER = 10_000
+CHECKED_NAME = 'New Vocab'  # Вільна назва: перевірка переглядає всі словники користувача, якщо немає індексу
+
+# Перевірка унікальності до появи індексу (повний перегляд словників користувача)
+ILIKE_CHECK_SQL = 'SELECT id FROM vocabularies WHERE name LIKE :name AND user_id = :user_db_id LIMIT 1'
+INDEX_CHECK_SQL = ('SELECT id FROM vocabularies '
+                   'WHERE user_id = :user_db_id AND normalized_name = :normalized_name AND is_deleted = 0 LIMIT 1')
+
+
+def main() -> None:
+    with temp_database(), Session() as session:
+        user_db_ids: list[int] = [create_bench_user(session, 1000 + user_num) for user_num in range(USERS_COUNT)]
+
+        # Словники без словникових пар достатньо для перевірки назв, тому додаються одним INSERT
+        session.execute(insert(Vocabulary), [{'name': f'vocab {vocab_num}',
+                                              'normalized_name': f'vocab {vocab_num}',
+                                              'user_id': user_db_id,
+                                              'is_deleted': False,
+                                              'created_at': datetime.now()}
+                                             for user_db_id in user_db_ids for vocab_num in range(VOCABS_PER_USER)])
+        session.commit()
+
+        user_db_id: int = user_db_ids[USERS_COUNT // 2]
+        params: dict[str, object] = {'name': CHECKED_NAME,
+                                     'normalized_name': CHECKED_NAME.casefold(),
+                                     'user_db_id': user_db_id}
+        ilike_time, _ = measure_best(lambda: session.execute(text(ILIKE_CHECK_SQL), params).all(), repeats=100)
+        index_time, _ = measure_best(lambda: session.execute(text(INDEX_CHECK_SQL), params).all(), repeats=100)
+        validator_time, is_valid = measure_best(
+            lambda: VocabNameValidator(CHECKED_NAME, user_db_id, session).is_valid(), repeats=100)
+        query_plan: str = ' '.join(row[-1] for row in session.execute(text(f'EXPLAIN QUERY PLAN {INDEX_CHECK_SQL}'),
+                                                                      params))
+
+        print(f'Словників: {USERS_COUNT * VOCABS_PER_USER} ({USERS_COUNT} користувачів)')
+        print(f'SQL: ILIKE {format_time(ilike_time)}, пошук за індексом {format_time(index_time)} ({query_plan})')
+        print(f'VocabNameValidator.is_valid: {format_time(validator_time)} (назва вільна: {is_valid})')
+
+    # Два одночасні створення словника з однаковою назвою (у різному регістрі кирилицею),
+    # які обидва пройшли перевірку назви
+    with temp_database(), Session() as first_session, Session() as second_session:
+        user_db_id = create_bench_user(first_session, 111)
+        is_first_valid: bool = VocabNameValidator('Тварини', user_db_id, first_session).is_valid()
+        is_second_valid: bool = VocabNameValidator('тварини', user_db_id, second_session).is_valid()
+        first_session.rollback()
+        second_session.rollback()
+
+        create_bench_vocab(first_session, user_db_id, 'Тварини', 1)
+        try:
+            create_bench_vocab(second_session, user_db_id, 'тварини', 1)
+            second_result: str = 'створено'
+        except VocabNameNotUniqueError:
+            second_result = 'відхилено (VocabNameNotUniqueError)'
+        print(f'Одночасне створення: перевірки назви {is_first_valid}/{is_second_valid}, '
+              f'другий словник {second_result}')
+
+
+if __name__ == '__main__':
+    main()
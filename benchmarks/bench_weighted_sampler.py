@@ -0,0 +1,79 @@
+"""Тренування "Робота над помилками": вибірка у кеші (WeightedSampler) проти серіалізації у FSM-Cache на кожному кроці.
+
+Запуск з головної директорії проєкту:
+    python -m benchmarks.bench_weighted_sampler
+"""
+import base64
+import random
+from datetime import datetime
+
+from benchmarks.bench_utils import format_time, measure_best
+from lingoro_bot.tools.training_cache import get_mistake_sampler, mistake_sampler_cache
+from lingoro_bot.tools.training_checkpoint import encode_training_progress
+from lingoro_bot.tools.vocab_trainer_utils import WeightedSampler, get_mistake_weight
+
+WORDPAIRS_COUNT = 50_000
+ANSWERS_COUNT = 1000  # Кількість відповідей (оновлення ваги та вибір наступної словникової пари)
+
+
+def get_answers(rnd: random.Random) -> list[tuple[int, int]]:
+    """Повертає індекси словникових пар та їх нові ваги після відповідей (0 — коректна відповідь)"""
+    return [(rnd.randrange(WORDPAIRS_COUNT), rnd.choice((0, get_mistake_weight(rnd.randint(0, 5), 1))))
+            for _ in range(ANSWERS_COUNT)]
+
+
+def run_fsm_answers(serialized_sampler: str, answers: list[tuple[int, int]]) -> str:
+    """Оновлює вагу та обирає наступну словникову пару з десеріалізацією вибірки з FSM-Cache (для порівняння)"""
+    for wordpair_idx, weight in answers:
+        sampler: WeightedSampler = WeightedSampler.deserialize(base64.b64decode(serialized_sampler))
+        sampler.update(wordpair_idx, weight)
+        serialized_sampler = base64.b64encode(sampler.serialize()).decode()
+
+        sampler = WeightedSampler.deserialize(base64.b64decode(serialized_sampler))
+        sampler.sample(wordpair_idx)
+    return serialized_sampler
+
+
+def run_cached_answers(start_time_training: datetime, weights: list[int], answers: list[tuple[int, int]]) -> None:
+    """Оновлює вагу та обирає наступну словникову пару з вибіркою з кешу"""
+    for wordpair_idx, weight in answers:
+        get_mistake_sampler(1, start_time_training, lambda: WeightedSampler.from_weights(weights)).update(
+            wordpair_idx, weight)
+        get_mistake_sampler(1, start_time_training, lambda: WeightedSampler.from_weights(weights)).sample(
+            wordpair_idx)
+
+
+def main() -> None:
+    rnd = random.Random(0)
+    weights: list[int] = [get_mistake_weight(rnd.randint(0, 10)) for _ in range(WORDPAIRS_COUNT)]
+    answers: list[tuple[int, int]] = get_answers(rnd)
+
+    build_time, sampler = measure_best(lambda: WeightedSampler.from_weights(weights))
+    serialized_sampler: str = base64.b64encode(sampler.serialize()).decode()
+    print(f'Словникових пар: {WORDPAIRS_COUNT}, побудова вибірки: {format_time(build_time)}, '
+          f'розмір у FSM-Cache: {len(serialized_sampler)} символів')
+
+    fsm_time, _ = measure_best(lambda: run_fsm_answers(serialized_sampler, answers), repeats=3)
+    start_time_training: datetime = datetime.now()
+    cached_time, _ = measure_best(lambda: run_cached_answers(start_time_training, weights, answers), repeats=3)
+    mistake_sampler_cache.pop((1, start_time_training))
+    print(f'Одна відповідь: серіалізація у FSM-Cache {format_time(fsm_time / ANSWERS_COUNT)}, '
+          f'вибірка з кешу {format_time(cached_time / ANSWERS_COUNT)} (x{fsm_time / cached_time:.0f})')
+
+    # Вибірка серіалізується лише під час збереження прогресу тренування до БД
+    data_fsm: dict[str, object] = {'training_wordpair_ids': list(range(1, WORDPAIRS_COUNT + 1)),
+                                   'available_idxs': list(range(WORDPAIRS_COUNT)),
+                                   'mixed_vocab_ids': None}
+    checkpoint_time, progress = measure_best(lambda: encode_training_progress(data_fsm, sampler))
+    print(f'Збереження прогресу тренування: {format_time(checkpoint_time)}, розмір: {len(progress)} байт')
+
+    # Частоти вибору словникових пар відповідають вагам
+    draws_count: int = 200_000
+    heavy_idxs: set[int] = set(sorted(range(WORDPAIRS_COUNT), key=weights.__getitem__)[-1000:])
+    heavy_draws: int = sum(sampler.sample() in heavy_idxs for _ in range(draws_count))
+    expected_share: float = sum(weights[idx] for idx in heavy_idxs) / sum(weights)
+    print(f'Частка вибору 1000 найважчих пар: {heavy_draws / draws_count:.4f} (очікувано {expected_share:.4f})')
+
+
+if __name__ == '__main__':
+    main()
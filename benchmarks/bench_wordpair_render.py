@@ -0,0 +1,44 @@
+"""Підготовка текстів словникової пари на кожному кроці тренування: з кешем (get_wordpair_render) та без нього.
+
+Запуск з головної директорії проєкту:
+    python -m benchmarks.bench_wordpair_render
+"""
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.bench_utils import format_time, make_wordpair, measure_best
+from lingoro_bot.tools.training_cache import get_wordpair_render
+from lingoro_bot.tools.vocab_trainer_utils import get_training_data, render_wordpair
+
+TRANSLATIONS_COUNT = 30
+TURNS_COUNT = 10_000
+
+
+def measure_allocated(func: Callable[[], Any]) -> int:
+    """Повертає кількість байтів, виділених під час виклику функції (без урахування звільнених)"""
+    tracemalloc.start()
+    func()
+    allocated_size: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return allocated_size
+
+
+def main() -> None:
+    wordpair_item: dict[str, Any] = {'id': 1, **make_wordpair(1, TRANSLATIONS_COUNT), 'number_errors': 0}
+
+    def render_turn() -> dict[str, Any]:
+        return get_training_data('direct_translation', render_wordpair(wordpair_item))
+
+    def cached_turn() -> dict[str, Any]:
+        return get_training_data('direct_translation', get_wordpair_render(wordpair_item))
+
+    cached_turn()  # Тексти словникової пари потрапляють до кешу
+    for turn_name, turn in (('Без кешу', render_turn), ('З кешем', cached_turn)):
+        turns_time, _ = measure_best(lambda turn=turn: [turn() for _ in range(TURNS_COUNT)])
+        print(f'{turn_name}: {format_time(turns_time / TURNS_COUNT)} на крок, '
+              f'виділено памʼяті {measure_allocated(turn)} Б ({TRANSLATIONS_COUNT} перекладів)')
+
+
+if __name__ == '__main__':
+    main()
@@ -8,6 +8,10 @@ from aiogram import Bot, Dispatcher
 from lingoro_bot.config import TOKEN
 from lingoro_bot.db.database import create_database_tables
 from lingoro_bot.handlers import register_handlers
+from lingoro_bot.middlewares.db_middleware import DatabaseMiddleware
+from lingoro_bot.tools.answer_events import answer_event_log
+from lingoro_bot.tools.timer_wheel import timer_wheel
+from lingoro_bot.tools.training_checkpoint import run_checkpoint_sweeper
 
 
 async def main() -> None:
@@ -23,10 +27,27 @@ async def main() -> None:
 
     logger: logging.Logger = logging.getLogger()
 
+    # Одна сесія БД та ID користувача в БД на кожне оновлення
+    dp.update.middleware(DatabaseMiddleware())
+
     register_handlers(dp)
 
+    # Фоновий запис подій відповідей під час тренувань до БД
+    answer_events_task: asyncio.Task = asyncio.create_task(answer_event_log.run())
+    # Фонове завершення покинутих тренувань (зі збереженим прогресом)
+    checkpoint_sweeper_task: asyncio.Task = asyncio.create_task(run_checkpoint_sweeper())
+    # Спільне колесо таймерів тренувань "Швидкий раунд"
+    timer_wheel_task: asyncio.Task = asyncio.create_task(timer_wheel.run())
+
     logger.info('BOT START')
-    await dp.start_polling(bot)
+    try:
+        await dp.start_polling(bot)
+    finally:
+        # Запис подій, які ще не потрапили до БД
+        answer_events_task.cancel()
+        checkpoint_sweeper_task.cancel()
+        timer_wheel_task.cancel()
+        await answer_event_log.flush()
 
 
 if __name__ == '__main__':
@@ -29,7 +29,115 @@ MAX_COUNT_WORDPAIR_ITEMS = 30  # Максимальна кількість "сл
 MIN_LENGTH_WORDPAIR_COMPONENT = 1  # Мінімальна кількість символів
 MAX_LENGTH_WORDPAIR_COMPONENT = 30  # Максимальна кількість символів
 
+# Імпорт словників з Anki
+ANKI_COLLECTION_NAMES: tuple[str, ...] = ('collection.anki21', 'collection.anki2')  # Колекції за пріоритетом
+ANKI_FIELD_SEPARATOR = '\x1f'  # Символ, яким Anki розділяє поля нотатки
+ANKI_IMPORT_CHUNK_SIZE = 1000  # Кількість нотаток, які читаються та додаються до БД за один раз
+ANKI_MAX_FILE_SIZE = 20 * 1024 * 1024  # Максимальний розмір Anki-пакета (ліміт завантаження файлів Bot API)
+
+# Експорт словників в Anki
+ANKI_EXPORT_COLLECTION_NAME = 'collection.anki2'  # Назва SQLite-колекції всередині Anki-пакета
+ANKI_EXPORT_CHUNK_SIZE = 1000  # Кількість словникових пар, які читаються з БД та записуються за один раз
+ANKI_EXPORT_MAX_CONCURRENCY = 2  # Максимальна кількість одночасних експортів
+ANKI_MODEL_ID = 1700000000000  # ID типу нотаток "Lingoro" у колекції
+ANKI_DECK_ID = 1700000000001  # ID колоди у колекції
+ANKI_MODEL_FIELDS: tuple[str, ...] = ('Front', 'Back', 'Annotation')  # Поля типу нотаток "Lingoro"
+
+# Інтервальне повторення (SM-2)
+SRS_INITIAL_EASE_FACTOR = 2.5  # Початковий коефіцієнт легкості словникової пари
+SRS_MIN_EASE_FACTOR = 1.3  # Мінімальний коефіцієнт легкості словникової пари
+SRS_PASSING_QUALITY = 3  # Мінімальна оцінка відповіді (0-5), за якої повторення вважається успішним
+REVIEW_DUE_SESSION_SIZE = 20  # Максимальна кількість словникових пар у тренуванні "Повторення"
+
+# Тренування "Робота над помилками"
+MISTAKE_SESSION_ERROR_WEIGHT = 3  # Додаткова вага словникової пари за кожну помилку під час поточного тренування
+
+# Тренування "Повторення помилок"
+REVIEW_MISTAKES_SESSION_SIZE = 20  # Максимальна кількість словникових пар у тренуванні "Повторення помилок"
+
+# Перевірка відповідей під час тренування
+ANSWER_APOSTROPHES: tuple[str, ...] = ('ʼ', '’', '‘', '`', '´', 'ʹ', '′')  # Варіанти апострофа, що замінюються на "'"
+ANSWER_TYPO_MIN_LENGTH = 5  # Мінімальна довжина перекладу, в якому допускається одна описка
+ANSWER_TYPO_LONG_LENGTH = 10  # Мінімальна довжина перекладу, в якому допускаються дві описки
+
+# Тренування "Вибір відповіді"
+CHOICE_OPTIONS_COUNT = 4  # Кількість варіантів відповіді (разом з коректним)
+CHOICE_SAMPLE_ATTEMPTS = 8  # Кількість спроб вибору схожого варіанту відповіді, перш ніж обрати будь-який
+CHOICE_LENGTH_BUCKET_SIZE = 2  # Ширина діапазону довжин, у межах якого варіанти відповіді вважаються схожими
+CHOICE_EXTRA_OPTIONS_LIMIT = 200  # Максимальна кількість перекладів з інших словників, якщо у словнику їх замало
+
+# Змішане тренування (декілька словників)
+MIXED_SESSION_SIZE = 30  # Кількість словникових пар у змішаному тренуванні
+
+# Завантаження словникових пар під час тренування
+TRAINING_PREFETCH_SIZE = 10  # Кількість словникових пар, які завантажуються з БД за один раз (поточна та наступні)
+
+# Кеш текстів словникових пар для тренування
+WORDPAIR_RENDER_CACHE_SIZE = 50_000  # Максимальна кількість словникових пар у кеші
+DISTRACTOR_INDEX_CACHE_SIZE = 100  # Максимальна кількість індексів варіантів відповіді (словників) у кеші
+MISTAKE_SAMPLER_CACHE_MAX_IDXS = 1_000_000  # Максимальна сумарна кількість індексів вибірок "Роботи над помилками"
+
+# Пошук словникових пар
+SEARCH_PAGE_SIZE = 10  # Кількість словникових пар на сторінці результатів пошуку
+SEARCH_QUERY_MAX_LENGTH = 50  # Максимальна кількість символів у пошуковому запиті
+SEARCH_MAX_TERMS = 5  # Максимальна кількість слів пошукового запиту, які враховуються
+
+# Автодоповнення слів у inline-режимі
+INLINE_RESULTS_LIMIT = 20  # Максимальна кількість підказок у відповіді на inline-запит (не більше 50)
+INLINE_CACHE_TIME = 30  # Час (у секундах), протягом якого Telegram кешує відповідь на inline-запит
+PREFIX_INDEX_CACHE_MAX_KEYS = 1_000_000  # Максимальна сумарна кількість ключів індексів автодоповнення у кеші
+
+# Сторінки зі словниками
+VOCABS_PAGE_SIZE = 8  # Кількість словників на сторінці клавіатури з вибором словника
+VOCABS_PAGE_CACHE_SIZE = 10_000  # Максимальна кількість сторінок зі словниками у кеші
+
+# Сторінки зі словниковими парами словника
+VOCAB_WORDPAIRS_PAGE_SIZE = 30  # Максимальна кількість словникових пар на сторінці інформації про словник
+MESSAGE_MAX_LENGTH = 4096  # Максимальна довжина тексту повідомлення Telegram (у UTF-16 кодових одиницях)
+VOCAB_DATETIME_FORMAT = '%d.%m.%Y %H:%M'  # Формат часу останнього тренування в інформації про словник
+VOCAB_WEAKEST_WORDPAIRS_COUNT = 3  # Кількість найслабших словникових пар кожного напрямку в інформації про словник
+
+# Кеш зареєстрованих користувачів
+KNOWN_USERS_CACHE_SIZE = 100_000  # Максимальна кількість користувачів у кеші
+USER_PROFILES_BATCH_SIZE = 100  # Кількість змінених профілів користувачів, які записуються до БД за один раз
+USER_PROFILES_FLUSH_INTERVAL = 300  # Максимальний час (у секундах), протягом якого змінений профіль не записується
+
+# Статистика тренувань
+STATS_DEFAULT_PERIOD = 'week'  # Період статистики, який відкривається першим ("day", "week" або "month")
+STATS_VOCABS_LIMIT = 10  # Максимальна кількість словників у статистиці тренувань за період
+
+# Рівень засвоєння словникових пар
+MASTERY_HALF_LIFE_DAYS = 14  # Кількість днів без тренування, за яку рівень засвоєння зменшується вдвічі
+MASTERY_ATTEMPTS_SCALE = 3  # Кількість спроб, після якої впевненість у рівні засвоєння досягає ~63%
+MASTERY_WEAK_THRESHOLD = 0.5  # Рівень засвоєння, нижче якого словникова пара вважається слабкою
+MASTERY_WEAKEST_COUNT = 10  # Кількість найслабших словникових пар в огляді засвоєння
+
+# Журнал відповідей під час тренувань
+ANSWER_EVENTS_BUFFER_SIZE = 10_000  # Максимальна кількість подій відповідей, які ще не записані до БД
+ANSWER_EVENTS_BATCH_SIZE = 500  # Кількість подій відповідей, які записуються до БД за один раз
+ANSWER_EVENTS_FLUSH_INTERVAL = 5  # Максимальний час (у секундах), протягом якого подія відповіді не записується
+
+# Тренування "Аркуш питань"
+QUIZ_SHEET_SIZE = 10  # Максимальна кількість словникових пар на одному аркуші питань
+
+# Тренування "Швидкий раунд"
+SPEED_ROUND_DURATION = 60  # Тривалість раунду (у секундах)
+SPEED_QUESTION_TIMEOUT = 10  # Час на відповідь на одну словникову пару (у секундах)
+
+# Колесо таймерів
+TIMER_WHEEL_RESOLUTION = 0.1  # Тривалість одного такту колеса (у секундах)
+TIMER_WHEEL_SLOT_BITS = 6  # Кількість біт номера слоту (64 слоти на кожному рівні)
+TIMER_WHEEL_LEVELS = 4  # Кількість рівнів колеса (максимальна затримка — 64^4 тактів, ~19 днів)
+
+# Збереження прогресу незавершених тренувань
+CHECKPOINT_PROGRESS_INTERVAL = 5  # Кількість відповідей, після якої прогрес тренування зберігається до БД
+CHECKPOINT_TIME_INTERVAL = 60  # Максимальний час (у секундах), протягом якого прогрес тренування не зберігається
+CHECKPOINT_ABANDON_TIMEOUT = 12 * 60 * 60  # Час (у секундах) без дій, після якого тренування вважається покинутим
+CHECKPOINT_SWEEP_INTERVAL = 10 * 60  # Інтервал (у секундах) завершення покинутих тренувань у фоновому завданні
+CHECKPOINT_SWEEP_BATCH_SIZE = 100  # Кількість покинутих тренувань, які завершуються за один запит
+
 # Повідомлення для кастомних виключень
 INVALID_VOCAB_INDEX_ERROR = 'Словника з ID "{id}" не знайдено у базі даних.'
 USER_NOT_FOUND_ERROR = 'Користувача з ID "{id}" не знайдено у базі даних.'
 WORDPAIR_NOT_FOUND_ERROR = 'Словникова пара з ID "{id}" не знайдено у базі даних.'
+VOCAB_NAME_NOT_UNIQUE_ERROR = 'Словник з назвою "{name}" вже є у базі даних користувача з ID "{id}".'
@@ -0,0 +1,12 @@
+from datetime import datetime
+from typing import TypedDict
+
+
+class AnswerEventType(TypedDict):
+    user_id: int
+    wordpair_id: int
+    training_mode: str
+    verdict: str
+    latency_ms: int | None
+    is_hint_used: bool
+    created_at: datetime
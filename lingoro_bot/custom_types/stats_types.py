@@ -0,0 +1,35 @@
+from typing import TypedDict
+
+
+class TrainingStatsType(TypedDict):
+    sessions_count: int
+    number_correct_answers: int
+    number_wrong_answers: int
+    duration_seconds: int
+
+
+class VocabTrainingStatsType(TrainingStatsType):
+    vocab_id: int
+    name: str
+    prev_number_correct_answers: int  # Кількість правильних відповідей за попередній період
+    prev_number_wrong_answers: int  # Кількість неправильних відповідей за попередній період
+
+
+class VocabMasteryType(TypedDict):
+    vocab_id: int
+    name: str
+    wordpairs_count: int
+    trained_count: int  # Кількість словникових пар, які вже тренувалися
+    weak_count: int  # Кількість натренованих словникових пар з рівнем засвоєння нижче порогу
+    mastery: float  # Середній рівень засвоєння словникових пар словника (не треновані мають 0)
+
+
+class WordpairMasteryType(TypedDict):
+    wordpair_id: int
+    vocab_id: int
+    mastery: float
+
+
+class MasteryOverviewType(TypedDict):
+    vocabs: list[VocabMasteryType]  # Від найменшого рівня засвоєння
+    weakest_wordpairs: list[WordpairMasteryType]  # Від найменшого рівня засвоєння
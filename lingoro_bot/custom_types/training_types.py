@@ -0,0 +1,18 @@
+from typing import TypedDict
+
+from lingoro_bot.custom_types.wordpair_types import WordpairStatType
+
+
+class TrainingProgressType(TypedDict):
+    training_wordpair_ids: list[int]
+    available_idxs: list[int]  # Черга індексів словникових пар, які ще не були використані
+    wordpair_idx: int  # Індекс поточної словникової пари
+    mixed_vocab_ids: list[int] | None  # ID словників змішаного тренування (None для тренування одного словника)
+    correct_answer_count: int
+    wrong_answer_count: int
+    annotation_shown_count: int
+    translation_shown_count: int
+    training_streak_count: int
+    session_wordpair_errors: dict[int, int]
+    session_wordpair_stats: dict[int, WordpairStatType]
+    mistake_sampler: bytes | None  # Серіалізована вибірка тренування "Робота над помилками"
@@ -0,0 +1,7 @@
+from typing import TypedDict
+
+
+class UserProfileType(TypedDict):
+    username: str | None
+    first_name: str | None
+    last_name: str | None
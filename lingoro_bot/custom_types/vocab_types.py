@@ -11,3 +11,11 @@ class VocabDataType(TypedDict):
     number_errors: Column[int]
     created_at: Column[datetime]
     wordpairs_count: int
+    last_trained_at: Column[datetime] | None
+    best_accuracy: Column[float] | None
+
+
+class VocabsPageType(TypedDict):
+    vocabs: list[VocabDataType]
+    prev_cursor_id: int | None  # ID першого словника сторінки, якщо є попередня сторінка
+    next_cursor_id: int | None  # ID останнього словника сторінки, якщо є наступна сторінка
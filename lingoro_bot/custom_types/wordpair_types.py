@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import TypedDict
 
 from sqlalchemy import Column
@@ -41,3 +42,27 @@ class WordpairInfoType(TypedDict):
     translations: list[WordpairTranslationType]
     annotation: Column[str] | None
     number_errors: Column[int]
+
+
+class WordpairRenderType(TypedDict):
+    formatted_words: str
+    formatted_translations: str
+    annotation: str
+    word_answer_keys: list[str]
+    translation_answer_keys: list[str]
+
+
+class WordpairSearchResultType(TypedDict):
+    id: int
+    words: str
+    translations: str
+    annotation: str | None
+    vocab_name: str
+
+
+class WordpairStatType(TypedDict):
+    attempts: int
+    number_errors: int
+    number_hints: int
+    number_translation_shown: int
+    last_seen_at: datetime | None
@@ -1,25 +1,76 @@
-from sqlalchemy import Column
-from sqlalchemy.orm import Session
-
-from lingoro_bot.config import INVALID_VOCAB_INDEX_ERROR, USER_NOT_FOUND_ERROR, WORDPAIR_NOT_FOUND_ERROR
-from lingoro_bot.custom_types.vocab_types import VocabDataType
+import bisect
+import itertools
+import random
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import (
+    Column,
+    Float,
+    and_,
+    bindparam,
+    case,
+    cast,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Query, Session
+
+from lingoro_bot.config import (
+    ANKI_EXPORT_CHUNK_SIZE,
+    INVALID_VOCAB_INDEX_ERROR,
+    SRS_INITIAL_EASE_FACTOR,
+    USER_NOT_FOUND_ERROR,
+    VOCAB_NAME_NOT_UNIQUE_ERROR,
+    WORDPAIR_NOT_FOUND_ERROR,
+)
+from lingoro_bot.custom_types.answer_types import AnswerEventType
+from lingoro_bot.custom_types.stats_types import TrainingStatsType, VocabTrainingStatsType
+from lingoro_bot.custom_types.user_types import UserProfileType
+from lingoro_bot.custom_types.vocab_types import VocabDataType, VocabsPageType
 from lingoro_bot.custom_types.wordpair_types import (
+    WordpairComponentsType,
     WordpairInfoType,
+    WordpairSearchResultType,
+    WordpairStatType,
     WordpairTranslationType,
     WordpairType,
     WordpairWordType,
 )
+from lingoro_bot.db.database import SEARCH_INDEX_INSERT_SQL
 from lingoro_bot.db.models import (
+    AnswerEvent,
+    TrainingCheckpoint,
     TrainingSession,
     Translation,
     User,
+    UserDailyStat,
+    VocabDailyStat,
+    VocabSummary,
     Vocabulary,
     Word,
     Wordpair,
+    WordpairReview,
+    WordpairStat,
     WordpairTranslation,
     WordpairWord,
 )
-from lingoro_bot.exceptions import InvalidVocabIndexError, UserNotFoundError
+from lingoro_bot.exceptions import InvalidVocabIndexError, UserNotFoundError, VocabNameNotUniqueError
+from lingoro_bot.tools.anki_utils import format_anki_note_fields, write_anki_package
+from lingoro_bot.tools.srs_utils import calculate_next_review
+from lingoro_bot.tools.stats_utils import get_training_duration_seconds
+from lingoro_bot.tools.wordpair_utils import calculate_error_rate
 
 
 class UserCRUD:
@@ -28,28 +79,60 @@ class UserCRUD:
     def __init__(self, session: Session) -> None:
         self.session: Session = session
 
-    def create_new_user(self, tg_user_data: User) -> None:
-        """Створює нового користувача в БД.
+    def register_user(self, user_id: int, user_profile: UserProfileType) -> bool:
+        """Додає користувача до БД, якщо його там ще немає.
+
+        Notes:
+            Використовується один запит INSERT ... ON CONFLICT DO NOTHING, тому одночасні реєстрації
+            одного користувача (декілька "/start" поспіль) не призводять до помилки унікальності.
+            Профіль вже наявного користувача не змінюється (див. update_user_profiles).
 
         Args:
-            tg_user_data (User): Вся telegram-інформація про користувача
-            (message.from_user / callback.from_user).
+            user_id (int): Telegram ID користувача.
+            user_profile (UserProfileType): Профіль користувача (username, імʼя та прізвище).
 
         Returns:
-            None
+            bool: Прапор, чи був користувач доданий (тобто, чи є він новим).
+        """
+        insert_user_query = sqlite_insert(User).values(user_id=user_id,
+                                                       created_at=datetime.now(),
+                                                       **user_profile).on_conflict_do_nothing(
+            index_elements=[User.user_id])
+        is_user_added: bool = self.session.execute(insert_user_query).rowcount == 1
+        self.session.commit()
+        return is_user_added
+
+    def update_user_profiles(self, user_profiles: dict[int, UserProfileType]) -> None:
+        """Оновлює профілі користувачів одним пакетним UPDATE-запитом.
+
+        Args:
+            user_profiles (dict[int, UserProfileType]): Словник, де ключ — telegram ID користувача,
+            а значення — його новий профіль.
         """
-        new_user = User(user_id=tg_user_data.id,
-                        username=tg_user_data.username,
-                        first_name=tg_user_data.first_name,
-                        last_name=tg_user_data.last_name)
-        self.session.add(new_user)
+        update_profile_query = update(User).where(User.user_id == bindparam('tg_user_id')).values(
+            username=bindparam('username'),
+            first_name=bindparam('first_name'),
+            last_name=bindparam('last_name'))
+        self.session.connection().execute(update_profile_query,
+                                          [{'tg_user_id': user_id, **user_profile}
+                                           for user_id, user_profile in user_profiles.items()])
         self.session.commit()
 
-    def check_user_exists_in_db(self, user_id: int) -> bool:
-        """Перевіряє, чи є користувач в БД"""
-        user: User | None = self.session.query(User).filter(
-            User.user_id == user_id).first()
-        return user is not None
+    def get_user_db_id(self, user_id: int) -> int:
+        """Повертає ID користувача в БД (users.id) за його telegram ID.
+
+        Args:
+            user_id (int): Telegram ID користувача.
+
+        Returns:
+            int: ID користувача в БД.
+        """
+        user_db_id: int | None = self.session.query(User.id).filter(
+            User.user_id == user_id).scalar()
+
+        if user_db_id is None:
+            raise UserNotFoundError(USER_NOT_FOUND_ERROR.format(id=user_id))
+        return user_db_id
 
 
 class VocabCRUD:
@@ -59,14 +142,18 @@ class VocabCRUD:
         self.session: Session = session
 
     def create_new_vocab(self,
-                         user_id: int,
+                         user_db_id: int,
                          vocab_name: str,
                          vocab_description: str | None,
                          vocab_wordpairs: list[WordpairType]) -> None:
         """Додає новий користувацький словник та його словникові пари до БД.
 
+        Notes:
+            Словник, словникові пари, повнотекстовий індекс та зведені дані словника зберігаються однією
+            транзакцією, тому помилка під час додавання словникових пар не залишає в БД неповний словник.
+
         Args:
-            user_id (int): ID користувача.
+            user_db_id (int): ID користувача в БД.
             vocab_name (str): Назва користувацького словника.
             vocab_description (str | None): Опис користувацького словника (може бути None).
             vocab_wordpairs (list[WordpairType]): Список словникових пар із розділеними компонентами у
@@ -98,46 +185,179 @@ class VocabCRUD:
         Returns:
             None
         """
-        user: User | None = self.session.query(User).filter(
-            User.user_id == user_id).first()
+        # Створення нового словника
+        new_vocab = Vocabulary(name=vocab_name,
+                               normalized_name=vocab_name.casefold(),
+                               description=vocab_description,
+                               user_id=user_db_id)
+        self._flush_new_vocab(new_vocab)
 
-        if user is None:
-            raise UserNotFoundError(USER_NOT_FOUND_ERROR.format(id=user_id))
+        vocab_id: Column[int] = new_vocab.id
 
-        # Створення нового словника
+        try:
+            # Додавання словникових пар та звʼязків між словами та перекладами
+            for wordpair_item in vocab_wordpairs:
+                wordpair_words: list[WordpairWordType] | None = wordpair_item.get('words')
+                if wordpair_words is None:
+                    raise ValueError('Ключ "words" відсутній або None')
+
+                wordpair_translations: list[WordpairTranslationType] | None = wordpair_item.get('translations')
+                if wordpair_translations is None:
+                    raise ValueError('Ключ "translations" відсутній або None')
+
+                annotation: Column[str] | None = wordpair_item.get('annotation')
+
+                new_wordpair = Wordpair(annotation=annotation,
+                                        vocabulary_id=vocab_id)
+                self.session.add(new_wordpair)
+                self.session.flush()
+
+                wordpair_id: Column[int] = new_wordpair.id
+
+                # Додавання слів та перекладів до БД
+                self._add_wordpair_words(wordpair_words, wordpair_id)
+                self._add_wordpair_translations(wordpair_translations, wordpair_id)
+        except Exception:
+            self.session.rollback()
+            raise
+
+        # Додавання словникових пар до повнотекстового індексу та зведених даних словника
+        search_crud = SearchCRUD(self.session)
+        search_crud.index_vocab_wordpairs(vocab_id)
+        summary_crud = VocabSummaryCRUD(self.session)
+        summary_crud.add_vocab_summary(new_vocab, wordpairs_count=len(vocab_wordpairs))
+        self.session.commit()
+
+    def create_new_vocab_from_chunks(self,
+                                     user_db_id: int,
+                                     vocab_name: str,
+                                     vocab_description: str | None,
+                                     wordpair_chunks: Iterable[list[WordpairComponentsType]]) -> int:
+        """Додає новий користувацький словник до БД, додаючи словникові пари частинами.
+
+        Notes:
+            Кожна частина додається пакетними INSERT-запитами (словникові пари, слова, переклади та звʼязки),
+            а весь словник зберігається однією транзакцією. Тому в памʼяті знаходиться лише поточна частина,
+            а перерваний імпорт не залишає в БД неповний словник.
+            Блокування запису SQLite утримується, доки не будуть прочитані всі частини, тому частини
+            мають бути підготовлені заздалегідь (без тривалого читання чи валідації під час ітерації).
+
+        Args:
+            user_db_id (int): ID користувача в БД.
+            vocab_name (str): Назва користувацького словника.
+            vocab_description (str | None): Опис користувацького словника (може бути None).
+            wordpair_chunks (Iterable[list[WordpairComponentsType]]): Частини зі словниковими парами,
+            розділеними на компоненти.
+
+        Returns:
+            int: Кількість доданих словникових пар. Якщо не було додано жодної, словник не зберігається.
+        """
         new_vocab = Vocabulary(name=vocab_name,
+                               normalized_name=vocab_name.casefold(),
                                description=vocab_description,
-                               user_id=user_id)
-        self.session.add(new_vocab)
+                               user_id=user_db_id)
+        self._flush_new_vocab(new_vocab)
+
+        wordpairs_count = 0
+        try:
+            for wordpair_chunk in wordpair_chunks:
+                if wordpair_chunk:
+                    self._bulk_add_wordpairs(wordpair_chunk, new_vocab.id)
+                    wordpairs_count += len(wordpair_chunk)
+        except Exception:
+            self.session.rollback()
+            raise
+
+        # Словник без словникових пар не зберігається
+        if wordpairs_count == 0:
+            self.session.rollback()
+            return 0
+
+        # Додавання словникових пар до повнотекстового індексу та зведених даних словника
+        search_crud = SearchCRUD(self.session)
+        search_crud.index_vocab_wordpairs(new_vocab.id)
+        summary_crud = VocabSummaryCRUD(self.session)
+        summary_crud.add_vocab_summary(new_vocab, wordpairs_count=wordpairs_count)
         self.session.commit()
+        return wordpairs_count
 
-        vocab_id: Column[int] = new_vocab.id
+    def _flush_new_vocab(self, new_vocab: Vocabulary) -> None:
+        """Додає новий словник до БД (без фіксації транзакції).
 
-        # Додавання словникових пар та звʼязків між словами та перекладами
-        for wordpair_item in vocab_wordpairs:
-            wordpair_words: list[WordpairWordType] | None = wordpair_item.get('words')
-            if wordpair_words is None:
-                raise ValueError('Ключ "words" відсутній або None')
+        Notes:
+            Унікальність назви словника гарантується індексом "uq_vocabularies_user_id_normalized_name",
+            тому словник з такою ж назвою, створений одночасно (після перевірки назви), не буде доданий.
+        """
+        self.session.add(new_vocab)
 
-            wordpair_translations: list[WordpairTranslationType] | None = wordpair_item.get('translations')
-            if wordpair_translations is None:
-                raise ValueError('Ключ "translations" відсутній або None')
+        try:
+            self.session.flush()
+        except IntegrityError as e:
+            self.session.rollback()
+            raise VocabNameNotUniqueError(VOCAB_NAME_NOT_UNIQUE_ERROR.format(name=new_vocab.name,
+                                                                             id=new_vocab.user_id)) from e
 
-            annotation: Column[str] | None = wordpair_item.get('annotation')
+    def _bulk_add_wordpairs(self, wordpairs: list[WordpairComponentsType], vocab_id: Column[int]) -> None:
+        """Додає частину словникових пар до БД пакетними INSERT-запитами (без фіксації транзакції).
 
-            new_wordpair = Wordpair(annotation=annotation,
-                                    vocabulary_id=vocab_id)
-            self.session.add(new_wordpair)
-            self.session.commit()
+        Notes:
+            ID словникових пар, слів та перекладів призначаються одразу після найбільшого ID таблиці,
+            тому рядки додаються через "executemany" без RETURNING (яке SQLite виконує малими пакетами).
+            Запити виконуються через таблиці (Core), бо ORM розбиває рядки з None-значеннями на малі пакети.
+            Призначення ID безпечне, бо транзакція вже утримує блокування запису (після додавання словника),
+            і ніхто інший не може додати рядки до цих таблиць до її завершення.
 
-            wordpair_id: Column[int] = new_wordpair.id
+        Args:
+            wordpairs (list[WordpairComponentsType]): Словникові пари, розділені на компоненти.
+            vocab_id (Column[int]): ID словника, якому належать словникові пари.
 
-            # Додавання слів та перекладів до БД
-            self._add_wordpair_words(wordpair_words, wordpair_id)
-            self._add_wordpair_translations(wordpair_translations, wordpair_id)
+        Returns:
+            None
+        """
+        wordpair_rows: list[dict[str, Any]] = [
+            {'id': wordpair_id, 'annotation': wordpair['annotation'], 'vocabulary_id': vocab_id}
+            for wordpair_id, wordpair in zip(self._get_next_ids(Wordpair, len(wordpairs)), wordpairs, strict=True)]
+
+        # Слова та переклади всіх словникових пар частини з ID словникової пари, до якої вони належать
+        word_rows: list[tuple[int, dict[str, str | None]]] = [
+            (wordpair_row['id'], {'word': word_item['word'], 'transcription': word_item['transcription']})
+            for wordpair_row, wordpair in zip(wordpair_rows, wordpairs, strict=True)
+            for word_item in wordpair['words']]
+        translation_rows: list[tuple[int, dict[str, str | None]]] = [
+            (wordpair_row['id'], {'translation': translation_item['translation'],
+                                  'transcription': translation_item['transcription']})
+            for wordpair_row, wordpair in zip(wordpair_rows, wordpairs, strict=True)
+            for translation_item in wordpair['translations']]
+
+        word_ids: range = self._get_next_ids(Word, len(word_rows))
+        translation_ids: range = self._get_next_ids(Translation, len(translation_rows))
+
+        self.session.execute(insert(Wordpair.__table__), wordpair_rows)
+        self.session.execute(insert(Word.__table__), [{'id': word_id, **word_row}
+                                            for word_id, (_, word_row) in zip(word_ids, word_rows, strict=True)])
+        self.session.execute(insert(Translation.__table__),
+                             [{'id': translation_id, **translation_row}
+                              for translation_id, (_, translation_row) in zip(translation_ids,
+                                                                              translation_rows,
+                                                                              strict=True)])
+
+        # Звʼязування слів та перекладів зі словниковими парами
+        self.session.execute(
+            insert(WordpairWord.__table__),
+            [{'word_id': word_id, 'wordpair_id': wordpair_id}
+             for word_id, (wordpair_id, _) in zip(word_ids, word_rows, strict=True)])
+        self.session.execute(
+            insert(WordpairTranslation.__table__),
+            [{'translation_id': translation_id, 'wordpair_id': wordpair_id}
+             for translation_id, (wordpair_id, _) in zip(translation_ids, translation_rows, strict=True)])
+
+    def _get_next_ids(self, model: type[Wordpair | Word | Translation], count: int) -> range:
+        """Повертає "count" ID, наступних після найбільшого ID таблиці моделі"""
+        max_id: int = self.session.scalar(select(func.max(model.id))) or 0
+        return range(max_id + 1, max_id + count + 1)
 
     def _add_wordpair_words(self, wordpair_words: list[WordpairWordType], wordpair_id: Column[int]) -> None:
-        """Додає слова словникової пари до БД.
+        """Додає слова словникової пари до БД (без фіксації транзакції).
         Одразу звʼязує їх з словниковою парою по "wordpair_id".
 
         Args:
@@ -162,18 +382,18 @@ class VocabCRUD:
             new_word = Word(word=word,
                             transcription=transcription)
             self.session.add(new_word)
-            self.session.commit()
+            self.session.flush()
 
             # Звʼязування слова та словникової пари
             new_wordpair_word = WordpairWord(word_id=new_word.id,
                                              wordpair_id=wordpair_id)
             self.session.add(new_wordpair_word)
-        self.session.commit()
+        self.session.flush()
 
     def _add_wordpair_translations(self,
                                    wordpair_translations: list[WordpairTranslationType],
                                    wordpair_id: Column[int]) -> None:
-        """Додає переклади словникової пари до БД.
+        """Додає переклади словникової пари до БД (без фіксації транзакції).
         Одразу звʼязує їх з словниковою парою по ID.
 
         Args:
@@ -198,26 +418,26 @@ class VocabCRUD:
             new_translation = Translation(translation=translation,
                                           transcription=transcription)
             self.session.add(new_translation)
-            self.session.commit()
+            self.session.flush()
 
             # Звʼязування перекладу та словникової пари
             new_wordpair_translation = WordpairTranslation(translation_id=new_translation.id,
                                                            wordpair_id=wordpair_id)
             self.session.add(new_wordpair_translation)
-        self.session.commit()
+        self.session.flush()
 
-    def get_all_vocabs_data(self, user_id: int) -> list[VocabDataType]:
+    def get_all_vocabs_data(self, user_db_id: int) -> list[VocabDataType]:
         """Повертає дані всіх користувацьких словників.
         За допомогою ID користувача.
 
         Args:
-            user_id (Column[int]): ID користувача.
+            user_db_id (int): ID користувача в БД.
 
         Returns:
             list[VocabDataType]: Дані всіх користувацьких словників у вигляді списку з python-словниками.
 
         Examples:
-            >>> get_all_vocabs_data(user_id=1)
+            >>> get_all_vocabs_data(user_db_id=1)
                 [
                     {
                     'id': 1,
@@ -225,21 +445,94 @@ class VocabCRUD:
                     'description': None,
                     'number_errors': 0,
                     'created_at': '2024-11-17 10:12:35.123',
-                    'wordpairs_count': 2
+                    'wordpairs_count': 2,
+                    'last_trained_at': None,
+                    'best_accuracy': None
                     },
                 ]
         """
-        all_vocabs: list[Vocabulary] = self.session.query(Vocabulary).filter(
-            Vocabulary.user_id == user_id,
-            ~Vocabulary.is_deleted).all()
+        summaries_query = self.session.query(VocabSummary).filter(
+            VocabSummary.user_id == user_db_id).order_by(VocabSummary.vocabulary_id)
+        return [self._get_vocab_data_from_summary(summary) for summary in summaries_query]
+
+    def get_vocab_ids(self, user_db_id: int) -> list[int]:
+        """Повертає ID всіх користувацьких словників (без завантаження даних словників).
+
+        Args:
+            user_db_id (int): ID користувача в БД.
+
+        Returns:
+            list[int]: ID користувацьких словників.
+        """
+        return list(self.session.execute(select(VocabSummary.vocabulary_id).where(
+            VocabSummary.user_id == user_db_id).order_by(VocabSummary.vocabulary_id)).scalars())
 
-        all_vocabs_data: list[VocabDataType] = []
+    def get_vocabs_page(self, user_db_id: int, cursor_id: int, is_backward: bool, limit: int) -> VocabsPageType:
+        """Повертає сторінку користувацьких словників (від нових до старих).
 
-        for vocab_item in all_vocabs:
-            vocab_id: Column[int] = vocab_item.id
-            vocab_data: VocabDataType = self.get_vocab_data(vocab_id)
-            all_vocabs_data.append(vocab_data)
-        return all_vocabs_data
+        Notes:
+            Словники впорядковані за (created_at, id) та розбиваються на сторінки за курсором
+            (словником, після або перед яким починається сторінка), а не за зміщенням. Тому з БД
+            завантажується лише одна сторінка (та ще один словник, щоб дізнатися, чи є наступна сторінка).
+            Сторінка читається лише зі зведених даних словників (один рядок індексу на словник).
+
+        Args:
+            user_db_id (int): ID користувача в БД.
+            cursor_id (int): ID словника, після (або перед) якого починається сторінка (0 — перша сторінка).
+            is_backward (bool): Прапор, чи потрібна сторінка перед курсором (інакше після нього).
+            limit (int): Кількість словників на сторінці.
+
+        Returns:
+            VocabsPageType: Дані словників сторінки та курсори сусідніх сторінок.
+        """
+        sort_key = tuple_(VocabSummary.created_at, VocabSummary.vocabulary_id)
+        vocabs_query: Query = self.session.query(VocabSummary).filter(VocabSummary.user_id == user_db_id)
+
+        # Якщо словника-курсора вже немає (наприклад, кнопка зі старого повідомлення), то повертається перша сторінка
+        cursor_created_at: datetime | None = self.session.query(VocabSummary.created_at).filter(
+            VocabSummary.vocabulary_id == cursor_id).scalar()
+        if cursor_created_at is None:
+            cursor_id = 0
+            is_backward = False
+        elif is_backward:
+            vocabs_query = vocabs_query.filter(sort_key > tuple_(cursor_created_at, cursor_id))
+        else:
+            vocabs_query = vocabs_query.filter(sort_key < tuple_(cursor_created_at, cursor_id))
+
+        if is_backward:
+            rows = vocabs_query.order_by(VocabSummary.created_at,
+                                         VocabSummary.vocabulary_id).limit(limit + 1).all()[::-1]
+            is_more_vocabs: bool = len(rows) > limit
+            page_rows = rows[-limit:]
+        else:
+            rows = vocabs_query.order_by(VocabSummary.created_at.desc(),
+                                         VocabSummary.vocabulary_id.desc()).limit(limit + 1).all()
+            is_more_vocabs: bool = len(rows) > limit
+            page_rows = rows[:limit]
+
+        vocabs_data: list[VocabDataType] = [self._get_vocab_data_from_summary(summary) for summary in page_rows]
+
+        is_prev_page: bool = is_more_vocabs if is_backward else cursor_id != 0
+        is_next_page: bool = True if is_backward else is_more_vocabs
+
+        vocabs_page: VocabsPageType = {
+            'vocabs': vocabs_data,
+            'prev_cursor_id': vocabs_data[0]['id'] if vocabs_data and is_prev_page else None,
+            'next_cursor_id': vocabs_data[-1]['id'] if vocabs_data and is_next_page else None}
+        return vocabs_page
+
+    @staticmethod
+    def _get_vocab_data_from_summary(summary: VocabSummary) -> VocabDataType:
+        """Повертає дані словника зі зведених даних словника"""
+        vocab_data: VocabDataType = {'id': summary.vocabulary_id,
+                                     'name': summary.name,
+                                     'description': summary.description,
+                                     'number_errors': summary.number_errors,
+                                     'created_at': summary.created_at,
+                                     'wordpairs_count': summary.wordpairs_count,
+                                     'last_trained_at': summary.last_trained_at,
+                                     'best_accuracy': summary.best_accuracy}
+        return vocab_data
 
     def get_vocab_data(self, vocab_id: Column[int]) -> VocabDataType:
         """Повертає дані користувацького словника.
@@ -259,9 +552,28 @@ class VocabCRUD:
                     'description': None,
                     'number_errors': 0,
                     'created_at': '2024-11-17 10:12:35.123',
-                    'wordpairs_count': 2
+                    'wordpairs_count': 2,
+                    'last_trained_at': '2024-11-18 09:00:00.000',
+                    'best_accuracy': 0.75
                 }
         """
+        # Видалені словники не мають зведених даних
+        summary: VocabSummary | None = self.session.get(VocabSummary, vocab_id)
+
+        if summary is None:
+            raise InvalidVocabIndexError(INVALID_VOCAB_INDEX_ERROR.format(id=vocab_id))
+        return self._get_vocab_data_from_summary(summary)
+
+    def export_vocab_to_anki(self, vocab_id: int, apkg_path: str | Path) -> int:
+        """Експортує користувацький словник в Anki-пакет (.apkg).
+
+        Args:
+            vocab_id (int): ID користувацького словника.
+            apkg_path (str | Path): Шлях, за яким буде створено Anki-пакет.
+
+        Returns:
+            int: Кількість експортованих словникових пар.
+        """
         vocab: Vocabulary | None = self.session.query(Vocabulary).filter(
             Vocabulary.id == vocab_id,
             ~Vocabulary.is_deleted).first()
@@ -269,17 +581,60 @@ class VocabCRUD:
         if vocab is None:
             raise InvalidVocabIndexError(INVALID_VOCAB_INDEX_ERROR.format(id=vocab_id))
 
-        all_wordpairs: list[Wordpair] = self.session.query(Wordpair).filter(
-                Wordpair.vocabulary_id == vocab_id).all()
-        wordpairs_count: int = len(all_wordpairs)
+        return write_anki_package(apkg_path=apkg_path,
+                                  deck_name=vocab.name,
+                                  notes_chunks=self._iter_anki_notes_chunks(vocab_id))
 
-        vocab_data: VocabDataType = {'id': vocab.id,
-                                     'name': vocab.name,
-                                     'description': vocab.description,
-                                     'number_errors': vocab.number_errors,
-                                     'created_at': vocab.created_at,
-                                     'wordpairs_count': wordpairs_count}
-        return vocab_data
+    def _iter_anki_notes_chunks(self, vocab_id: int) -> Iterator[list[tuple[int, list[str]]]]:
+        """Повертає частинами словникові пари словника: ID словникової пари та поля нотатки Anki.
+
+        Notes:
+            Слова та переклади всіх словникових пар читаються одним запитом (UNION ALL),
+            відсортованим за ID словникової пари, та надходять з БД потоково (yield_per).
+            Тому словникова пара збирається з сусідніх рядків і не потребує додаткових запитів.
+        """
+        words_query = select(
+            Wordpair.id.label('wordpair_id'),
+            Wordpair.annotation.label('annotation'),
+            literal(0).label('kind'),
+            WordpairWord.id.label('link_id'),
+            Word.word.label('component'),
+            Word.transcription.label('transcription'),
+        ).join(WordpairWord, WordpairWord.wordpair_id == Wordpair.id).join(
+            Word, Word.id == WordpairWord.word_id).where(Wordpair.vocabulary_id == vocab_id)
+
+        translations_query = select(
+            Wordpair.id,
+            Wordpair.annotation,
+            literal(1),
+            WordpairTranslation.id,
+            Translation.translation,
+            Translation.transcription,
+        ).join(WordpairTranslation, WordpairTranslation.wordpair_id == Wordpair.id).join(
+            Translation, Translation.id == WordpairTranslation.translation_id).where(Wordpair.vocabulary_id == vocab_id)
+
+        components_query = union_all(words_query, translations_query).order_by('wordpair_id', 'kind', 'link_id')
+        rows = self.session.execute(components_query,
+                                    execution_options={'yield_per': ANKI_EXPORT_CHUNK_SIZE})
+
+        notes_chunk: list[tuple[int, list[str]]] = []
+        for wordpair_id, wordpair_rows in itertools.groupby(rows, key=lambda row: row.wordpair_id):
+            word_items: list[tuple[str, str | None]] = []
+            translation_items: list[tuple[str, str | None]] = []
+            annotation: str | None = None
+
+            for row in wordpair_rows:
+                annotation = row.annotation
+                items: list[tuple[str, str | None]] = word_items if row.kind == 0 else translation_items
+                items.append((row.component, row.transcription))
+
+            notes_chunk.append((wordpair_id, format_anki_note_fields(word_items, translation_items, annotation)))
+            if len(notes_chunk) >= ANKI_EXPORT_CHUNK_SIZE:
+                yield notes_chunk
+                notes_chunk = []
+
+        if notes_chunk:
+            yield notes_chunk
 
     def soft_delete_vocab(self, vocab_id: int) -> None:
         """Мʼяко видаляє користувацький словник, позначаючи його як 'видалений' (.is_deleted=True)"""
@@ -290,6 +645,8 @@ class VocabCRUD:
             raise InvalidVocabIndexError(INVALID_VOCAB_INDEX_ERROR.format(id=vocab_id))
 
         vocab.is_deleted = True  # type: ignore
+        summary_crud = VocabSummaryCRUD(self.session)
+        summary_crud.delete_vocab_summary(vocab_id)
         self.session.commit()
 
     def delete_vocab(self, vocab_id: int) -> None:
@@ -301,7 +658,11 @@ class VocabCRUD:
         if vocab is None:
             raise InvalidVocabIndexError(INVALID_VOCAB_INDEX_ERROR.format(id=vocab_id))
 
-        # Видалення всіх словникових пар, повʼязаних зі словником
+        # Видалення словникових пар з повнотекстового індексу та всіх словникових пар, повʼязаних зі словником
+        search_crud = SearchCRUD(self.session)
+        search_crud.delete_vocab_wordpairs(vocab_id)
+        summary_crud = VocabSummaryCRUD(self.session)
+        summary_crud.delete_vocab_summary(vocab_id)
         self._delete_wordpairs_by_vocab_id(vocab_id)
 
         # Видалення словника
@@ -318,6 +679,10 @@ class VocabCRUD:
         wordpairs: list[Wordpair] = self.session.query(Wordpair).filter(
             Wordpair.vocabulary_id == vocab_id).all()
 
+        # Видалення статистики словникових пар словника
+        self.session.query(WordpairStat).filter(
+            WordpairStat.vocabulary_id == vocab_id).delete(synchronize_session=False)
+
         for wordpair in wordpairs:
             # Видалення звʼязків слів та перекладів зі словниковою парою
             self.session.query(WordpairWord).filter(
@@ -401,6 +766,174 @@ class WordpairCRUD:
             all_wordpairs.append(wordpair_components)
         return all_wordpairs
 
+    def get_wordpairs_by_ids(self, wordpair_ids: list[int]) -> list[WordpairInfoType]:
+        """Повертає словникові пари за списком їх ID (у тому ж порядку).
+
+        Notes:
+            Словникові пари, слова та переклади завантажуються трьома запитами на весь список,
+            а не окремими запитами для кожної словникової пари.
+
+        Args:
+            wordpair_ids (list[int]): Список ID словникових пар.
+
+        Returns:
+            list[WordpairInfoType]: Список з всією інформацією про словникові пари (як у "get_wordpairs").
+        """
+        wordpairs: list[Wordpair] = self.session.query(Wordpair).filter(
+            Wordpair.id.in_(wordpair_ids)).all()
+
+        words_by_wordpair: dict[int, list[WordpairWordType]] = {wordpair_id: [] for wordpair_id in wordpair_ids}
+        translations_by_wordpair: dict[int, list[WordpairTranslationType]] = {wordpair_id: []
+                                                                               for wordpair_id in wordpair_ids}
+
+        word_rows = self.session.query(WordpairWord.wordpair_id, Word.word, Word.transcription).join(
+            Word, Word.id == WordpairWord.word_id).filter(
+            WordpairWord.wordpair_id.in_(wordpair_ids)).order_by(WordpairWord.id)
+        for wordpair_id, word, transcription in word_rows:
+            words_by_wordpair[wordpair_id].append({'word': word, 'transcription': transcription})
+
+        translation_rows = self.session.query(
+            WordpairTranslation.wordpair_id, Translation.translation, Translation.transcription).join(
+            Translation, Translation.id == WordpairTranslation.translation_id).filter(
+            WordpairTranslation.wordpair_id.in_(wordpair_ids)).order_by(WordpairTranslation.id)
+        for wordpair_id, translation, transcription in translation_rows:
+            translations_by_wordpair[wordpair_id].append({'translation': translation,
+                                                          'transcription': transcription})
+
+        wordpairs_by_id: dict[int, WordpairInfoType] = {
+            wordpair.id: {'id': wordpair.id,
+                          'words': words_by_wordpair[wordpair.id],
+                          'translations': translations_by_wordpair[wordpair.id],
+                          'annotation': wordpair.annotation,
+                          'number_errors': wordpair.number_errors}
+            for wordpair in wordpairs}
+        return [wordpairs_by_id[wordpair_id] for wordpair_id in wordpair_ids if wordpair_id in wordpairs_by_id]
+
+    def get_wordpairs_page(self,
+                           vocab_id: int,
+                           cursor_id: int,
+                           is_backward: bool,
+                           limit: int) -> list[WordpairInfoType]:
+        """Повертає сторінку словникових пар словника (від більшої кількості помилок до меншої).
+
+        Notes:
+            Словникові пари впорядковані за (number_errors DESC, id) та розбиваються на сторінки за курсором
+            (словниковою парою, після або перед якою починається сторінка), а не за зміщенням.
+            Спочатку за індексом обираються лише ID словникових пар сторінки, а потім завантажуються
+            їх дані (див. get_wordpairs_by_ids).
+
+        Args:
+            vocab_id (int): ID користувацького словника.
+            cursor_id (int): ID словникової пари, після (або перед) якої починається сторінка (0 — перша сторінка).
+            is_backward (bool): Прапор, чи потрібна сторінка перед курсором (інакше після нього).
+            limit (int): Максимальна кількість словникових пар.
+
+        Returns:
+            list[WordpairInfoType]: Словникові пари сторінки у порядку відображення.
+        """
+        wordpair_ids_query = self.session.query(Wordpair.id).filter(Wordpair.vocabulary_id == vocab_id)
+
+        # Якщо словникової пари-курсора немає, то повертається перша сторінка
+        cursor_number_errors: int | None = self.session.query(Wordpair.number_errors).filter(
+            Wordpair.id == cursor_id,
+            Wordpair.vocabulary_id == vocab_id).scalar()
+        if cursor_number_errors is None:
+            is_backward = False
+        elif is_backward:
+            wordpair_ids_query = wordpair_ids_query.filter(or_(
+                Wordpair.number_errors > cursor_number_errors,
+                and_(Wordpair.number_errors == cursor_number_errors, Wordpair.id < cursor_id)))
+        else:
+            wordpair_ids_query = wordpair_ids_query.filter(or_(
+                Wordpair.number_errors < cursor_number_errors,
+                and_(Wordpair.number_errors == cursor_number_errors, Wordpair.id > cursor_id)))
+
+        if is_backward:
+            wordpair_ids_query = wordpair_ids_query.order_by(Wordpair.number_errors, Wordpair.id.desc())
+            wordpair_ids: list[int] = [wordpair_id for (wordpair_id,) in wordpair_ids_query.limit(limit)][::-1]
+        else:
+            wordpair_ids_query = wordpair_ids_query.order_by(Wordpair.number_errors.desc(), Wordpair.id)
+            wordpair_ids: list[int] = [wordpair_id for (wordpair_id,) in wordpair_ids_query.limit(limit)]
+        return self.get_wordpairs_by_ids(wordpair_ids)
+
+    def get_wordpair_ids(self, vocab_id: int) -> list[int]:
+        """Повертає ID всіх словникових пар словника (за зростанням).
+
+        Notes:
+            Запит виконується лише за індексом (vocabulary_id, id), без читання даних словникових пар.
+
+        Args:
+            vocab_id (int): ID користувацького словника.
+
+        Returns:
+            list[int]: Список ID словникових пар.
+        """
+        wordpair_ids_query = self.session.query(Wordpair.id).filter(
+            Wordpair.vocabulary_id == vocab_id).order_by(Wordpair.id)
+        return [wordpair_id for (wordpair_id,) in wordpair_ids_query]
+
+    def get_mistake_wordpair_ids(self, vocab_id: int, limit: int) -> list[int]:
+        """Повертає ID словникових пар словника, в яких були помилки (від найбільшої кількості помилок).
+
+        Notes:
+            Запит виконується лише за індексом (vocabulary_id, number_errors DESC, id) і читає не більше
+            "limit" його записів, без завантаження всіх словникових пар словника.
+
+        Args:
+            vocab_id (int): ID користувацького словника.
+            limit (int): Максимальна кількість словникових пар.
+
+        Returns:
+            list[int]: Список ID словникових пар.
+        """
+        wordpair_ids_query = self.session.query(Wordpair.id).filter(
+            Wordpair.vocabulary_id == vocab_id,
+            Wordpair.number_errors > 0).order_by(Wordpair.number_errors.desc(), Wordpair.id).limit(limit)
+        return [wordpair_id for (wordpair_id,) in wordpair_ids_query]
+
+    def get_wordpair_error_counts(self, vocab_id: int, user_db_id: int, direction: str) -> dict[int, int]:
+        """Повертає кількість невдалих спроб кожної словникової пари словника у напрямку перекладу.
+
+        Notes:
+            Невдалими спробами є неправильні відповіді та покази перекладу (див. WordpairStat).
+            Для словникових пар, які ще не тренувалися в цьому напрямку, повертається загальна кількість
+            їх помилок (Wordpair.number_errors), щоб не втратити історію помилок до появи статистики.
+
+        Args:
+            vocab_id (int): ID користувацького словника.
+            user_db_id (int): ID користувача в БД.
+            direction (str): Напрямок перекладу (див. TRAINING_DIRECTION_NAMES).
+
+        Returns:
+            dict[int, int]: Словник, де ключ — ID словникової пари, а значення — кількість її невдалих спроб.
+        """
+        error_counts_query = self.session.query(
+            Wordpair.id,
+            func.coalesce(WordpairStat.number_errors + WordpairStat.number_translation_shown, Wordpair.number_errors),
+        ).outerjoin(WordpairStat, and_(WordpairStat.user_id == user_db_id,
+                                       WordpairStat.wordpair_id == Wordpair.id,
+                                       WordpairStat.direction == direction)).filter(
+            Wordpair.vocabulary_id == vocab_id)
+        return {wordpair_id: number_errors for wordpair_id, number_errors in error_counts_query}
+
+    def get_vocab_translations(self, vocab_id: int) -> list[str]:
+        """Повертає перші переклади всіх словникових пар словника.
+
+        Args:
+            vocab_id (int): ID користувацького словника.
+
+        Returns:
+            list[str]: Список перекладів (по одному на словникову пару).
+        """
+        first_translation_ids = self.session.query(func.min(WordpairTranslation.id)).join(
+            Wordpair, Wordpair.id == WordpairTranslation.wordpair_id).filter(
+            Wordpair.vocabulary_id == vocab_id).group_by(WordpairTranslation.wordpair_id)
+
+        translations_query = self.session.query(Translation.translation).join(
+            WordpairTranslation, WordpairTranslation.translation_id == Translation.id).filter(
+            WordpairTranslation.id.in_(first_translation_ids.scalar_subquery()))
+        return [translation for (translation,) in translations_query]
+
     def _get_words_with_transcriptions(self, wordpair_id: Column[int]) -> list[WordpairWordType]:
         """Повертає список слів та їх транскрипцій зі словникової пари за "wordpair_id".
 
@@ -471,6 +1004,67 @@ class WordpairCRUD:
                                                      'transcription': translation_query.transcription})
         return translations_with_transcriptions
 
+    def sample_wordpair_ids(self, vocab_ids: list[int], limit: int) -> list[int]:
+        """Повертає ID випадкових словникових пар з кількох словників без завантаження всіх словникових пар.
+
+        Notes:
+            Кількість словникових пар кожного словника рахується за індексом (vocabulary_id, id).
+            Серед усіх позицій словникових пар обираються випадкові, і ID словникових пар на всіх позиціях
+            отримуються одним запитом (UNION ALL): кожна позиція — пошук зі зміщенням (OFFSET) за тим же індексом.
+            Кількість позицій обмежена лімітом SQLite на кількість частин UNION ALL (500).
+
+        Args:
+            vocab_ids (list[int]): Список ID словників.
+            limit (int): Максимальна кількість словникових пар.
+
+        Returns:
+            list[int]: ID випадкових словникових пар (без повторів).
+        """
+        wordpairs_counts: list[tuple[int, int]] = self.session.query(
+            Wordpair.vocabulary_id, func.count(Wordpair.id)).filter(
+            Wordpair.vocabulary_id.in_(vocab_ids)).group_by(Wordpair.vocabulary_id).all()
+
+        # Позиція першої словникової пари кожного словника серед усіх словникових пар
+        vocab_start_positions: list[int] = list(itertools.accumulate(
+            (count for _, count in wordpairs_counts[:-1]), initial=0))
+        total_wordpairs_count: int = sum(count for _, count in wordpairs_counts)
+
+        positions: list[int] = random.sample(range(total_wordpairs_count), min(limit, total_wordpairs_count))
+        if not positions:
+            return []
+
+        position_queries = []
+        for position in positions:
+            vocab_idx: int = bisect.bisect_right(vocab_start_positions, position) - 1
+            wordpair_query = select(Wordpair.id).filter(
+                Wordpair.vocabulary_id == wordpairs_counts[vocab_idx][0]).order_by(Wordpair.id).offset(
+                position - vocab_start_positions[vocab_idx]).limit(1).subquery()
+            position_queries.append(select(literal(position).label('position'), wordpair_query.c.id))
+
+        wordpair_ids_by_position: dict[int, int] = dict(
+            self.session.execute(union_all(*position_queries)).tuples().all())
+        return [wordpair_ids_by_position[position] for position in positions]
+
+    def get_user_translations(self, user_db_id: int, excluded_vocab_id: int, limit: int) -> list[str]:
+        """Повертає переклади з інших користувацьких словників користувача.
+
+        Args:
+            user_db_id (int): ID користувача в БД.
+            excluded_vocab_id (int): ID словника, переклади якого не враховуються.
+            limit (int): Максимальна кількість перекладів.
+
+        Returns:
+            list[str]: Унікальні переклади.
+        """
+        translations_query = self.session.query(Translation.translation).join(
+            WordpairTranslation, WordpairTranslation.translation_id == Translation.id).join(
+            Wordpair, Wordpair.id == WordpairTranslation.wordpair_id).join(
+            Vocabulary, Vocabulary.id == Wordpair.vocabulary_id).filter(
+            Vocabulary.user_id == user_db_id,
+            Vocabulary.id != excluded_vocab_id,
+            ~Vocabulary.is_deleted).distinct().limit(limit)
+        return [translation for (translation,) in translations_query]
+
     def increment_wordpair_error_count(self, wordpair_id: int) -> None:
         """Збільшує кількість помилок у словниковій парі на 1.
 
@@ -486,6 +1080,32 @@ class WordpairCRUD:
         # Оновлення значення через SQLAlchemy
         self.session.query(Wordpair).filter(Wordpair.id == wordpair_id).update(
             {'number_errors': Wordpair.number_errors + 1})
+        summary_crud = VocabSummaryCRUD(self.session)
+        summary_crud.increment_number_errors(wordpair.vocabulary_id)
+        self.session.commit()
+
+    def increment_wordpair_error_counts(self, wordpair_ids: list[int]) -> None:
+        """Збільшує кількість помилок у кожній словниковій парі зі списку на 1.
+
+        Notes:
+            Лічильники словникових пар оновлюються одним запитом, а лічильники словників — одним запитом
+            на кожен словник, з фіксацією транзакції один раз (а не для кожної словникової пари).
+
+        Args:
+            wordpair_ids (list[int]): Список ID словникових пар (без повторів).
+        """
+        if not wordpair_ids:
+            return
+
+        vocab_error_counts: list[tuple[int, int]] = self.session.query(
+            Wordpair.vocabulary_id, func.count()).filter(
+            Wordpair.id.in_(wordpair_ids)).group_by(Wordpair.vocabulary_id).all()
+
+        self.session.query(Wordpair).filter(Wordpair.id.in_(wordpair_ids)).update(
+            {'number_errors': Wordpair.number_errors + 1}, synchronize_session=False)
+        summary_crud = VocabSummaryCRUD(self.session)
+        for vocab_id, error_count in vocab_error_counts:
+            summary_crud.increment_number_errors(vocab_id, error_count)
         self.session.commit()
 
 
@@ -496,7 +1116,7 @@ class TrainingCRUD:
         self.session: Session = session
 
     def create_new_training_session(self,
-                                    user_id: int,
+                                    user_db_id: int,
                                     vocabulary_id: int,
                                     training_mode: str,
                                     start_time: str,
@@ -509,7 +1129,7 @@ class TrainingCRUD:
         """Створює нову сесію тренування для користувача.
 
         Args:
-            user_id (int): ID користувача.
+            user_db_id (int): ID користувача в БД.
             vocabulary_id (int): ID словника, який використовується для тренування.
             training_mode (str): Режим тренування.
             start_time (str): Час початку тренування у форматі рядка.
@@ -531,8 +1151,599 @@ class TrainingCRUD:
                                                number_annotation_shown=number_annotation_shown,
                                                number_translation_shown=number_translation_shown,
                                                is_completed=is_completed,
-                                               user_id=user_id,
+                                               user_id=user_db_id,
                                                vocabulary_id=vocabulary_id)
 
         self.session.add(new_training_session)
+        summary_crud = VocabSummaryCRUD(self.session)
+        summary_crud.add_training_result(vocab_id=vocabulary_id,
+                                         end_time=end_time,
+                                         number_correct_answers=number_correct_answers,
+                                         number_wrong_answers=number_wrong_answers,
+                                         is_completed=is_completed)
+        stats_crud = TrainingStatsCRUD(self.session)
+        stats_crud.add_training_result(user_db_id=user_db_id,
+                                       vocab_id=vocabulary_id,
+                                       end_time=end_time,
+                                       number_correct_answers=number_correct_answers,
+                                       number_wrong_answers=number_wrong_answers,
+                                       duration_seconds=get_training_duration_seconds(start_time, end_time))
         self.session.commit()
+
+
+class TrainingStatsCRUD:
+    """Клас для операцій з денними підсумками тренувань в БД (див. UserDailyStat та VocabDailyStat).
+
+    Notes:
+        Статистика за період обчислюється з денних підсумків, тому кількість рядків, які читаються,
+        залежить від кількості днів у періоді, а не від кількості сесій тренувань.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session: Session = session
+
+    def add_training_result(self,
+                            user_db_id: int,
+                            vocab_id: int | None,
+                            end_time: datetime,
+                            number_correct_answers: int,
+                            number_wrong_answers: int,
+                            duration_seconds: int) -> None:
+        """Додає результат тренування до денних підсумків користувача та словника (без фіксації транзакції).
+        Результат змішаного тренування (vocab_id=None) додається лише до денних підсумків користувача.
+        """
+        training_stats: TrainingStatsType = {'sessions_count': 1,
+                                             'number_correct_answers': number_correct_answers,
+                                             'number_wrong_answers': number_wrong_answers,
+                                             'duration_seconds': duration_seconds}
+        day: date = end_time.date()
+
+        self._upsert_daily_stat(UserDailyStat, {'user_id': user_db_id, 'day': day}, training_stats)
+        if vocab_id is None:
+            return
+
+        self._upsert_daily_stat(VocabDailyStat,
+                                {'vocabulary_id': vocab_id, 'day': day, 'user_id': user_db_id},
+                                training_stats)
+
+    def _upsert_daily_stat(self,
+                           model: type[UserDailyStat] | type[VocabDailyStat],
+                           key_values: dict[str, int | date],
+                           training_stats: TrainingStatsType) -> None:
+        """Додає денний підсумок або збільшує лічильники вже наявного (одним запитом INSERT ... ON CONFLICT)"""
+        insert_query = sqlite_insert(model).values(**key_values, **training_stats)
+        upsert_query = insert_query.on_conflict_do_update(
+            index_elements=list(model.__table__.primary_key),
+            set_={column: getattr(model, column) + insert_query.excluded[column] for column in training_stats})
+        self.session.execute(upsert_query)
+
+    def get_user_stats(self, user_db_id: int, start_day: date, end_day: date) -> TrainingStatsType:
+        """Повертає підсумки тренувань користувача за дні з "start_day" по "end_day" (включно)"""
+        stats_row = self.session.query(
+            func.coalesce(func.sum(UserDailyStat.sessions_count), 0),
+            func.coalesce(func.sum(UserDailyStat.number_correct_answers), 0),
+            func.coalesce(func.sum(UserDailyStat.number_wrong_answers), 0),
+            func.coalesce(func.sum(UserDailyStat.duration_seconds), 0),
+        ).filter(UserDailyStat.user_id == user_db_id,
+                 UserDailyStat.day.between(start_day, end_day)).one()
+
+        training_stats: TrainingStatsType = {'sessions_count': stats_row[0],
+                                             'number_correct_answers': stats_row[1],
+                                             'number_wrong_answers': stats_row[2],
+                                             'duration_seconds': stats_row[3]}
+        return training_stats
+
+    def get_user_training_days(self, user_db_id: int) -> list[date]:
+        """Повертає дні, в які користувач тренувався (за зростанням)"""
+        days_query: Query = self.session.query(UserDailyStat.day).filter(
+            UserDailyStat.user_id == user_db_id).order_by(UserDailyStat.day)
+        return [day for (day,) in days_query]
+
+    def get_vocabs_stats(self,
+                         user_db_id: int,
+                         start_day: date,
+                         prev_start_day: date,
+                         end_day: date,
+                         limit: int) -> list[VocabTrainingStatsType]:
+        """Повертає статистику тренувань не видалених словників користувача за період
+        разом з кількістю відповідей за попередній період (для зміни точності).
+
+        Notes:
+            Обидва періоди обчислюються одним запитом з умовними сумами за денними підсумками
+            з "prev_start_day" по "end_day". Словники, яких не тренували у поточному періоді, не повертаються.
+
+        Args:
+            user_db_id (int): ID користувача в БД.
+            start_day (date): Перший день періоду.
+            prev_start_day (date): Перший день попереднього періоду (останній день якого передує "start_day").
+            end_day (date): Останній день періоду (включно).
+            limit (int): Максимальна кількість словників (найбільше тренувань у періоді).
+
+        Returns:
+            list[VocabTrainingStatsType]: Статистика словників за спаданням кількості тренувань у періоді.
+        """
+        is_current_period = VocabDailyStat.day >= start_day
+        sessions_count = func.sum(case((is_current_period, VocabDailyStat.sessions_count), else_=0))
+
+        stats_query: Query = self.session.query(
+            VocabDailyStat.vocabulary_id,
+            VocabSummary.name,
+            sessions_count,
+            func.sum(case((is_current_period, VocabDailyStat.number_correct_answers), else_=0)),
+            func.sum(case((is_current_period, VocabDailyStat.number_wrong_answers), else_=0)),
+            func.sum(case((is_current_period, VocabDailyStat.duration_seconds), else_=0)),
+            func.sum(case((is_current_period, 0), else_=VocabDailyStat.number_correct_answers)),
+            func.sum(case((is_current_period, 0), else_=VocabDailyStat.number_wrong_answers)),
+        ).join(
+            VocabSummary, VocabSummary.vocabulary_id == VocabDailyStat.vocabulary_id,
+        ).filter(
+            VocabDailyStat.user_id == user_db_id,
+            VocabDailyStat.day.between(prev_start_day, end_day),
+        ).group_by(VocabDailyStat.vocabulary_id).having(sessions_count > 0).order_by(
+            sessions_count.desc(), VocabDailyStat.vocabulary_id).limit(limit)
+
+        vocabs_stats: list[VocabTrainingStatsType] = [
+            {'vocab_id': vocab_id,
+             'name': name,
+             'sessions_count': vocab_sessions_count,
+             'number_correct_answers': number_correct_answers,
+             'number_wrong_answers': number_wrong_answers,
+             'duration_seconds': duration_seconds,
+             'prev_number_correct_answers': prev_number_correct_answers,
+             'prev_number_wrong_answers': prev_number_wrong_answers}
+            for (vocab_id, name, vocab_sessions_count, number_correct_answers, number_wrong_answers,
+                 duration_seconds, prev_number_correct_answers, prev_number_wrong_answers) in stats_query]
+        return vocabs_stats
+
+
+class WordpairStatCRUD:
+    """Клас для CRUD-операцій зі статистикою словникових пар за напрямками перекладу в БД (див. WordpairStat)"""
+
+    def __init__(self, session: Session) -> None:
+        self.session: Session = session
+
+    def add_session_stats(self,
+                          user_db_id: int,
+                          direction: str,
+                          session_wordpair_stats: dict[int, WordpairStatType]) -> None:
+        """Додає статистику словникових пар за тренування до їх загальної статистики.
+
+        Notes:
+            Всі словникові пари тренування записуються одним запитом INSERT ... ON CONFLICT DO UPDATE
+            (executemany). Словникові пари, які вже видалені з БД, пропускаються.
+
+        Args:
+            user_db_id (int): ID користувача в БД.
+            direction (str): Напрямок перекладу тренування (див. TRAINING_DIRECTION_NAMES).
+            session_wordpair_stats (dict[int, WordpairStatType]): Статистика словникових пар за тренування
+            (ключ — ID словникової пари).
+        """
+        if not session_wordpair_stats:
+            return
+
+        # ID словників словникових пар (змішане тренування містить словникові пари декількох словників)
+        vocab_ids_query = self.session.query(Wordpair.id, Wordpair.vocabulary_id).filter(
+            Wordpair.id.in_(session_wordpair_stats))
+        vocab_ids: dict[int, int] = {wordpair_id: vocab_id for wordpair_id, vocab_id in vocab_ids_query}
+
+        wordpair_stats_rows: list[dict] = [
+            {'user_id': user_db_id,
+             'wordpair_id': wordpair_id,
+             'direction': direction,
+             'vocabulary_id': vocab_ids[wordpair_id],
+             **wordpair_stat,
+             'error_rate': calculate_error_rate(wordpair_stat['attempts'],
+                                                wordpair_stat['number_errors'],
+                                                wordpair_stat['number_translation_shown'])}
+            for wordpair_id, wordpair_stat in session_wordpair_stats.items() if wordpair_id in vocab_ids]
+
+        insert_query = sqlite_insert(WordpairStat)
+        excluded = insert_query.excluded
+
+        attempts = WordpairStat.attempts + excluded.attempts
+        number_errors = WordpairStat.number_errors + excluded.number_errors
+        number_translation_shown = WordpairStat.number_translation_shown + excluded.number_translation_shown
+
+        upsert_query = insert_query.on_conflict_do_update(
+            index_elements=[WordpairStat.user_id, WordpairStat.wordpair_id, WordpairStat.direction],
+            set_={'attempts': attempts,
+                  'number_errors': number_errors,
+                  'number_hints': WordpairStat.number_hints + excluded.number_hints,
+                  'number_translation_shown': number_translation_shown,
+                  'error_rate': cast(number_errors + number_translation_shown, Float) / func.max(
+                      attempts + number_translation_shown, 1),
+                  'last_seen_at': func.max(WordpairStat.last_seen_at, excluded.last_seen_at)})
+        self.session.execute(upsert_query, wordpair_stats_rows)
+        self.session.commit()
+
+    def get_wordpair_stats(self,
+                           user_db_id: int,
+                           wordpair_ids: list[int]) -> dict[int, dict[str, WordpairStatType]]:
+        """Повертає статистику словникових пар за напрямками перекладу.
+
+        Returns:
+            dict[int, dict[str, WordpairStatType]]: Словник, де ключ — ID словникової пари, а значення —
+            статистика за напрямками перекладу (лише тих, в яких словникова пара тренувалася).
+        """
+        stats_query = self.session.query(WordpairStat).filter(WordpairStat.user_id == user_db_id,
+                                                              WordpairStat.wordpair_id.in_(wordpair_ids))
+
+        wordpair_stats: dict[int, dict[str, WordpairStatType]] = {}
+        for stat in stats_query:
+            wordpair_stats.setdefault(stat.wordpair_id, {})[stat.direction] = {
+                'attempts': stat.attempts,
+                'number_errors': stat.number_errors,
+                'number_hints': stat.number_hints,
+                'number_translation_shown': stat.number_translation_shown,
+                'last_seen_at': stat.last_seen_at}
+        return wordpair_stats
+
+    def get_weakest_wordpair_ids(self, vocab_id: int, direction: str, limit: int) -> list[int]:
+        """Повертає ID словникових пар словника з найбільшою часткою невдалих спроб у напрямку перекладу.
+
+        Notes:
+            Запит читає перші "limit" записів індексу (vocabulary_id, direction, error_rate DESC, wordpair_id)
+            без сортування. Словникові пари без невдалих спроб не повертаються.
+        """
+        weakest_query = self.session.query(WordpairStat.wordpair_id).filter(
+            WordpairStat.vocabulary_id == vocab_id,
+            WordpairStat.direction == direction,
+            WordpairStat.error_rate > 0,
+        ).order_by(WordpairStat.error_rate.desc(), WordpairStat.wordpair_id).limit(limit)
+        return [wordpair_id for (wordpair_id,) in weakest_query]
+
+    def get_user_mastery_rows(self, user_db_id: int) -> list[tuple[int, int, int, int, float]]:
+        """Повертає статистику натренованих словникових пар не видалених словників користувача
+        (обидва напрямки перекладу разом) для обчислення рівня засвоєння (див. build_mastery_overview).
+
+        Returns:
+            list[tuple[int, int, int, int, float]]: Рядки (ID словникової пари, ID словника, кількість спроб
+            разом з показами перекладу, кількість невдалих спроб, кількість днів від останньої дії).
+        """
+        attempts_sum = func.sum(WordpairStat.attempts + WordpairStat.number_translation_shown)
+        failures_sum = func.sum(WordpairStat.number_errors + WordpairStat.number_translation_shown)
+        days_since_seen = func.julianday('now', 'localtime') - func.julianday(func.max(WordpairStat.last_seen_at))
+
+        user_vocab_ids = select(VocabSummary.vocabulary_id).where(VocabSummary.user_id == user_db_id)
+        mastery_query = select(WordpairStat.wordpair_id,
+                               func.min(WordpairStat.vocabulary_id),
+                               attempts_sum,
+                               failures_sum,
+                               days_since_seen).where(
+            WordpairStat.user_id == user_db_id,
+            WordpairStat.vocabulary_id.in_(user_vocab_ids),
+        ).group_by(WordpairStat.wordpair_id)
+        return self.session.execute(mastery_query).tuples().all()
+
+
+class AnswerEventCRUD:
+    """Клас для CRUD-операцій з подіями відповідей під час тренувань в БД"""
+
+    def __init__(self, session: Session) -> None:
+        self.session: Session = session
+
+    def add_answer_events(self, answer_events: list[AnswerEventType]) -> None:
+        """Додає пакет подій відповідей одним запитом (executemany)"""
+        self.session.execute(insert(AnswerEvent), answer_events)
+        self.session.commit()
+
+
+class TrainingCheckpointCRUD:
+    """Клас для CRUD-операцій зі збереженим прогресом незавершених тренувань в БД"""
+
+    def __init__(self, session: Session) -> None:
+        self.session: Session = session
+
+    def get_checkpoint(self, user_db_id: int) -> TrainingCheckpoint | None:
+        """Повертає збережений прогрес незавершеного тренування користувача (за первинним ключем)"""
+        return self.session.get(TrainingCheckpoint, user_db_id)
+
+    def is_checkpoint_exists(self, user_db_id: int) -> bool:
+        """Перевіряє, чи є у користувача незавершене тренування зі збереженим прогресом"""
+        checkpoint_query = self.session.query(TrainingCheckpoint.user_id).filter(
+            TrainingCheckpoint.user_id == user_db_id)
+        return self.session.query(checkpoint_query.exists()).scalar()
+
+    def create_checkpoint(self,
+                          user_db_id: int,
+                          vocab_id: int | None,
+                          training_mode: str,
+                          start_time: datetime,
+                          updated_at: datetime,
+                          progress: bytes) -> None:
+        """Додає збережений прогрес нового тренування користувача.
+
+        Args:
+            user_db_id (int): ID користувача в БД.
+            vocab_id (int | None): ID словника тренування (None для змішаного тренування).
+            training_mode (str): Тип тренування.
+            start_time (datetime): Час початку тренування.
+            updated_at (datetime): Час збереження прогресу.
+            progress (bytes): Прогрес тренування (див. encode_training_progress).
+        """
+        new_checkpoint = TrainingCheckpoint(user_id=user_db_id,
+                                            vocabulary_id=vocab_id,
+                                            training_mode=training_mode,
+                                            start_time=start_time,
+                                            updated_at=updated_at,
+                                            progress=progress)
+        self.session.add(new_checkpoint)
+        self.session.commit()
+
+    def update_checkpoint(self, user_db_id: int, start_time: datetime, updated_at: datetime, progress: bytes) -> bool:
+        """Оновлює збережений прогрес тренування користувача, яке почалося у "start_time".
+
+        Returns:
+            bool: Чи був оновлений прогрес (False, якщо тренування вже завершене, див. delete_checkpoint).
+        """
+        updated_count: int = self.session.query(TrainingCheckpoint).filter(
+            TrainingCheckpoint.user_id == user_db_id,
+            TrainingCheckpoint.start_time == start_time).update({'updated_at': updated_at, 'progress': progress},
+                                                                synchronize_session=False)
+        self.session.commit()
+        return updated_count > 0
+
+    def delete_checkpoint(self, user_db_id: int, start_time: datetime) -> bool:
+        """Видаляє збережений прогрес тренування користувача, яке почалося у "start_time".
+
+        Notes:
+            Тренування завершує лише той, хто видалив його прогрес (обробник або фонове завдання),
+            тому одне тренування не зберігається у БД двічі.
+
+        Returns:
+            bool: Чи був видалений прогрес.
+        """
+        deleted_count: int = self.session.query(TrainingCheckpoint).filter(
+            TrainingCheckpoint.user_id == user_db_id,
+            TrainingCheckpoint.start_time == start_time).delete(synchronize_session=False)
+        self.session.commit()
+        return deleted_count > 0
+
+    def get_abandoned_checkpoints(self, updated_before: datetime, limit: int) -> list[TrainingCheckpoint]:
+        """Повертає збережений прогрес тренувань, який не оновлювався з "updated_before" (за індексом updated_at)"""
+        return self.session.query(TrainingCheckpoint).filter(
+            TrainingCheckpoint.updated_at < updated_before).order_by(TrainingCheckpoint.updated_at).limit(limit).all()
+
+
+class ReviewCRUD:
+    """Клас для CRUD-операцій зі станом інтервального повторення словникових пар в БД"""
+
+    def __init__(self, session: Session) -> None:
+        self.session: Session = session
+
+    def get_due_wordpair_ids(self, user_db_id: int, vocab_id: int, now: datetime, limit: int) -> list[int]:
+        """Повертає ID словникових пар словника, які потрібно повторити.
+
+        Notes:
+            - Спочатку повертаються пари, час повторення яких настав (від найдавнішого),
+            діапазонним запитом за індексом (user_id, due_at).
+            - Якщо їх менше за "limit", то список доповнюється новими парами, які ще не повторювались.
+
+        Args:
+            user_db_id (int): ID користувача в БД.
+            vocab_id (int): ID користувацького словника.
+            now (datetime): Поточний час.
+            limit (int): Максимальна кількість словникових пар.
+
+        Returns:
+            list[int]: Список ID словникових пар.
+        """
+        due_wordpair_ids: list[int] = self.session.scalars(
+            select(WordpairReview.wordpair_id).join(
+                Wordpair, Wordpair.id == WordpairReview.wordpair_id).where(
+                WordpairReview.user_id == user_db_id,
+                WordpairReview.due_at <= now,
+                Wordpair.vocabulary_id == vocab_id).order_by(
+                WordpairReview.due_at).limit(limit)).all()
+
+        new_limit: int = limit - len(due_wordpair_ids)
+        if new_limit <= 0:
+            return due_wordpair_ids
+
+        has_review_query = select(WordpairReview.id).where(WordpairReview.user_id == user_db_id,
+                                                           WordpairReview.wordpair_id == Wordpair.id)
+        new_wordpair_ids: list[int] = self.session.scalars(
+            select(Wordpair.id).where(
+                Wordpair.vocabulary_id == vocab_id,
+                ~has_review_query.exists()).order_by(
+                Wordpair.id).limit(new_limit)).all()
+        return due_wordpair_ids + new_wordpair_ids
+
+    def update_wordpair_review(self, user_db_id: int, wordpair_id: int, quality: int, reviewed_at: datetime) -> None:
+        """Оновлює стан інтервального повторення словникової пари після відповіді користувача.
+
+        Args:
+            user_db_id (int): ID користувача в БД.
+            wordpair_id (int): ID словникової пари.
+            quality (int): Оцінка відповіді від 0 до 5.
+            reviewed_at (datetime): Час відповіді.
+
+        Returns:
+            None
+        """
+        self.update_wordpair_reviews(user_db_id=user_db_id, qualities={wordpair_id: quality}, reviewed_at=reviewed_at)
+
+    def update_wordpair_reviews(self, user_db_id: int, qualities: dict[int, int], reviewed_at: datetime) -> None:
+        """Оновлює стан інтервального повторення словникових пар після відповідей користувача.
+        Стани всіх словникових пар завантажуються одним запитом, а транзакція фіксується один раз.
+
+        Args:
+            user_db_id (int): ID користувача в БД.
+            qualities (dict[int, int]): Оцінки відповідей від 0 до 5 (ключ — ID словникової пари).
+            reviewed_at (datetime): Час відповідей.
+
+        Returns:
+            None
+        """
+        reviews: dict[int, WordpairReview] = {review.wordpair_id: review
+                                              for review in self.session.query(WordpairReview).filter(
+                                                  WordpairReview.user_id == user_db_id,
+                                                  WordpairReview.wordpair_id.in_(qualities))}
+
+        for wordpair_id, quality in qualities.items():
+            review: WordpairReview | None = reviews.get(wordpair_id)
+            if review is None:
+                review = WordpairReview(user_id=user_db_id,
+                                        wordpair_id=wordpair_id,
+                                        ease_factor=SRS_INITIAL_EASE_FACTOR,
+                                        interval_days=0,
+                                        repetitions=0)
+                self.session.add(review)
+
+            ease_factor, interval_days, repetitions = calculate_next_review(ease_factor=review.ease_factor,
+                                                                            interval_days=review.interval_days,
+                                                                            repetitions=review.repetitions,
+                                                                            quality=quality)
+            review.ease_factor = ease_factor
+            review.interval_days = interval_days
+            review.repetitions = repetitions
+            review.last_reviewed_at = reviewed_at
+            review.due_at = reviewed_at + timedelta(days=interval_days)
+        self.session.commit()
+
+
+class SearchCRUD:
+    """Клас для операцій з повнотекстовим індексом словникових пар в БД (див. create_search_index).
+
+    Notes:
+        Індекс оновлюється під час додавання та видалення словників (див. VocabCRUD),
+        а мʼяко видалені словники відфільтровуються під час пошуку.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session: Session = session
+
+    def index_vocab_wordpairs(self, vocab_id: int) -> None:
+        """Додає словникові пари словника до повнотекстового індексу (без фіксації транзакції)"""
+        self.session.execute(text(SEARCH_INDEX_INSERT_SQL.format(condition='wp.vocabulary_id = :vocab_id')),
+                             {'vocab_id': vocab_id})
+
+    def delete_vocab_wordpairs(self, vocab_id: int) -> None:
+        """Видаляє словникові пари словника з повнотекстового індексу (без фіксації транзакції)"""
+        self.session.execute(text(
+            'DELETE FROM wordpair_search WHERE rowid IN (SELECT id FROM wordpairs WHERE vocabulary_id = :vocab_id)'),
+            {'vocab_id': vocab_id})
+
+    def get_user_wordpairs(self, user_db_id: int) -> list[WordpairSearchResultType]:
+        """Повертає тексти всіх словникових пар не видалених словників користувача з повнотекстового індексу.
+
+        Args:
+            user_db_id (int): ID користувача в БД.
+
+        Returns:
+            list[WordpairSearchResultType]: Словникові пари користувача.
+        """
+        rows = self.session.execute(text(
+            'SELECT s.rowid, s.words, s.translations, s.annotation, v.name FROM vocabularies AS v '
+            'JOIN wordpairs AS wp ON wp.vocabulary_id = v.id '
+            'JOIN wordpair_search AS s ON s.rowid = wp.id '
+            'WHERE v.user_id = :user_db_id AND NOT v.is_deleted'),
+            {'user_db_id': user_db_id}).all()
+        return [{'id': wordpair_id,
+                 'words': words,
+                 'translations': translations,
+                 'annotation': annotation,
+                 'vocab_name': vocab_name}
+                for wordpair_id, words, translations, annotation, vocab_name in rows]
+
+    def search_wordpairs(self,
+                         user_db_id: int,
+                         match_query: str,
+                         cursor_id: int,
+                         is_backward: bool,
+                         limit: int) -> list[WordpairSearchResultType]:
+        """Повертає словникові пари користувача, які відповідають пошуковому запиту.
+
+        Notes:
+            Враховуються лише словникові пари не видалених словників користувача.
+            Результати впорядковані за ID словникової пари та розбиваються на сторінки за курсором
+            (ID останньої чи першої словникової пари попередньої сторінки), а не за зміщенням.
+
+        Args:
+            user_db_id (int): ID користувача в БД.
+            match_query (str): Запит у синтаксисі FTS5 (див. build_search_match_query).
+            cursor_id (int): ID словникової пари, після (або перед) якої починається сторінка.
+            is_backward (bool): Прапор, чи потрібна сторінка перед курсором (інакше після нього).
+            limit (int): Максимальна кількість словникових пар.
+
+        Returns:
+            list[WordpairSearchResultType]: Знайдені словникові пари за зростанням ID.
+        """
+        if is_backward:
+            cursor_condition: str = 's.rowid < :cursor_id ORDER BY s.rowid DESC'
+        else:
+            cursor_condition: str = 's.rowid > :cursor_id ORDER BY s.rowid'
+
+        rows = self.session.execute(text(
+            'SELECT s.rowid, s.words, s.translations, s.annotation, v.name FROM wordpair_search AS s '
+            'JOIN wordpairs AS wp ON wp.id = s.rowid '
+            'JOIN vocabularies AS v ON v.id = wp.vocabulary_id '
+            'WHERE wordpair_search MATCH :match_query AND v.user_id = :user_db_id AND NOT v.is_deleted '
+            f'AND {cursor_condition} LIMIT :limit'),
+            {'match_query': match_query, 'user_db_id': user_db_id, 'cursor_id': cursor_id, 'limit': limit}).all()
+
+        search_results: list[WordpairSearchResultType] = [
+            {'id': wordpair_id,
+             'words': words,
+             'translations': translations,
+             'annotation': annotation,
+             'vocab_name': vocab_name}
+            for wordpair_id, words, translations, annotation, vocab_name in rows]
+        return search_results[::-1] if is_backward else search_results
+
+
+class VocabSummaryCRUD:
+    """Клас для операцій зі зведеними даними словників в БД (див. VocabSummary).
+
+    Notes:
+        Зведені дані оновлюються в тій же транзакції, що й вихідні таблиці, тому методи не фіксують транзакцію.
+        Видалені словники не мають зведених даних.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session: Session = session
+
+    def add_vocab_summary(self, vocab: Vocabulary, wordpairs_count: int) -> None:
+        """Додає зведені дані нового словника (без фіксації транзакції)"""
+        self.session.add(VocabSummary(vocabulary_id=vocab.id,
+                                      user_id=vocab.user_id,
+                                      name=vocab.name,
+                                      description=vocab.description,
+                                      created_at=vocab.created_at,
+                                      wordpairs_count=wordpairs_count,
+                                      number_errors=0))
+
+    def delete_vocab_summary(self, vocab_id: int) -> None:
+        """Видаляє зведені дані словника (без фіксації транзакції)"""
+        self.session.query(VocabSummary).filter(
+            VocabSummary.vocabulary_id == vocab_id).delete(synchronize_session=False)
+
+    def increment_number_errors(self, vocab_id: int, count: int = 1) -> None:
+        """Збільшує кількість помилок словника на "count" (без фіксації транзакції)"""
+        self.session.query(VocabSummary).filter(VocabSummary.vocabulary_id == vocab_id).update(
+            {'number_errors': VocabSummary.number_errors + count}, synchronize_session=False)
+
+    def add_training_result(self,
+                            vocab_id: int,
+                            end_time: datetime,
+                            number_correct_answers: int,
+                            number_wrong_answers: int,
+                            is_completed: bool) -> None:
+        """Оновлює час останнього тренування та найкращу точність словника (без фіксації транзакції).
+
+        Notes:
+            Точність обчислюється так само, як у VOCAB_SUMMARY_SELECT_SQL (лише для завершених тренувань,
+            в яких була хоча б одна відповідь), інакше перевірка узгодженості вважатиме рядок застарілим.
+        """
+        summary: VocabSummary | None = self.session.get(VocabSummary, vocab_id)
+        if summary is None:
+            return
+
+        if summary.last_trained_at is None or end_time > summary.last_trained_at:
+            summary.last_trained_at = end_time  # type: ignore
+
+        answers_count: int = number_correct_answers + number_wrong_answers
+        if is_completed and answers_count > 0:
+            accuracy: float = number_correct_answers / answers_count
+            if summary.best_accuracy is None or accuracy > summary.best_accuracy:
+                summary.best_accuracy = accuracy  # type: ignore
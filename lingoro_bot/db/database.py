@@ -1,6 +1,6 @@
 from typing import Any
 
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Connection, Engine, create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -10,7 +10,250 @@ engine: Engine = create_engine(DATABASE_URL)
 Base: Any = declarative_base()
 Session = sessionmaker(engine)
 
+USER_IDS_MIGRATION_VERSION = 1  # Версія БД після міграції ID користувачів (див. migrate_user_ids)
+TRAINING_STATS_MIGRATION_VERSION = 2  # Версія БД після міграції статистики тренувань (див. migrate_training_stats)
+VOCAB_SUMMARIES_MIGRATION_VERSION = 3  # Версія БД після побудови зведених даних (див. migrate_vocab_summaries)
+VOCAB_NAMES_MIGRATION_VERSION = 4  # Версія БД після нормалізації назв словників (див. migrate_vocab_names)
+
+# Запит, що додає до повнотекстового індексу словникові пари, які відповідають умові "condition"
+SEARCH_INDEX_INSERT_SQL = (
+    'INSERT INTO wordpair_search (rowid, words, translations, transcriptions, annotation) '
+    'SELECT wp.id, '
+    "(SELECT group_concat(w.word, ', ') FROM wordpair_words AS ww "
+    'JOIN words AS w ON w.id = ww.word_id WHERE ww.wordpair_id = wp.id), '
+    "(SELECT group_concat(t.translation, ', ') FROM wordpair_translations AS wt "
+    'JOIN translations AS t ON t.id = wt.translation_id WHERE wt.wordpair_id = wp.id), '
+    "(SELECT group_concat(transcription, ' ') FROM ("
+    'SELECT w.transcription FROM wordpair_words AS ww '
+    'JOIN words AS w ON w.id = ww.word_id WHERE ww.wordpair_id = wp.id '
+    'UNION ALL SELECT t.transcription FROM wordpair_translations AS wt '
+    'JOIN translations AS t ON t.id = wt.translation_id WHERE wt.wordpair_id = wp.id)), '
+    'wp.annotation '
+    'FROM wordpairs AS wp WHERE {condition}')
+
+# Запит, що обчислює з вихідних таблиць зведені дані не видалених словників, які відповідають умові "condition".
+# Найкраща точність враховує лише завершені тренування, в яких була хоча б одна відповідь
+VOCAB_SUMMARY_SELECT_SQL = (
+    'SELECT v.id AS vocabulary_id, v.user_id, v.name, v.description, v.created_at, '
+    'coalesce(wp.wordpairs_count, 0), coalesce(wp.number_errors, 0), ts.last_trained_at, ts.best_accuracy '
+    'FROM vocabularies AS v '
+    'LEFT JOIN (SELECT vocabulary_id, count(*) AS wordpairs_count, sum(number_errors) AS number_errors '
+    'FROM wordpairs GROUP BY vocabulary_id) AS wp ON wp.vocabulary_id = v.id '
+    'LEFT JOIN (SELECT vocabulary_id, max(end_time) AS last_trained_at, '
+    'max(CASE WHEN is_completed AND number_correct_answers + number_wrong_answers > 0 '
+    'THEN CAST(number_correct_answers AS REAL) / (number_correct_answers + number_wrong_answers) END) '
+    'AS best_accuracy '
+    'FROM training_sessions GROUP BY vocabulary_id) AS ts ON ts.vocabulary_id = v.id '
+    'WHERE v.is_deleted = 0 AND {condition}')
+
+# Запит, що обчислює денні підсумки тренувань з усієї історії сесій тренувань, згрупованої за "group_by".
+# Тривалість обчислюється в цілих секундах так само, як у get_training_duration_seconds
+TRAINING_DAILY_STATS_SELECT_SQL = (
+    'SELECT {group_by}, date(end_time), count(*), '
+    'coalesce(sum(number_correct_answers), 0), coalesce(sum(number_wrong_answers), 0), '
+    "coalesce(sum(strftime('%s', end_time) - strftime('%s', start_time)), 0) "
+    'FROM training_sessions WHERE end_time IS NOT NULL GROUP BY {group_by}, date(end_time)')
+
+TRAINING_DAILY_STATS_COLUMNS = 'day, sessions_count, number_correct_answers, number_wrong_answers, duration_seconds'
+
+VOCAB_SUMMARY_COLUMNS = ('vocabulary_id, user_id, name, description, created_at, '
+                         'wordpairs_count, number_errors, last_trained_at, best_accuracy')
+
 
 def create_database_tables() -> None:
-    """Створює всі таблиці у БД"""
+    """Створює всі таблиці у БД та індекси, яких ще немає в існуючих таблицях"""
     Base.metadata.create_all(bind=engine)
+
+    # "create_all" не додає нові індекси до таблиць, які вже існують у БД
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+    migrate_user_ids()
+    migrate_training_stats()
+    create_search_index()
+    migrate_vocab_summaries()
+    migrate_vocab_names()
+    create_vocab_name_index()
+
+
+def migrate_user_ids() -> None:
+    """Замінює telegram ID користувачів на їх ID в БД (users.id) у таблицях словників та сесій тренувань.
+
+    Notes:
+        Раніше у колонках "user_id" цих таблиць зберігався telegram ID користувача, хоча вони посилаються
+        на "users.id". Міграція виконується один раз: після неї версія БД (PRAGMA user_version) стає 1.
+    """
+    with engine.begin() as connection:
+        database_version: int = connection.execute(text('PRAGMA user_version')).scalar()
+        if database_version >= USER_IDS_MIGRATION_VERSION:
+            return
+
+        # Під час заміни ID рядки тимчасово можуть збігатися за унікальним індексом назв словників,
+        # тому індекс видаляється (після міграцій унікальний індекс назв створює create_vocab_name_index)
+        connection.execute(text('DROP INDEX IF EXISTS uq_vocabularies_user_id_lower_name'))
+
+        for table_name in ('vocabularies', 'training_sessions'):
+            connection.execute(text(
+                f'UPDATE {table_name} SET user_id = ('
+                f'SELECT users.id FROM users WHERE users.user_id = {table_name}.user_id) '
+                f'WHERE EXISTS (SELECT 1 FROM users WHERE users.user_id = {table_name}.user_id)'))
+        connection.execute(text(f'PRAGMA user_version = {USER_IDS_MIGRATION_VERSION}'))
+
+
+def migrate_training_stats() -> None:
+    """Обчислює денні підсумки тренувань для наявної історії сесій тренувань.
+
+    Notes:
+        Міграція виконується один раз: після неї версія БД (PRAGMA user_version) стає 2,
+        а денні підсумки оновлюються після кожного збереженого тренування (див. TrainingStatsCRUD).
+    """
+    with engine.begin() as connection:
+        database_version: int = connection.execute(text('PRAGMA user_version')).scalar()
+        if database_version >= TRAINING_STATS_MIGRATION_VERSION:
+            return
+
+        backfill_training_stats(connection)
+        connection.execute(text(f'PRAGMA user_version = {TRAINING_STATS_MIGRATION_VERSION}'))
+
+
+def backfill_training_stats(connection: Connection) -> None:
+    """Перебудовує денні підсумки тренувань користувачів та словників з усієї історії сесій тренувань.
+
+    Notes:
+        Підсумки обчислюються запитами INSERT ... SELECT з групуванням за днями, а не по одній сесії,
+        тому перебудова не потребує завантаження сесій тренувань у Python.
+    """
+    for table_name, group_by in (('user_daily_stats', 'user_id'),
+                                 ('vocab_daily_stats', 'vocabulary_id, user_id')):
+        connection.execute(text(f'DELETE FROM {table_name}'))
+        connection.execute(text(
+            f'INSERT INTO {table_name} ({group_by}, {TRAINING_DAILY_STATS_COLUMNS}) '
+            + TRAINING_DAILY_STATS_SELECT_SQL.format(group_by=group_by)))
+
+
+def migrate_vocab_names() -> None:
+    """Додає до таблиці словників нормалізовану назву (normalized_name) та заповнює її для наявних словників.
+
+    Notes:
+        Вбудована функція SQLite "lower()" змінює регістр лише ASCII-символів, тому попередній індекс
+        за виразом "lower(name)" вважав назви "Слова" та "слова" різними. Нормалізовану назву (str.casefold)
+        обчислює Python, тому вона записується для кожного словника окремим параметром одного UPDATE.
+        Словники з однаковими нормалізованими назвами, створені до міграції, не перейменовуються:
+        до нормалізованої назви всіх, крім першого, додається "#<ID словника>" (символ "#" не може бути
+        у назві словника), тому вони не порушують унікальний індекс, а нові словники з такою назвою не додаються.
+        Міграція виконується один раз: після неї версія БД (PRAGMA user_version) стає 4.
+    """
+    with engine.begin() as connection:
+        database_version: int = connection.execute(text('PRAGMA user_version')).scalar()
+        if database_version >= VOCAB_NAMES_MIGRATION_VERSION:
+            return
+
+        column_names: set[str] = {row.name for row in connection.execute(text('PRAGMA table_info(vocabularies)'))}
+        if 'normalized_name' not in column_names:
+            connection.execute(text(
+                "ALTER TABLE vocabularies ADD COLUMN normalized_name VARCHAR(50) NOT NULL DEFAULT ''"))
+        connection.execute(text('DROP INDEX IF EXISTS uq_vocabularies_user_id_lower_name'))
+
+        used_names: set[tuple[int, str]] = set()
+        normalized_names: list[dict[str, Any]] = []
+        for vocab_id, user_db_id, name, is_deleted in connection.execute(text(
+                'SELECT id, user_id, name, is_deleted FROM vocabularies ORDER BY id')):
+            normalized_name: str = name.casefold()
+            if not is_deleted and (user_db_id, normalized_name) in used_names:
+                normalized_name = f'{normalized_name}#{vocab_id}'
+            elif not is_deleted:
+                used_names.add((user_db_id, normalized_name))
+            normalized_names.append({'id': vocab_id, 'normalized_name': normalized_name})
+
+        if normalized_names:
+            connection.execute(text('UPDATE vocabularies SET normalized_name = :normalized_name WHERE id = :id'),
+                               normalized_names)
+        connection.execute(text(f'PRAGMA user_version = {VOCAB_NAMES_MIGRATION_VERSION}'))
+
+
+def create_vocab_name_index() -> None:
+    """Створює унікальний індекс назв користувацьких словників (без урахування регістру), якщо його ще немає.
+
+    Notes:
+        Індекс побудований за нормалізованою назвою (normalized_name), яка в наявних БД зʼявляється
+        лише після міграції (див. migrate_vocab_names), тому не описаний у моделі "Vocabulary".
+        Видалені словники до індексу не входять, тому їх назви можна використовувати повторно.
+        Умова індексу записана так само, як SQLAlchemy записує умову "~Vocabulary.is_deleted" для SQLite,
+        інакше SQLite не використовує частковий індекс у запитах.
+    """
+    with engine.begin() as connection:
+        connection.execute(text(
+            'CREATE UNIQUE INDEX IF NOT EXISTS uq_vocabularies_user_id_normalized_name '
+            'ON vocabularies (user_id, normalized_name) WHERE is_deleted = 0'))
+
+
+def create_search_index() -> None:
+    """Створює повнотекстовий індекс словникових пар (SQLite FTS5), якщо його ще немає,
+    та додає до нього всі наявні словникові пари.
+
+    Notes:
+        Індекс "wordpair_search" містить слова, переклади, транскрипції та анотацію кожної словникової пари,
+        а його "rowid" збігається з ID словникової пари.
+    """
+    with engine.begin() as connection:
+        is_index_exists: bool = connection.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'wordpair_search'")).first() is not None
+        if is_index_exists:
+            return
+
+        connection.execute(text(
+            'CREATE VIRTUAL TABLE wordpair_search USING fts5('
+            'words, translations, transcriptions, annotation, '
+            "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"))
+        connection.execute(text(SEARCH_INDEX_INSERT_SQL.format(condition='1')))
+
+
+def migrate_vocab_summaries() -> None:
+    """Будує зведені дані словників (vocab_summaries) для наявних словників.
+
+    Notes:
+        Міграція виконується один раз: після неї версія БД (PRAGMA user_version) стає 3, а зведені дані
+        оновлюються разом зі змінами вихідних таблиць (див. VocabSummaryCRUD). Повна перевірка узгодженості
+        читає всі словники, словникові пари та сесії тренувань, тому під час запуску бота більше не виконується
+        (див. команду обслуговування БД lingoro_bot.db.maintenance).
+    """
+    with engine.connect() as connection:
+        database_version: int = connection.execute(text('PRAGMA user_version')).scalar()
+    if database_version >= VOCAB_SUMMARIES_MIGRATION_VERSION:
+        return
+
+    check_vocab_summaries()
+    with engine.begin() as connection:
+        connection.execute(text(f'PRAGMA user_version = {VOCAB_SUMMARIES_MIGRATION_VERSION}'))
+
+
+def check_vocab_summaries() -> int:
+    """Перевіряє узгодженість зведених даних словників (vocab_summaries) з вихідними таблицями
+    та перебудовує неузгоджені рядки.
+
+    Notes:
+        Неузгодженими є рядки, яких немає в одній з частин порівняння (EXCEPT в обидва боки): відсутні,
+        застарілі та рядки видалених словників. Вони видаляються та додаються знову одним
+        INSERT ... SELECT, тому перебудова виконується запитами над множинами, а не по одному словнику.
+        Для БД, у якій ще немає зведених даних, це повна побудова таблиці.
+
+    Returns:
+        int: Кількість перебудованих (неузгоджених) словників.
+    """
+    expected_sql: str = VOCAB_SUMMARY_SELECT_SQL.format(condition='1')
+    actual_sql: str = f'SELECT {VOCAB_SUMMARY_COLUMNS} FROM vocab_summaries'
+    inconsistent_ids_sql: str = (f'SELECT vocabulary_id FROM ({expected_sql} EXCEPT {actual_sql}) '
+                                 f'UNION SELECT vocabulary_id FROM ({actual_sql} EXCEPT {expected_sql})')
+
+    with engine.begin() as connection:
+        inconsistent_count: int = connection.execute(text(
+            f'SELECT count(*) FROM ({inconsistent_ids_sql})')).scalar()
+        if inconsistent_count == 0:
+            return 0
+
+        connection.execute(text(f'DELETE FROM vocab_summaries WHERE vocabulary_id IN ({inconsistent_ids_sql})'))
+        connection.execute(text(
+            f'INSERT INTO vocab_summaries ({VOCAB_SUMMARY_COLUMNS}) ' + VOCAB_SUMMARY_SELECT_SQL.format(
+                condition='v.id NOT IN (SELECT vocabulary_id FROM vocab_summaries)')))
+    return inconsistent_count
@@ -0,0 +1,27 @@
+import json
+import logging
+import logging.config
+
+from lingoro_bot.db import models  # noqa: F401 (моделі реєструються у Base.metadata під час імпорту)
+from lingoro_bot.db.database import check_vocab_summaries, create_database_tables
+
+
+def main() -> None:
+    """Команда обслуговування БД: перевіряє узгодженість зведених даних словників та перебудовує застарілі рядки.
+    Виконується вручну (python -m lingoro_bot.db.maintenance), а не під час кожного запуску бота,
+    бо перевірка читає всі словники, словникові пари та сесії тренувань.
+    """
+    with open('logging.conf') as file:
+        logging_config: dict = json.load(file)
+    logging.config.dictConfig(logging_config)
+
+    logger: logging.Logger = logging.getLogger()
+
+    create_database_tables()
+
+    rebuilt_count: int = check_vocab_summaries()
+    logger.info(f'Перевірено зведені дані словників. Перебудовано неузгоджених словників: {rebuilt_count}')
+
+
+if __name__ == '__main__':
+    main()
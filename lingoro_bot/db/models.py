@@ -1,6 +1,19 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    UniqueConstraint,
+    desc,
+)
 
 from lingoro_bot.db.database import Base
 
@@ -24,9 +37,13 @@ class Vocabulary(Base):
     """Таблиця словників"""
 
     __tablename__: str = 'vocabularies'
+    __table_args__ = (
+        Index('ix_vocabularies_user_id_created_at_id', 'user_id', 'created_at', 'id'),
+    )
 
     id = Column(Integer, primary_key=True)
     name = Column(String(50), nullable=False)
+    normalized_name = Column(String(50), nullable=False)  # Назва без урахування регістру (str.casefold)
     description = Column(String(100))
     number_errors = Column(Integer, default=0)
     is_deleted = Column(Boolean, default=False)
@@ -35,10 +52,41 @@ class Vocabulary(Base):
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
 
 
+class VocabSummary(Base):
+    """Таблиця зведених даних не видалених словників (денормалізована, для списків та заголовків словників).
+
+    Notes:
+        Оновлюється разом зі змінами вихідних таблиць (див. VocabSummaryCRUD), а її узгодженість з ними
+        перевіряється командою обслуговування БД (див. check_vocab_summaries).
+    """
+
+    __tablename__: str = 'vocab_summaries'
+    __table_args__ = (
+        Index('ix_vocab_summaries_user_id_created_at_vocabulary_id', 'user_id', 'created_at', 'vocabulary_id'),
+    )
+
+    vocabulary_id = Column(Integer, ForeignKey('vocabularies.id'), primary_key=True)
+    user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+
+    name = Column(String(50), nullable=False)
+    description = Column(String(100))
+    created_at = Column(DateTime(timezone=True))
+
+    wordpairs_count = Column(Integer, nullable=False, default=0)
+    number_errors = Column(Integer, nullable=False, default=0)  # Сума помилок словникових пар словника
+
+    last_trained_at = Column(DateTime(timezone=True))  # Час завершення останнього тренування
+    best_accuracy = Column(Float)  # Найкраща частка правильних відповідей серед завершених тренувань
+
+
 class Wordpair(Base):
     """Таблиця словникових пар словника"""
 
     __tablename__: str = 'wordpairs'
+    __table_args__ = (
+        Index('ix_wordpairs_vocabulary_id_id', 'vocabulary_id', 'id'),
+        Index('ix_wordpairs_vocabulary_id_number_errors_id', 'vocabulary_id', desc('number_errors'), 'id'),
+    )
 
     id = Column(Integer, primary_key=True)
     annotation = Column(String(50))
@@ -53,6 +101,9 @@ class WordpairWord(Base):
     """Таблиця зв'язків між словниковими парами та словами"""
 
     __tablename__: str = 'wordpair_words'
+    __table_args__ = (
+        Index('ix_wordpair_words_wordpair_id', 'wordpair_id'),
+    )
 
     id = Column(Integer, primary_key=True)
 
@@ -64,6 +115,9 @@ class WordpairTranslation(Base):
     """Таблиця зв'язків між словниковими парами та перекладами"""
 
     __tablename__: str = 'wordpair_translations'
+    __table_args__ = (
+        Index('ix_wordpair_translations_wordpair_id', 'wordpair_id'),
+    )
 
     id = Column(Integer, primary_key=True)
 
@@ -112,3 +166,135 @@ class TrainingSession(Base):
 
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
     vocabulary_id = Column(Integer, ForeignKey('vocabularies.id'), nullable=False)
+
+
+class WordpairStat(Base):
+    """Таблиця статистики словникових пар користувача за напрямками перекладу (W -> T та T -> W).
+
+    Notes:
+        Оновлюється пакетом після завершення тренування (див. WordpairStatCRUD). Частка невдалих спроб
+        (error_rate) зберігається, щоб найслабші словникові пари словника обиралися за індексом без сортування.
+    """
+
+    __tablename__: str = 'wordpair_stats'
+    __table_args__ = (
+        Index('ix_wordpair_stats_vocabulary_id_direction_error_rate',
+              'vocabulary_id', 'direction', desc('error_rate'), 'wordpair_id'),
+    )
+
+    user_id = Column(Integer, ForeignKey('users.id'), primary_key=True)
+    wordpair_id = Column(Integer, ForeignKey('wordpairs.id'), primary_key=True)
+    direction = Column(String(10), primary_key=True)  # Напрямок перекладу ("direct" або "reverse")
+    vocabulary_id = Column(Integer, ForeignKey('vocabularies.id'), nullable=False)
+
+    attempts = Column(Integer, nullable=False, default=0)  # Кількість відповідей
+    number_errors = Column(Integer, nullable=False, default=0)  # Кількість неправильних відповідей
+    number_hints = Column(Integer, nullable=False, default=0)  # Кількість показів анотації
+    number_translation_shown = Column(Integer, nullable=False, default=0)
+    error_rate = Column(Float, nullable=False, default=0)  # Частка невдалих спроб (див. calculate_error_rate)
+
+    last_seen_at = Column(DateTime(timezone=True))  # Час останньої дії зі словниковою парою під час тренування
+
+
+class AnswerEvent(Base):
+    """Таблиця подій відповідей під час тренувань (лише додавання, див. AnswerEventLog)"""
+
+    __tablename__: str = 'answer_events'
+    __table_args__ = (
+        Index('ix_answer_events_user_id_wordpair_id', 'user_id', 'wordpair_id'),
+    )
+
+    id = Column(Integer, primary_key=True)
+    training_mode = Column(String(50))
+    verdict = Column(String(10), nullable=False)  # Результат перевірки відповіді ("exact", "near" або "wrong")
+    latency_ms = Column(Integer)  # Час від показу словникової пари до відповіді (у мілісекундах)
+    is_hint_used = Column(Boolean, nullable=False, default=False)  # Чи була показана анотація перед відповіддю
+
+    created_at = Column(DateTime(timezone=True), nullable=False)
+
+    user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+    wordpair_id = Column(Integer, ForeignKey('wordpairs.id'), nullable=False)
+
+
+class UserDailyStat(Base):
+    """Таблиця денних підсумків тренувань користувача (день визначається за часом завершення тренування).
+
+    Notes:
+        Оновлюється після кожного збереженого тренування (див. TrainingStatsCRUD), а для наявної історії
+        тренувань обчислюється під час міграції БД (див. backfill_training_stats).
+    """
+
+    __tablename__: str = 'user_daily_stats'
+
+    user_id = Column(Integer, ForeignKey('users.id'), primary_key=True)
+    day = Column(Date, primary_key=True)
+
+    sessions_count = Column(Integer, nullable=False, default=0)
+    number_correct_answers = Column(Integer, nullable=False, default=0)
+    number_wrong_answers = Column(Integer, nullable=False, default=0)
+    duration_seconds = Column(Integer, nullable=False, default=0)  # Сумарна тривалість тренувань (у секундах)
+
+
+class VocabDailyStat(Base):
+    """Таблиця денних підсумків тренувань словника (оновлюється разом з UserDailyStat)"""
+
+    __tablename__: str = 'vocab_daily_stats'
+    __table_args__ = (
+        Index('ix_vocab_daily_stats_user_id_day', 'user_id', 'day'),
+    )
+
+    vocabulary_id = Column(Integer, ForeignKey('vocabularies.id'), primary_key=True)
+    day = Column(Date, primary_key=True)
+    user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+
+    sessions_count = Column(Integer, nullable=False, default=0)
+    number_correct_answers = Column(Integer, nullable=False, default=0)
+    number_wrong_answers = Column(Integer, nullable=False, default=0)
+    duration_seconds = Column(Integer, nullable=False, default=0)  # Сумарна тривалість тренувань (у секундах)
+
+
+class WordpairReview(Base):
+    """Таблиця стану інтервального повторення (SM-2) словникових пар користувача"""
+
+    __tablename__: str = 'wordpair_reviews'
+    __table_args__ = (
+        UniqueConstraint('user_id', 'wordpair_id', name='uq_wordpair_reviews_user_id_wordpair_id'),
+        Index('ix_wordpair_reviews_user_id_due_at', 'user_id', 'due_at'),
+    )
+
+    id = Column(Integer, primary_key=True)
+
+    ease_factor = Column(Float, nullable=False)  # Коефіцієнт легкості
+    interval_days = Column(Integer, nullable=False)  # Поточний інтервал між повтореннями (у днях)
+    repetitions = Column(Integer, nullable=False)  # Кількість успішних повторень поспіль
+
+    due_at = Column(DateTime(timezone=True), nullable=False)  # Час наступного повторення
+    last_reviewed_at = Column(DateTime(timezone=True))
+
+    user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+    wordpair_id = Column(Integer, ForeignKey('wordpairs.id'), nullable=False)
+
+
+class TrainingCheckpoint(Base):
+    """Таблиця збереженого прогресу незавершених тренувань (не більше одного тренування на користувача).
+
+    Notes:
+        Прогрес тренування (черга словникових пар, лічильники та статистика словникових пар) зберігається
+        у компактному бінарному вигляді (див. encode_training_progress) не частіше, ніж кожні
+        CHECKPOINT_PROGRESS_INTERVAL відповідей або CHECKPOINT_TIME_INTERVAL секунд.
+        Покинуті тренування завершуються у фоновому завданні (див. sweep_abandoned_checkpoints).
+    """
+
+    __tablename__: str = 'training_checkpoints'
+    __table_args__ = (
+        Index('ix_training_checkpoints_updated_at', 'updated_at'),
+    )
+
+    user_id = Column(Integer, ForeignKey('users.id'), primary_key=True)
+    vocabulary_id = Column(Integer, ForeignKey('vocabularies.id'))  # None для змішаного тренування
+    training_mode = Column(String(50), nullable=False)
+
+    start_time = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)  # Час останнього збереження прогресу
+
+    progress = Column(LargeBinary, nullable=False)
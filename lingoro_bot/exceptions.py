@@ -8,3 +8,15 @@ class InvalidVocabIndexError(Exception):
     """Виняток, якщо у БД немає словника з заданим ID"""
 
     pass
+
+
+class VocabNameNotUniqueError(Exception):
+    """Виняток, якщо у БД користувача вже є словник з такою назвою"""
+
+    pass
+
+
+class AnkiPackageError(Exception):
+    """Виняток, якщо файл не є підтримуваним Anki-пакетом (.apkg)"""
+
+    pass
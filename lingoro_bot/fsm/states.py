@@ -7,5 +7,14 @@ class VocabCreation(StatesGroup):
     waiting_for_wordpairs = State()  # Стан очікування словникових пар
 
 
+class VocabImport(StatesGroup):
+    waiting_for_anki_file = State()  # Стан очікування Anki-пакета (.apkg)
+
+
 class VocabTraining(StatesGroup):
     waiting_for_translation = State()  # Стан очікування перекладу
+    waiting_for_quiz_sheet_answers = State()  # Стан очікування перекладів усіх питань аркуша (одним повідомленням)
+
+
+class WordpairSearch(StatesGroup):
+    waiting_for_query = State()  # Стан очікування пошукового запиту
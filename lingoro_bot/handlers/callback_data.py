@@ -6,12 +6,49 @@ class VocabCallback(CallbackData, prefix='vocab'):
 
 
 class PaginationCallback(CallbackData, prefix='pagination'):
-    name: str  # Ім'я
-    page: int  # Номер сторінки
-    limit: int  # Ліміт словників на сторінці
+    name: str  # Ім'я розділу, до якого належить сторінка
+    cursor_id: int  # ID словника, після (або перед) якого починається сторінка
+    is_backward: bool  # Прапор, чи потрібна сторінка перед курсором
+
+
+class MixedVocabCallback(CallbackData, prefix='mixed_vocab'):
+    """Обробляє вибір словника (або скасування вибору) для змішаного тренування"""
+
+    vocab_id: int  # ID користувацького словника
+    cursor_id: int  # Курсор сторінки словників, на якій знаходиться кнопка
+    is_backward: bool  # Прапор, чи сторінка перед курсором
 
 
 class CancelProcessCallback(CallbackData, prefix='cancel_process'):
     """Обробляє процес скасування на різних етапах"""
 
     action: str  # Етап, до якого потрібно повернутися при скасуванні
+
+
+class TrainingChoiceCallback(CallbackData, prefix='training_choice'):
+    """Обробляє вибір варіанту відповіді під час тренування з вибором відповіді"""
+
+    wordpair_idx: int  # Індекс словникової пари у тренуванні
+    option_idx: int  # Індекс обраного варіанту відповіді
+
+
+class SearchPageCallback(CallbackData, prefix='search_page'):
+    """Обробляє перехід між сторінками результатів пошуку словникових пар"""
+
+    cursor_id: int  # ID словникової пари, після (або перед) якої починається сторінка
+    is_backward: bool  # Прапор, чи потрібна сторінка перед курсором
+
+
+class VocabWordpairsPageCallback(CallbackData, prefix='vocab_wordpairs_page'):
+    """Обробляє перехід між сторінками словникових пар в інформації про словник"""
+
+    vocab_id: int  # ID користувацького словника
+    cursor_id: int  # ID словникової пари, після (або перед) якої починається сторінка
+    cursor_number: int  # Порядковий номер словникової пари-курсора у списку
+    is_backward: bool  # Прапор, чи потрібна сторінка перед курсором
+
+
+class StatsPeriodCallback(CallbackData, prefix='stats_period'):
+    """Обробляє вибір періоду статистики тренувань"""
+
+    period: str  # Період статистики ("day", "week" або "month")
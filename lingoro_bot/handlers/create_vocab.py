@@ -6,9 +6,10 @@ from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State
 from aiogram.types.inline_keyboard_markup import InlineKeyboardMarkup
 
+from lingoro_bot.custom_types.vocab_types import VocabsPageType
 from lingoro_bot.db.crud import VocabCRUD
 from lingoro_bot.db.database import Session
-from lingoro_bot.exceptions import UserNotFoundError
+from lingoro_bot.exceptions import VocabNameNotUniqueError
 from lingoro_bot.filters.check_empty_filters import CheckEmptyFilter
 from lingoro_bot.fsm import states
 from lingoro_bot.keyboards.create_vocab_kb import (
@@ -30,6 +31,7 @@ from lingoro_bot.text_data import (
     MSG_ERROR_VOCAB_DESCRIPTION_INVALID,
     MSG_ERROR_VOCAB_NAME_DUPLICATE,
     MSG_ERROR_VOCAB_NAME_INVALID,
+    MSG_ERROR_VOCAB_NAME_TAKEN,
     MSG_ERROR_WORDPAIRS_NO_VALID,
     MSG_INFO_ADDED_WORDPAIRS,
     MSG_INFO_NO_ADDED_WORDPAIRS,
@@ -37,6 +39,7 @@ from lingoro_bot.text_data import (
     MSG_SUCCESS_VOCAB_SAVED_TO_DB,
 )
 from lingoro_bot.tools import fsm_utils, vocab_utils, wordpair_utils
+from lingoro_bot.tools.user_cache import get_vocabs_page, reset_user_cache
 from lingoro_bot.tools.vocab_utils import add_vocab_data_to_message
 from lingoro_bot.validators.vocab.vocab_description_validator import VocabDescriptionValidator
 from lingoro_bot.validators.vocab.vocab_name_validator import VocabNameValidator
@@ -68,7 +71,10 @@ async def process_create_vocab(callback: types.CallbackQuery, state: FSMContext)
 
 
 @router.message(states.VocabCreation.waiting_for_vocab_name)
-async def process_create_vocab_name(message: types.Message, state: FSMContext) -> None:
+async def process_create_vocab_name(message: types.Message,
+                                    state: FSMContext,
+                                    session: Session,
+                                    user_db_id: int) -> None:
     """Обробляє назву користувацького словника, введену користувачем"""
     data_fsm: dict[str, Any] = await state.get_data()
 
@@ -88,9 +94,7 @@ async def process_create_vocab_name(message: types.Message, state: FSMContext) -
         await message.answer(text=msg_name_duplicate, reply_markup=kb)
         return  # Завершення обробки
 
-    user_id: int = message.from_user.id
-    with Session() as session:
-        validator_vocab_name = VocabNameValidator(vocab_name, user_id, session)
+    validator_vocab_name = VocabNameValidator(vocab_name, user_db_id, session)
 
     if validator_vocab_name.is_valid():
         kb: InlineKeyboardMarkup = get_kb_create_vocab_description()
@@ -304,7 +308,10 @@ async def process_create_wordpairs_status(callback: types.CallbackQuery, state:
 
 
 @router.callback_query(F.data == 'save_vocab')
-async def process_save_vocab(callback: types.CallbackQuery, state: FSMContext) -> None:
+async def process_save_vocab(callback: types.CallbackQuery,
+                             state: FSMContext,
+                             session: Session,
+                             user_db_id: int) -> None:
     """Відстежує натискання на кнопку "Зберегти" під час введення словникових пар.
     Якщо є додані валідні словникові пари, то створює в БД користувацький словник з ними.
     """
@@ -332,27 +339,27 @@ async def process_save_vocab(callback: types.CallbackQuery, state: FSMContext) -
     logger.info('FSM стан та FSM-Cache очищено після збереження користувацького словника')
 
     user_id: int = callback.from_user.id
-    msg_vocab_saved_with_choose: str = '\n\n'.join((MSG_SUCCESS_VOCAB_SAVED_TO_DB.format(name=vocab_name),
-                                                    MSG_CHOOSE_VOCAB))
+    msg_vocab_saved: str = MSG_SUCCESS_VOCAB_SAVED_TO_DB.format(name=vocab_name)
 
     # Список словникових пар із розділеними компонентами
     vocab_wordpairs: list[dict] = [wordpair_utils.parse_wordpair_components(wordpair)
                                    for wordpair in wordpairs]
 
+    vocab_crud = VocabCRUD(session)
     try:
-        with Session() as session:
-            vocab_crud = VocabCRUD(session)
-            vocab_crud.create_new_vocab(user_id, vocab_name, vocab_description, vocab_wordpairs)
+        vocab_crud.create_new_vocab(user_db_id, vocab_name, vocab_description, vocab_wordpairs)
 
-            logger.info(f'До БД доданий користувацький словник. Назва: "{vocab_name}". USER_ID: {user_id}')
+        logger.info(f'До БД доданий користувацький словник. Назва: "{vocab_name}". USER_ID: {user_id}')
+        reset_user_cache(user_db_id)
+    except VocabNameNotUniqueError as e:
+        # Словник з такою ж назвою був створений вже після перевірки назви
+        logger.warning(e)
+        msg_vocab_saved = MSG_ERROR_VOCAB_NAME_TAKEN.format(name=vocab_name)
 
-            # Дані всіх користувацьких словників користувача
-            all_vocabs_data: list[dict] = vocab_crud.get_all_vocabs_data(user_id)
-    except UserNotFoundError as e:
-        logger.error(e)
-        return
+    vocabs_page: VocabsPageType = get_vocabs_page(vocab_crud, user_db_id)  # Перша сторінка словників
 
-    kb: InlineKeyboardMarkup = get_kb_vocab_selection_base(all_vocabs_data[::-1])
+    msg_vocab_saved_with_choose: str = '\n\n'.join((msg_vocab_saved, MSG_CHOOSE_VOCAB))
+    kb: InlineKeyboardMarkup = get_kb_vocab_selection_base(vocabs_page)
     await callback.message.edit_text(text=msg_vocab_saved_with_choose, reply_markup=kb)
 
 
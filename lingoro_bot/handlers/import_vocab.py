@@ -0,0 +1,168 @@
+import asyncio
+import logging
+import tempfile
+from pathlib import Path
+
+from aiogram import F, Router, types
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.state import State
+from aiogram.types.inline_keyboard_markup import InlineKeyboardMarkup
+
+from lingoro_bot.config import ANKI_MAX_FILE_SIZE
+from lingoro_bot.custom_types.vocab_types import VocabsPageType
+from lingoro_bot.db.crud import VocabCRUD
+from lingoro_bot.db.database import Session
+from lingoro_bot.exceptions import AnkiPackageError, VocabNameNotUniqueError
+from lingoro_bot.fsm import states
+from lingoro_bot.keyboards.vocab_base_kb import get_kb_import_anki_vocab, get_kb_vocab_selection_base
+from lingoro_bot.text_data import (
+    MSG_CHOOSE_VOCAB,
+    MSG_ERROR_ANKI_FILE_INVALID,
+    MSG_ERROR_ANKI_FILE_TOO_LARGE,
+    MSG_ERROR_ANKI_NO_VALID_NOTES,
+    MSG_ERROR_ANKI_PACKAGE,
+    MSG_ERROR_VOCAB_NAME_INVALID,
+    MSG_ERROR_VOCAB_NAME_TAKEN,
+    MSG_INFO_ANKI_IMPORT_STARTED,
+    MSG_SEND_ANKI_FILE,
+    MSG_SUCCESS_ANKI_IMPORTED,
+)
+from lingoro_bot.tools import fsm_utils
+from lingoro_bot.tools.anki_utils import iter_staged_wordpairs, stage_anki_wordpairs
+from lingoro_bot.tools.user_cache import get_vocabs_page, reset_user_cache
+from lingoro_bot.validators.vocab.vocab_name_validator import VocabNameValidator
+
+router = Router(name='import_vocab')
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@router.callback_query(F.data == 'import_anki_vocab')
+async def process_import_anki_vocab(callback: types.CallbackQuery, state: FSMContext) -> None:
+    """Відстежує натискання на кнопку "Імпорт з Anki" у розділі "База словників".
+    Переводить FSM стан в очікування Anki-пакета.
+    """
+    user_id: int = callback.from_user.id
+    logger.info(f'Початок процесу "імпорт користувацького словника з Anki". USER_ID: {user_id}')
+
+    await state.clear()
+    logger.info('FSM стан та FSM-Cache очищено перед імпортом користувацького словника')
+
+    new_state: State = states.VocabImport.waiting_for_anki_file
+    await fsm_utils.save_current_fsm_state(state, new_state)
+    logger.info(f'FSM стан змінено на "{new_state}"')
+
+    kb: InlineKeyboardMarkup = get_kb_import_anki_vocab()
+    await callback.message.edit_text(text=MSG_SEND_ANKI_FILE, reply_markup=kb)
+
+
+@router.message(states.VocabImport.waiting_for_anki_file)
+async def process_anki_file(message: types.Message, state: FSMContext, session: Session, user_db_id: int) -> None:
+    """Обробляє Anki-пакет, надісланий користувачем.
+    Створює в БД користувацький словник з валідних нотаток колоди.
+    """
+    document: types.Document | None = message.document
+    kb: InlineKeyboardMarkup = get_kb_import_anki_vocab()
+
+    if document is None or not (document.file_name or '').lower().endswith('.apkg'):
+        logger.warning('Надіслано не Anki-пакет')
+        await message.answer(text=MSG_ERROR_ANKI_FILE_INVALID, reply_markup=kb)
+        return  # Завершення обробки
+
+    if document.file_size is not None and document.file_size > ANKI_MAX_FILE_SIZE:
+        logger.warning(f'Anki-пакет занадто великий. Розмір: {document.file_size} байт')
+        msg_error_too_large: str = MSG_ERROR_ANKI_FILE_TOO_LARGE.format(max_size=ANKI_MAX_FILE_SIZE // (1024 * 1024))
+        await message.answer(text=msg_error_too_large, reply_markup=kb)
+        return  # Завершення обробки
+
+    user_id: int = message.from_user.id
+    vocab_name: str = Path(document.file_name).stem.strip()
+    logger.info(f'Отримано Anki-пакет. Назва словника: "{vocab_name}". USER_ID: {user_id}')
+
+    validator_vocab_name = VocabNameValidator(vocab_name, user_db_id, session)
+
+    if not validator_vocab_name.is_valid():
+        formatted_vocab_name_errors: str = validator_vocab_name.format_errors()
+        msg_error_name_invalid: str = MSG_ERROR_VOCAB_NAME_INVALID.format(name=vocab_name,
+                                                                          errors=formatted_vocab_name_errors)
+        await message.answer(text=msg_error_name_invalid, reply_markup=kb)
+        return  # Завершення обробки
+
+    await message.answer(text=MSG_INFO_ANKI_IMPORT_STARTED.format(name=vocab_name))
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            apkg_path = Path(temp_dir, 'deck.apkg')
+            await message.bot.download(document, destination=apkg_path)
+
+            # Читання колоди та запис у БД блокують, тому виконуються поза циклом подій
+            # (у власній сесії БД, бо сесія оновлення не може використовуватися з іншого потоку)
+            imported_count, skipped_count = await asyncio.to_thread(_import_anki_package,
+                                                                    apkg_path,
+                                                                    user_db_id,
+                                                                    vocab_name)
+    except AnkiPackageError as e:
+        logger.warning(e)
+        await message.answer(text=MSG_ERROR_ANKI_PACKAGE.format(error=e), reply_markup=kb)
+        return
+    except VocabNameNotUniqueError as e:
+        # Словник з такою ж назвою був створений вже після перевірки назви
+        logger.warning(e)
+        await message.answer(text=MSG_ERROR_VOCAB_NAME_TAKEN.format(name=vocab_name), reply_markup=kb)
+        return
+
+    if imported_count == 0:
+        logger.warning('У колоді Anki немає валідних нотаток. Не вдалося створити користувацький словник')
+        await message.answer(text=MSG_ERROR_ANKI_NO_VALID_NOTES, reply_markup=kb)
+        return  # Завершення обробки
+
+    logger.info(f'До БД імпортовано користувацький словник з Anki. Назва: "{vocab_name}". '
+                f'Додано: {imported_count}. Пропущено: {skipped_count}. USER_ID: {user_id}')
+
+    reset_user_cache(user_db_id)
+
+    await state.clear()
+    logger.info('FSM стан та FSM-Cache очищено після імпорту користувацького словника')
+
+    vocab_crud = VocabCRUD(session)
+    vocabs_page: VocabsPageType = get_vocabs_page(vocab_crud, user_db_id)  # Перша сторінка словників
+
+    msg_imported_with_choose: str = '\n\n'.join((MSG_SUCCESS_ANKI_IMPORTED.format(name=vocab_name,
+                                                                                 imported_count=imported_count,
+                                                                                 skipped_count=skipped_count),
+                                                 MSG_CHOOSE_VOCAB))
+    kb: InlineKeyboardMarkup = get_kb_vocab_selection_base(vocabs_page)
+    await message.answer(text=msg_imported_with_choose, reply_markup=kb)
+
+
+def _import_anki_package(apkg_path: Path, user_db_id: int, vocab_name: str) -> tuple[int, int]:
+    """Імпортує Anki-пакет у новий користувацький словник.
+
+    Notes:
+        Нотатки колоди спочатку перетворюються на словникові пари та записуються у тимчасовий файл,
+        і лише після цього додаються до БД. Тому транзакція запису не блокує інші записи до БД
+        на час розпакування, очищення та валідації колоди.
+
+    Args:
+        apkg_path (Path): Шлях до Anki-пакета.
+        user_db_id (int): ID користувача в БД.
+        vocab_name (str): Назва користувацького словника.
+
+    Returns:
+        tuple[int, int]: Кількість доданих словникових пар та кількість пропущених (не валідних) нотаток.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        staging_path = Path(temp_dir, 'wordpairs.jsonl')
+        valid_count, skipped_count = stage_anki_wordpairs(apkg_path, staging_path)
+
+        # Словник без словникових пар не створюється
+        if valid_count == 0:
+            return 0, skipped_count
+
+        with Session() as session:
+            vocab_crud = VocabCRUD(session)
+            imported_count: int = vocab_crud.create_new_vocab_from_chunks(
+                user_db_id=user_db_id,
+                vocab_name=vocab_name,
+                vocab_description=None,
+                wordpair_chunks=iter_staged_wordpairs(staging_path))
+    return imported_count, skipped_count
@@ -3,10 +3,7 @@ import logging
 from aiogram import F, Router, types
 from aiogram.filters import Command
 from aiogram.types.inline_keyboard_markup import InlineKeyboardMarkup
-from aiogram.types.user import User
 
-from lingoro_bot.db.crud import UserCRUD
-from lingoro_bot.db.database import Session
 from lingoro_bot.keyboards.menu_kb import get_kb_menu
 from lingoro_bot.text_data import MSG_TITLE_MENU, MSG_TITLE_MENU_FOR_NEW_USER
 
@@ -15,7 +12,7 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 
 @router.message(Command(commands=['start', 'menu']))
-async def cmd_menu(message: types.Message) -> None:
+async def cmd_menu(message: types.Message, is_new_user: bool) -> None:
     """Відстежує введення команди "help" та "menu".
     Перенаправляє до розділу "Головне меню".
     """
@@ -24,20 +21,10 @@ async def cmd_menu(message: types.Message) -> None:
     logger.info(f'Користувач ввів команду "{message.text}"')
     logger.info(f'Користувач перейшов до розділу "Головне меню". USER_ID: {user_id}')
 
-    tg_user_data: User = message.from_user
-
     kb: InlineKeyboardMarkup = get_kb_menu()
 
-    with Session() as session:
-        user_crud = UserCRUD(session)
-        user_id: int = tg_user_data.id
-
-        if user_crud.check_user_exists_in_db(user_id):
-            msg_title_menu: str = MSG_TITLE_MENU
-        else:
-            msg_title_menu: str = MSG_TITLE_MENU_FOR_NEW_USER
-            user_crud.create_new_user(tg_user_data)
-            logger.info(f'До БД був доданий користувач. USER_ID: {user_id}')
+    # Новий користувач реєструється у БД ще до хендлера (див. DatabaseMiddleware)
+    msg_title_menu: str = MSG_TITLE_MENU_FOR_NEW_USER if is_new_user else MSG_TITLE_MENU
     await message.answer(text=msg_title_menu, reply_markup=kb)
 
 
@@ -0,0 +1,219 @@
+import asyncio
+import logging
+from typing import Any
+
+from aiogram import F, Router, types
+from aiogram.filters import Command, CommandObject
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.state import State
+from aiogram.types import InlineQueryResultArticle, InputTextMessageContent
+from aiogram.types.inline_keyboard_markup import InlineKeyboardMarkup
+
+from lingoro_bot.config import INLINE_CACHE_TIME, INLINE_RESULTS_LIMIT, SEARCH_PAGE_SIZE, SEARCH_QUERY_MAX_LENGTH
+from lingoro_bot.custom_types.wordpair_types import WordpairSearchResultType
+from lingoro_bot.db.crud import SearchCRUD
+from lingoro_bot.db.database import Session
+from lingoro_bot.fsm import states
+from lingoro_bot.handlers.callback_data import SearchPageCallback
+from lingoro_bot.keyboards.search_kb import get_kb_search_query, get_kb_search_results
+from lingoro_bot.text_data import (
+    MSG_ENTER_SEARCH_QUERY,
+    MSG_ERROR_SEARCH_QUERY_INVALID,
+    MSG_INFO_SEARCH_NO_RESULTS,
+    MSG_SEARCH_RESULTS,
+)
+from lingoro_bot.tools import fsm_utils
+from lingoro_bot.tools.search_utils import PrefixIndex, build_search_match_query, format_search_results
+from lingoro_bot.tools.user_cache import prefix_index_cache
+
+router = Router(name='search')
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@router.callback_query(F.data == 'search')
+async def process_search(callback: types.CallbackQuery, state: FSMContext) -> None:
+    """Відстежує натискання на кнопку "Пошук слів".
+    Запускає очікування пошукового запиту.
+    """
+    user_id: int = callback.from_user.id
+    logger.info(f'Користувач перейшов до розділу "Пошук слів". USER_ID: {user_id}')
+
+    await start_waiting_for_query(state)
+    await callback.message.edit_text(text=MSG_ENTER_SEARCH_QUERY, reply_markup=get_kb_search_query())
+
+
+@router.message(Command(commands=['search']))
+async def cmd_search(message: types.Message,
+                     command: CommandObject,
+                     state: FSMContext,
+                     session: Session,
+                     user_db_id: int) -> None:
+    """Відстежує введення команди "search".
+    Якщо разом з командою введено пошуковий запит (/search кіт), то одразу відправляє результати пошуку,
+    інакше запускає очікування пошукового запиту.
+    """
+    user_id: int = message.from_user.id
+
+    logger.info(f'Користувач ввів команду "{message.text}"')
+    logger.info(f'Користувач перейшов до розділу "Пошук слів". USER_ID: {user_id}')
+
+    await start_waiting_for_query(state)
+
+    if command.args is None:
+        await message.answer(text=MSG_ENTER_SEARCH_QUERY, reply_markup=get_kb_search_query())
+    else:
+        await process_query(message, state, session, user_db_id, command.args)
+
+
+@router.message(states.WordpairSearch.waiting_for_query)
+async def process_search_query(message: types.Message, state: FSMContext, session: Session, user_db_id: int) -> None:
+    """Обробляє пошуковий запит, введений користувачем"""
+    await process_query(message, state, session, user_db_id, message.text or '')
+
+
+@router.callback_query(SearchPageCallback.filter())
+async def process_search_page(callback: types.CallbackQuery,
+                              callback_data: SearchPageCallback,
+                              state: FSMContext,
+                              session: Session,
+                              user_db_id: int) -> None:
+    """Відстежує натискання на кнопки переходу між сторінками результатів пошуку"""
+    data_fsm: dict[str, Any] = await state.get_data()
+
+    search_query: str | None = data_fsm.get('search_query')
+    match_query: str | None = data_fsm.get('search_match_query')
+
+    # Якщо дані пошуку вже видалені з FSM-Cache (наприклад, після переходу до іншого розділу)
+    if match_query is None:
+        logger.info('Дані пошуку відсутні у FSM-Cache')
+        await callback.answer()
+        return  # Завершення обробки
+
+    msg_text, kb = get_search_page(session=session,
+                                   user_db_id=user_db_id,
+                                   search_query=search_query,
+                                   match_query=match_query,
+                                   cursor_id=callback_data.cursor_id,
+                                   is_backward=callback_data.is_backward)
+    await callback.message.edit_text(text=msg_text, reply_markup=kb)
+
+
+async def start_waiting_for_query(state: FSMContext) -> None:
+    """Очищує FSM-Cache та змінює FSM стан на очікування пошукового запиту"""
+    await state.clear()
+    logger.info('FSM стан та FSM-Cache очищено перед пошуком словникових пар')
+
+    new_state: State = states.WordpairSearch.waiting_for_query
+    await fsm_utils.save_current_fsm_state(state, new_state)
+    logger.info(f'FSM стан змінено на "{new_state}"')
+
+
+async def process_query(message: types.Message,
+                        state: FSMContext,
+                        session: Session,
+                        user_db_id: int,
+                        search_query: str) -> None:
+    """Перевіряє пошуковий запит та відправляє першу сторінку результатів пошуку"""
+    search_query = search_query.strip()
+    logger.info(f'Введено пошуковий запит: "{search_query}"')
+
+    match_query: str | None = build_search_match_query(search_query)
+
+    if match_query is None or len(search_query) > SEARCH_QUERY_MAX_LENGTH:
+        logger.warning('Пошуковий запит не валідний')
+
+        msg_query_invalid: str = MSG_ERROR_SEARCH_QUERY_INVALID.format(max_length=SEARCH_QUERY_MAX_LENGTH)
+        await message.answer(text=msg_query_invalid, reply_markup=get_kb_search_query())
+        return  # Завершення обробки
+
+    await state.update_data(search_query=search_query, search_match_query=match_query)
+    logger.info('Пошуковий запит збережений у FSM-Cache')
+
+    msg_text, kb = get_search_page(session=session,
+                                   user_db_id=user_db_id,
+                                   search_query=search_query,
+                                   match_query=match_query,
+                                   cursor_id=0,
+                                   is_backward=False)
+    await message.answer(text=msg_text, reply_markup=kb)
+
+
+def get_search_page(session: Session,
+                    user_db_id: int,
+                    search_query: str,
+                    match_query: str,
+                    cursor_id: int,
+                    is_backward: bool) -> tuple[str, InlineKeyboardMarkup]:
+    """Повертає текст та клавіатуру сторінки результатів пошуку.
+
+    Notes:
+        З БД завантажується на одну словникову пару більше, ніж поміщається на сторінці,
+        щоб дізнатися, чи є наступна (або попередня) сторінка.
+    """
+    search_crud = SearchCRUD(session)
+    search_results: list[WordpairSearchResultType] = search_crud.search_wordpairs(user_db_id=user_db_id,
+                                                                                  match_query=match_query,
+                                                                                  cursor_id=cursor_id,
+                                                                                  is_backward=is_backward,
+                                                                                  limit=SEARCH_PAGE_SIZE + 1)
+
+    is_more_results: bool = len(search_results) > SEARCH_PAGE_SIZE
+
+    if is_backward:
+        page_results: list[WordpairSearchResultType] = search_results[-SEARCH_PAGE_SIZE:]
+        is_prev_page: bool = is_more_results
+        is_next_page: bool = True
+    else:
+        page_results: list[WordpairSearchResultType] = search_results[:SEARCH_PAGE_SIZE]
+        is_prev_page: bool = cursor_id != 0
+        is_next_page: bool = is_more_results
+
+    logger.info(f'Знайдено словникових пар на сторінці: {len(page_results)}')
+
+    if not page_results:
+        return MSG_INFO_SEARCH_NO_RESULTS.format(query=search_query), get_kb_search_results(None, None)
+
+    kb: InlineKeyboardMarkup = get_kb_search_results(
+        prev_cursor_id=page_results[0]['id'] if is_prev_page else None,
+        next_cursor_id=page_results[-1]['id'] if is_next_page else None)
+    msg_search_results: str = MSG_SEARCH_RESULTS.format(query=search_query,
+                                                        results=format_search_results(page_results))
+    return msg_search_results, kb
+
+
+@router.inline_query()
+async def process_inline_search(inline_query: types.InlineQuery, user_db_id: int) -> None:
+    """Відстежує inline-запити (@bot текст).
+    Відправляє підказки зі словниковими парами користувача, слова чи переклади яких починаються з тексту запиту.
+    """
+    user_id: int = inline_query.from_user.id
+
+    prefix_index: PrefixIndex | None = prefix_index_cache.get(user_db_id)
+    if prefix_index is None:
+        # Побудова індексу блокує, тому виконується поза циклом подій (лише при першому запиті користувача)
+        # у власній сесії БД, бо сесія оновлення не може використовуватися з іншого потоку
+        prefix_index = await asyncio.to_thread(_create_user_prefix_index, user_db_id)
+        prefix_index_cache.put(user_db_id, prefix_index)
+        logger.info(f'Побудовано індекс автодоповнення. Ключів: {len(prefix_index)}. USER_ID: {user_id}')
+
+    search_results: list[WordpairSearchResultType] = prefix_index.search(inline_query.query, INLINE_RESULTS_LIMIT)
+
+    inline_results: list[InlineQueryResultArticle] = [
+        InlineQueryResultArticle(
+            id=str(result['id']),
+            title=result['words'],
+            description=f'{result['translations']} ▪️ 📗 {result['vocab_name']}',
+            input_message_content=InputTextMessageContent(
+                message_text=f'{result['words']} ▪️ {result['translations']}'))
+        for result in search_results]
+
+    # Підказки залежать від словників користувача, тому Telegram кешує їх окремо для кожного користувача
+    await inline_query.answer(results=inline_results, cache_time=INLINE_CACHE_TIME, is_personal=True)
+
+
+def _create_user_prefix_index(user_db_id: int) -> PrefixIndex:
+    """Будує індекс автодоповнення за словниковими парами користувача"""
+    with Session() as session:
+        search_crud = SearchCRUD(session)
+        user_wordpairs: list[WordpairSearchResultType] = search_crud.get_user_wordpairs(user_db_id)
+    return PrefixIndex(user_wordpairs)
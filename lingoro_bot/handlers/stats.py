@@ -0,0 +1,127 @@
+import logging
+from datetime import date, timedelta
+
+from aiogram import F, Router, types
+from aiogram.filters import Command
+from aiogram.types.inline_keyboard_markup import InlineKeyboardMarkup
+
+from lingoro_bot.config import MASTERY_WEAKEST_COUNT, STATS_DEFAULT_PERIOD, STATS_VOCABS_LIMIT
+from lingoro_bot.custom_types.stats_types import MasteryOverviewType, TrainingStatsType, VocabTrainingStatsType
+from lingoro_bot.custom_types.vocab_types import VocabDataType
+from lingoro_bot.db.crud import TrainingStatsCRUD, VocabCRUD, WordpairCRUD, WordpairStatCRUD
+from lingoro_bot.db.database import Session
+from lingoro_bot.handlers.callback_data import StatsPeriodCallback
+from lingoro_bot.keyboards.stats_kb import get_kb_stats, get_kb_stats_mastery
+from lingoro_bot.tools.mastery_utils import build_mastery_overview, format_mastery_overview
+from lingoro_bot.tools.stats_utils import calculate_streaks, format_stats_message, get_period_bounds
+
+router = Router(name='stats')
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@router.message(Command(commands=['stats']))
+async def cmd_stats(message: types.Message, session: Session, user_db_id: int) -> None:
+    """Відстежує введення команди "stats".
+    Відправляє статистику тренувань користувача за період за замовчуванням.
+    """
+    user_id: int = message.from_user.id
+
+    logger.info(f'Користувач ввів команду "{message.text}"')
+    logger.info(f'Користувач перейшов до розділу "Статистика". USER_ID: {user_id}')
+
+    msg_stats, kb = get_stats_page(session, user_db_id, STATS_DEFAULT_PERIOD)
+    await message.answer(text=msg_stats, reply_markup=kb)
+
+
+@router.callback_query(F.data == 'stats')
+async def process_stats(callback: types.CallbackQuery, session: Session, user_db_id: int) -> None:
+    """Відстежує натискання на кнопку "Статистика" у головному меню.
+    Відправляє статистику тренувань користувача за період за замовчуванням.
+    """
+    user_id: int = callback.from_user.id
+    logger.info(f'Користувач перейшов до розділу "Статистика". USER_ID: {user_id}')
+
+    msg_stats, kb = get_stats_page(session, user_db_id, STATS_DEFAULT_PERIOD)
+    await callback.message.edit_text(text=msg_stats, reply_markup=kb)
+
+
+@router.callback_query(StatsPeriodCallback.filter())
+async def process_stats_period(callback: types.CallbackQuery,
+                               callback_data: StatsPeriodCallback,
+                               session: Session,
+                               user_db_id: int) -> None:
+    """Відстежує натискання на кнопки вибору періоду статистики тренувань"""
+    msg_stats, kb = get_stats_page(session, user_db_id, callback_data.period)
+
+    # Повторне натискання на поточний період не змінює повідомлення
+    if msg_stats == callback.message.text:
+        await callback.answer()
+        return
+
+    await callback.message.edit_text(text=msg_stats, reply_markup=kb)
+
+
+@router.callback_query(F.data == 'stats_mastery')
+async def process_stats_mastery(callback: types.CallbackQuery, session: Session, user_db_id: int) -> None:
+    """Відстежує натискання на кнопку "Рівень засвоєння" у розділі "Статистика".
+    Відправляє рівень засвоєння всіх словників користувача та найслабші словникові пари.
+    """
+    user_id: int = callback.from_user.id
+    logger.info(f'Користувач перейшов до розділу "Рівень засвоєння". USER_ID: {user_id}')
+
+    msg_mastery: str = get_mastery_page(session, user_db_id)
+    await callback.message.edit_text(text=msg_mastery, reply_markup=get_kb_stats_mastery())
+
+
+def get_mastery_page(session: Session, user_db_id: int) -> str:
+    """Повертає повідомлення з рівнем засвоєння всіх словників користувача та найслабшими словниковими парами.
+
+    Notes:
+        Рівні засвоєння обчислюються одним векторним проходом за статистикою всіх словникових пар
+        користувача (див. build_mastery_overview), а слова завантажуються лише для найслабших пар.
+    """
+    vocabs_data: list[VocabDataType] = VocabCRUD(session).get_all_vocabs_data(user_db_id)
+    mastery_rows: list[tuple[int, int, int, int, float]] = WordpairStatCRUD(session).get_user_mastery_rows(user_db_id)
+    mastery_overview: MasteryOverviewType = build_mastery_overview(mastery_rows, vocabs_data, MASTERY_WEAKEST_COUNT)
+
+    weakest_ids: list[int] = [wordpair_mastery['wordpair_id']
+                              for wordpair_mastery in mastery_overview['weakest_wordpairs']]
+    wordpair_words: dict[int, str] = {
+        wordpair_item['id']: ', '.join(word_item['word'] for word_item in wordpair_item['words'])
+        for wordpair_item in WordpairCRUD(session).get_wordpairs_by_ids(weakest_ids)}
+    vocab_names: dict[int, str] = {vocab_data['id']: vocab_data['name'] for vocab_data in vocabs_data}
+
+    return format_mastery_overview(mastery_overview=mastery_overview,
+                                   vocab_names=vocab_names,
+                                   wordpair_words=wordpair_words,
+                                   vocabs_limit=STATS_VOCABS_LIMIT)
+
+
+def get_stats_page(session: Session, user_db_id: int, period: str) -> tuple[str, InlineKeyboardMarkup]:
+    """Повертає повідомлення зі статистикою тренувань користувача за період та клавіатуру вибору періоду.
+
+    Notes:
+        Статистика читається з денних підсумків тренувань (див. TrainingStatsCRUD).
+    """
+    today: date = date.today()
+    start_day, prev_start_day = get_period_bounds(period, today)
+
+    stats_crud = TrainingStatsCRUD(session)
+    stats: TrainingStatsType = stats_crud.get_user_stats(user_db_id=user_db_id, start_day=start_day, end_day=today)
+    prev_stats: TrainingStatsType = stats_crud.get_user_stats(user_db_id=user_db_id,
+                                                              start_day=prev_start_day,
+                                                              end_day=start_day - timedelta(days=1))
+    vocabs_stats: list[VocabTrainingStatsType] = stats_crud.get_vocabs_stats(user_db_id=user_db_id,
+                                                                             start_day=start_day,
+                                                                             prev_start_day=prev_start_day,
+                                                                             end_day=today,
+                                                                             limit=STATS_VOCABS_LIMIT)
+    current_streak, best_streak = calculate_streaks(stats_crud.get_user_training_days(user_db_id), today)
+
+    msg_stats: str = format_stats_message(period=period,
+                                          stats=stats,
+                                          prev_stats=prev_stats,
+                                          current_streak=current_streak,
+                                          best_streak=best_streak,
+                                          vocabs_stats=vocabs_stats)
+    return msg_stats, get_kb_stats(period)
@@ -1,15 +1,28 @@
+import asyncio
 import logging
+import tempfile
+from pathlib import Path
 from typing import Any
 
 from aiogram import F, Router, types
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
+from aiogram.types import FSInputFile
 from aiogram.types.inline_keyboard_markup import InlineKeyboardMarkup
 
-from lingoro_bot.db.crud import VocabCRUD, WordpairCRUD
+from lingoro_bot.config import (
+    ANKI_EXPORT_MAX_CONCURRENCY,
+    MESSAGE_MAX_LENGTH,
+    VOCAB_WEAKEST_WORDPAIRS_COUNT,
+    VOCAB_WORDPAIRS_PAGE_SIZE,
+)
+from lingoro_bot.custom_types.vocab_types import VocabsPageType
+from lingoro_bot.custom_types.wordpair_types import WordpairInfoType, WordpairStatType
+from lingoro_bot.db.crud import VocabCRUD, WordpairCRUD, WordpairStatCRUD
 from lingoro_bot.db.database import Session
 from lingoro_bot.exceptions import InvalidVocabIndexError
 from lingoro_bot.filters.check_empty_filters import CheckEmptyFilter
+from lingoro_bot.handlers.callback_data import PaginationCallback, VocabWordpairsPageCallback
 from lingoro_bot.keyboards.vocab_base_kb import (
     get_kb_confirm_delete,
     get_kb_vocab_options,
@@ -19,17 +32,26 @@ from lingoro_bot.text_data import (
     MSG_CHOOSE_VOCAB,
     MSG_CONFIRM_DELETE_VOCAB,
     MSG_INFO_VOCAB_BASE_EMPTY,
+    MSG_INFO_VOCAB_EXPORT_STARTED,
     MSG_SUCCESS_VOCAB_DELETED,
+    MSG_SUCCESS_VOCAB_EXPORTED,
 )
-from lingoro_bot.tools.vocab_utils import format_vocab_info
-from lingoro_bot.tools.wordpair_utils import get_formatted_wordpairs_list
+from lingoro_bot.tools.user_cache import get_vocabs_page, reset_user_cache
+from lingoro_bot.tools.vocab_utils import count_fitting_lines, format_vocab_info, get_message_length
+from lingoro_bot.tools.wordpair_utils import TRAINING_DIRECTION_NAMES, get_formatted_wordpairs_list
 
 router = Router(name='vocab_base')
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Обмеження одночасних експортів, щоб великі словники не навантажували памʼять та диск разом
+export_semaphore = asyncio.Semaphore(ANKI_EXPORT_MAX_CONCURRENCY)
+
 
 @router.callback_query(F.data == 'vocab_base')
-async def process_vocab_base(callback: types.CallbackQuery, state: FSMContext) -> None:
+async def process_vocab_base(callback: types.CallbackQuery,
+                             state: FSMContext,
+                             session: Session,
+                             user_db_id: int) -> None:
     """Відстежує натискання на кнопку "База словників" у головному меню.
     Відправляє користувачу користувацькі словники у вигляді кнопок.
     """
@@ -40,26 +62,23 @@ async def process_vocab_base(callback: types.CallbackQuery, state: FSMContext) -
     await state.clear()
     logger.info('FSM стан та FSM-Cache очищено перед запуском розділу "База словників"')
 
-    with Session() as session:
-        vocab_crud = VocabCRUD(session)
-
-        # Дані всіх користувацьких словників користувача
-        all_vocabs_data: list[dict] = vocab_crud.get_all_vocabs_data(user_id)
+    vocab_crud = VocabCRUD(session)
+    vocabs_page: VocabsPageType = get_vocabs_page(vocab_crud, user_db_id)  # Перша сторінка словників
 
     # Якщо в БД користувача немає користувацьких словників
     check_empty_filter = CheckEmptyFilter()
-    if check_empty_filter.apply(all_vocabs_data):
+    if check_empty_filter.apply(vocabs_page.get('vocabs')):
         logger.info('В БД користувача немає користувацьких словників')
         msg_text: str = MSG_INFO_VOCAB_BASE_EMPTY
     else:
         msg_text: str = MSG_CHOOSE_VOCAB
 
-    kb: InlineKeyboardMarkup = get_kb_vocab_selection_base(all_vocabs_data[::-1])
+    kb: InlineKeyboardMarkup = get_kb_vocab_selection_base(vocabs_page)
     await callback.message.edit_text(text=msg_text, reply_markup=kb)
 
 
 @router.message(Command(commands=['vocab_base']))
-async def cmd_vocab_base(message: types.Message, state: FSMContext) -> None:
+async def cmd_vocab_base(message: types.Message, state: FSMContext, session: Session, user_db_id: int) -> None:
     """Відстежує введення команди "vocab_base".
     Відправляє користувачу користувацькі словники у вигляді кнопок.
     """
@@ -71,26 +90,42 @@ async def cmd_vocab_base(message: types.Message, state: FSMContext) -> None:
     await state.clear()
     logger.info('FSM стан та FSM-Cache очищено перед запуском розділу "База словників"')
 
-    with Session() as session:
-        vocab_crud = VocabCRUD(session)
-
-        # Дані всіх користувацьких словників користувача
-        all_vocabs_data: list[dict] = vocab_crud.get_all_vocabs_data(user_id)
+    vocab_crud = VocabCRUD(session)
+    vocabs_page: VocabsPageType = get_vocabs_page(vocab_crud, user_db_id)  # Перша сторінка словників
 
     # Якщо в БД користувача немає користувацьких словників
     check_empty_filter = CheckEmptyFilter()
-    if check_empty_filter.apply(all_vocabs_data):
+    if check_empty_filter.apply(vocabs_page.get('vocabs')):
         logger.info('В БД користувача немає користувацьких словників')
         msg_text: str = MSG_INFO_VOCAB_BASE_EMPTY
     else:
         msg_text: str = MSG_CHOOSE_VOCAB
 
-    kb: InlineKeyboardMarkup = get_kb_vocab_selection_base(all_vocabs_data[::-1])
+    kb: InlineKeyboardMarkup = get_kb_vocab_selection_base(vocabs_page)
     await message.answer(text=msg_text, reply_markup=kb)
 
 
+@router.callback_query(PaginationCallback.filter(F.name == 'vocab_base'))
+async def process_vocab_base_page(callback: types.CallbackQuery,
+                                  callback_data: PaginationCallback,
+                                  session: Session,
+                                  user_db_id: int) -> None:
+    """Відстежує натискання на кнопки переходу між сторінками словників у розділі "База словників"."""
+    vocab_crud = VocabCRUD(session)
+    vocabs_page: VocabsPageType = get_vocabs_page(vocab_crud,
+                                                  user_db_id,
+                                                  cursor_id=callback_data.cursor_id,
+                                                  is_backward=callback_data.is_backward)
+
+    kb: InlineKeyboardMarkup = get_kb_vocab_selection_base(vocabs_page)
+    await callback.message.edit_reply_markup(reply_markup=kb)
+
+
 @router.callback_query(F.data.startswith('select_vocab_base'))
-async def process_vocab_base_selection(callback: types.CallbackQuery, state: FSMContext) -> None:
+async def process_vocab_base_selection(callback: types.CallbackQuery,
+                                       state: FSMContext,
+                                       session: Session,
+                                       user_db_id: int) -> None:
     """Відстежує натискання на кнопку користувацького словника у розділі "База словників".
     Відправляє користувачу його статистику з словниковими парами та клавіатуру для взаємодії з ним.
     """
@@ -101,39 +136,216 @@ async def process_vocab_base_selection(callback: types.CallbackQuery, state: FSM
     logger.info('ID користувацького словника збережений у FSM-Cache')
 
     try:
-        with Session() as session:
-            vocab_crud = VocabCRUD(session)
-            wordpair_crud = WordpairCRUD(session)
+        msg_vocab_info, kb = get_vocab_info_page(session=session,
+                                                 user_db_id=user_db_id,
+                                                 vocab_id=vocab_id,
+                                                 cursor_id=0,
+                                                 cursor_number=0,
+                                                 is_backward=False)
+    except InvalidVocabIndexError as e:
+        logger.error(e)
+        return
+
+    await callback.message.edit_text(text=msg_vocab_info, reply_markup=kb)
 
-            wordpair_items: list[dict] = wordpair_crud.get_wordpairs(vocab_id)
 
-            # Відсортований список словникових пар по кількості їх помилок
-            sorted_wordpair_items: list[dict] = sorted(wordpair_items,
-                                                       key=lambda item: item['number_errors'],
-                                                       reverse=True)
-            vocab_data: dict[str, Any] = vocab_crud.get_vocab_data(vocab_id)
+@router.callback_query(VocabWordpairsPageCallback.filter())
+async def process_vocab_wordpairs_page(callback: types.CallbackQuery,
+                                       callback_data: VocabWordpairsPageCallback,
+                                       state: FSMContext,
+                                       session: Session,
+                                       user_db_id: int) -> None:
+    """Відстежує натискання на кнопки переходу між сторінками словникових пар в інформації про словник"""
+    vocab_id: int = callback_data.vocab_id
+
+    # Кнопки сторінки можуть належати повідомленню іншого словника, ніж збережений у FSM-Cache
+    await state.update_data(vocab_id=vocab_id)
+
+    try:
+        msg_vocab_info, kb = get_vocab_info_page(session=session,
+                                                 user_db_id=user_db_id,
+                                                 vocab_id=vocab_id,
+                                                 cursor_id=callback_data.cursor_id,
+                                                 cursor_number=callback_data.cursor_number,
+                                                 is_backward=callback_data.is_backward)
     except InvalidVocabIndexError as e:
         logger.error(e)
+        await callback.answer()
         return
 
-    vocab_name: str = vocab_data.get('name')
-    vocab_description: str = vocab_data.get('description') or 'Відсутній'
-    vocab_number_errors: int = vocab_data.get('number_errors')
-    vocab_wordpairs_count: int = vocab_data.get('wordpairs_count')
-
-    kb: InlineKeyboardMarkup = get_kb_vocab_options()
-    formatted_wordpairs: list[str] = get_formatted_wordpairs_list(sorted_wordpair_items)
-
-    msg_vocab_info: str = format_vocab_info(name=vocab_name,
-                                            description=vocab_description,
-                                            wordpairs_count=vocab_wordpairs_count,
-                                            number_errors=vocab_number_errors,
-                                            wordpairs=formatted_wordpairs)
     await callback.message.edit_text(text=msg_vocab_info, reply_markup=kb)
 
 
+def get_vocab_info_page(session: Session,
+                        user_db_id: int,
+                        vocab_id: int,
+                        cursor_id: int,
+                        cursor_number: int,
+                        is_backward: bool) -> tuple[str, InlineKeyboardMarkup]:
+    """Повертає текст та клавіатуру сторінки інформації про словник.
+
+    Notes:
+        З БД завантажується на одну словникову пару більше, ніж поміщається на сторінці,
+        щоб дізнатися, чи є наступна (або попередня) сторінка. Якщо словникові пари не вміщуються
+        в одне повідомлення, то сторінка закінчується раніше (решта переходить на сусідню сторінку).
+
+    Args:
+        session (Session): Сесія БД.
+        user_db_id (int): ID користувача в БД.
+        vocab_id (int): ID користувацького словника.
+        cursor_id (int): ID словникової пари, після (або перед) якої починається сторінка (0 — перша сторінка).
+        cursor_number (int): Порядковий номер словникової пари-курсора (0 — перша сторінка).
+        is_backward (bool): Прапор, чи потрібна сторінка перед курсором.
+    """
+    vocab_crud = VocabCRUD(session)
+    wordpair_crud = WordpairCRUD(session)
+
+    vocab_data: dict[str, Any] = vocab_crud.get_vocab_data(vocab_id)
+    wordpair_items: list[WordpairInfoType] = wordpair_crud.get_wordpairs_page(vocab_id=vocab_id,
+                                                                              cursor_id=cursor_id,
+                                                                              is_backward=is_backward,
+                                                                              limit=VOCAB_WORDPAIRS_PAGE_SIZE + 1)
+
+    is_more_wordpairs: bool = len(wordpair_items) > VOCAB_WORDPAIRS_PAGE_SIZE
+
+    if is_backward:
+        wordpair_items = wordpair_items[-VOCAB_WORDPAIRS_PAGE_SIZE:]
+        first_number: int = max(cursor_number - len(wordpair_items), 1)
+    else:
+        wordpair_items = wordpair_items[:VOCAB_WORDPAIRS_PAGE_SIZE]
+        first_number: int = cursor_number + 1
+
+    msg_vocab_header: str = format_vocab_info(name=vocab_data.get('name'),
+                                              description=vocab_data.get('description') or 'Відсутній',
+                                              wordpairs_count=vocab_data.get('wordpairs_count'),
+                                              number_errors=vocab_data.get('number_errors'),
+                                              last_trained_at=vocab_data.get('last_trained_at'),
+                                              best_accuracy=vocab_data.get('best_accuracy'),
+                                              wordpairs=[],
+                                              weakest_wordpairs=get_weakest_wordpairs(session, vocab_id))
+    free_length: int = MESSAGE_MAX_LENGTH - get_message_length(msg_vocab_header)
+
+    wordpair_stat_crud = WordpairStatCRUD(session)
+    wordpair_stats: dict[int, dict[str, WordpairStatType]] = wordpair_stat_crud.get_wordpair_stats(
+        user_db_id=user_db_id,
+        wordpair_ids=[wordpair_item['id'] for wordpair_item in wordpair_items])
+    formatted_wordpairs: list[str] = get_formatted_wordpairs_list(wordpair_items,
+                                                                  start_idx=first_number,
+                                                                  wordpair_stats=wordpair_stats)
+
+    # Словникові пари, які не вміщуються в повідомлення, відкидаються з боку, протилежного курсору
+    if is_backward:
+        fitting_count: int = count_fitting_lines(formatted_wordpairs[::-1], free_length)
+        is_page_cut: bool = fitting_count < len(formatted_wordpairs)
+        first_number += len(formatted_wordpairs) - fitting_count
+        wordpair_items = wordpair_items[len(wordpair_items) - fitting_count:]
+        formatted_wordpairs = formatted_wordpairs[len(formatted_wordpairs) - fitting_count:]
+
+        is_prev_page: bool = is_more_wordpairs or is_page_cut
+        is_next_page: bool = True
+    else:
+        fitting_count: int = count_fitting_lines(formatted_wordpairs, free_length)
+        is_page_cut: bool = fitting_count < len(formatted_wordpairs)
+        wordpair_items = wordpair_items[:fitting_count]
+        formatted_wordpairs = formatted_wordpairs[:fitting_count]
+
+        is_prev_page: bool = cursor_id != 0
+        is_next_page: bool = is_more_wordpairs or is_page_cut
+
+    logger.info(f'Словникових пар на сторінці інформації про словник: {len(wordpair_items)}')
+
+    prev_page: VocabWordpairsPageCallback | None = None
+    next_page: VocabWordpairsPageCallback | None = None
+    if wordpair_items and is_prev_page:
+        prev_page = VocabWordpairsPageCallback(vocab_id=vocab_id,
+                                               cursor_id=wordpair_items[0]['id'],
+                                               cursor_number=first_number,
+                                               is_backward=True)
+    if wordpair_items and is_next_page:
+        next_page = VocabWordpairsPageCallback(vocab_id=vocab_id,
+                                               cursor_id=wordpair_items[-1]['id'],
+                                               cursor_number=first_number + len(wordpair_items) - 1,
+                                               is_backward=False)
+
+    msg_vocab_info: str = msg_vocab_header + '\n'.join(formatted_wordpairs)
+    return msg_vocab_info, get_kb_vocab_options(prev_page, next_page)
+
+
+def get_weakest_wordpairs(session: Session, vocab_id: int) -> dict[str, str]:
+    """Повертає слова найслабших словникових пар словника для кожного напрямку перекладу, в якому вони є.
+
+    Returns:
+        dict[str, str]: Словник, де ключ — назва напрямку перекладу, а значення — слова найслабших
+        словникових пар (від найслабшої), розділені символом ";".
+    """
+    wordpair_stat_crud = WordpairStatCRUD(session)
+    weakest_ids: dict[str, list[int]] = {
+        direction: wordpair_stat_crud.get_weakest_wordpair_ids(vocab_id, direction, VOCAB_WEAKEST_WORDPAIRS_COUNT)
+        for direction in TRAINING_DIRECTION_NAMES}
+
+    all_weakest_ids: list[int] = list({wordpair_id for ids in weakest_ids.values() for wordpair_id in ids})
+    if not all_weakest_ids:
+        return {}
+
+    # Дані словникових пар обох напрямків завантажуються разом
+    wordpair_crud = WordpairCRUD(session)
+    words_by_id: dict[int, str] = {
+        wordpair_item['id']: ', '.join(word_item['word'] for word_item in wordpair_item['words'])
+        for wordpair_item in wordpair_crud.get_wordpairs_by_ids(all_weakest_ids)}
+
+    weakest_wordpairs: dict[str, str] = {
+        TRAINING_DIRECTION_NAMES[direction]: '; '.join(words_by_id[wordpair_id] for wordpair_id in ids)
+        for direction, ids in weakest_ids.items() if ids}
+    return weakest_wordpairs
+
+
+@router.callback_query(F.data == 'export_vocab_anki')
+async def process_export_vocab_anki(callback: types.CallbackQuery, state: FSMContext) -> None:
+    """Відстежує натискання на кнопку "Експорт в Anki" після обрання користувацького словника
+    у розділі "База словників".
+    Відправляє користувачу Anki-пакет (.apkg) зі словниковими парами словника.
+    """
+    logger.info('Обрано експорт користувацького словника в Anki')
+
+    data_fsm: dict[str, Any] = await state.get_data()
+    vocab_id: int | None = data_fsm.get('vocab_id')
+
+    await callback.answer(text=MSG_INFO_VOCAB_EXPORT_STARTED)
+
+    try:
+        async with export_semaphore:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                apkg_path = Path(temp_dir, f'vocab_{vocab_id}.apkg')
+
+                # Створення пакета блокує, тому виконується поза циклом подій (у власній сесії БД)
+                vocab_name, wordpairs_count = await asyncio.to_thread(_export_vocab_to_anki, vocab_id, apkg_path)
+
+                document = FSInputFile(apkg_path, filename=f'{vocab_name}.apkg')
+                msg_vocab_exported: str = MSG_SUCCESS_VOCAB_EXPORTED.format(name=vocab_name,
+                                                                            wordpairs_count=wordpairs_count)
+                await callback.message.answer_document(document=document, caption=msg_vocab_exported)
+    except InvalidVocabIndexError as e:
+        logger.error(e)
+        return
+
+    logger.info(f'Користувацький словник експортовано в Anki. VOCAB_ID: {vocab_id}')
+
+
+def _export_vocab_to_anki(vocab_id: int, apkg_path: Path) -> tuple[str, int]:
+    """Експортує користувацький словник в Anki-пакет.
+
+    Returns:
+        tuple[str, int]: Назва словника та кількість експортованих словникових пар.
+    """
+    with Session() as session:
+        vocab_crud = VocabCRUD(session)
+        vocab_data: dict[str, Any] = vocab_crud.get_vocab_data(vocab_id)
+        wordpairs_count: int = vocab_crud.export_vocab_to_anki(vocab_id, apkg_path)
+    return vocab_data['name'], wordpairs_count
+
+
 @router.callback_query(F.data == 'delete_vocab')
-async def process_delete_vocab(callback: types.CallbackQuery, state: FSMContext) -> None:
+async def process_delete_vocab(callback: types.CallbackQuery, state: FSMContext, session: Session) -> None:
     """Відстежує натискання на кнопку "Видалити словник" після обрання користувацького словника
     у розділі "База словників".
     Відправляє клавіатуру для підтвердження видалення.
@@ -144,9 +356,8 @@ async def process_delete_vocab(callback: types.CallbackQuery, state: FSMContext)
     vocab_id: int | None = data_fsm.get('vocab_id')
 
     try:
-        with Session() as session:
-            vocab_crud = VocabCRUD(session)
-            vocab_data: dict[str, Any] = vocab_crud.get_vocab_data(vocab_id)
+        vocab_crud = VocabCRUD(session)
+        vocab_data: dict[str, Any] = vocab_crud.get_vocab_data(vocab_id)
     except InvalidVocabIndexError as e:
         logger.error(e)
         return
@@ -160,7 +371,10 @@ async def process_delete_vocab(callback: types.CallbackQuery, state: FSMContext)
 
 
 @router.callback_query(F.data == 'accept_delete_vocab')
-async def process_accept_delete_vocab(callback: types.CallbackQuery, state: FSMContext) -> None:
+async def process_accept_delete_vocab(callback: types.CallbackQuery,
+                                      state: FSMContext,
+                                      session: Session,
+                                      user_db_id: int) -> None:
     """Відстежує натискання на кнопку "Так" при підтвердженні видалення користувацького словника.
     Мʼяко видаляє користувацький словник, позначаючи його як 'видалений' (.is_deleted=True).
     Відправляє користувачу користувацькі словники у вигляді кнопок.
@@ -170,27 +384,23 @@ async def process_accept_delete_vocab(callback: types.CallbackQuery, state: FSMC
     data_fsm: dict[str, Any] = await state.get_data()
     vocab_id: int = data_fsm.get('vocab_id')
 
-    user_id: int = callback.from_user.id
-
+    vocab_crud = VocabCRUD(session)
     try:
-        with Session() as session:
-            vocab_crud = VocabCRUD(session)
-            vocab_data: dict[str, Any] = vocab_crud.get_vocab_data(vocab_id)
-
-            vocab_crud.soft_delete_vocab(vocab_id)
-            logger.info('Користувацький словник був "мʼяко" видалений з БД')
+        vocab_data: dict[str, Any] = vocab_crud.get_vocab_data(vocab_id)
 
-            # Дані всіх користувацьких словників користувача
-            all_vocabs_data: list[dict] = vocab_crud.get_all_vocabs_data(user_id)
+        vocab_crud.soft_delete_vocab(vocab_id)
+        logger.info('Користувацький словник був "мʼяко" видалений з БД')
+        reset_user_cache(user_db_id)
     except InvalidVocabIndexError as e:
         logger.error(e)
         return
 
+    vocabs_page: VocabsPageType = get_vocabs_page(vocab_crud, user_db_id)  # Перша сторінка словників
     vocab_name: str = vocab_data.get('name')
 
     # Якщо в БД користувача немає користувацьких словників
     check_empty_filter = CheckEmptyFilter()
-    if check_empty_filter.apply(all_vocabs_data):
+    if check_empty_filter.apply(vocabs_page.get('vocabs')):
         logger.info('В БД користувача немає користувацьких словників')
         msg_text: str = '\n\n'.join((MSG_SUCCESS_VOCAB_DELETED.format(name=vocab_name),
                                      MSG_INFO_VOCAB_BASE_EMPTY))
@@ -198,6 +408,6 @@ async def process_accept_delete_vocab(callback: types.CallbackQuery, state: FSMC
         msg_text: str = '\n\n'.join((MSG_SUCCESS_VOCAB_DELETED.format(name=vocab_name),
                                      MSG_CHOOSE_VOCAB))
 
-    kb: InlineKeyboardMarkup = get_kb_vocab_selection_base(all_vocabs_data[::-1])
+    kb: InlineKeyboardMarkup = get_kb_vocab_selection_base(vocabs_page)
 
     await callback.message.edit_text(text=msg_text, reply_markup=kb)
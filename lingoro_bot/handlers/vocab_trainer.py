@@ -1,5 +1,7 @@
 import logging
-from datetime import datetime
+import math
+import random
+from datetime import datetime, timedelta
 from typing import Any
 
 from aiogram import F, Router, types
@@ -8,34 +10,105 @@ from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State
 from aiogram.types import InlineKeyboardMarkup
 
-from lingoro_bot.db.crud import TrainingCRUD, VocabCRUD, WordpairCRUD
+from lingoro_bot.config import (
+    CHOICE_EXTRA_OPTIONS_LIMIT,
+    CHOICE_OPTIONS_COUNT,
+    MIXED_SESSION_SIZE,
+    QUIZ_SHEET_SIZE,
+    REVIEW_DUE_SESSION_SIZE,
+    REVIEW_MISTAKES_SESSION_SIZE,
+    SPEED_QUESTION_TIMEOUT,
+    SPEED_ROUND_DURATION,
+    TRAINING_PREFETCH_SIZE,
+)
+from lingoro_bot.custom_types.training_types import TrainingProgressType
+from lingoro_bot.custom_types.vocab_types import VocabsPageType
+from lingoro_bot.custom_types.wordpair_types import WordpairStatType
+from lingoro_bot.db.crud import ReviewCRUD, TrainingCheckpointCRUD, VocabCRUD, WordpairCRUD
 from lingoro_bot.db.database import Session
+from lingoro_bot.db.models import TrainingCheckpoint
 from lingoro_bot.exceptions import InvalidVocabIndexError
 from lingoro_bot.filters.check_empty_filters import CheckEmptyFilter
 from lingoro_bot.fsm.states import VocabTraining
+from lingoro_bot.handlers.callback_data import MixedVocabCallback, PaginationCallback, TrainingChoiceCallback
 from lingoro_bot.keyboards.vocab_trainer_kb import (
     get_kb_confirm_cancel_training,
     get_kb_finish_training,
+    get_kb_mixed_vocab_selection,
+    get_kb_quiz_sheet,
     get_kb_training_actions,
+    get_kb_training_choices,
     get_kb_training_modes,
     get_kb_vocab_selection_training,
 )
 from lingoro_bot.text_data import (
     MSG_CHOOSE_TRAINING_MODE,
     MSG_CHOOSE_VOCAB_FOR_TRAINING,
+    MSG_CHOOSE_VOCABS_FOR_MIXED_TRAINING,
     MSG_CONFIRM_CANCEL_TRAINING,
     MSG_CORRECT_ANSWER,
+    MSG_ERROR_NO_VOCABS_SELECTED,
+    MSG_INFO_NO_TRAINING_TO_CONTINUE,
+    MSG_INFO_NO_WORDPAIRS_DUE,
+    MSG_INFO_NO_WORDPAIRS_WITH_MISTAKES,
+    MSG_INFO_NOT_ENOUGH_CHOICE_OPTIONS,
+    MSG_INFO_SPEED_QUESTION_TIMEOUT,
     MSG_INFO_VOCAB_BASE_EMPTY_FOR_TRAINING,
     MSG_LEFT_ONE_WORD_TRAINING,
+    MSG_MIXED_TRAINING_NAME,
+    MSG_NEAR_ANSWER,
+    MSG_QUIZ_SHEET_CORRECT_LINE,
+    MSG_QUIZ_SHEET_HINT,
+    MSG_QUIZ_SHEET_NEAR_LINE,
+    MSG_QUIZ_SHEET_PROMPT_LINE,
+    MSG_QUIZ_SHEET_RESULTS,
+    MSG_QUIZ_SHEET_SKIPPED_LINE,
+    MSG_QUIZ_SHEET_WRONG_LINE,
     MSG_SHOW_WORDPAIR_ANNOTATION,
     MSG_SHOW_WORDPAIR_TRANSLATION,
+    MSG_SPEED_ROUND_FINISHED,
+    MSG_SPEED_ROUND_TIMER,
+    MSG_TRAINING_CONTINUED,
     MSG_WRONG_ANSWER,
 )
+from lingoro_bot.tools.answer_events import answer_event_log
+from lingoro_bot.tools.answer_utils import (
+    ANSWER_VERDICT_EXACT,
+    ANSWER_VERDICT_NEAR,
+    ANSWER_VERDICT_WRONG,
+    check_answer,
+)
+from lingoro_bot.tools.speed_round import speed_round_timers
+from lingoro_bot.tools.srs_utils import get_review_quality
+from lingoro_bot.tools.training_cache import (
+    get_distractor_index,
+    get_mistake_sampler,
+    get_wordpair_render,
+    mistake_sampler_cache,
+)
+from lingoro_bot.tools.training_checkpoint import (
+    decode_training_progress,
+    encode_training_progress,
+    finalize_training_checkpoint,
+    get_progress_count,
+    is_checkpoint_due,
+    save_training_results,
+)
+from lingoro_bot.tools.user_cache import get_vocabs_page
 from lingoro_bot.tools.vocab_trainer_utils import (
+    TRAINING_MODE_NAMES,
+    DistractorIndex,
+    WeightedSampler,
+    add_session_wordpair_stat,
     format_training_process_message,
     format_training_summary_message,
+    get_answer_latency_ms,
+    get_mistake_weight,
     get_training_data,
+    get_training_direction,
     get_wordpair_idx_for_training,
+    parse_quiz_sheet_answers,
+    requeue_wordpair_idx,
 )
 
 router = Router(name='vocab_trainer')
@@ -43,7 +116,10 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 
 @router.callback_query(F.data == 'vocab_trainer')
-async def process_vocab_trainer(callback: types.CallbackQuery, state: FSMContext) -> None:
+async def process_vocab_trainer(callback: types.CallbackQuery,
+                                state: FSMContext,
+                                session: Session,
+                                user_db_id: int) -> None:
     """Відстежує натискання на кнопку "Тренування" у головному меню.
     Відправляє користувачу користувацькі словники у вигляді кнопок.
     """
@@ -54,25 +130,28 @@ async def process_vocab_trainer(callback: types.CallbackQuery, state: FSMContext
     await state.clear()
     logger.info('FSM стан та FSM-Cache очищено перед запуском розділу "Тренування"')
 
-    await state.update_data(user_id=user_id)
+    vocab_crud = VocabCRUD(session)
+    vocabs_page: VocabsPageType = get_vocabs_page(vocab_crud, user_db_id)  # Перша сторінка словників
 
-    with Session() as session:
-        vocab_crud = VocabCRUD(session)
-        all_vocabs_data: list[dict] = vocab_crud.get_all_vocabs_data(user_id)  # Дані всіх користувацьких словників
+    # Кнопка продовження, якщо є незавершене тренування зі збереженим прогресом
+    checkpoint_crud = TrainingCheckpointCRUD(session)
+    is_with_btn_continue_training: bool = checkpoint_crud.is_checkpoint_exists(user_db_id)
 
     # Якщо в БД користувача немає користувацьких словників
     check_empty_filter = CheckEmptyFilter()
-    if check_empty_filter.apply(all_vocabs_data):
-        kb: InlineKeyboardMarkup = get_kb_vocab_selection_training(all_vocabs_data[::-1], is_with_btn_vocab_base=True)
+    is_vocab_base_empty: bool = check_empty_filter.apply(vocabs_page.get('vocabs'))
+    if is_vocab_base_empty:
         msg_text: str = MSG_INFO_VOCAB_BASE_EMPTY_FOR_TRAINING
     else:
-        kb: InlineKeyboardMarkup = get_kb_vocab_selection_training(all_vocabs_data[::-1])
         msg_text: str = MSG_CHOOSE_VOCAB_FOR_TRAINING
+    kb: InlineKeyboardMarkup = get_kb_vocab_selection_training(vocabs_page,
+                                                               is_with_btn_vocab_base=is_vocab_base_empty,
+                                                               is_with_btn_continue_training=is_with_btn_continue_training)
     await callback.message.edit_text(text=msg_text, reply_markup=kb)
 
 
 @router.message(Command(commands=['vocab_trainer']))
-async def cmd_vocab_trainer(message: types.Message, state: FSMContext) -> None:
+async def cmd_vocab_trainer(message: types.Message, state: FSMContext, session: Session, user_db_id: int) -> None:
     """Відстежує введення команди "vocab_trainer".
     Відправляє користувачу користувацькі словники у вигляді кнопок.
     """
@@ -84,37 +163,52 @@ async def cmd_vocab_trainer(message: types.Message, state: FSMContext) -> None:
     await state.clear()
     logger.info('FSM стан та FSM-Cache очищено перед запуском розділу "Тренування"')
 
-    await state.update_data(user_id=user_id)
+    vocab_crud = VocabCRUD(session)
+    vocabs_page: VocabsPageType = get_vocabs_page(vocab_crud, user_db_id)  # Перша сторінка словників
 
-    with Session() as session:
-        vocab_crud = VocabCRUD(session)
-        all_vocabs_data: list[dict] = vocab_crud.get_all_vocabs_data(user_id)  # Дані всіх користувацьких словників
+    # Кнопка продовження, якщо є незавершене тренування зі збереженим прогресом
+    checkpoint_crud = TrainingCheckpointCRUD(session)
+    is_with_btn_continue_training: bool = checkpoint_crud.is_checkpoint_exists(user_db_id)
 
     # Якщо в БД користувача немає користувацьких словників
     check_empty_filter = CheckEmptyFilter()
-    if check_empty_filter.apply(all_vocabs_data):
-        kb: InlineKeyboardMarkup = get_kb_vocab_selection_training(all_vocabs_data[::-1], is_with_btn_vocab_base=True)
+    is_vocab_base_empty: bool = check_empty_filter.apply(vocabs_page.get('vocabs'))
+    if is_vocab_base_empty:
         msg_text: str = MSG_INFO_VOCAB_BASE_EMPTY_FOR_TRAINING
     else:
-        kb: InlineKeyboardMarkup = get_kb_vocab_selection_training(all_vocabs_data[::-1])
         msg_text: str = MSG_CHOOSE_VOCAB_FOR_TRAINING
+    kb: InlineKeyboardMarkup = get_kb_vocab_selection_training(vocabs_page,
+                                                               is_with_btn_vocab_base=is_vocab_base_empty,
+                                                               is_with_btn_continue_training=is_with_btn_continue_training)
     await message.answer(text=msg_text, reply_markup=kb)
 
 
+@router.callback_query(PaginationCallback.filter(F.name == 'vocab_training'))
+async def process_vocab_trainer_page(callback: types.CallbackQuery,
+                                     callback_data: PaginationCallback,
+                                     session: Session,
+                                     user_db_id: int) -> None:
+    """Відстежує натискання на кнопки переходу між сторінками словників у розділі "Тренування"."""
+    vocab_crud = VocabCRUD(session)
+    vocabs_page: VocabsPageType = get_vocabs_page(vocab_crud,
+                                                  user_db_id,
+                                                  cursor_id=callback_data.cursor_id,
+                                                  is_backward=callback_data.is_backward)
+
+    kb: InlineKeyboardMarkup = get_kb_vocab_selection_training(vocabs_page)
+    await callback.message.edit_reply_markup(reply_markup=kb)
+
+
 @router.callback_query(F.data.startswith('select_vocab_training'))
-async def process_training_selection(callback: types.CallbackQuery, state: FSMContext) -> None:
+async def process_training_selection(callback: types.CallbackQuery, state: FSMContext, session: Session) -> None:
     """Відстежує натискання на кнопку користувацького словника у розділі "Тренування".
     Відправляє клавіатуру з вибором типу тренування.
     """
     vocab_id = int(callback.data.split('_')[-1])
 
     try:
-        with Session() as session:
-            vocab_crud = VocabCRUD(session)
-            vocab_data: dict[str, Any] = vocab_crud.get_vocab_data(vocab_id)
-
-            wordpair_crud = WordpairCRUD(session)
-            wordpair_items: list[dict] = wordpair_crud.get_wordpairs(vocab_id)
+        vocab_crud = VocabCRUD(session)
+        vocab_data: dict[str, Any] = vocab_crud.get_vocab_data(vocab_id)
     except InvalidVocabIndexError as e:
         logger.error(e)
         return
@@ -130,64 +224,573 @@ async def process_training_selection(callback: types.CallbackQuery, state: FSMCo
 
     await state.update_data(vocab_id=vocab_id,
                             vocab_name=vocab_name,
-                            wordpair_items=wordpair_items,
-                            total_wordpairs_count=total_wordpairs_count)
+                            total_wordpairs_count=total_wordpairs_count,
+                            mixed_vocab_ids=None,
+                            last_session_mistake_ids=[])
     logger.info('Дані словника збережені у FSM-Cache')
 
     await callback.message.edit_text(text=msg_choose_training_mode, reply_markup=kb)
 
 
-@router.callback_query(F.data == 'direct_translation')
-async def process_direct_translation(callback: types.CallbackQuery, state: FSMContext) -> None:
-    """Відстежує натискання на кнопку "Прямий переклад" під час вибору типу тренування.
-    Починає процес тренування та відправляє перше слово для перекладу.
+@router.callback_query(F.data == 'mixed_training')
+async def process_mixed_training(callback: types.CallbackQuery,
+                                 state: FSMContext,
+                                 session: Session,
+                                 user_db_id: int) -> None:
+    """Відстежує натискання на кнопку "Змішане тренування" у розділі "Тренування".
+    Відправляє клавіатуру з вибором словників для змішаного тренування.
     """
-    logger.info('Початок тренування. Тип: "Прямий переклад"')
-    await callback.message.delete()
+    user_id: int = callback.from_user.id
+    logger.info(f'Обрано змішане тренування. USER_ID: {user_id}')
+
+    await state.update_data(mixed_selected_vocab_ids=[])
+    logger.info('Обрані словники для змішаного тренування очищено у FSM-Cache')
+
+    vocab_crud = VocabCRUD(session)
+    vocabs_page: VocabsPageType = get_vocabs_page(vocab_crud, user_db_id)  # Перша сторінка словників
 
+    kb: InlineKeyboardMarkup = get_kb_mixed_vocab_selection(vocabs_page, selected_vocab_ids=[])
+    await callback.message.edit_text(text=MSG_CHOOSE_VOCABS_FOR_MIXED_TRAINING, reply_markup=kb)
+
+
+@router.callback_query(PaginationCallback.filter(F.name == 'mixed_training'))
+async def process_mixed_training_page(callback: types.CallbackQuery,
+                                      callback_data: PaginationCallback,
+                                      state: FSMContext,
+                                      session: Session,
+                                      user_db_id: int) -> None:
+    """Відстежує натискання на кнопки переходу між сторінками словників під час вибору словників
+    для змішаного тренування.
+    """
     data_fsm: dict[str, Any] = await state.get_data()
+    selected_vocab_ids: list[int] = data_fsm.get('mixed_selected_vocab_ids', [])
+
+    vocab_crud = VocabCRUD(session)
+    vocabs_page: VocabsPageType = get_vocabs_page(vocab_crud,
+                                                  user_db_id,
+                                                  cursor_id=callback_data.cursor_id,
+                                                  is_backward=callback_data.is_backward)
+
+    kb: InlineKeyboardMarkup = get_kb_mixed_vocab_selection(vocabs_page,
+                                                            selected_vocab_ids,
+                                                            cursor_id=callback_data.cursor_id,
+                                                            is_backward=callback_data.is_backward)
+    await callback.message.edit_reply_markup(reply_markup=kb)
+
+
+@router.callback_query(MixedVocabCallback.filter())
+async def process_toggle_mixed_vocab(callback: types.CallbackQuery,
+                                     callback_data: MixedVocabCallback,
+                                     state: FSMContext,
+                                     session: Session,
+                                     user_db_id: int) -> None:
+    """Відстежує натискання на кнопку словника під час вибору словників для змішаного тренування.
+    Обирає словник або скасовує його вибір.
+    """
+    vocab_id: int = callback_data.vocab_id
 
-    total_wordpairs_count: int = data_fsm.get('total_wordpairs_count')
-    available_idxs: list = list(range(total_wordpairs_count))  # Список індексів словникових пар
-    start_time_training: datetime = datetime.now()  # Час початку тренування
+    data_fsm: dict[str, Any] = await state.get_data()
+    selected_vocab_ids: list[int] = data_fsm.get('mixed_selected_vocab_ids', [])
 
-    await state.update_data(training_mode='direct_translation',
-                            start_time_training=start_time_training,
-                            available_idxs=available_idxs)
-    logger.info('Початкові дані тренування збережені у FSM-Cache')
+    if vocab_id in selected_vocab_ids:
+        selected_vocab_ids.remove(vocab_id)
+    else:
+        selected_vocab_ids.append(vocab_id)
+
+    await state.update_data(mixed_selected_vocab_ids=selected_vocab_ids)
+    logger.info(f'Оновлено обрані словники для змішаного тренування у FSM-Cache. VOCAB_IDS: {selected_vocab_ids}')
+
+    # Сторінка словників, на якій натиснуто кнопку
+    vocab_crud = VocabCRUD(session)
+    vocabs_page: VocabsPageType = get_vocabs_page(vocab_crud,
+                                                  user_db_id,
+                                                  cursor_id=callback_data.cursor_id,
+                                                  is_backward=callback_data.is_backward)
+
+    kb: InlineKeyboardMarkup = get_kb_mixed_vocab_selection(vocabs_page,
+                                                            selected_vocab_ids,
+                                                            cursor_id=callback_data.cursor_id,
+                                                            is_backward=callback_data.is_backward)
+    await callback.message.edit_reply_markup(reply_markup=kb)
+
+
+@router.callback_query(F.data.in_({'start_mixed_selected', 'start_mixed_all'}))
+async def process_start_mixed_training(callback: types.CallbackQuery,
+                                       state: FSMContext,
+                                       session: Session,
+                                       user_db_id: int) -> None:
+    """Відстежує натискання на кнопки "Тренувати обрані" та "Тренувати всі" під час вибору словників
+    для змішаного тренування.
+    Відправляє клавіатуру з вибором типу тренування.
+    """
+    if callback.data == 'start_mixed_all':
+        vocab_crud = VocabCRUD(session)
+        mixed_vocab_ids: list[int] = vocab_crud.get_vocab_ids(user_db_id)
+    else:
+        data_fsm: dict[str, Any] = await state.get_data()
+        mixed_vocab_ids: list[int] = data_fsm.get('mixed_selected_vocab_ids', [])
 
-    new_state: State = VocabTraining.waiting_for_translation
-    await state.set_state(new_state)
-    logger.info(f'FSM стан змінено на "{new_state}"')
+    # Якщо не обрано жодного словника
+    check_empty_filter = CheckEmptyFilter()
+    if check_empty_filter.apply(mixed_vocab_ids):
+        logger.info('Не обрано жодного словника для змішаного тренування')
+        await callback.answer(text=MSG_ERROR_NO_VOCABS_SELECTED, show_alert=True)
+        return  # Завершення обробки
+
+    vocab_name: str = MSG_MIXED_TRAINING_NAME.format(count=len(mixed_vocab_ids))
+    logger.info(f'Обрані словники для змішаного тренування. VOCAB_IDS: {mixed_vocab_ids}')
+
+    await state.update_data(vocab_id=None,
+                            vocab_name=vocab_name,
+                            mixed_vocab_ids=mixed_vocab_ids,
+                            last_session_mistake_ids=[])
+    logger.info('Дані змішаного тренування збережені у FSM-Cache')
 
-    await send_next_word(callback.message, state)
+    kb: InlineKeyboardMarkup = get_kb_training_modes(is_mixed_training=True)
+    msg_choose_training_mode: str = MSG_CHOOSE_TRAINING_MODE.format(name=vocab_name)
+    await callback.message.edit_text(text=msg_choose_training_mode, reply_markup=kb)
+
+
+@router.callback_query(F.data == 'direct_translation')
+async def process_direct_translation(callback: types.CallbackQuery,
+                                     state: FSMContext,
+                                     session: Session,
+                                     user_db_id: int) -> None:
+    """Відстежує натискання на кнопку "Прямий переклад" під час вибору типу тренування.
+    Починає процес тренування та відправляє перше слово для перекладу.
+    """
+    logger.info('Початок тренування. Тип: "Прямий переклад"')
+    await start_training(callback, state, session, user_db_id, training_mode='direct_translation')
 
 
 @router.callback_query(F.data == 'reverse_translation')
-async def process_reverse_translation(callback: types.CallbackQuery, state: FSMContext) -> None:
+async def process_reverse_translation(callback: types.CallbackQuery,
+                                      state: FSMContext,
+                                      session: Session,
+                                      user_db_id: int) -> None:
     """Відстежує натискання на кнопку "Зворотній переклад" під час вибору типу тренування.
     Починає процес тренування та відправляє перше слово для перекладу.
     Переводить FSM стан в очікування введення перекладу.
     """
     logger.info('Початок тренування. Тип: "Зворотній переклад"')
+    await start_training(callback, state, session, user_db_id, training_mode='reverse_translation')
+
+
+@router.callback_query(F.data == 'review_due')
+async def process_review_due(callback: types.CallbackQuery,
+                             state: FSMContext,
+                             session: Session,
+                             user_db_id: int) -> None:
+    """Відстежує натискання на кнопку "Повторення" під час вибору типу тренування.
+    Починає тренування лише тих словникових пар, час повторення яких настав (та ще не повторених).
+    """
+    logger.info('Початок тренування. Тип: "Повторення"')
+    await start_training(callback, state, session, user_db_id, training_mode='review_due')
+
+
+@router.callback_query(F.data == 'focus_mistakes')
+async def process_focus_mistakes(callback: types.CallbackQuery,
+                                 state: FSMContext,
+                                 session: Session,
+                                 user_db_id: int) -> None:
+    """Відстежує натискання на кнопку "Робота над помилками" під час вибору типу тренування.
+    Починає тренування, в якому словникові пари з більшою кількістю помилок випадають частіше.
+    """
+    logger.info('Початок тренування. Тип: "Робота над помилками"')
+    await start_training(callback, state, session, user_db_id, training_mode='focus_mistakes')
+
+
+@router.callback_query(F.data == 'review_mistakes')
+async def process_review_mistakes(callback: types.CallbackQuery,
+                                  state: FSMContext,
+                                  session: Session,
+                                  user_db_id: int) -> None:
+    """Відстежує натискання на кнопку "Повторення помилок" під час вибору типу тренування
+    або після завершення тренування.
+    Починає тренування лише тих словникових пар, в яких були помилки в останньому тренуванні або раніше.
+    """
+    logger.info('Початок тренування. Тип: "Повторення помилок"')
+
+    # Після завершення тренування стан FSM скинутий, тому кнопка працює так само, як і у виборі типу тренування
+    await start_training(callback, state, session, user_db_id, training_mode='review_mistakes')
+
+
+@router.callback_query(F.data == 'multiple_choice')
+async def process_multiple_choice(callback: types.CallbackQuery,
+                                  state: FSMContext,
+                                  session: Session,
+                                  user_db_id: int) -> None:
+    """Відстежує натискання на кнопку "Вибір відповіді" під час вибору типу тренування.
+    Починає тренування, в якому переклад обирається з варіантів відповіді у вигляді кнопок.
+    """
+    logger.info('Початок тренування. Тип: "Вибір відповіді"')
+    await start_training(callback, state, session, user_db_id, training_mode='multiple_choice')
+
+
+@router.callback_query(F.data == 'speed_round')
+async def process_speed_round(callback: types.CallbackQuery,
+                              state: FSMContext,
+                              session: Session,
+                              user_db_id: int) -> None:
+    """Відстежує натискання на кнопку "Швидкий раунд" під час вибору типу тренування.
+    Починає тренування, в якому потрібно перекласти якомога більше словникових пар за SPEED_ROUND_DURATION секунд,
+    а на кожну словникову пару є SPEED_QUESTION_TIMEOUT секунд.
+    """
+    logger.info('Початок тренування. Тип: "Швидкий раунд"')
+    await start_training(callback, state, session, user_db_id, training_mode='speed_round')
+
+
+@router.callback_query(F.data == 'quiz_sheet')
+async def process_quiz_sheet(callback: types.CallbackQuery,
+                             state: FSMContext,
+                             session: Session,
+                             user_db_id: int) -> None:
+    """Відстежує натискання на кнопку "Аркуш питань" під час вибору типу тренування.
+    Починає тренування, в якому декілька словникових пар надсилаються одним повідомленням,
+    а переклади всіх них приймаються однією відповіддю.
+    """
+    logger.info('Початок тренування. Тип: "Аркуш питань"')
+    await start_training(callback, state, session, user_db_id, training_mode='quiz_sheet')
+
+
+@router.callback_query(F.data == 'continue_training')
+async def process_continue_training(callback: types.CallbackQuery,
+                                    state: FSMContext,
+                                    session: Session,
+                                    user_db_id: int) -> None:
+    """Відстежує натискання на кнопку "Продовжити тренування" у розділі "Тренування".
+    Відновлює незавершене тренування зі збереженого прогресу (за первинним ключем) та відправляє поточне слово.
+    Переводить FSM стан в очікування введення перекладу.
+    """
+    checkpoint_crud = TrainingCheckpointCRUD(session)
+    checkpoint: TrainingCheckpoint | None = checkpoint_crud.get_checkpoint(user_db_id)
+
+    # Тренування могло бути завершене як покинуте, поки була відкрита клавіатура
+    if checkpoint is None:
+        logger.info('Немає незавершеного тренування для продовження')
+        await callback.answer(text=MSG_INFO_NO_TRAINING_TO_CONTINUE, show_alert=True)
+        return  # Завершення обробки
+
+    training_progress: TrainingProgressType = decode_training_progress(checkpoint.progress)
+    mixed_vocab_ids: list[int] | None = training_progress.get('mixed_vocab_ids')
+
+    if mixed_vocab_ids is not None:
+        vocab_name: str = MSG_MIXED_TRAINING_NAME.format(count=len(mixed_vocab_ids))
+    else:
+        try:
+            vocab_crud = VocabCRUD(session)
+            vocab_name: str = vocab_crud.get_vocab_data(checkpoint.vocabulary_id).get('name')
+        except InvalidVocabIndexError as e:
+            logger.error(e)
+            return
+
+    logger.info(f'Продовження тренування. Тип: "{checkpoint.training_mode}". VOCAB_ID: {checkpoint.vocabulary_id}')
+
     await callback.message.delete()
 
+    # Вибірка "Роботи над помилками" зберігається у кеші, а не у FSM-Cache. Якщо тренування продовжується
+    # без перезапуску бота, то вибірка з кешу новіша за збережену
+    serialized_sampler: bytes | None = training_progress.pop('mistake_sampler')
+    if serialized_sampler is not None:
+        get_mistake_sampler(user_db_id, checkpoint.start_time, lambda: WeightedSampler.deserialize(serialized_sampler))
+
+    await state.update_data(vocab_id=checkpoint.vocabulary_id,
+                            vocab_name=vocab_name,
+                            training_mode=checkpoint.training_mode,
+                            training_mode_name=TRAINING_MODE_NAMES[checkpoint.training_mode],
+                            start_time_training=checkpoint.start_time,
+                            training_wordpair_items={},
+                            next_wordpair_idx=None,
+                            total_wordpairs_count=len(training_progress['training_wordpair_ids']),
+                            is_use_current_words=True,
+                            wordpair_shown_at=None,
+                            is_hint_used=False,
+                            checkpoint_at=checkpoint.updated_at,
+                            checkpoint_progress_count=get_progress_count(training_progress),
+                            **training_progress)
+    logger.info('Прогрес тренування відновлено у FSM-Cache')
+
+    new_state: State = VocabTraining.waiting_for_translation
+    await state.set_state(new_state)
+    logger.info(f'FSM стан змінено на "{new_state}"')
+
+    await callback.message.answer(text=MSG_TRAINING_CONTINUED)
+    await send_next_word(callback.message, state, session, user_db_id)
+
+
+async def start_training(callback: types.CallbackQuery,
+                         state: FSMContext,
+                         session: Session,
+                         user_db_id: int,
+                         training_mode: str) -> None:
+    """Починає процес тренування обраного типу та відправляє перше слово для перекладу.
+    Переводить FSM стан в очікування введення перекладу.
+    """
     data_fsm: dict[str, Any] = await state.get_data()
 
-    total_wordpairs_count: int = data_fsm.get('total_wordpairs_count')
-    available_idxs: list = list(range(total_wordpairs_count))  # Список індексів словникових пар
+    # Якщо немає словникових пар для тренування (наприклад, немає пар для повторення)
+    if not await prepare_training_wordpairs(state, session, data_fsm, training_mode, user_db_id):
+        logger.info('Немає словникових пар для тренування')
+
+        kb: InlineKeyboardMarkup = get_kb_training_modes(is_mixed_training(data_fsm))
+        await callback.message.edit_text(text=get_no_wordpairs_message(training_mode), reply_markup=kb)
+        return  # Завершення обробки
+
+    # Для тренування "Вибір відповіді" потрібно хоча б два різні варіанти відповіді
+    if training_mode == 'multiple_choice' and len(get_vocab_distractor_index(session, data_fsm, user_db_id)) < 2:
+        logger.info('Недостатньо варіантів відповіді для тренування')
+
+        kb: InlineKeyboardMarkup = get_kb_training_modes()
+        await callback.message.edit_text(text=MSG_INFO_NOT_ENOUGH_CHOICE_OPTIONS, reply_markup=kb)
+        return  # Завершення обробки
+
+    await callback.message.delete()
+
     start_time_training: datetime = datetime.now()  # Час початку тренування
 
-    await state.update_data(training_mode='reverse_translation',
+    await state.update_data(training_mode=training_mode,
+                            training_mode_name=TRAINING_MODE_NAMES[training_mode],
                             start_time_training=start_time_training,
-                            available_idxs=available_idxs)
+                            session_wordpair_errors={},
+                            session_wordpair_stats={})
     logger.info('Початкові дані тренування збережені у FSM-Cache')
 
     new_state: State = VocabTraining.waiting_for_translation
     await state.set_state(new_state)
     logger.info(f'FSM стан змінено на "{new_state}"')
 
-    await send_next_word(callback.message, state)
+    await send_next_word(callback.message, state, session, user_db_id)
+
+
+def get_no_wordpairs_message(training_mode: str) -> str:
+    """Повертає повідомлення про відсутність словникових пар для тренування обраного типу"""
+    if training_mode == 'review_mistakes':
+        return MSG_INFO_NO_WORDPAIRS_WITH_MISTAKES
+    return MSG_INFO_NO_WORDPAIRS_DUE
+
+
+def is_mixed_training(data_fsm: dict[str, Any]) -> bool:
+    """Перевіряє, чи тренування змішане (з декількох словників)"""
+    return data_fsm.get('mixed_vocab_ids') is not None
+
+
+async def prepare_training_wordpairs(state: FSMContext,
+                                     session: Session,
+                                     data_fsm: dict[str, Any],
+                                     training_mode: str,
+                                     user_db_id: int) -> bool:
+    """Отримує ID словникових пар для тренування та зберігає у FSM-Cache нову (перемішану) чергу їх індексів.
+
+    Returns:
+        bool: Чи є словникові пари для тренування.
+    """
+    training_wordpair_ids: list[int] = get_training_wordpair_ids(session, data_fsm, training_mode, user_db_id)
+
+    check_empty_filter = CheckEmptyFilter()
+    if check_empty_filter.apply(training_wordpair_ids):
+        return False
+
+    total_wordpairs_count: int = len(training_wordpair_ids)  # К-сть словникових пар у тренуванні
+    available_idxs: list = list(range(total_wordpairs_count))  # Черга індексів словникових пар
+    random.shuffle(available_idxs)
+
+    await state.update_data(training_wordpair_ids=training_wordpair_ids,
+                            training_wordpair_items={},
+                            total_wordpairs_count=total_wordpairs_count,
+                            available_idxs=available_idxs,
+                            next_wordpair_idx=None)
+    logger.info(f'Словникові пари для тренування збережені у FSM-Cache. Кількість: {total_wordpairs_count}')
+    return True
+
+
+def get_training_wordpair_ids(session: Session,
+                              data_fsm: dict[str, Any],
+                              training_mode: str,
+                              user_db_id: int) -> list[int]:
+    """Повертає ID словникових пар для тренування обраного типу.
+
+    Notes:
+        - Для змішаного тренування — ID випадкових словникових пар обраних словників.
+        - Для тренування "Повторення" — ID пар, час повторення яких настав (та ще не повторених).
+        - Для тренування "Повторення помилок" — ID пар з помилками (див. get_review_mistakes_wordpair_ids).
+        - В інших випадках — ID всіх словникових пар словника (за індексом, без завантаження їх даних).
+        Дані словникових пар завантажуються частинами під час тренування (див. load_training_wordpair_item).
+    """
+    vocab_id: int = data_fsm.get('vocab_id')
+
+    wordpair_crud = WordpairCRUD(session)
+
+    if training_mode == 'review_mistakes':
+        return get_review_mistakes_wordpair_ids(session, data_fsm)
+
+    if is_mixed_training(data_fsm):
+        return wordpair_crud.sample_wordpair_ids(vocab_ids=data_fsm.get('mixed_vocab_ids'),
+                                                 limit=MIXED_SESSION_SIZE)
+
+    if training_mode == 'review_due':
+        review_crud = ReviewCRUD(session)
+        return review_crud.get_due_wordpair_ids(user_db_id=user_db_id,
+                                                vocab_id=vocab_id,
+                                                now=datetime.now(),
+                                                limit=REVIEW_DUE_SESSION_SIZE)
+
+    return wordpair_crud.get_wordpair_ids(vocab_id)
+
+
+def get_review_mistakes_wordpair_ids(session: Session, data_fsm: dict[str, Any]) -> list[int]:
+    """Повертає ID словникових пар для тренування "Повторення помилок" (не більше REVIEW_MISTAKES_SESSION_SIZE).
+
+    Notes:
+        Спочатку йдуть словникові пари з помилками в останньому тренуванні (їх ID зберігаються у FSM-Cache
+        після завершення тренування, тому повторно не запитуються), а потім пари словника з найбільшою
+        кількістю помилок (за індексом, див. WordpairCRUD.get_mistake_wordpair_ids).
+        Для змішаного тренування використовуються лише словникові пари з помилками в останньому тренуванні.
+    """
+    last_session_mistake_ids: list[int] = data_fsm.get('last_session_mistake_ids', [])
+    if is_mixed_training(data_fsm):
+        return last_session_mistake_ids[:REVIEW_MISTAKES_SESSION_SIZE]
+
+    wordpair_crud = WordpairCRUD(session)
+    mistake_wordpair_ids: list[int] = wordpair_crud.get_mistake_wordpair_ids(vocab_id=data_fsm.get('vocab_id'),
+                                                                             limit=REVIEW_MISTAKES_SESSION_SIZE)
+
+    # Без повторів, зі збереженням порядку
+    wordpair_ids: list[int] = list(dict.fromkeys([*last_session_mistake_ids, *mistake_wordpair_ids]))
+    return wordpair_ids[:REVIEW_MISTAKES_SESSION_SIZE]
+
+
+async def load_training_wordpair_item(state: FSMContext,
+                                      session: Session,
+                                      data_fsm: dict[str, Any],
+                                      wordpair_idx: int,
+                                      next_idxs: list[int] | None = None) -> dict:
+    """Повертає дані словникової пари тренування за її індексом (див. load_training_wordpair_items)"""
+    wordpair_items: list[dict] = await load_training_wordpair_items(state, session, data_fsm, [wordpair_idx], next_idxs)
+    return wordpair_items[0]
+
+
+async def load_training_wordpair_items(state: FSMContext,
+                                       session: Session,
+                                       data_fsm: dict[str, Any],
+                                       wordpair_idxs: list[int],
+                                       next_idxs: list[int] | None = None) -> list[dict]:
+    """Повертає дані словникових пар тренування за їх індексами (у тому ж порядку).
+
+    Notes:
+        Якщо дані хоча б однієї словникової пари ще не завантажені, то разом з ними з БД за первинним ключем
+        завантажуються дані наступних словникових пар (за замовчуванням — не більше TRAINING_PREFETCH_SIZE
+        наступних у черзі). У FSM-Cache зберігаються дані лише поточних та наступних словникових пар.
+
+    Args:
+        state (FSMContext): FSM-контекст користувача.
+        session (Session): Сесія БД.
+        data_fsm (dict[str, Any]): Дані FSM-Cache.
+        wordpair_idxs (list[int]): Індекси словникових пар.
+        next_idxs (list[int] | None): Індекси словникових пар, дані яких завантажуються наперед
+        (за замовчуванням None — наступні у черзі невикористаних індексів).
+    """
+    wordpair_items: dict[int, dict] = data_fsm.get('training_wordpair_items')
+    if all(wordpair_idx in wordpair_items for wordpair_idx in wordpair_idxs):
+        return [wordpair_items[wordpair_idx] for wordpair_idx in wordpair_idxs]
+
+    wordpair_ids: list[int] = data_fsm.get('training_wordpair_ids')
+    if next_idxs is None:
+        next_idxs = data_fsm.get('available_idxs')[:TRAINING_PREFETCH_SIZE]
+
+    prefetch_idxs: list[int] = list(dict.fromkeys([*wordpair_idxs, *next_idxs]))
+    missing_idxs: list[int] = [idx for idx in prefetch_idxs if idx not in wordpair_items]
+
+    wordpair_crud = WordpairCRUD(session)
+    loaded_items: list[dict] = wordpair_crud.get_wordpairs_by_ids([wordpair_ids[idx] for idx in missing_idxs])
+
+    loaded_items_by_id: dict[int, dict] = {wordpair_item.get('id'): wordpair_item for wordpair_item in loaded_items}
+    wordpair_items = {idx: wordpair_items[idx] if idx in wordpair_items else loaded_items_by_id[wordpair_ids[idx]]
+                      for idx in prefetch_idxs}
+
+    await state.update_data(training_wordpair_items=wordpair_items)
+    logger.info(f'Дані словникових пар завантажено з БД та збережено у FSM-Cache. Кількість: {len(loaded_items)}')
+    return [wordpair_items[wordpair_idx] for wordpair_idx in wordpair_idxs]
+
+
+def get_vocab_distractor_index(session: Session, data_fsm: dict[str, Any], user_db_id: int) -> DistractorIndex:
+    """Повертає індекс варіантів відповіді словника для тренування "Вибір відповіді".
+
+    Notes:
+        Варіантами відповіді є переклади словникових пар словника. Якщо їх менше, ніж потрібно
+        для одного питання, то додаються переклади з інших словників користувача.
+    """
+    vocab_id: int = data_fsm.get('vocab_id')
+
+    def create_options() -> list[str]:
+        """Повертає варіанти відповіді для індексу (викликається лише при його побудові)"""
+        wordpair_crud = WordpairCRUD(session)
+        options: list[str] = wordpair_crud.get_vocab_translations(vocab_id)
+
+        if len(options) < CHOICE_OPTIONS_COUNT:
+            options.extend(wordpair_crud.get_user_translations(user_db_id=user_db_id,
+                                                               excluded_vocab_id=vocab_id,
+                                                               limit=CHOICE_EXTRA_OPTIONS_LIMIT))
+        return options
+
+    return get_distractor_index(user_db_id, vocab_id, create_options)
+
+
+def get_training_mistake_sampler(session: Session,
+                                 data_fsm: dict[str, Any],
+                                 user_db_id: int) -> WeightedSampler | None:
+    """Повертає вибірку з вагами за кількістю невдалих спроб (у напрямку перекладу тренування)
+    для тренування "Робота над помилками" з кешу. Для інших типів тренування повертає None.
+
+    Notes:
+        Вибірка будується при першому зверненні під час тренування. Якщо її було витіснено з кешу,
+        то під час побудови враховуються помилки поточного тренування, а словникові пари,
+        яких вже немає у черзі невикористаних індексів, отримують нульову вагу.
+    """
+    training_mode: str = data_fsm.get('training_mode')
+    if training_mode != 'focus_mistakes':
+        return None
+
+    def create_sampler() -> WeightedSampler:
+        """Будує вибірку тренування (викликається, якщо її немає у кеші)"""
+        wordpair_crud = WordpairCRUD(session)
+        wordpair_error_counts: dict[int, int] = wordpair_crud.get_wordpair_error_counts(
+            vocab_id=data_fsm.get('vocab_id'),
+            user_db_id=user_db_id,
+            direction=get_training_direction(training_mode))
+
+        session_wordpair_errors: dict[int, int] = data_fsm.get('session_wordpair_errors', {})
+        available_idxs: set[int] = set(data_fsm.get('available_idxs'))
+        weights: list[int] = [get_mistake_weight(wordpair_error_counts.get(wordpair_id, 0),
+                                                 session_wordpair_errors.get(wordpair_id, 0))
+                              if wordpair_idx in available_idxs else 0
+                              for wordpair_idx, wordpair_id in enumerate(data_fsm.get('training_wordpair_ids'))]
+        logger.info(f'Побудовано вибірку тренування "Робота над помилками". Розмір: {len(weights)}')
+        return WeightedSampler.from_weights(weights)
+
+    return get_mistake_sampler(user_db_id, data_fsm.get('start_time_training'), create_sampler)
+
+
+def update_mistake_sampler(session: Session,
+                           data_fsm: dict[str, Any],
+                           user_db_id: int,
+                           wordpair_idx: int,
+                           weight: int) -> None:
+    """Оновлює вагу словникової пари у вибірці тренування "Робота над помилками" (у кеші)"""
+    sampler: WeightedSampler | None = get_training_mistake_sampler(session, data_fsm, user_db_id)
+    if sampler is None:
+        return
+
+    sampler.update(wordpair_idx, weight)
+    logger.info(f'Оновлення ваги словникової пари у вибірці. Вага: {weight}. WORDPAIR_IDX: {wordpair_idx}')
+
+
+async def update_session_wordpair_stat(state: FSMContext, wordpair_id: int, **counters: int) -> None:
+    """Оновлює статистику словникової пари за поточне тренування у FSM-Cache (див. add_session_wordpair_stat)"""
+    data_fsm: dict[str, Any] = await state.get_data()
+
+    session_wordpair_stats: dict[int, WordpairStatType] = data_fsm.get('session_wordpair_stats', {})
+    add_session_wordpair_stat(session_wordpair_stats, wordpair_id, seen_at=datetime.now(), **counters)
+    await state.update_data(session_wordpair_stats=session_wordpair_stats)
 
 
 @router.callback_query(F.data == 'change_training_mode')
@@ -200,18 +803,24 @@ async def process_change_training_mode(callback: types.CallbackQuery, state: FSM
     data_fsm: dict[str, Any] = await state.get_data()
     vocab_name: str = data_fsm.get('vocab_name')
 
-    kb: InlineKeyboardMarkup = get_kb_training_modes()
+    kb: InlineKeyboardMarkup = get_kb_training_modes(is_mixed_training(data_fsm))
     msg_choose_training_mode: str = MSG_CHOOSE_TRAINING_MODE.format(name=vocab_name)
 
     await callback.message.edit_text(text=msg_choose_training_mode, reply_markup=kb)
 
 
-async def send_next_word(message: types.Message, state: FSMContext) -> None:
+async def send_next_word(message: types.Message, state: FSMContext, session: Session, user_db_id: int) -> None:
     """Відправляє наступне слово для перекладу"""
     data_fsm: dict[str, Any] = await state.get_data()
 
     available_idxs: list = data_fsm.get('available_idxs')  # Список індексів, які ще не були використані
 
+    # Тренування "Швидкий раунд" завершується, щойно вичерпано час раунду (навіть якщо залишились словникові пари)
+    speed_round_ends_at: datetime | None = data_fsm.get('speed_round_ends_at')
+    if speed_round_ends_at is not None and datetime.now() >= speed_round_ends_at:
+        await finish_speed_round(message, state, session, user_db_id)
+        return
+
     # Якщо не залишилось невикористаних індексів
     check_empty_filter = CheckEmptyFilter()
     if check_empty_filter.apply(available_idxs):
@@ -219,13 +828,17 @@ async def send_next_word(message: types.Message, state: FSMContext) -> None:
         logger.info('Оновлення  а "тренування було завершено (is_training_completed)" на True у FSM-Cache')
 
         await send_training_finish_stats(message, state)
-        await finish_training(state)
+        await finish_training(state, session, user_db_id)
+        return
+
+    if data_fsm.get('training_mode') == 'quiz_sheet':
+        await send_quiz_sheet(message, state, session, user_db_id)
         return
 
     vocab_name: str = data_fsm.get('vocab_name')
-    wordpair_items: list[dict] = data_fsm.get('wordpair_items')
     total_wordpairs_count: int = data_fsm.get('total_wordpairs_count')
     training_mode: str = data_fsm.get('training_mode')  # Обраний тип тренування
+    training_mode_name: str = data_fsm.get('training_mode_name')  # Назва обраного типу тренування
     preview_wordpair_idx: int = data_fsm.get('wordpair_idx', 0)  # Минулий індекс
 
     # Прапор, використовувати поточне слово(а) чи обрати нове
@@ -233,78 +846,392 @@ async def send_next_word(message: types.Message, state: FSMContext) -> None:
     if is_use_current_words:
         await state.update_data(is_use_current_words=False)
 
+    # Вибірка з вагами за кількістю помилок (лише для тренування "Робота над помилками")
+    sampler: WeightedSampler | None = get_training_mistake_sampler(session, data_fsm, user_db_id)
+
     wordpair_idx: int = get_wordpair_idx_for_training(available_idxs,
                                                       preview_wordpair_idx,
-                                                      is_use_current_words)
+                                                      is_use_current_words,
+                                                      sampler,
+                                                      data_fsm.get('next_wordpair_idx'))
     await state.update_data(wordpair_idx=wordpair_idx)
     logger.info('Оновлення нового індексу словникової пари у FSM-Cache')
 
-    wordpair_item: dict[str, Any] = wordpair_items[wordpair_idx]
+    # Черга невикористаних індексів не визначає порядок словникових пар з вибіркою, тому наступна словникова пара
+    # обирається заздалегідь, а її дані завантажуються після відправлення питання (див. кінець функції)
+    next_idxs: list[int] | None = None
+    if sampler is not None:
+        next_wordpair_idx: int = await predraw_next_wordpair_idx(state,
+                                                                 data_fsm,
+                                                                 sampler,
+                                                                 wordpair_idx,
+                                                                 is_use_current_words)
+        next_idxs = []
+
+    # Час показу та прапор підказки належать словниковій парі, поки на неї не буде відповіді (для журналу відповідей)
+    if not is_use_current_words:
+        await state.update_data(wordpair_shown_at=datetime.now(), is_hint_used=False)
+
+    wordpair_item: dict[str, Any] = await load_training_wordpair_item(state, session, data_fsm, wordpair_idx, next_idxs)
 
     wordpair_id: int = wordpair_item.get('id')
-    wordpair_annotation: str = wordpair_item.get('annotation') or 'Відсутня'
     wordpair_total_error_count: int = wordpair_item.get('number_errors')  # К-сть всіх помилок словникової пари з БД
 
-    # Список всіх слів та перекладів словникової пари з їх транскрипціями
-    word_items: list[dict] = wordpair_item.get('words')
-    translation_items: list[dict] = wordpair_item.get('translations')
-
-    # Дані для тренування
-    training_data: dict[str, Any] = get_training_data(training_mode, word_items, translation_items)
-    training_mode_name: str = training_data.get('training_mode_name')
+    # Дані для тренування (з кешу текстів словникових пар)
+    training_data: dict[str, Any] = get_training_data(training_mode, get_wordpair_render(wordpair_item))
     formatted_words: str = training_data.get('formatted_words')
     formatted_translations: str = training_data.get('formatted_translations')
-    correct_translations: list[str] = training_data.get('correct_translations')
+    wordpair_annotation: str = training_data.get('annotation')
 
     logger.info(f'Словникова пара для перекладу: "{formatted_words}" -> "{formatted_translations}" -> '
                 f'"{wordpair_annotation}". WORDPAIR_ID: {wordpair_id}. WORDPAIR_IDX: {wordpair_idx}')
 
     wordpairs_left: int = total_wordpairs_count - len(available_idxs)  # Скільки залишилось словникових пар
 
-    kb: InlineKeyboardMarkup = get_kb_training_actions()  # Клавіатура з діями під час тренування
+    if training_mode == 'multiple_choice':
+        # Варіанти відповіді: перший переклад словникової пари та схожі переклади інших словникових пар
+        correct_option: str = wordpair_item.get('translations')[0].get('translation')
+        distractor_index: DistractorIndex = get_vocab_distractor_index(session, data_fsm, user_db_id)
+        choice_options: list[str] = distractor_index.sample(answer=correct_option,
+                                                            answer_keys=training_data.get('answer_keys'),
+                                                            count=CHOICE_OPTIONS_COUNT - 1)
+        choice_options.append(correct_option)
+        random.shuffle(choice_options)
+
+        await state.update_data(choice_options=choice_options,
+                                choice_correct_idx=choice_options.index(correct_option))
+        logger.info('Варіанти відповіді збережені у FSM-Cache')
+
+        # Клавіатура з варіантами відповіді та діями під час тренування
+        kb: InlineKeyboardMarkup = get_kb_training_choices(choice_options, wordpair_idx)
+    else:
+        kb: InlineKeyboardMarkup = get_kb_training_actions()  # Клавіатура з діями під час тренування
     msg_enter_translation: str = format_training_process_message(vocab_name=vocab_name,
                                                                  training_mode=training_mode_name,
                                                                  wordpairs_left=wordpairs_left,
                                                                  total_wordpairs_count=total_wordpairs_count,
                                                                  words=formatted_words)
 
-    await state.update_data(wordpair_id=wordpair_id,
-                            wordpair_total_error_count=wordpair_total_error_count,
-                            wordpair_annotation=wordpair_annotation,
-                            formatted_words=formatted_words,
-                            formatted_translations=formatted_translations,
-                            correct_translations=correct_translations,
-                            training_mode_name=training_mode_name)
+    await state.update_data(wordpair_id=wordpair_id, wordpair_total_error_count=wordpair_total_error_count)
     logger.info('Дані словникової пари збережені у FSM-Cache')
 
+    if training_mode == 'speed_round':
+        msg_speed_round_timer: str = await schedule_speed_round_timers(message, state, user_db_id)
+        msg_enter_translation = f'{msg_enter_translation}\n\n{msg_speed_round_timer}'
+
+    await save_training_checkpoint(state, session, user_db_id)
+
     await message.answer(text=msg_enter_translation, reply_markup=kb)
 
+    # Дані заздалегідь обраної наступної словникової пари завантажуються, поки користувач відповідає
+    if sampler is not None:
+        data_fsm = await state.get_data()
+        await load_training_wordpair_items(state, session, data_fsm, [wordpair_idx, next_wordpair_idx], next_idxs=[])
+
+
+async def predraw_next_wordpair_idx(state: FSMContext,
+                                    data_fsm: dict[str, Any],
+                                    sampler: WeightedSampler,
+                                    wordpair_idx: int,
+                                    is_use_current_words: bool) -> int:
+    """Обирає з вибірки наступний індекс словникової пари (після поточної) та зберігає його у FSM-Cache.
+    Якщо поточна словникова пара показується повторно, то повертає вже обраний наступний індекс.
+    """
+    next_wordpair_idx: int | None = data_fsm.get('next_wordpair_idx')
+    if is_use_current_words and next_wordpair_idx is not None:
+        return next_wordpair_idx
+
+    next_wordpair_idx = get_wordpair_idx_for_training(available_idxs=data_fsm.get('available_idxs'),
+                                                      preview_wordpair_idx=wordpair_idx,
+                                                      is_use_current_words=False,
+                                                      sampler=sampler)
+    await state.update_data(next_wordpair_idx=next_wordpair_idx)
+    logger.info(f'Наступний індекс словникової пари обрано заздалегідь. WORDPAIR_IDX: {next_wordpair_idx}')
+    return next_wordpair_idx
+
+
+async def send_quiz_sheet(message: types.Message, state: FSMContext, session: Session, user_db_id: int) -> None:
+    """Відправляє аркуш питань: не більше QUIZ_SHEET_SIZE наступних у черзі словникових пар одним повідомленням.
+    Переводить FSM стан в очікування перекладів усіх питань аркуша.
+    """
+    data_fsm: dict[str, Any] = await state.get_data()
+
+    training_mode: str = data_fsm.get('training_mode')
+    total_wordpairs_count: int = data_fsm.get('total_wordpairs_count')
+    available_idxs: list = data_fsm.get('available_idxs')
+
+    quiz_sheet_idxs: list[int] = available_idxs[:QUIZ_SHEET_SIZE]  # Індекси словникових пар аркуша
+    wordpair_items: list[dict] = await load_training_wordpair_items(state, session, data_fsm, quiz_sheet_idxs)
+
+    prompt_lines: list[str] = []
+    for question_num, wordpair_item in enumerate(wordpair_items, start=1):
+        training_data: dict[str, Any] = get_training_data(training_mode, get_wordpair_render(wordpair_item))
+        prompt_lines.append(MSG_QUIZ_SHEET_PROMPT_LINE.format(num=question_num,
+                                                              words=training_data.get('formatted_words')))
+
+    # Індекс першої словникової пари аркуша зберігається як поточний (для збереження прогресу тренування)
+    await state.update_data(quiz_sheet_idxs=quiz_sheet_idxs,
+                            wordpair_idx=quiz_sheet_idxs[0],
+                            is_use_current_words=False,
+                            wordpair_shown_at=datetime.now(),
+                            is_hint_used=False)
+    logger.info(f'Аркуш питань збережено у FSM-Cache. Кількість питань: {len(quiz_sheet_idxs)}')
+
+    new_state: State = VocabTraining.waiting_for_quiz_sheet_answers
+    await state.set_state(new_state)
+    logger.info(f'FSM стан змінено на "{new_state}"')
+
+    msg_quiz_sheet: str = format_training_process_message(
+        vocab_name=data_fsm.get('vocab_name'),
+        training_mode=data_fsm.get('training_mode_name'),
+        wordpairs_left=total_wordpairs_count - len(available_idxs),
+        total_wordpairs_count=total_wordpairs_count,
+        words='\n'.join(prompt_lines))
+
+    await save_training_checkpoint(state, session, user_db_id)
+
+    await message.answer(text=f'{msg_quiz_sheet}\n\n{MSG_QUIZ_SHEET_HINT}', reply_markup=get_kb_quiz_sheet())
+
+
+async def schedule_speed_round_timers(message: types.Message, state: FSMContext, user_db_id: int) -> str:
+    """Планує таймер часу на відповідь на поточну словникову пару тренування "Швидкий раунд",
+    а для першої словникової пари — і таймер завершення раунду (див. speed_round_timers).
+
+    Returns:
+        str: Повідомлення з часом до кінця раунду та часом на відповідь.
+    """
+    data_fsm: dict[str, Any] = await state.get_data()
+
+    now: datetime = datetime.now()
+    start_time_training: datetime = data_fsm.get('start_time_training')
+    speed_round_ends_at: datetime | None = data_fsm.get('speed_round_ends_at')
+
+    if speed_round_ends_at is None:
+        speed_round_ends_at = now + timedelta(seconds=SPEED_ROUND_DURATION)
+        await state.update_data(speed_round_ends_at=speed_round_ends_at)
+        speed_round_timers.schedule_round_end(user_db_id,
+                                              SPEED_ROUND_DURATION,
+                                              on_speed_round_end,
+                                              message,
+                                              state,
+                                              user_db_id,
+                                              start_time_training)
+        logger.info('Заплановано завершення раунду тренування "Швидкий раунд"')
+
+    round_seconds_left: float = (speed_round_ends_at - now).total_seconds()
+
+    # Номер питання відрізняє таймер поточної словникової пари від таймерів попередніх
+    question_seq: int = data_fsm.get('speed_question_seq', 0) + 1
+    await state.update_data(speed_question_seq=question_seq)
+
+    # Якщо раунд закінчиться раніше, ніж час на відповідь, то достатньо таймера завершення раунду
+    if round_seconds_left > SPEED_QUESTION_TIMEOUT:
+        speed_round_timers.schedule_question(user_db_id,
+                                             SPEED_QUESTION_TIMEOUT,
+                                             on_speed_question_timeout,
+                                             message,
+                                             state,
+                                             user_db_id,
+                                             question_seq)
+    else:
+        speed_round_timers.cancel_question(user_db_id)
+
+    return MSG_SPEED_ROUND_TIMER.format(round_seconds=math.ceil(round_seconds_left),
+                                        question_seconds=math.ceil(min(SPEED_QUESTION_TIMEOUT, round_seconds_left)))
+
+
+async def is_waiting_for_translation(state: FSMContext) -> bool:
+    """Перевіряє, чи користувач зараз перекладає словникову пару (а не, наприклад, підтверджує завершення)"""
+    return await state.get_state() == VocabTraining.waiting_for_translation.state
+
+
+async def on_speed_question_timeout(message: types.Message,
+                                    state: FSMContext,
+                                    user_db_id: int,
+                                    question_seq: int) -> None:
+    """Таймер часу на відповідь тренування "Швидкий раунд" (див. schedule_speed_round_timers).
+    Показує переклад поточної словникової пари та відправляє наступне слово.
+    """
+    data_fsm: dict[str, Any] = await state.get_data()
+
+    # Відповідь могла надійти, поки таймер вже спрацював
+    if not await is_waiting_for_translation(state) or data_fsm.get('speed_question_seq') != question_seq:
+        return
+
+    logger.info('Вичерпано час на відповідь у тренуванні "Швидкий раунд"')
+
+    await message.answer(text=MSG_INFO_SPEED_QUESTION_TIMEOUT)
+    with Session() as session:
+        await show_current_translation(message, state, session, user_db_id)
+
+
+async def on_speed_round_end(message: types.Message,
+                             state: FSMContext,
+                             user_db_id: int,
+                             start_time_training: datetime) -> None:
+    """Таймер завершення раунду тренування "Швидкий раунд" (див. schedule_speed_round_timers).
+    Якщо користувач зараз не перекладає словникову пару, то раунд завершиться під час наступного слова.
+    """
+    data_fsm: dict[str, Any] = await state.get_data()
+
+    if not await is_waiting_for_translation(state) or data_fsm.get('start_time_training') != start_time_training:
+        return
+
+    with Session() as session:
+        await finish_speed_round(message, state, session, user_db_id)
+
+
+async def finish_speed_round(message: types.Message, state: FSMContext, session: Session, user_db_id: int) -> None:
+    """Завершує тренування "Швидкий раунд", час раунду якого вичерпано"""
+    logger.info('Вичерпано час раунду тренування "Швидкий раунд"')
+
+    await state.update_data(is_training_completed=True)
+    logger.info('Оновлення прапора "тренування було завершено (is_training_completed)" на True у FSM-Cache')
+
+    await message.answer(text=MSG_SPEED_ROUND_FINISHED)
+    await send_training_finish_stats(message, state)
+    await finish_training(state, session, user_db_id)
+
+
+async def save_training_checkpoint(state: FSMContext, session: Session, user_db_id: int) -> None:
+    """Зберігає прогрес тренування до БД, якщо настав час збереження (див. is_checkpoint_due).
+
+    Notes:
+        Під час першого збереження прогресу тренування попереднє незавершене тренування користувача
+        (наприклад, перерване переходом до іншого розділу) завершується як покинуте.
+    """
+    data_fsm: dict[str, Any] = await state.get_data()
+
+    now: datetime = datetime.now()
+    if not is_checkpoint_due(data_fsm, now):
+        return
+
+    start_time_training: datetime = data_fsm.get('start_time_training')
+    progress: bytes = encode_training_progress(data_fsm, get_training_mistake_sampler(session, data_fsm, user_db_id))
+
+    checkpoint_crud = TrainingCheckpointCRUD(session)
+    if data_fsm.get('checkpoint_at') is None:
+        prev_checkpoint: TrainingCheckpoint | None = checkpoint_crud.get_checkpoint(user_db_id)
+        if prev_checkpoint is not None:
+            finalize_training_checkpoint(session, prev_checkpoint)
+            logger.info('Попереднє незавершене тренування завершено як покинуте')
+
+        checkpoint_crud.create_checkpoint(user_db_id=user_db_id,
+                                          vocab_id=data_fsm.get('vocab_id'),
+                                          training_mode=data_fsm.get('training_mode'),
+                                          start_time=start_time_training,
+                                          updated_at=now,
+                                          progress=progress)
+    elif not checkpoint_crud.update_checkpoint(user_db_id, start_time_training, updated_at=now, progress=progress):
+        logger.info('Прогрес тренування не збережено, бо тренування вже було завершене як покинуте')
+
+    await state.update_data(checkpoint_at=now, checkpoint_progress_count=get_progress_count(data_fsm))
+    logger.info(f'Прогрес тренування збережено до БД. Розмір: {len(progress)} байт')
+
+
+def get_current_training_data(data_fsm: dict[str, Any]) -> dict[str, Any]:
+    """Повертає дані для тренування поточної словникової пари (за її індексом у FSM-Cache) з кешу текстів"""
+    wordpair_items: dict[int, dict] = data_fsm.get('training_wordpair_items')
+    wordpair_idx: int = data_fsm.get('wordpair_idx')
+    training_mode: str = data_fsm.get('training_mode')
+
+    return get_training_data(training_mode, get_wordpair_render(wordpair_items[wordpair_idx]))
+
 
 @router.message(VocabTraining.waiting_for_translation)
-async def process_check_user_translation(message: types.Message, state: FSMContext) -> None:
+async def process_check_user_translation(message: types.Message,
+                                         state: FSMContext,
+                                         session: Session,
+                                         user_db_id: int) -> None:
     """Обробляє переклад, введений користувачем"""
     data_fsm: dict[str, Any] = await state.get_data()
 
     user_translation: str = message.text.strip()  # Введений користувачем переклад
     logger.info(f'Введений переклад: "{user_translation}"')
 
+    training_data: dict[str, Any] = get_current_training_data(data_fsm)
+    answer_keys: list[str] = training_data.get('answer_keys')  # Нормалізовані переклади
+
+    answer_verdict: str = check_answer(user_translation, answer_keys)
+    await process_training_answer(message, state, session, user_db_id, user_translation, answer_verdict)
+
+
+@router.callback_query(TrainingChoiceCallback.filter(), VocabTraining.waiting_for_translation)
+async def process_training_choice(callback: types.CallbackQuery,
+                                  callback_data: TrainingChoiceCallback,
+                                  state: FSMContext,
+                                  session: Session,
+                                  user_db_id: int) -> None:
+    """Відстежує натискання на кнопку варіанту відповіді під час тренування.
+    Перевіряє обраний варіант та відправляє наступне слово для перекладу.
+    """
+    data_fsm: dict[str, Any] = await state.get_data()
+
+    # Кнопки попередніх питань ігноруються
+    if callback_data.wordpair_idx != data_fsm.get('wordpair_idx'):
+        logger.info('Обрано варіант відповіді не поточної словникової пари')
+        await callback.answer()
+        return  # Завершення обробки
+
+    await callback.message.delete()
+
+    choice_options: list[str] = data_fsm.get('choice_options')
+    user_translation: str = choice_options[callback_data.option_idx]  # Обраний користувачем переклад
+    logger.info(f'Обраний переклад: "{user_translation}"')
+
+    is_correct_option: bool = callback_data.option_idx == data_fsm.get('choice_correct_idx')
+    answer_verdict: str = ANSWER_VERDICT_EXACT if is_correct_option else ANSWER_VERDICT_WRONG
+    await process_training_answer(callback.message, state, session, user_db_id, user_translation, answer_verdict)
+
+
+async def process_training_answer(message: types.Message,
+                                  state: FSMContext,
+                                  session: Session,
+                                  user_db_id: int,
+                                  user_translation: str,
+                                  answer_verdict: str) -> None:
+    """Обробляє перевірену відповідь користувача на поточну словникову пару та відправляє наступне слово"""
+    speed_round_timers.cancel_question(user_db_id)
+
+    data_fsm: dict[str, Any] = await state.get_data()
+
     wordpair_idx: int = data_fsm.get('wordpair_idx')  # Індекс поточної словникової пари
     wordpair_id: int = data_fsm.get('wordpair_id')  # ID в БД поточної словникової пари
 
-    formatted_words: str = data_fsm.get('formatted_words')
-    formatted_translations: str = data_fsm.get('formatted_translations')
+    training_data: dict[str, Any] = get_current_training_data(data_fsm)
+    formatted_words: str = training_data.get('formatted_words')
+    formatted_translations: str = training_data.get('formatted_translations')
 
     available_idxs: list = data_fsm.get('available_idxs')
-    correct_translations: list = data_fsm.get('correct_translations')  # Переклади у нижньому регістри без анотацій
 
-    if user_translation.lower() in correct_translations:
-        await message.answer(MSG_CORRECT_ANSWER.format(words=formatted_words, translations=formatted_translations))
-        logger.info('Переклад ВІРНИЙ')
+    answered_at: datetime = datetime.now()
+    await record_answer_event(data_fsm,
+                              user_db_id,
+                              answer_verdict,
+                              wordpair_id,
+                              get_answer_latency_ms(data_fsm.get('wordpair_shown_at'), answered_at),
+                              answered_at)
+    await update_session_wordpair_stat(state,
+                                       wordpair_id,
+                                       attempts=1,
+                                       number_errors=int(answer_verdict == ANSWER_VERDICT_WRONG))
+
+    if answer_verdict != ANSWER_VERDICT_WRONG:
+        if answer_verdict == ANSWER_VERDICT_NEAR:
+            await message.answer(MSG_NEAR_ANSWER.format(words=formatted_words, translations=formatted_translations))
+            logger.info('Переклад ВІРНИЙ З ОПИСКАМИ')
+        else:
+            await message.answer(MSG_CORRECT_ANSWER.format(words=formatted_words,
+                                                           translations=formatted_translations))
+            logger.info('Переклад ВІРНИЙ')
 
         available_idxs.remove(wordpair_idx)
         await state.update_data(available_idxs=available_idxs)
         logger.info('Видалення індексу коректного перекладу та оновлення списку невикористаних індексів у FSM-Cache')
 
+        update_wordpair_review(session, data_fsm, user_db_id, wordpair_id, is_translation_shown=False)
+        update_mistake_sampler(session, data_fsm, user_db_id, wordpair_idx, weight=0)
+
         correct_answer_count: int = data_fsm.get('correct_answer_count', 0)
         await state.update_data(correct_answer_count=correct_answer_count + 1)
         logger.info('Оновлення к-сть коректних відповідей у FSM-Cache')
@@ -313,20 +1240,154 @@ async def process_check_user_translation(message: types.Message, state: FSMConte
         logger.info('Переклад НЕ ВІРНИЙ')
 
         # Оновлення к-сть сумарних помилок словникової пари в БД
-        with Session() as session:
-            wordpair_crud = WordpairCRUD(session)
-            wordpair_crud.increment_wordpair_error_count(wordpair_id=wordpair_id)
-            logger.info('К-сть всіх помилок словникової пари в БД збільшено на 1')
+        wordpair_crud = WordpairCRUD(session)
+        wordpair_crud.increment_wordpair_error_count(wordpair_id=wordpair_id)
+        logger.info('К-сть всіх помилок словникової пари в БД збільшено на 1')
 
         wrong_answer_count: int = data_fsm.get('wrong_answer_count', 0)
         await state.update_data(wrong_answer_count=wrong_answer_count + 1)
         logger.info('К-сть некоректних відповідей збільшено на 1 у FSM-Cache')
 
-    await send_next_word(message, state)
+        session_wordpair_errors: dict[int, int] = data_fsm.get('session_wordpair_errors', {})
+        session_wordpair_errors[wordpair_id] = session_wordpair_errors.get(wordpair_id, 0) + 1
+        await state.update_data(session_wordpair_errors=session_wordpair_errors)
+        logger.info('К-сть помилок словникової пари за тренування збільшено на 1 у FSM-Cache')
+
+        wordpair_total_error_count: int = data_fsm.get('wordpair_total_error_count')
+        mistake_weight: int = get_mistake_weight(number_errors=wordpair_total_error_count,
+                                                 session_error_count=session_wordpair_errors[wordpair_id])
+        update_mistake_sampler(session, data_fsm, user_db_id, wordpair_idx, mistake_weight)
+
+        requeue_wordpair_idx(available_idxs, wordpair_idx)
+        await state.update_data(available_idxs=available_idxs)
+        logger.info('Переміщення індексу некоректного перекладу у черзі невикористаних індексів у FSM-Cache')
+
+    await send_next_word(message, state, session, user_db_id)
+
+
+@router.message(VocabTraining.waiting_for_quiz_sheet_answers)
+async def process_quiz_sheet_answers(message: types.Message,
+                                     state: FSMContext,
+                                     session: Session,
+                                     user_db_id: int) -> None:
+    """Обробляє переклади всіх питань аркуша, введені користувачем одним повідомленням.
+
+    Notes:
+        Усі відповіді перевіряються за один прохід, лічильники тренування у FSM-Cache оновлюються один раз,
+        а лічильники помилок та стан інтервального повторення в БД — пакетно (по одному запиту на всі пари).
+        Пропущені питання повертаються у чергу без помилки, як і після кнопки "Пропустити".
+    """
+    data_fsm: dict[str, Any] = await state.get_data()
+
+    training_mode: str = data_fsm.get('training_mode')
+    training_wordpair_ids: list[int] = data_fsm.get('training_wordpair_ids')
+    wordpair_items: dict[int, dict] = data_fsm.get('training_wordpair_items')
+    quiz_sheet_idxs: list[int] = data_fsm.get('quiz_sheet_idxs')
+    available_idxs: list = data_fsm.get('available_idxs')
+    session_wordpair_errors: dict[int, int] = data_fsm.get('session_wordpair_errors', {})
+    session_wordpair_stats: dict[int, WordpairStatType] = data_fsm.get('session_wordpair_stats', {})
+
+    user_translations: list[str] = parse_quiz_sheet_answers(message.text or '', len(quiz_sheet_idxs))
+    logger.info(f'Введені переклади аркуша питань: {user_translations}')
+
+    answered_at: datetime = datetime.now()
+    # Час відповіді на аркуш розподіляється порівну між питаннями, на які є відповідь
+    answers_count: int = sum(1 for user_translation in user_translations if user_translation)
+    latency_ms: int | None = get_answer_latency_ms(data_fsm.get('wordpair_shown_at'), answered_at, answers_count)
+
+    result_lines: list[str] = []
+    correct_wordpair_ids: list[int] = []
+    wrong_wordpair_ids: list[int] = []
+
+    quiz_sheet_answers = zip(quiz_sheet_idxs, user_translations, strict=True)
+    for question_num, (wordpair_idx, user_translation) in enumerate(quiz_sheet_answers, start=1):
+        wordpair_id: int = training_wordpair_ids[wordpair_idx]
+        training_data: dict[str, Any] = get_training_data(training_mode,
+                                                          get_wordpair_render(wordpair_items[wordpair_idx]))
+        formatted_words: str = training_data.get('formatted_words')
+        formatted_translations: str = training_data.get('formatted_translations')
+
+        if not user_translation:
+            requeue_wordpair_idx(available_idxs, wordpair_idx)
+            result_lines.append(MSG_QUIZ_SHEET_SKIPPED_LINE.format(num=question_num, words=formatted_words))
+            continue
+
+        answer_verdict: str = check_answer(user_translation, training_data.get('answer_keys'))
+        is_wrong_answer: bool = answer_verdict == ANSWER_VERDICT_WRONG
+
+        add_session_wordpair_stat(session_wordpair_stats,
+                                  wordpair_id,
+                                  seen_at=answered_at,
+                                  attempts=1,
+                                  number_errors=int(is_wrong_answer))
+        await record_answer_event(data_fsm, user_db_id, answer_verdict, wordpair_id, latency_ms, answered_at)
+
+        if is_wrong_answer:
+            session_wordpair_errors[wordpair_id] = session_wordpair_errors.get(wordpair_id, 0) + 1
+            wrong_wordpair_ids.append(wordpair_id)
+            requeue_wordpair_idx(available_idxs, wordpair_idx)
+            result_lines.append(MSG_QUIZ_SHEET_WRONG_LINE.format(num=question_num,
+                                                                 words=formatted_words,
+                                                                 translations=formatted_translations,
+                                                                 user_translation=user_translation))
+        else:
+            correct_wordpair_ids.append(wordpair_id)
+            available_idxs.remove(wordpair_idx)
+            msg_result_line: str = (MSG_QUIZ_SHEET_NEAR_LINE if answer_verdict == ANSWER_VERDICT_NEAR
+                                    else MSG_QUIZ_SHEET_CORRECT_LINE)
+            result_lines.append(msg_result_line.format(num=question_num,
+                                                       words=formatted_words,
+                                                       translations=formatted_translations))
+
+    wordpair_crud = WordpairCRUD(session)
+    wordpair_crud.increment_wordpair_error_counts(wrong_wordpair_ids)
+    logger.info(f'К-сть всіх помилок словникових пар в БД збільшено на 1. Кількість пар: {len(wrong_wordpair_ids)}')
+
+    if correct_wordpair_ids:
+        review_crud = ReviewCRUD(session)
+        qualities: dict[int, int] = {wordpair_id: get_review_quality(
+            session_error_count=session_wordpair_errors.get(wordpair_id, 0),
+            is_translation_shown=False) for wordpair_id in correct_wordpair_ids}
+        review_crud.update_wordpair_reviews(user_db_id=user_db_id, qualities=qualities, reviewed_at=answered_at)
+        logger.info(f'Оновлено стан повторення словникових пар. Кількість: {len(qualities)}')
+
+    await state.update_data(available_idxs=available_idxs,
+                            session_wordpair_errors=session_wordpair_errors,
+                            session_wordpair_stats=session_wordpair_stats,
+                            correct_answer_count=data_fsm.get('correct_answer_count', 0) + len(correct_wordpair_ids),
+                            wrong_answer_count=data_fsm.get('wrong_answer_count', 0) + len(wrong_wordpair_ids))
+    logger.info('Оновлення черги невикористаних індексів та лічильників тренування у FSM-Cache')
+
+    skipped_count: int = len(quiz_sheet_idxs) - len(correct_wordpair_ids) - len(wrong_wordpair_ids)
+    await message.answer(MSG_QUIZ_SHEET_RESULTS.format(correct=len(correct_wordpair_ids),
+                                                       wrong=len(wrong_wordpair_ids),
+                                                       skipped=skipped_count,
+                                                       results='\n'.join(result_lines)))
+
+    await send_next_word(message, state, session, user_db_id)
+
+
+async def record_answer_event(data_fsm: dict[str, Any],
+                              user_db_id: int,
+                              answer_verdict: str,
+                              wordpair_id: int,
+                              latency_ms: int | None,
+                              answered_at: datetime) -> None:
+    """Додає відповідь на словникову пару до журналу відповідей (без запитів до БД, див. AnswerEventLog)"""
+    await answer_event_log.record({'user_id': user_db_id,
+                                   'wordpair_id': wordpair_id,
+                                   'training_mode': data_fsm.get('training_mode'),
+                                   'verdict': answer_verdict,
+                                   'latency_ms': latency_ms,
+                                   'is_hint_used': data_fsm.get('is_hint_used', False),
+                                   'created_at': answered_at})
 
 
 @router.callback_query(F.data == 'skip_word')
-async def process_skip_word(callback: types.CallbackQuery, state: FSMContext) -> None:
+async def process_skip_word(callback: types.CallbackQuery,
+                            state: FSMContext,
+                            session: Session,
+                            user_db_id: int) -> None:
     """Відстежує натискання на кнопку "Пропустити" під час тренування"""
     logger.info('Обрано пропуск словникової пари')
 
@@ -338,11 +1399,18 @@ async def process_skip_word(callback: types.CallbackQuery, state: FSMContext) ->
     if len(available_idxs) == 1:
         logger.info('Залишилась остання словникова пара. Пропуск неможливий')
         await callback.message.answer(text=MSG_LEFT_ONE_WORD_TRAINING)
-    await send_next_word(callback.message, state)
+    else:
+        requeue_wordpair_idx(available_idxs, data_fsm.get('wordpair_idx'))
+        await state.update_data(available_idxs=available_idxs)
+        logger.info('Переміщення індексу пропущеної словникової пари у черзі невикористаних індексів у FSM-Cache')
+    await send_next_word(callback.message, state, session, user_db_id)
 
 
 @router.callback_query(F.data == 'show_annotation')
-async def process_show_annotation(callback: types.CallbackQuery, state: FSMContext) -> None:
+async def process_show_annotation(callback: types.CallbackQuery,
+                                  state: FSMContext,
+                                  session: Session,
+                                  user_db_id: int) -> None:
     """Відстежує натискання на кнопку "Показати анотацію" під час тренування"""
     logger.info('Обрано показ анотації словникової пари')
 
@@ -350,35 +1418,49 @@ async def process_show_annotation(callback: types.CallbackQuery, state: FSMConte
 
     data_fsm: dict[str, Any] = await state.get_data()
 
-    wordpair_annotation: str = data_fsm.get('wordpair_annotation')
-    formatted_words: str = data_fsm.get('formatted_words')
+    training_data: dict[str, Any] = get_current_training_data(data_fsm)
+    wordpair_annotation: str = training_data.get('annotation')
+    formatted_words: str = training_data.get('formatted_words')
     annotation_shown_count: int = data_fsm.get('annotation_shown_count', 0)  # К-сть показів анотацій
 
     await state.update_data(is_use_current_words=True)
     logger.info('Оновлення прапора "використання поточного слова (is_use_current_words)" на True у FSM-Cache. '
                 'Щоб після показу анотації, потрібно було перекласти поточне слово')
 
-    await state.update_data(annotation_shown_count=annotation_shown_count + 1)
-    logger.info('Оновлення к-сть показів анотацій у FSM-Cache')
+    await state.update_data(annotation_shown_count=annotation_shown_count + 1, is_hint_used=True)
+    logger.info('Оновлення к-сть показів анотацій та прапора використання підказки у FSM-Cache')
+
+    await update_session_wordpair_stat(state, data_fsm.get('wordpair_id'), number_hints=1)
 
     msg_show_annotation: str = MSG_SHOW_WORDPAIR_ANNOTATION.format(words=formatted_words,
                                                                    annotation=wordpair_annotation)
     await callback.message.answer(msg_show_annotation)
-    await send_next_word(callback.message, state)
+    await send_next_word(callback.message, state, session, user_db_id)
 
 
 @router.callback_query(F.data == 'show_translation')
-async def process_show_translation(callback: types.CallbackQuery, state: FSMContext) -> None:
+async def process_show_translation(callback: types.CallbackQuery,
+                                   state: FSMContext,
+                                   session: Session,
+                                   user_db_id: int) -> None:
     """Відстежує натискання на кнопку "Показати переклад" під час тренування"""
     logger.info('Обрано показ перекладу слова')
 
     await callback.message.delete()
+    await show_current_translation(callback.message, state, session, user_db_id)
 
+
+async def show_current_translation(message: types.Message,
+                                   state: FSMContext,
+                                   session: Session,
+                                   user_db_id: int) -> None:
+    """Показує переклад поточної словникової пари (пара вважається пройденою) та відправляє наступне слово"""
     data_fsm: dict[str, Any] = await state.get_data()
 
-    formatted_words: str = data_fsm.get('formatted_words')
-    formatted_translations: str = data_fsm.get('formatted_translations')
-    wordpair_annotation: str = data_fsm.get('wordpair_annotation')
+    training_data: dict[str, Any] = get_current_training_data(data_fsm)
+    formatted_words: str = training_data.get('formatted_words')
+    formatted_translations: str = training_data.get('formatted_translations')
+    wordpair_annotation: str = training_data.get('annotation')
 
     translation_shown_count: int = data_fsm.get('translation_shown_count', 0)
 
@@ -389,19 +1471,28 @@ async def process_show_translation(callback: types.CallbackQuery, state: FSMCont
     await state.update_data(available_idxs=available_idxs)
     logger.info('Видалення індексу перекладу слова та оновлення списку невикористаних індексів у FSM-Cache')
 
+    wordpair_id: int = data_fsm.get('wordpair_id')
+    update_wordpair_review(session, data_fsm, user_db_id, wordpair_id, is_translation_shown=True)
+    update_mistake_sampler(session, data_fsm, user_db_id, wordpair_idx, weight=0)
+
     await state.update_data(translation_shown_count=translation_shown_count + 1)
     logger.info('Оновлення к-сть показаних перекладів у FSM-Cache')
 
+    await update_session_wordpair_stat(state, wordpair_id, number_translation_shown=1)
+
     msg_show_translation: str = MSG_SHOW_WORDPAIR_TRANSLATION.format(words=formatted_words,
                                                                      translations=formatted_translations,
                                                                      annotation=wordpair_annotation)
-    await callback.message.answer(msg_show_translation)
+    await message.answer(msg_show_translation)
 
-    await send_next_word(callback.message, state)
+    await send_next_word(message, state, session, user_db_id)
 
 
 @router.callback_query(F.data == 'repeat_training')
-async def process_repeat_training(callback: types.CallbackQuery, state: FSMContext) -> None:
+async def process_repeat_training(callback: types.CallbackQuery,
+                                  state: FSMContext,
+                                  session: Session,
+                                  user_db_id: int) -> None:
     """Відстежує натискання на кнопку "Повторити тренування" після проходження тренування.
     Оновлює дані тренування та відправляє слово для перекладу.
     Переводить FSM стан в очікування введення перекладу.
@@ -419,20 +1510,32 @@ async def process_repeat_training(callback: types.CallbackQuery, state: FSMConte
                             training_streak_count=training_streak_count + 1)
     logger.info('Оновлення к-сть тренувань поспіль та час початку тренування у FSM-Cache')
 
+    # Словникові пари отримуються знову, бо для деяких типів тренування вони змінюються після кожного тренування
+    training_mode: str = data_fsm.get('training_mode')
+    if not await prepare_training_wordpairs(state, session, data_fsm, training_mode, user_db_id):
+        logger.info('Немає словникових пар для тренування')
+
+        kb: InlineKeyboardMarkup = get_kb_training_modes(is_mixed_training(data_fsm))
+        await callback.message.answer(text=get_no_wordpairs_message(training_mode), reply_markup=kb)
+        return  # Завершення обробки
+
     new_state: State = VocabTraining.waiting_for_translation
     await state.set_state(new_state)
     logger.info(f'FSM стан змінено на "{new_state}"')
 
-    await send_next_word(callback.message, state)
+    await send_next_word(callback.message, state, session, user_db_id)
 
 
 @router.callback_query(F.data == 'cancel_training')
-async def process_cancel_training(callback: types.CallbackQuery, state: FSMContext) -> None:
+async def process_cancel_training(callback: types.CallbackQuery, state: FSMContext, user_db_id: int) -> None:
     """Відстежує натискання на кнопку "Завершити тренування" під час тренування.
     Відправляє клавіатуру для підтвердження завершення.
     """
     logger.info('Обрано дострокове завершення тренування під час тренування')
 
+    # Поки користувач підтверджує завершення, час на відповідь не спливає (час раунду "Швидкого раунду" — спливає)
+    speed_round_timers.cancel_question(user_db_id)
+
     await state.set_state()
     logger.info('FSM стан переведено у очікування')
 
@@ -443,7 +1546,10 @@ async def process_cancel_training(callback: types.CallbackQuery, state: FSMConte
 
 
 @router.callback_query(F.data == 'accept_cancel_training')
-async def process_accept_cancel_training(callback: types.CallbackQuery, state: FSMContext) -> None:
+async def process_accept_cancel_training(callback: types.CallbackQuery,
+                                         state: FSMContext,
+                                         session: Session,
+                                         user_db_id: int) -> None:
     """Відстежує натискання на кнопку "Так" при підтвердженні дострокового завершення тренування.
     Завершує тренування.
     Відправляє клавіатуру зі списком типів тренування.
@@ -456,16 +1562,19 @@ async def process_accept_cancel_training(callback: types.CallbackQuery, state: F
     await state.update_data(is_training_completed=False)
     logger.info('Оновлення прапора "тренування було завершено (is_training_completed)" на False у FSM-Cache')
 
-    await finish_training(state)
+    await finish_training(state, session, user_db_id)
 
-    kb: InlineKeyboardMarkup = get_kb_training_modes()
+    kb: InlineKeyboardMarkup = get_kb_training_modes(is_mixed_training(data_fsm))
     msg_choose_training_mode: str = MSG_CHOOSE_TRAINING_MODE.format(name=vocab_name)
 
     await callback.message.edit_text(text=msg_choose_training_mode, reply_markup=kb)
 
 
 @router.callback_query(F.data == 'decline_cancel_training')
-async def process_decline_cancel_training(callback: types.CallbackQuery, state: FSMContext) -> None:
+async def process_decline_cancel_training(callback: types.CallbackQuery,
+                                          state: FSMContext,
+                                          session: Session,
+                                          user_db_id: int) -> None:
     """Відстежує натискання на кнопку "Ні" при підтвердженні дострокового завершення тренування.
     Продовжує тренування.
     Відправляє нове слово для перекладу.
@@ -479,16 +1588,17 @@ async def process_decline_cancel_training(callback: types.CallbackQuery, state:
     await state.set_state(new_state)
     logger.info(f'FSM стан змінено на "{new_state}"')
 
-    await send_next_word(callback.message, state)
+    await send_next_word(callback.message, state, session, user_db_id)
 
 
-async def finish_training(state: FSMContext) -> None:
+async def finish_training(state: FSMContext, session: Session, user_db_id: int) -> None:
     """Завершення тренування.
     Додає до БД інформацію про сесію тренування та анулює лічильники тренування.
     """
+    speed_round_timers.cancel_all(user_db_id)
+
     data_fsm: dict[str, Any] = await state.get_data()
 
-    user_id: int = data_fsm.get('user_id')
     vocab_id: int = data_fsm.get('vocab_id')
 
     training_mode: str = data_fsm.get('training_mode')
@@ -497,25 +1607,22 @@ async def finish_training(state: FSMContext) -> None:
     start_time_training: datetime = data_fsm.get('start_time_training')
     end_time_training: datetime = datetime.now()
 
-    wrong_answer_count: int = data_fsm.get('wrong_answer_count', 0)
-    correct_answer_count: int = data_fsm.get('correct_answer_count', 0)
-    annotation_shown_count: int = data_fsm.get('annotation_shown_count', 0)  # Показів анотацій
-    translation_shown_count: int = data_fsm.get('translation_shown_count', 0)  # Показів перекладу
-
-    with Session() as session:
-        training_crud = TrainingCRUD(session)
-        training_crud.create_new_training_session(
-            user_id=user_id,
-            vocabulary_id=vocab_id,
-            training_mode=training_mode,
-            start_time=start_time_training,
-            end_time=end_time_training,
-            number_correct_answers=correct_answer_count,
-            number_wrong_answers=wrong_answer_count,
-            number_annotation_shown=annotation_shown_count,
-            number_translation_shown=translation_shown_count,
-            is_completed=is_training_completed)
-        logger.info('В БД додано інформацію про сесію тренування')
+    mistake_sampler_cache.pop((user_db_id, start_time_training))  # Вибірка завершеного тренування більше не потрібна
+
+    # Тренування, яке вже завершило фонове завдання (див. sweep_abandoned_checkpoints), повторно не зберігається
+    checkpoint_crud = TrainingCheckpointCRUD(session)
+    is_checkpoint_deleted: bool = checkpoint_crud.delete_checkpoint(user_db_id, start_time_training)
+    if is_checkpoint_deleted or data_fsm.get('checkpoint_at') is None:
+        save_training_results(session,
+                              user_db_id=user_db_id,
+                              vocab_id=vocab_id,
+                              training_mode=training_mode,
+                              start_time=start_time_training,
+                              end_time=end_time_training,
+                              training_progress=data_fsm,
+                              is_completed=is_training_completed)
+    else:
+        logger.info('Тренування вже було завершене як покинуте, тому не зберігається у БД')
 
     total_wordpairs_count: int = data_fsm.get('total_wordpairs_count')
     available_idxs = list(range(total_wordpairs_count))
@@ -523,9 +1630,22 @@ async def finish_training(state: FSMContext) -> None:
     await state.update_data(available_idxs=available_idxs)
     logger.info('Оновлення списку невикористаних індексів словникових пар у FSM-Cache')
 
+    # ID словникових пар з помилками (від найбільшої кількості помилок) для тренування "Повторення помилок"
+    session_wordpair_errors: dict[int, int] = data_fsm.get('session_wordpair_errors', {})
+    last_session_mistake_ids: list[int] = sorted(session_wordpair_errors,
+                                                 key=session_wordpair_errors.get,
+                                                 reverse=True)
+    await state.update_data(last_session_mistake_ids=last_session_mistake_ids)
+    logger.info(f'ID словникових пар з помилками збережені у FSM-Cache. Кількість: {len(last_session_mistake_ids)}')
+
     await state.update_data(correct_answer_count=0,
                             wrong_answer_count=0,
-                            translation_shown_count=0)
+                            translation_shown_count=0,
+                            session_wordpair_errors={},
+                            session_wordpair_stats={},
+                            checkpoint_at=None,
+                            checkpoint_progress_count=0,
+                            speed_round_ends_at=None)
     logger.info('Анулювання лічильників тренування у FSM-Cache')
 
 
@@ -533,7 +1653,9 @@ async def send_training_finish_stats(message: types.Message, state: FSMContext)
     """Відправляє статистику завершеного тренування користувачеві"""
     data_fsm: dict[str, Any] = await state.get_data()
 
-    kb: InlineKeyboardMarkup = get_kb_finish_training()
+    # Для змішаного тренування "Повторення помилок" можливе лише, якщо були помилки в цьому тренуванні
+    is_with_btn_review_mistakes: bool = not is_mixed_training(data_fsm) or bool(data_fsm.get('session_wordpair_errors'))
+    kb: InlineKeyboardMarkup = get_kb_finish_training(is_with_btn_review_mistakes)
 
     vocab_name: str = data_fsm.get('vocab_name')
     training_mode_name: str = data_fsm.get('training_mode_name')  # Назва режиму тренування
@@ -565,3 +1687,24 @@ async def send_training_finish_stats(message: types.Message, state: FSMContext)
                                                            training_time_minutes=training_time_minutes,
                                                            training_time_seconds=training_time_seconds)
     await message.answer(text=summary_message, reply_markup=kb)
+
+
+def update_wordpair_review(session: Session,
+                           data_fsm: dict[str, Any],
+                           user_db_id: int,
+                           wordpair_id: int,
+                           is_translation_shown: bool) -> None:
+    """Оновлює в БД стан інтервального повторення словникової пари, яка завершена у тренуванні
+    (перекладена або показано переклад), з оцінкою за кількістю помилок у ній за тренування.
+    """
+    session_wordpair_errors: dict[int, int] = data_fsm.get('session_wordpair_errors', {})
+
+    quality: int = get_review_quality(session_error_count=session_wordpair_errors.get(wordpair_id, 0),
+                                      is_translation_shown=is_translation_shown)
+
+    review_crud = ReviewCRUD(session)
+    review_crud.update_wordpair_review(user_db_id=user_db_id,
+                                       wordpair_id=wordpair_id,
+                                       quality=quality,
+                                       reviewed_at=datetime.now())
+    logger.info(f'Оновлено стан повторення словникової пари. Оцінка: {quality}. WORDPAIR_ID: {wordpair_id}')
@@ -7,5 +7,7 @@ def get_kb_menu() -> InlineKeyboardMarkup:
     buttons: list[list[InlineKeyboardButton]] = [
         [InlineKeyboardButton(text='📚 Словниковий тренажер', callback_data='vocab_trainer')],
         [InlineKeyboardButton(text='📂 База словників', callback_data='vocab_base')],
+        [InlineKeyboardButton(text='🔎 Пошук слів', callback_data='search')],
+        [InlineKeyboardButton(text='📊 Статистика', callback_data='stats')],
         [InlineKeyboardButton(text='⁉️ Довідка', callback_data='help')]]
     return InlineKeyboardMarkup(inline_keyboard=buttons)
@@ -0,0 +1,28 @@
+from aiogram.types import InlineKeyboardButton
+
+from lingoro_bot.custom_types.vocab_types import VocabsPageType
+from lingoro_bot.handlers.callback_data import PaginationCallback
+
+
+def get_vocabs_page_buttons(name: str, vocabs_page: VocabsPageType) -> list[InlineKeyboardButton]:
+    """Повертає кнопки переходу між сторінками словників.
+
+    Args:
+        name (str): Ім'я розділу, до якого належить сторінка.
+        vocabs_page (VocabsPageType): Поточна сторінка словників.
+
+    Returns:
+        list[InlineKeyboardButton]: Кнопки переходу (порожній список, якщо сторінка одна).
+    """
+    page_buttons: list[InlineKeyboardButton] = []
+
+    prev_cursor_id: int | None = vocabs_page.get('prev_cursor_id')
+    if prev_cursor_id is not None:
+        callback_data: str = PaginationCallback(name=name, cursor_id=prev_cursor_id, is_backward=True).pack()
+        page_buttons.append(InlineKeyboardButton(text='⬅️ Попередні', callback_data=callback_data))
+
+    next_cursor_id: int | None = vocabs_page.get('next_cursor_id')
+    if next_cursor_id is not None:
+        callback_data: str = PaginationCallback(name=name, cursor_id=next_cursor_id, is_backward=False).pack()
+        page_buttons.append(InlineKeyboardButton(text='Наступні ➡️', callback_data=callback_data))
+    return page_buttons
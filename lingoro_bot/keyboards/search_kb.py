@@ -0,0 +1,40 @@
+from aiogram.types import InlineKeyboardButton
+from aiogram.types.inline_keyboard_markup import InlineKeyboardMarkup
+from aiogram.utils.keyboard import InlineKeyboardBuilder
+
+from lingoro_bot.handlers.callback_data import SearchPageCallback
+
+
+def get_kb_search_query() -> InlineKeyboardMarkup:
+    """Повертає клавіатуру для очікування пошукового запиту"""
+    buttons: list[list[InlineKeyboardButton]] = [
+        [InlineKeyboardButton(text='🏠 Головне меню', callback_data='menu')]]
+    return InlineKeyboardMarkup(inline_keyboard=buttons)
+
+
+def get_kb_search_results(prev_cursor_id: int | None, next_cursor_id: int | None) -> InlineKeyboardMarkup:
+    """Повертає клавіатуру для сторінки результатів пошуку словникових пар.
+
+    Args:
+        prev_cursor_id (int | None): ID першої словникової пари сторінки, якщо є попередня сторінка.
+        next_cursor_id (int | None): ID останньої словникової пари сторінки, якщо є наступна сторінка.
+
+    Returns:
+        InlineKeyboardMarkup: Сформована клавіатура.
+    """
+    kb = InlineKeyboardBuilder()
+
+    # Кнопки переходу між сторінками
+    navigation_buttons: list[InlineKeyboardButton] = []
+    if prev_cursor_id is not None:
+        callback_data: str = SearchPageCallback(cursor_id=prev_cursor_id, is_backward=True).pack()
+        navigation_buttons.append(InlineKeyboardButton(text='⬅️ Попередні', callback_data=callback_data))
+    if next_cursor_id is not None:
+        callback_data: str = SearchPageCallback(cursor_id=next_cursor_id, is_backward=False).pack()
+        navigation_buttons.append(InlineKeyboardButton(text='Наступні ➡️', callback_data=callback_data))
+    if navigation_buttons:
+        kb.row(*navigation_buttons)
+
+    kb.row(InlineKeyboardButton(text='🔎 Новий пошук', callback_data='search'))
+    kb.row(InlineKeyboardButton(text='🏠 Головне меню', callback_data='menu'))
+    return kb.as_markup()
@@ -0,0 +1,36 @@
+from aiogram.types import InlineKeyboardButton
+from aiogram.types.inline_keyboard_markup import InlineKeyboardMarkup
+from aiogram.utils.keyboard import InlineKeyboardBuilder
+
+from lingoro_bot.handlers.callback_data import StatsPeriodCallback
+
+# Назви кнопок періодів статистики тренувань
+STATS_PERIOD_BUTTONS: dict[str, str] = {'day': 'День', 'week': 'Тиждень', 'month': 'Місяць'}
+
+
+def get_kb_stats(current_period: str) -> InlineKeyboardMarkup:
+    """Повертає клавіатуру для розділу "Статистика" з вибором періоду (поточний період позначається)"""
+    kb = InlineKeyboardBuilder()
+
+    period_buttons: list[InlineKeyboardButton] = []
+    for period, button_text in STATS_PERIOD_BUTTONS.items():
+        if period == current_period:
+            button_text = f'🔘 {button_text}'
+        callback_data: str = StatsPeriodCallback(period=period).pack()
+        period_buttons.append(InlineKeyboardButton(text=button_text, callback_data=callback_data))
+    kb.row(*period_buttons)
+
+    kb.row(InlineKeyboardButton(text='🧠 Рівень засвоєння', callback_data='stats_mastery'))
+    kb.row(InlineKeyboardButton(text='🏠 Головне меню', callback_data='menu'))
+    return kb.as_markup()
+
+
+def get_kb_stats_mastery() -> InlineKeyboardMarkup:
+    """Повертає клавіатуру для огляду рівня засвоєння словників"""
+    kb = InlineKeyboardBuilder()
+
+    kb.button(text='⬅️ Назад', callback_data='stats')
+    kb.button(text='🏠 Головне меню', callback_data='menu')
+
+    kb.adjust(1)
+    return kb.as_markup()
@@ -2,16 +2,39 @@ from aiogram.types import InlineKeyboardButton
 from aiogram.types.inline_keyboard_markup import InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
+from lingoro_bot.custom_types.vocab_types import VocabsPageType
+from lingoro_bot.handlers.callback_data import VocabWordpairsPageCallback
+from lingoro_bot.keyboards.pagination_kb import get_vocabs_page_buttons
 
-def get_kb_vocab_options() -> InlineKeyboardMarkup:
+
+def get_kb_vocab_options(prev_page: VocabWordpairsPageCallback | None = None,
+                         next_page: VocabWordpairsPageCallback | None = None) -> InlineKeyboardMarkup:
     """Повертає клавіатуру для взаємодії з користувацькими словниками після їх вибору
     в розділі "База словників".
+
+    Args:
+        prev_page (VocabWordpairsPageCallback | None): Дані попередньої сторінки словникових пар (якщо є).
+        next_page (VocabWordpairsPageCallback | None): Дані наступної сторінки словникових пар (якщо є).
+
+    Returns:
+        InlineKeyboardMarkup: Сформована клавіатура.
     """
-    buttons: list[list[InlineKeyboardButton]] = [
-        [InlineKeyboardButton(text='🗑️ Видалити словник', callback_data='delete_vocab')],
-        [InlineKeyboardButton(text='⬅️ Назад', callback_data='vocab_base')],
-        [InlineKeyboardButton(text='🏠 Головне меню', callback_data='menu')]]
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+    kb = InlineKeyboardBuilder()
+
+    # Кнопки переходу між сторінками словникових пар
+    navigation_buttons: list[InlineKeyboardButton] = []
+    if prev_page is not None:
+        navigation_buttons.append(InlineKeyboardButton(text='⬅️ Попередні', callback_data=prev_page.pack()))
+    if next_page is not None:
+        navigation_buttons.append(InlineKeyboardButton(text='Наступні ➡️', callback_data=next_page.pack()))
+    if navigation_buttons:
+        kb.row(*navigation_buttons)
+
+    kb.row(InlineKeyboardButton(text='📤 Експорт в Anki', callback_data='export_vocab_anki'))
+    kb.row(InlineKeyboardButton(text='🗑️ Видалити словник', callback_data='delete_vocab'))
+    kb.row(InlineKeyboardButton(text='⬅️ Назад', callback_data='vocab_base'))
+    kb.row(InlineKeyboardButton(text='🏠 Головне меню', callback_data='menu'))
+    return kb.as_markup()
 
 
 def get_kb_confirm_delete() -> InlineKeyboardMarkup:
@@ -22,19 +45,19 @@ def get_kb_confirm_delete() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
-def get_kb_vocab_selection_base(all_vocabs_data: list[dict]) -> InlineKeyboardMarkup:
+def get_kb_vocab_selection_base(vocabs_page: VocabsPageType) -> InlineKeyboardMarkup:
     """Повертає клавіатуру з вибором словників для розділу "База словників".
 
     Args:
-        all_vocabs_data (list[dict]): Список словників зі всіма даними.
+        vocabs_page (VocabsPageType): Сторінка словників зі всіма даними.
 
     Returns:
         InlineKeyboardMarkup: Сформована клавіатура.
     """
     kb = InlineKeyboardBuilder()
 
-    # Генерація кнопок для кожного словника
-    for vocab in all_vocabs_data:
+    # Генерація кнопок для кожного словника сторінки
+    for vocab in vocabs_page.get('vocabs'):
         vocab_id: int = vocab.get('id')
         vocab_name: str = vocab.get('name')
         wordpairs_count: int = vocab.get('wordpairs_count')
@@ -44,10 +67,21 @@ def get_kb_vocab_selection_base(all_vocabs_data: list[dict]) -> InlineKeyboardMa
 
         btn_vocab = InlineKeyboardButton(text=btn_text, callback_data=callback_data_text)
         kb.add(btn_vocab)
+    kb.adjust(1)
 
-    btn_create_vocab = InlineKeyboardButton(text='➕ Додати словник', callback_data='create_vocab')
-    btn_menu = InlineKeyboardButton(text='🏠 Головне меню', callback_data='menu')
-    kb.add(btn_create_vocab, btn_menu)
+    # Кнопки переходу між сторінками в одному рядку
+    page_buttons: list[InlineKeyboardButton] = get_vocabs_page_buttons('vocab_base', vocabs_page)
+    if page_buttons:
+        kb.row(*page_buttons)
 
-    kb.adjust(1)
+    kb.row(InlineKeyboardButton(text='➕ Додати словник', callback_data='create_vocab'))
+    kb.row(InlineKeyboardButton(text='📥 Імпорт з Anki', callback_data='import_anki_vocab'))
+    kb.row(InlineKeyboardButton(text='🏠 Головне меню', callback_data='menu'))
     return kb.as_markup()
+
+
+def get_kb_import_anki_vocab() -> InlineKeyboardMarkup:
+    """Повертає клавіатуру для процесу імпорту користувацького словника з Anki"""
+    buttons: list[list[InlineKeyboardButton]] = [
+        [InlineKeyboardButton(text='🛑 Скасувати', callback_data='vocab_base')]]
+    return InlineKeyboardMarkup(inline_keyboard=buttons)
@@ -2,24 +2,60 @@ from aiogram.types import InlineKeyboardButton
 from aiogram.types.inline_keyboard_markup import InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
+from lingoro_bot.custom_types.vocab_types import VocabsPageType
+from lingoro_bot.handlers.callback_data import MixedVocabCallback, TrainingChoiceCallback
+from lingoro_bot.keyboards.pagination_kb import get_vocabs_page_buttons
 
-def get_kb_training_modes() -> InlineKeyboardMarkup:
-    """Повертає клавіатуру зі списком типів словникових тренувань"""
+
+def get_kb_training_modes(is_mixed_training: bool = False) -> InlineKeyboardMarkup:
+    """Повертає клавіатуру зі списком типів словникових тренувань.
+
+    Args:
+        is_mixed_training (bool): Прапор, чи тренування змішане (з декількох словників).
+        Для нього доступні лише типи тренування, які не залежать від словника. За замовчуванням False.
+
+    Returns:
+        InlineKeyboardMarkup: Сформована клавіатура.
+    """
     buttons: list[list[InlineKeyboardButton]] = [
         [InlineKeyboardButton(text='🎯 Прямий переклад (W -> T)', callback_data='direct_translation')],
         [InlineKeyboardButton(text='🎯 Зворотній переклад (T -> W)', callback_data='reverse_translation')],
+        [InlineKeyboardButton(text='⚡ Швидкий раунд (W -> T)', callback_data='speed_round')],
+        [InlineKeyboardButton(text='📝 Аркуш питань (W -> T)', callback_data='quiz_sheet')]]
+
+    if not is_mixed_training:
+        buttons.extend([
+            [InlineKeyboardButton(text='🔁 Повторення (W -> T)', callback_data='review_due')],
+            [InlineKeyboardButton(text='❗ Робота над помилками (W -> T)', callback_data='focus_mistakes')],
+            [InlineKeyboardButton(text='🩹 Повторення помилок (W -> T)', callback_data='review_mistakes')],
+            [InlineKeyboardButton(text='🔘 Вибір відповіді (W -> T)', callback_data='multiple_choice')]])
+
+    buttons.extend([
         [InlineKeyboardButton(text='📗 Змінити словник', callback_data='vocab_trainer')],
-        [InlineKeyboardButton(text='🏠 Головне меню', callback_data='menu')]]
+        [InlineKeyboardButton(text='🏠 Головне меню', callback_data='menu')]])
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
-def get_kb_finish_training() -> InlineKeyboardMarkup:
-    """Повертає клавіатуру з функціоналом після завершення тренування"""
+def get_kb_finish_training(is_with_btn_review_mistakes: bool = False) -> InlineKeyboardMarkup:
+    """Повертає клавіатуру з функціоналом після завершення тренування.
+
+    Args:
+        is_with_btn_review_mistakes (bool): Прапор, чи потрібно додавати кнопку "Повторення помилок".
+        За замовчуванням False.
+
+    Returns:
+        InlineKeyboardMarkup: Сформована клавіатура.
+    """
     buttons: list[list[InlineKeyboardButton]] = [
-        [InlineKeyboardButton(text='🔄 Повторити тренування', callback_data='repeat_training')],
+        [InlineKeyboardButton(text='🔄 Повторити тренування', callback_data='repeat_training')]]
+
+    if is_with_btn_review_mistakes:
+        buttons.append([InlineKeyboardButton(text='🩹 Повторити помилки', callback_data='review_mistakes')])
+
+    buttons.extend([
         [InlineKeyboardButton(text='🎯 Змінити тип тренування', callback_data='change_training_mode')],
         [InlineKeyboardButton(text='📗 Змінити словник', callback_data='vocab_trainer')],
-        [InlineKeyboardButton(text='🏠 Головне меню', callback_data='menu')]]
+        [InlineKeyboardButton(text='🏠 Головне меню', callback_data='menu')]])
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
@@ -34,6 +70,34 @@ def get_kb_training_actions() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+def get_kb_quiz_sheet() -> InlineKeyboardMarkup:
+    """Повертає клавіатуру з діями під час тренування "Аркуш питань" (лише завершення тренування)"""
+    buttons: list[list[InlineKeyboardButton]] = [
+        [InlineKeyboardButton(text='🛑 Завершити тренування', callback_data='cancel_training')]]
+    return InlineKeyboardMarkup(inline_keyboard=buttons)
+
+
+def get_kb_training_choices(options: list[str], wordpair_idx: int) -> InlineKeyboardMarkup:
+    """Повертає клавіатуру з варіантами відповіді та діями під час тренування "Вибір відповіді".
+
+    Args:
+        options (list[str]): Варіанти відповіді.
+        wordpair_idx (int): Індекс словникової пари у тренуванні.
+
+    Returns:
+        InlineKeyboardMarkup: Сформована клавіатура.
+    """
+    kb = InlineKeyboardBuilder()
+
+    for option_idx, option in enumerate(options):
+        callback_data = TrainingChoiceCallback(wordpair_idx=wordpair_idx, option_idx=option_idx)
+        kb.button(text=option, callback_data=callback_data)
+    kb.adjust(1)
+
+    kb.attach(InlineKeyboardBuilder.from_markup(get_kb_training_actions()))
+    return kb.as_markup()
+
+
 def get_kb_confirm_cancel_training() -> InlineKeyboardMarkup:
     """Повертає клавіатуру з кнопками підтвердження скасування тренування"""
     buttons: list[list[InlineKeyboardButton]] = [
@@ -42,22 +106,29 @@ def get_kb_confirm_cancel_training() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
-def get_kb_vocab_selection_training(all_vocabs_data: list[dict],
-                                    is_with_btn_vocab_base: bool = False) -> InlineKeyboardMarkup:
+def get_kb_vocab_selection_training(vocabs_page: VocabsPageType,
+                                    is_with_btn_vocab_base: bool = False,
+                                    is_with_btn_continue_training: bool = False) -> InlineKeyboardMarkup:
     """Повертає клавіатуру з вибором словників для розділу "Тренування".
 
     Args:
-        all_vocabs_data (list[dict]): Список словників зі всіма даними.
+        vocabs_page (VocabsPageType): Сторінка словників зі всіма даними.
         is_with_btn_vocab_base (bool): Прапор, чи потрібно додавати кнопку "База словників". За замовчуванням False.
-        "Додати словник" для розділу "База словників"
+        is_with_btn_continue_training (bool): Прапор, чи потрібно додавати кнопку "Продовжити тренування".
+        За замовчуванням False.
 
     Returns:
         InlineKeyboardMarkup: Сформована клавіатура.
     """
     kb = InlineKeyboardBuilder()
 
-    # Генерація кнопок для кожного словника
-    for vocab in all_vocabs_data:
+    if is_with_btn_continue_training:
+        kb.add(InlineKeyboardButton(text='▶️ Продовжити тренування', callback_data='continue_training'))
+
+    vocabs_data: list[dict] = vocabs_page.get('vocabs')
+
+    # Генерація кнопок для кожного словника сторінки
+    for vocab in vocabs_data:
         vocab_id: int = vocab.get('id')
         vocab_name: str = vocab.get('name')
         wordpairs_count: int = vocab.get('wordpairs_count')
@@ -67,13 +138,62 @@ def get_kb_vocab_selection_training(all_vocabs_data: list[dict],
 
         btn_vocab = InlineKeyboardButton(text=btn_text, callback_data=callback_data_text)
         kb.add(btn_vocab)
+    kb.adjust(1)
+
+    # Кнопки переходу між сторінками в одному рядку
+    page_buttons: list[InlineKeyboardButton] = get_vocabs_page_buttons('vocab_training', vocabs_page)
+    if page_buttons:
+        kb.row(*page_buttons)
+
+    # Змішане тренування має сенс лише для декількох словників
+    if len(vocabs_data) > 1 or page_buttons:
+        kb.row(InlineKeyboardButton(text='🔀 Змішане тренування', callback_data='mixed_training'))
 
     if is_with_btn_vocab_base:
-        btn_vocab_base = InlineKeyboardButton(text='📂 База словників', callback_data='vocab_base')
-        kb.add(btn_vocab_base)
+        kb.row(InlineKeyboardButton(text='📂 База словників', callback_data='vocab_base'))
 
-    btn_menu = InlineKeyboardButton(text='🏠 Головне меню', callback_data='menu')
-    kb.add(btn_menu)
+    kb.row(InlineKeyboardButton(text='🏠 Головне меню', callback_data='menu'))
+    return kb.as_markup()
 
+
+def get_kb_mixed_vocab_selection(vocabs_page: VocabsPageType,
+                                 selected_vocab_ids: list[int],
+                                 cursor_id: int = 0,
+                                 is_backward: bool = False) -> InlineKeyboardMarkup:
+    """Повертає клавіатуру з вибором словників для змішаного тренування.
+
+    Args:
+        vocabs_page (VocabsPageType): Сторінка словників зі всіма даними.
+        selected_vocab_ids (list[int]): ID обраних словників (з усіх сторінок).
+        cursor_id (int): Курсор сторінки словників (для повернення на цю ж сторінку після вибору словника).
+        За замовчуванням 0 (перша сторінка).
+        is_backward (bool): Прапор, чи сторінка перед курсором. За замовчуванням False.
+
+    Returns:
+        InlineKeyboardMarkup: Сформована клавіатура.
+    """
+    kb = InlineKeyboardBuilder()
+
+    # Генерація кнопок для кожного словника сторінки (натискання обирає словник або скасовує вибір)
+    for vocab in vocabs_page.get('vocabs'):
+        vocab_id: int = vocab.get('id')
+        vocab_name: str = vocab.get('name')
+        wordpairs_count: int = vocab.get('wordpairs_count')
+
+        btn_mark: str = '✅' if vocab_id in selected_vocab_ids else '▫️'
+        btn_text: str = f'{btn_mark} {vocab_name} [{wordpairs_count}]'
+        callback_data: str = MixedVocabCallback(vocab_id=vocab_id, cursor_id=cursor_id, is_backward=is_backward).pack()
+
+        btn_vocab = InlineKeyboardButton(text=btn_text, callback_data=callback_data)
+        kb.add(btn_vocab)
     kb.adjust(1)
+
+    # Кнопки переходу між сторінками в одному рядку
+    page_buttons: list[InlineKeyboardButton] = get_vocabs_page_buttons('mixed_training', vocabs_page)
+    if page_buttons:
+        kb.row(*page_buttons)
+
+    kb.row(InlineKeyboardButton(text='▶️ Тренувати обрані', callback_data='start_mixed_selected'))
+    kb.row(InlineKeyboardButton(text='▶️ Тренувати всі', callback_data='start_mixed_all'))
+    kb.row(InlineKeyboardButton(text='📗 Змінити словник', callback_data='vocab_trainer'))
     return kb.as_markup()
@@ -0,0 +1,71 @@
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject, User
+
+from lingoro_bot.custom_types.user_types import UserProfileType
+from lingoro_bot.db.crud import UserCRUD
+from lingoro_bot.db.database import Session
+from lingoro_bot.tools.user_cache import known_users
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class DatabaseMiddleware(BaseMiddleware):
+    """Відкриває одну сесію БД на кожне оновлення та визначає ID користувача в БД (users.id).
+
+    Notes:
+        До даних хендлерів додаються:
+            - session (Session): Сесія БД оновлення (спільна для всіх запитів хендлера).
+            - user_db_id (int): ID користувача в БД (з кешу зареєстрованих користувачів).
+            - is_new_user (bool): Прапор, чи був користувач зареєстрований під час цього оновлення.
+        Користувач, якого ще немає в БД, реєструється автоматично.
+    """
+
+    async def __call__(self,
+                       handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+                       event: TelegramObject,
+                       data: dict[str, Any]) -> Any:
+        tg_user_data: User | None = data.get('event_from_user')
+
+        with Session() as session:
+            data['session'] = session
+
+            if tg_user_data is not None:
+                data['user_db_id'], data['is_new_user'] = self._resolve_user(session, tg_user_data)
+
+            result: Any = await handler(event, data)
+
+            pending_profiles: dict[int, UserProfileType] = known_users.pop_pending_profiles()
+            if pending_profiles:
+                user_crud = UserCRUD(session)
+                user_crud.update_user_profiles(pending_profiles)
+                logger.info(f'Оновлено профілі користувачів у БД. Кількість: {len(pending_profiles)}')
+        return result
+
+    @staticmethod
+    def _resolve_user(session: Session, tg_user_data: User) -> tuple[int, bool]:
+        """Повертає ID користувача в БД та прапор, чи був користувач щойно зареєстрований.
+        Звертається до БД лише, якщо користувача немає у кеші зареєстрованих користувачів.
+        """
+        user_id: int = tg_user_data.id
+        user_profile: UserProfileType = {'username': tg_user_data.username,
+                                         'first_name': tg_user_data.first_name,
+                                         'last_name': tg_user_data.last_name}
+
+        user_db_id: int | None = known_users.get_user_db_id(user_id, user_profile)
+        if user_db_id is not None:
+            return user_db_id, False
+
+        user_crud = UserCRUD(session)
+        is_new_user: bool = user_crud.register_user(user_id, user_profile)
+        user_db_id = user_crud.get_user_db_id(user_id)
+
+        if is_new_user:
+            logger.info(f'До БД був доданий користувач. USER_ID: {user_id}')
+
+        # Профіль вже зареєстрованого користувача міг змінитися, поки його не було в кеші
+        known_users.add_user(user_id, user_db_id, user_profile, is_profile_changed=not is_new_user)
+        return user_db_id, is_new_user
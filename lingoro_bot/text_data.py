@@ -25,6 +25,7 @@ MSG_ERROR_VOCAB_DESCRIPTION_INVALID = ('⚠️ У примітці "{description
 MSG_ERROR_WORDPAIRS_NO_VALID = '⚠️ Немає жодної валідної словникової пари.'
 MSG_ERROR_NO_VALID_WORDPAIRS_ADDED = '❌ Не вдалося зберегти словник, оскільки немає валідних словникових пар.'
 MSG_SUCCESS_VOCAB_SAVED_TO_DB = '✅ Словник "{name}" успішно збережено до бази словників!'
+MSG_ERROR_VOCAB_NAME_TAKEN = '❌ Не вдалося зберегти словник, оскільки у вашій базі вже є словник з назвою "{name}".'
 MSG_SUCCESS_ALL_WORDPAIRS_VALID = '🎉 Усі введені словникові пари валідні!'
 MSG_INFO_ADDED_WORDPAIRS = ('✅ Додано словникові пари:\n'
                             '{wordpairs}')
@@ -46,6 +47,24 @@ MSG_INFO_VOCAB_BASE_EMPTY = ('❗️ У вашій базі поки що нем
                               'Для створення словників, натисніть на кнопку "Додати словник".')
 MSG_CONFIRM_DELETE_VOCAB = '❓ Ви дійсно хочете видалити словник "{name}"?'
 MSG_SUCCESS_VOCAB_DELETED = '✅ Словник "{name}" успішно видалено з бази словників.'
+MSG_INFO_VOCAB_EXPORT_STARTED = '⏳ Експорт словника в Anki...'
+MSG_SUCCESS_VOCAB_EXPORTED = '✅ Словник "{name}" експортовано в Anki. Словникових пар: {wordpairs_count}.'
+
+
+# handlers/import_vocab.py
+MSG_SEND_ANKI_FILE = ('📥 Надішліть файл колоди Anki у форматі ".apkg".\n\n'
+                      '📌 Примітки:\n'
+                      '*Назвою словника стане назва файлу\n'
+                      '*Перше поле нотатки — слово(а), друге — переклад(и), третє — анотація (опціонально)\n'
+                      '*Нотатки, які не проходять валідацію словникових пар, будуть пропущені')
+MSG_ERROR_ANKI_FILE_INVALID = '⚠️ Потрібно надіслати файл колоди Anki у форматі ".apkg".'
+MSG_ERROR_ANKI_FILE_TOO_LARGE = '⚠️ Файл занадто великий. Максимальний розмір: {max_size} МБ.'
+MSG_ERROR_ANKI_PACKAGE = '⚠️ Не вдалося прочитати колоду Anki: {error}.'
+MSG_ERROR_ANKI_NO_VALID_NOTES = '❌ Не вдалося зберегти словник, оскільки у колоді немає валідних словникових пар.'
+MSG_INFO_ANKI_IMPORT_STARTED = '⏳ Імпорт колоди "{name}"...'
+MSG_SUCCESS_ANKI_IMPORTED = ('✅ Словник "{name}" успішно імпортовано до бази словників!\n'
+                             '📥 Додано словникових пар: {imported_count}\n'
+                             '⏭ Пропущено нотаток: {skipped_count}')
 
 
 # handlers/vocab_trainer.py
@@ -58,8 +77,35 @@ MSG_CONFIRM_CANCEL_TRAINING = ('❓ Ви дійсно хочете заверш
                                'Усі результати будуть збережені.')
 MSG_CORRECT_ANSWER = ('✅ Вірно!\n'
                       '{words} -> {translations}')
+MSG_NEAR_ANSWER = ('✅ Майже вірно! Зверніть увагу на написання.\n'
+                   '{words} -> {translations}')
 MSG_WRONG_ANSWER = ('❌ Неправильно!\n'
                     '"{words}" не перекладається як "{user_translation}"')
+MSG_INFO_NO_WORDPAIRS_DUE = ('🎉 Зараз немає словникових пар для повторення.\n\n'
+                             '🎯 Оберіть інший тип тренування, щоб продовжити.')
+MSG_INFO_NO_WORDPAIRS_WITH_MISTAKES = ('🎉 У словнику немає словникових пар з помилками.\n\n'
+                                       '🎯 Оберіть інший тип тренування, щоб продовжити.')
+MSG_INFO_NOT_ENOUGH_CHOICE_OPTIONS = ('⚠️ Недостатньо різних перекладів для тренування "Вибір відповіді".\n\n'
+                                     '🎯 Оберіть інший тип тренування, щоб продовжити.')
+MSG_CHOOSE_VOCABS_FOR_MIXED_TRAINING = ('🔀 Оберіть словники для змішаного тренування '
+                                        'або тренуйте всі словники одразу.')
+MSG_ERROR_NO_VOCABS_SELECTED = '⚠️ Оберіть хоча б один словник!'
+MSG_MIXED_TRAINING_NAME = 'Змішане тренування (словників: {count})'
+MSG_TRAINING_CONTINUED = '▶️ Продовження незавершеного тренування.'
+MSG_INFO_NO_TRAINING_TO_CONTINUE = 'Незавершене тренування вже не можна продовжити.'
+MSG_QUIZ_SHEET_HINT = ('✍️ Надішліть переклади одним повідомленням: кожен з нового рядка у тому ж порядку '
+                       'або з номером питання (наприклад, "3. переклад"). Порожній рядок — пропуск.')
+MSG_QUIZ_SHEET_PROMPT_LINE = '{num}. {words}'
+MSG_QUIZ_SHEET_CORRECT_LINE = '{num}. ✅ {words} -> {translations}'
+MSG_QUIZ_SHEET_NEAR_LINE = '{num}. ✅ {words} -> {translations} (з описками)'
+MSG_QUIZ_SHEET_WRONG_LINE = '{num}. ❌ {words} -> {translations} (ваша відповідь: "{user_translation}")'
+MSG_QUIZ_SHEET_SKIPPED_LINE = '{num}. ➡️ {words} (пропущено)'
+MSG_QUIZ_SHEET_RESULTS = ('📝 Результати аркуша питань\n'
+                          '✅ Вірно: {correct}. ❌ Неправильно: {wrong}. ➡️ Пропущено: {skipped}.\n\n'
+                          '{results}')
+MSG_SPEED_ROUND_TIMER = '⏱ До кінця раунду: {round_seconds} с. Час на відповідь: {question_seconds} с.'
+MSG_INFO_SPEED_QUESTION_TIMEOUT = '⌛ Час на відповідь вичерпано!'
+MSG_SPEED_ROUND_FINISHED = '⏰ Час раунду вичерпано!'
 MSG_LEFT_ONE_WORD_TRAINING = '⚠️ Залишилось останнє слово. Пропускати більше не можна!'
 MSG_SHOW_WORDPAIR_ANNOTATION = ('💡 Показ анотації\n\n'
                                 '📝 Слово(а): {words}\n'
@@ -70,6 +116,16 @@ MSG_SHOW_WORDPAIR_TRANSLATION = ('💬 Показ перекладу\n\n'
                                  '📝 Анотація: {annotation}')
 
 
+# handlers/search.py
+MSG_ENTER_SEARCH_QUERY = ('🔎 Введіть слово, переклад, транскрипцію або анотацію для пошуку у ваших словниках.\n\n'
+                          '📌 Шукаються слова, які починаються з введеного тексту.')
+MSG_ERROR_SEARCH_QUERY_INVALID = ('⚠️ Пошуковий запит має містити хоча б одну літеру або цифру '
+                                  'та бути не довшим за {max_length} символів.')
+MSG_SEARCH_RESULTS = ('🔎 Результати пошуку "{query}":\n\n'
+                      '{results}')
+MSG_INFO_SEARCH_NO_RESULTS = '🔎 За запитом "{query}" у ваших словниках нічого не знайдено.'
+
+
 # handlers/help.py
 MSG_TITLE_HELP = """
 ⁉️ Довідка: Як користуватися ботом «qx3learn-bot»
@@ -107,10 +163,17 @@ MSG_TITLE_HELP = """
 2. Оберіть словник з бази:
     - Бот відобразить список словників, які ви створили.
     - Якщо у вашій базі немає словників, спочатку потрібно створити їх у розділі «База словників».
+    - Щоб тренувати декілька словників одразу, натисніть «🔀 Змішане тренування» та оберіть словники.
 
 3. Оберіть режим тренування:
     - 🎯 Прямий переклад (W -> T): Тренування перекладу від слова до перекладу.
     - 🎯 Зворотній переклад (T -> W): Тренування перекладу від перекладу до слова.
+    - 🔁 Повторення (W -> T): Тренування лише тих слів, які настав час повторити (інтервальне повторення).
+    - ❗ Робота над помилками (W -> T): Слова, в яких ви помиляєтесь частіше, випадають частіше.
+    - 🩹 Повторення помилок (W -> T): Лише слова, в яких ви помилялися, спочатку — з останнього тренування.
+    - 🔘 Вибір відповіді (W -> T): Оберіть правильний переклад з кількох варіантів.
+    - ⚡ Швидкий раунд (W -> T): Перекладіть якомога більше слів за хвилину, на кожне слово — обмежений час.
+    - 📝 Аркуш питань (W -> T): Декілька слів одним повідомленням, переклади — однією відповіддю (рядок на слово).
 
 4. Розпочніть тренування:
     - Бот надасть вам слово для перекладу, і ви зможете:
@@ -118,6 +181,33 @@ MSG_TITLE_HELP = """
         - Пропустити слово.
         - Запросити підказку, анотацію або дізнатися переклад.
         - Завершити тренування.
+    - Прогрес тренування зберігається: якщо ви не завершили тренування, натисніть «▶️ Продовжити тренування»
+      у розділі «Словниковий тренажер». Покинуте тренування з часом завершується автоматично.
+
+---
+
+3️⃣ Пошук слів
+1. Натисніть кнопку «Пошук слів» у головному меню або введіть команду /search.
+
+2. Введіть слово, переклад, транскрипцію або анотацію (можна одразу: /search кіт):
+    - Бот покаже словникові пари з усіх ваших словників, які містять слова, що починаються з введеного тексту.
+    - Біля кожної словникової пари вказано словник, до якого вона належить.
+
+3. У будь-якому чаті введіть @назва_бота та початок слова чи перекладу, щоб отримати підказки з ваших словників.
+
+---
+
+4️⃣ Статистика тренувань
+1. Натисніть кнопку «Статистика» у головному меню або введіть команду /stats.
+
+2. Оберіть період: день, тиждень або місяць:
+    - Бот покаже кількість тренувань, точність, час тренувань та серії днів з тренуваннями поспіль.
+    - Біля точності вказано її зміну відносно попереднього періоду такої ж довжини.
+    - Для кожного словника, який ви тренували у цьому періоді, вказано кількість тренувань та точність.
+
+3. Натисніть кнопку «Рівень засвоєння», щоб дізнатися, що варто повторити:
+    - Рівень засвоєння враховує частку помилок, кількість спроб та час від останнього тренування словникової пари.
+    - Бот покаже рівень засвоєння кожного словника та словникові пари з найменшим рівнем засвоєння.
 
 ---
 
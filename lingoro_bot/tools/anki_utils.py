@@ -0,0 +1,333 @@
+import hashlib
+import html
+import json
+import re
+import shutil
+import sqlite3
+import tempfile
+import time
+import zipfile
+import zlib
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from lingoro_bot.config import (
+    ANKI_COLLECTION_NAMES,
+    ANKI_DECK_ID,
+    ANKI_EXPORT_COLLECTION_NAME,
+    ANKI_FIELD_SEPARATOR,
+    ANKI_IMPORT_CHUNK_SIZE,
+    ANKI_MODEL_FIELDS,
+    ANKI_MODEL_ID,
+    WORDPAIR_ITEM_SEPARATOR,
+    WORDPAIR_SEPARATOR,
+    WORDPAIR_TRANSCRIPTION_SEPARATOR,
+)
+from lingoro_bot.custom_types.wordpair_types import WordpairComponentsType
+from lingoro_bot.exceptions import AnkiPackageError
+from lingoro_bot.tools.wordpair_utils import parse_wordpair_components
+from lingoro_bot.validators.wordpair.wordpair_validator import WordpairValidator
+
+HTML_BREAK_TAG_PATTERN: re.Pattern[str] = re.compile(r'<(br|div|p|li)\b[^>]*>', re.IGNORECASE)  # Теги-розриви
+HTML_TAG_PATTERN: re.Pattern[str] = re.compile(r'<[^>]+>')  # Інші HTML-теги у полях нотаток Anki
+SOUND_TAG_PATTERN: re.Pattern[str] = re.compile(r'\[sound:[^\]]*\]')  # Посилання на аудіо у полях нотаток Anki
+WHITESPACE_PATTERN: re.Pattern[str] = re.compile(r'\s+')
+
+# Схема SQLite-колекції Anki (формат "collection.anki2", версія схеми 11)
+ANKI_COLLECTION_SCHEMA = """
+CREATE TABLE col (id INTEGER PRIMARY KEY, crt INTEGER NOT NULL, mod INTEGER NOT NULL, scm INTEGER NOT NULL,
+                  ver INTEGER NOT NULL, dty INTEGER NOT NULL, usn INTEGER NOT NULL, ls INTEGER NOT NULL,
+                  conf TEXT NOT NULL, models TEXT NOT NULL, decks TEXT NOT NULL, dconf TEXT NOT NULL,
+                  tags TEXT NOT NULL);
+CREATE TABLE notes (id INTEGER PRIMARY KEY, guid TEXT NOT NULL, mid INTEGER NOT NULL, mod INTEGER NOT NULL,
+                    usn INTEGER NOT NULL, tags TEXT NOT NULL, flds TEXT NOT NULL, sfld INTEGER NOT NULL,
+                    csum INTEGER NOT NULL, flags INTEGER NOT NULL, data TEXT NOT NULL);
+CREATE TABLE cards (id INTEGER PRIMARY KEY, nid INTEGER NOT NULL, did INTEGER NOT NULL, ord INTEGER NOT NULL,
+                    mod INTEGER NOT NULL, usn INTEGER NOT NULL, type INTEGER NOT NULL, queue INTEGER NOT NULL,
+                    due INTEGER NOT NULL, ivl INTEGER NOT NULL, factor INTEGER NOT NULL, reps INTEGER NOT NULL,
+                    lapses INTEGER NOT NULL, left INTEGER NOT NULL, odue INTEGER NOT NULL, odid INTEGER NOT NULL,
+                    flags INTEGER NOT NULL, data TEXT NOT NULL);
+CREATE TABLE revlog (id INTEGER PRIMARY KEY, cid INTEGER NOT NULL, usn INTEGER NOT NULL, ease INTEGER NOT NULL,
+                     ivl INTEGER NOT NULL, lastIvl INTEGER NOT NULL, factor INTEGER NOT NULL,
+                     time INTEGER NOT NULL, type INTEGER NOT NULL);
+CREATE TABLE graves (usn INTEGER NOT NULL, oid INTEGER NOT NULL, type INTEGER NOT NULL);
+CREATE INDEX ix_notes_usn ON notes (usn);
+CREATE INDEX ix_cards_usn ON cards (usn);
+CREATE INDEX ix_revlog_usn ON revlog (usn);
+CREATE INDEX ix_cards_nid ON cards (nid);
+CREATE INDEX ix_cards_sched ON cards (did, queue, due);
+CREATE INDEX ix_revlog_cid ON revlog (cid);
+CREATE INDEX ix_notes_csum ON notes (csum);
+"""
+
+
+def iter_anki_notes(apkg_path: str | Path, chunk_size: int = ANKI_IMPORT_CHUNK_SIZE) -> Iterator[list[list[str]]]:
+    """Повертає поля нотаток Anki-пакета частинами (по "chunk_size" нотаток).
+
+    Notes:
+        З архіву на диск (у тимчасовий файл) потоково копіюється лише SQLite-колекція,
+        медіафайли не розпаковуються. Нотатки читаються курсором через "fetchmany",
+        тому в памʼяті одночасно знаходиться не більше однієї частини.
+
+    Args:
+        apkg_path (str | Path): Шлях до Anki-пакета.
+        chunk_size (int): Кількість нотаток в одній частині.
+
+    Yields:
+        list[list[str]]: Список нотаток, кожна з яких є списком її полів.
+    """
+    try:
+        apkg = zipfile.ZipFile(apkg_path)
+    except zipfile.BadZipFile as e:
+        raise AnkiPackageError('Файл не є zip-архівом Anki-пакета') from e
+
+    with apkg, tempfile.TemporaryDirectory() as temp_dir:
+        collection_name: str = _get_collection_name(apkg)
+        collection_path = Path(temp_dir, collection_name)
+
+        # Потокове копіювання колекції на диск без читання всього файлу в памʼять
+        try:
+            with apkg.open(collection_name) as src, open(collection_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+        except (zipfile.BadZipFile, zlib.error, EOFError) as e:
+            raise AnkiPackageError('Колекція Anki в архіві пошкоджена') from e
+
+        connection: sqlite3.Connection = sqlite3.connect(collection_path)
+        try:
+            cursor: sqlite3.Cursor = connection.execute('SELECT flds FROM notes ORDER BY id')
+            while True:
+                rows: list[tuple[str]] = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield [row[0].split(ANKI_FIELD_SEPARATOR) for row in rows]
+        except sqlite3.DatabaseError as e:
+            raise AnkiPackageError('Не вдалося прочитати нотатки з колекції Anki') from e
+        finally:
+            connection.close()
+
+
+def _get_collection_name(apkg: zipfile.ZipFile) -> str:
+    """Повертає назву файлу SQLite-колекції всередині Anki-пакета"""
+    apkg_names: set[str] = set(apkg.namelist())
+
+    for collection_name in ANKI_COLLECTION_NAMES:
+        if collection_name in apkg_names:
+            return collection_name
+    raise AnkiPackageError('В архіві немає колекції Anki ("collection.anki21" або "collection.anki2")')
+
+
+def clean_anki_field(field: str) -> str:
+    """Очищує поле нотатки Anki від HTML-тегів, посилань на аудіо та зайвих пробілів"""
+    cleaned_field: str = SOUND_TAG_PATTERN.sub(' ', field)
+    cleaned_field = HTML_BREAK_TAG_PATTERN.sub(' ', cleaned_field)
+    cleaned_field = HTML_TAG_PATTERN.sub('', cleaned_field)
+    cleaned_field = html.unescape(cleaned_field).replace('\xa0', ' ')
+    return WHITESPACE_PATTERN.sub(' ', cleaned_field).strip()
+
+
+def convert_anki_note_to_wordpair(fields: list[str]) -> WordpairComponentsType | None:
+    """Перетворює поля нотатки Anki на словникову пару.
+
+    Notes:
+        - Перше поле — слова, друге — переклади, третє (якщо є) — анотація. Інші поля ігноруються.
+        - Слова та переклади можуть містити транскрипції та декілька елементів у форматі бота.
+        - Нотатка проходить ту ж валідацію, що й словникова пара, введена вручну.
+
+    Args:
+        fields (list[str]): Поля нотатки Anki.
+
+    Returns:
+        WordpairComponentsType | None: Розділена на компоненти словникова пара
+        або None, якщо нотатка не валідна.
+    """
+    cleaned_fields: list[str] = [clean_anki_field(field) for field in fields[:3]]
+
+    # Порожня анотація не додається до словникової пари
+    if len(cleaned_fields) == 3 and not cleaned_fields[2]:
+        cleaned_fields.pop()
+
+    # Роздільник частин всередині поля зламав би структуру словникової пари
+    if any(WORDPAIR_SEPARATOR in field for field in cleaned_fields):
+        return None
+
+    wordpair: str = WORDPAIR_SEPARATOR.join(cleaned_fields)
+
+    if not WordpairValidator(wordpair).is_valid():
+        return None
+    return parse_wordpair_components(wordpair)
+
+
+def stage_anki_wordpairs(apkg_path: str | Path, staging_path: str | Path) -> tuple[int, int]:
+    """Перетворює нотатки Anki-пакета на словникові пари та записує валідні у файл частинами.
+
+    Notes:
+        Читання, очищення та валідація нотаток виконуються до відкриття транзакції запису в БД,
+        тому блокування запису SQLite утримується лише під час додавання вже підготовлених словникових пар.
+        Кожна частина записується окремим JSON-рядком, тому в памʼяті знаходиться лише поточна частина.
+
+    Args:
+        apkg_path (str | Path): Шлях до Anki-пакета.
+        staging_path (str | Path): Шлях до файлу, у який будуть записані словникові пари.
+
+    Returns:
+        tuple[int, int]: Кількість валідних словникових пар та кількість пропущених (не валідних) нотаток.
+    """
+    valid_count = 0
+    skipped_count = 0
+
+    with open(staging_path, 'w', encoding='utf-8') as staging_file:
+        for notes_chunk in iter_anki_notes(apkg_path):
+            wordpairs: list[WordpairComponentsType] = []
+            for note_fields in notes_chunk:
+                wordpair: WordpairComponentsType | None = convert_anki_note_to_wordpair(note_fields)
+                if wordpair is None:
+                    skipped_count += 1
+                    continue
+                wordpairs.append(wordpair)
+
+            if wordpairs:
+                staging_file.write(json.dumps(wordpairs, ensure_ascii=False) + '\n')
+                valid_count += len(wordpairs)
+    return valid_count, skipped_count
+
+
+def iter_staged_wordpairs(staging_path: str | Path) -> Iterator[list[WordpairComponentsType]]:
+    """Повертає частинами словникові пари, записані у файл функцією stage_anki_wordpairs"""
+    with open(staging_path, encoding='utf-8') as staging_file:
+        for line in staging_file:
+            yield json.loads(line)
+
+
+def format_anki_note_fields(word_items: list[tuple[str, str | None]],
+                            translation_items: list[tuple[str, str | None]],
+                            annotation: str | None) -> list[str]:
+    """Форматує словникову пару у поля нотатки Anki ("Front", "Back", "Annotation").
+
+    Notes:
+        Слова та переклади записуються у форматі бота ("слово | транскрипція, слово2"),
+        тому експортовану колоду можна без втрат імпортувати назад.
+
+    Args:
+        word_items (list[tuple[str, str | None]]): Слова словникової пари з їх транскрипціями.
+        translation_items (list[tuple[str, str | None]]): Переклади словникової пари з їх транскрипціями.
+        annotation (str | None): Анотація словникової пари.
+
+    Returns:
+        list[str]: Поля нотатки Anki.
+    """
+    def format_items(items: list[tuple[str, str | None]]) -> str:
+        formatted_items: list[str] = [
+            f'{component} {WORDPAIR_TRANSCRIPTION_SEPARATOR} {transcription}' if transcription is not None
+            else component
+            for component, transcription in items]
+        return html.escape(f'{WORDPAIR_ITEM_SEPARATOR} '.join(formatted_items), quote=False)
+
+    return [format_items(word_items),
+            format_items(translation_items),
+            html.escape(annotation or '', quote=False)]
+
+
+def write_anki_package(apkg_path: str | Path,
+                       deck_name: str,
+                       notes_chunks: Iterable[list[tuple[int, list[str]]]]) -> int:
+    """Створює Anki-пакет (.apkg) з нотаток, що надходять частинами.
+
+    Notes:
+        SQLite-колекція та медіа-маніфест створюються у тимчасовій директорії. Кожна частина нотаток
+        записується в колекцію окремою транзакцією, тому в памʼяті знаходиться лише поточна частина.
+        Після цього колекція та маніфест пакуються в zip-архів за шляхом "apkg_path".
+        GUID нотатки утворюється з ID словникової пари, тому повторно експортований словник
+        під час імпорту в Anki оновлює вже існуючі нотатки, а не створює їх дублікати.
+
+    Args:
+        apkg_path (str | Path): Шлях, за яким буде створено Anki-пакет.
+        deck_name (str): Назва колоди.
+        notes_chunks (Iterable[list[tuple[int, list[str]]]]): Частини з нотатками: ID словникової пари
+        та поля нотатки ("Front", "Back", "Annotation").
+
+    Returns:
+        int: Кількість записаних нотаток.
+    """
+    now_ms: int = int(time.time() * 1000)
+    now_s: int = now_ms // 1000
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        collection_path = Path(temp_dir, ANKI_EXPORT_COLLECTION_NAME)
+        media_path = Path(temp_dir, 'media')
+
+        connection: sqlite3.Connection = sqlite3.connect(collection_path)
+        try:
+            connection.executescript(ANKI_COLLECTION_SCHEMA)
+            connection.execute('INSERT INTO col VALUES (1, ?, ?, ?, 11, 0, 0, 0, ?, ?, ?, ?, ?)',
+                               (now_s, now_ms, now_ms, *_get_anki_collection_config(deck_name, now_s)))
+            connection.commit()
+
+            notes_count = 0
+            for notes_chunk in notes_chunks:
+                note_rows: list[tuple] = []
+                card_rows: list[tuple] = []
+
+                for wordpair_id, note_fields in notes_chunk:
+                    notes_count += 1
+                    note_id: int = now_ms + notes_count  # ID нотаток та карток в Anki — мітки часу в мс
+                    sort_field: str = note_fields[0]
+                    checksum = int(hashlib.sha1(sort_field.encode()).hexdigest()[:8], 16)
+
+                    note_rows.append((note_id, f'lingoro{wordpair_id}', ANKI_MODEL_ID, now_s, -1, '',
+                                      ANKI_FIELD_SEPARATOR.join(note_fields), sort_field, checksum, 0, ''))
+                    card_rows.append((note_id, note_id, ANKI_DECK_ID, 0, now_s, -1,
+                                      0, 0, notes_count, 0, 0, 0, 0, 0, 0, 0, 0, ''))
+
+                connection.executemany('INSERT INTO notes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', note_rows)
+                connection.executemany('INSERT INTO cards VALUES '
+                                       '(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', card_rows)
+                connection.commit()
+        finally:
+            connection.close()
+
+        # Медіафайли не експортуються, тому маніфест порожній
+        media_path.write_text('{}')
+
+        with zipfile.ZipFile(apkg_path, 'w', compression=zipfile.ZIP_DEFLATED) as apkg:
+            apkg.write(collection_path, arcname=ANKI_EXPORT_COLLECTION_NAME)
+            apkg.write(media_path, arcname='media')
+    return notes_count
+
+
+def _get_anki_collection_config(deck_name: str, now_s: int) -> tuple[str, str, str, str, str]:
+    """Повертає JSON-налаштування колекції Anki: conf, models, decks, dconf, tags"""
+    fields: list[dict[str, Any]] = [
+        {'name': field_name, 'ord': ord_, 'sticky': False, 'rtl': False, 'font': 'Arial', 'size': 20, 'media': []}
+        for ord_, field_name in enumerate(ANKI_MODEL_FIELDS)]
+    model: dict[str, Any] = {
+        'id': ANKI_MODEL_ID, 'name': 'Lingoro', 'type': 0, 'mod': now_s, 'usn': -1, 'sortf': 0,
+        'did': ANKI_DECK_ID, 'tags': [], 'vers': [], 'flds': fields, 'req': [[0, 'any', [0]]],
+        'tmpls': [{'name': 'Card 1', 'ord': 0, 'did': None, 'bqfmt': '', 'bafmt': '',
+                   'qfmt': '{{Front}}',
+                   'afmt': '{{FrontSide}}<hr id=answer>{{Back}}<br><i>{{Annotation}}</i>'}],
+        'css': '.card { font-family: arial; font-size: 20px; text-align: center; }',
+        'latexPre': '', 'latexPost': ''}
+
+    def get_deck(deck_id: int, name: str) -> dict[str, Any]:
+        return {'id': deck_id, 'name': name, 'mod': now_s, 'usn': -1, 'desc': '', 'dyn': 0, 'conf': 1,
+                'collapsed': False, 'extendNew': 10, 'extendRev': 50,
+                'newToday': [0, 0], 'revToday': [0, 0], 'lrnToday': [0, 0], 'timeToday': [0, 0]}
+
+    decks: dict[str, Any] = {'1': get_deck(1, 'Default'),
+                             str(ANKI_DECK_ID): get_deck(ANKI_DECK_ID, deck_name)}
+    deck_config: dict[str, Any] = {'1': {'id': 1, 'name': 'Default', 'mod': 0, 'usn': 0, 'maxTaken': 60,
+                                         'autoplay': True, 'timer': 0, 'replayq': True, 'dyn': False,
+                                         'new': {'delays': [1, 10], 'ints': [1, 4, 7], 'initialFactor': 2500,
+                                                 'order': 1, 'perDay': 20},
+                                         'rev': {'perDay': 200, 'ease4': 1.3, 'maxIvl': 36500},
+                                         'lapse': {'delays': [10], 'mult': 0, 'minInt': 1,
+                                                   'leechFails': 8, 'leechAction': 0}}}
+    config: dict[str, Any] = {'nextPos': 1, 'curDeck': ANKI_DECK_ID, 'curModel': ANKI_MODEL_ID,
+                              'activeDecks': [ANKI_DECK_ID], 'sortType': 'noteFld', 'sortBackwards': False}
+
+    return (json.dumps(config),
+            json.dumps({str(ANKI_MODEL_ID): model}),
+            json.dumps(decks),
+            json.dumps(deck_config),
+            json.dumps({}))
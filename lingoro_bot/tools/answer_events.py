@@ -0,0 +1,137 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from lingoro_bot.config import ANSWER_EVENTS_BATCH_SIZE, ANSWER_EVENTS_BUFFER_SIZE, ANSWER_EVENTS_FLUSH_INTERVAL
+from lingoro_bot.custom_types.answer_types import AnswerEventType
+from lingoro_bot.db.crud import AnswerEventCRUD
+from lingoro_bot.db.database import Session
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class RingBuffer:
+    """Кільцевий буфер фіксованої місткості (елементи повертаються в порядку додавання).
+
+    Args:
+        capacity (int): Максимальна кількість елементів у буфері.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity: int = capacity
+        self._items: list[Any] = [None] * capacity
+        self._head: int = 0  # Індекс найдавнішого елемента
+        self._size: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def is_full(self) -> bool:
+        """Повертає прапор, чи заповнений буфер"""
+        return self._size == self.capacity
+
+    def append(self, item: Any) -> None:
+        """Додає елемент у кінець буфера. Якщо буфер заповнений, то викликає IndexError"""
+        if self.is_full():
+            raise IndexError('Кільцевий буфер заповнений')
+
+        self._items[(self._head + self._size) % self.capacity] = item
+        self._size += 1
+
+    def pop_batch(self, limit: int) -> list[Any]:
+        """Видаляє з буфера та повертає не більше "limit" найдавніших елементів"""
+        batch_size: int = min(limit, self._size)
+        batch: list[Any] = []
+
+        for _ in range(batch_size):
+            batch.append(self._items[self._head])
+            self._items[self._head] = None
+            self._head = (self._head + 1) % self.capacity
+        self._size -= batch_size
+        return batch
+
+
+class AnswerEventLog:
+    """Журнал подій відповідей під час тренувань, які записуються до БД пакетами у фоновому завданні.
+
+    Notes:
+        Додавання події (record) не виконує запитів до БД: подія потрапляє до кільцевого буфера, а фонове
+        завдання (run) записує накопичені події пакетами (executemany) в окремому потоці з власною сесією БД.
+        Якщо буфер заповнений, то record очікує, поки фонове завдання не звільнить місце (зворотний тиск),
+        тому події не відкидаються.
+
+    Args:
+        capacity (int): Максимальна кількість подій, які ще не записані до БД.
+        batch_size (int): Кількість подій, після якої їх потрібно записати до БД.
+        flush_interval (float): Максимальний час (у секундах) між записами подій до БД.
+        write_batch (Callable[[list[AnswerEventType]], None]): Функція, що записує пакет подій до БД
+        (викликається в окремому потоці).
+    """
+
+    def __init__(self,
+                 capacity: int,
+                 batch_size: int,
+                 flush_interval: float,
+                 write_batch: Callable[[list[AnswerEventType]], None]) -> None:
+        self.batch_size: int = batch_size
+        self.flush_interval: float = flush_interval
+        self.write_batch: Callable[[list[AnswerEventType]], None] = write_batch
+        self._buffer = RingBuffer(capacity)
+        self._is_batch_ready = asyncio.Event()  # Сигнал фоновому завданню записати події, не чекаючи інтервалу
+        self._has_free_space = asyncio.Event()  # Сигнал подіям, які очікують на місце в заповненому буфері
+        self._has_free_space.set()
+        self._flush_lock = asyncio.Lock()  # Пакети записуються по одному, щоб зберегти порядок подій
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    async def record(self, answer_event: AnswerEventType) -> None:
+        """Додає подію відповіді до буфера (очікує, якщо буфер заповнений)"""
+        while self._buffer.is_full():
+            self._has_free_space.clear()
+            self._is_batch_ready.set()
+            await self._has_free_space.wait()
+
+        self._buffer.append(answer_event)
+        if len(self._buffer) >= self.batch_size:
+            self._is_batch_ready.set()
+
+    async def flush(self) -> None:
+        """Записує до БД усі накопичені події пакетами"""
+        async with self._flush_lock:
+            while self._buffer:
+                batch: list[AnswerEventType] = self._buffer.pop_batch(self.batch_size)
+                self._has_free_space.set()
+
+                try:
+                    await asyncio.to_thread(self.write_batch, batch)
+                except Exception:
+                    logger.exception(f'Не вдалося записати події відповідей до БД. Кількість: {len(batch)}')
+
+    async def run(self) -> None:
+        """Фонове завдання, що записує події до БД, коли накопичився пакет або минув інтервал запису"""
+        while True:
+            try:
+                await asyncio.wait_for(self._is_batch_ready.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+
+            self._is_batch_ready.clear()
+            await self.flush()
+
+
+def _write_answer_events(answer_events: list[AnswerEventType]) -> None:
+    """Записує пакет подій відповідей до БД.
+    Виконується в окремому потоці, тому використовує власну сесію БД.
+    """
+    with Session() as session:
+        answer_event_crud = AnswerEventCRUD(session)
+        answer_event_crud.add_answer_events(answer_events)
+
+
+# Події відповідей під час тренувань, які ще не записані до БД
+answer_event_log = AnswerEventLog(ANSWER_EVENTS_BUFFER_SIZE,
+                                  ANSWER_EVENTS_BATCH_SIZE,
+                                  ANSWER_EVENTS_FLUSH_INTERVAL,
+                                  write_batch=_write_answer_events)
@@ -0,0 +1,124 @@
+import re
+import unicodedata
+
+from lingoro_bot.config import ANSWER_APOSTROPHES, ANSWER_TYPO_LONG_LENGTH, ANSWER_TYPO_MIN_LENGTH
+
+# Вердикти перевірки відповіді
+ANSWER_VERDICT_EXACT = 'exact'  # Відповідь збігається з перекладом
+ANSWER_VERDICT_NEAR = 'near'  # Відповідь відрізняється від перекладу допустимою кількістю описок
+ANSWER_VERDICT_WRONG = 'wrong'  # Відповідь не вірна
+
+# Таблиця заміни всіх варіантів апострофа на звичайний
+APOSTROPHE_TRANSLATION_TABLE: dict[int, str] = str.maketrans({apostrophe: "'" for apostrophe in ANSWER_APOSTROPHES})
+
+
+def normalize_answer(text: str) -> str:
+    """Нормалізує відповідь (або переклад) для порівняння.
+
+    Notes:
+        - Unicode-нормалізація NFKC та приведення до нижнього регістру (casefold).
+        - Всі варіанти апострофа (ʼ, ’, ‘, ` тощо) замінюються на звичайний (').
+        - Пробіли на початку та в кінці видаляються, а декілька пробілів поспіль замінюються на один.
+
+    Examples:
+        >>> normalize_answer('  Пʼять   РАЗІВ ')
+        "п'ять разів"
+    """
+    normalized_text: str = unicodedata.normalize('NFKC', text).casefold()
+    normalized_text = normalized_text.translate(APOSTROPHE_TRANSLATION_TABLE)
+    return re.sub(r'\s+', ' ', normalized_text).strip()
+
+
+def get_answer_keys(translations: list[str]) -> list[str]:
+    """Повертає унікальні нормалізовані переклади словникової пари (ключі для перевірки відповіді)"""
+    return list(dict.fromkeys(normalize_answer(translation) for translation in translations))
+
+
+def get_max_typo_distance(answer_key: str) -> int:
+    """Повертає допустиму кількість описок у відповіді, залежно від довжини перекладу"""
+    if len(answer_key) >= ANSWER_TYPO_LONG_LENGTH:
+        return 2
+    if len(answer_key) >= ANSWER_TYPO_MIN_LENGTH:
+        return 1
+    return 0
+
+
+def get_bounded_edit_distance(source: str, target: str, max_distance: int) -> int | None:
+    """Обчислює відстань Левенштейна між рядками, якщо вона не перевищує максимальну.
+
+    Notes:
+        Обчислюється лише смуга матриці шириною 2 * max_distance + 1 навколо діагоналі.
+        Обчислення припиняється, щойно всі значення рядка матриці перевищують максимальну відстань.
+
+    Args:
+        source (str): Перший рядок.
+        target (str): Другий рядок.
+        max_distance (int): Максимальна допустима відстань.
+
+    Returns:
+        int | None: Відстань між рядками або None, якщо вона перевищує максимальну.
+
+    Examples:
+        >>> get_bounded_edit_distance('будинок', 'будинк', max_distance=1)
+        1
+        >>> get_bounded_edit_distance('будинок', 'бутинк', max_distance=1) is None
+        True
+    """
+    source_length: int = len(source)
+    target_length: int = len(target)
+
+    if abs(source_length - target_length) > max_distance:
+        return None
+
+    over_limit: int = max_distance + 1  # Будь-яке значення, більше за максимальну відстань
+    previous_row: list[int] = [idx if idx <= max_distance else over_limit for idx in range(target_length + 1)]
+
+    for source_idx in range(1, source_length + 1):
+        current_row: list[int] = [over_limit] * (target_length + 1)
+        if source_idx <= max_distance:
+            current_row[0] = source_idx
+
+        row_min: int = current_row[0]
+        band_start: int = max(1, source_idx - max_distance)
+        band_end: int = min(target_length, source_idx + max_distance)
+        source_char: str = source[source_idx - 1]
+
+        for target_idx in range(band_start, band_end + 1):
+            substitution_cost: int = 0 if source_char == target[target_idx - 1] else 1
+            distance: int = min(previous_row[target_idx] + 1,
+                                current_row[target_idx - 1] + 1,
+                                previous_row[target_idx - 1] + substitution_cost)
+            current_row[target_idx] = min(distance, over_limit)
+            row_min = min(row_min, distance)
+
+        if row_min > max_distance:
+            return None
+        previous_row = current_row
+
+    distance: int = previous_row[target_length]
+    return distance if distance <= max_distance else None
+
+
+def check_answer(answer: str, answer_keys: list[str]) -> str:
+    """Перевіряє відповідь користувача за нормалізованими перекладами словникової пари.
+
+    Args:
+        answer (str): Відповідь користувача.
+        answer_keys (list[str]): Нормалізовані переклади словникової пари (див. get_answer_keys).
+
+    Returns:
+        str: Вердикт перевірки (ANSWER_VERDICT_EXACT, ANSWER_VERDICT_NEAR або ANSWER_VERDICT_WRONG).
+    """
+    normalized_answer: str = normalize_answer(answer)
+
+    if normalized_answer in answer_keys:
+        return ANSWER_VERDICT_EXACT
+
+    for answer_key in answer_keys:
+        max_distance: int = get_max_typo_distance(answer_key)
+        if max_distance == 0:
+            continue
+
+        if get_bounded_edit_distance(normalized_answer, answer_key, max_distance) is not None:
+            return ANSWER_VERDICT_NEAR
+    return ANSWER_VERDICT_WRONG
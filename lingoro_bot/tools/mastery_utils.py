@@ -0,0 +1,131 @@
+from itertools import chain
+
+import numpy as np
+
+from lingoro_bot.config import MASTERY_ATTEMPTS_SCALE, MASTERY_HALF_LIFE_DAYS, MASTERY_WEAK_THRESHOLD
+from lingoro_bot.custom_types.stats_types import MasteryOverviewType, VocabMasteryType, WordpairMasteryType
+from lingoro_bot.custom_types.vocab_types import VocabDataType
+
+
+def calculate_mastery_scores(attempts: np.ndarray,
+                             failures: np.ndarray,
+                             days_since_seen: np.ndarray) -> np.ndarray:
+    """Обчислює рівень засвоєння (від 0 до 1) словникових пар одним векторним проходом.
+
+    Notes:
+        Рівень засвоєння — добуток трьох множників:
+            - частки вдалих спроб (1 - невдалі спроби / всі спроби);
+            - впевненості за кількістю спроб (1 - e^(-спроби / MASTERY_ATTEMPTS_SCALE));
+            - згасання з часом (зменшується вдвічі кожні MASTERY_HALF_LIFE_DAYS днів без тренування).
+
+    Args:
+        attempts (np.ndarray): Кількість спроб кожної словникової пари (разом з показами перекладу).
+        failures (np.ndarray): Кількість невдалих спроб (неправильні відповіді та покази перекладу).
+        days_since_seen (np.ndarray): Кількість днів від останньої дії зі словниковою парою.
+
+    Returns:
+        np.ndarray: Рівень засвоєння кожної словникової пари.
+    """
+    success_rate: np.ndarray = 1 - failures / np.maximum(attempts, 1)
+    confidence: np.ndarray = 1 - np.exp(-attempts / MASTERY_ATTEMPTS_SCALE)
+    recency: np.ndarray = np.exp2(-np.maximum(days_since_seen, 0) / MASTERY_HALF_LIFE_DAYS)
+    return success_rate * confidence * recency
+
+
+def build_mastery_overview(mastery_rows: list[tuple[int, int, int, int, float]],
+                           vocabs_data: list[VocabDataType],
+                           weakest_count: int) -> MasteryOverviewType:
+    """Повертає огляд засвоєння всіх словників користувача: рівень засвоєння кожного словника
+    та найслабші словникові пари.
+
+    Notes:
+        Рядки статистики перетворюються на масиви-стовпці, після чого рівні засвоєння, суми за словниками
+        (np.bincount) та найслабші словникові пари (np.partition) обчислюються без циклу Python
+        за словниковими парами. Словникові пари, які ще не тренувалися, мають рівень засвоєння 0
+        і враховуються лише у середньому рівні засвоєння словника.
+
+    Args:
+        mastery_rows (list[tuple[int, int, int, int, float]]): Статистика натренованих словникових пар
+        (див. WordpairStatCRUD.get_user_mastery_rows).
+        vocabs_data (list[VocabDataType]): Дані не видалених словників користувача.
+        weakest_count (int): Кількість найслабших словникових пар.
+
+    Returns:
+        MasteryOverviewType: Словники та найслабші словникові пари від найменшого рівня засвоєння.
+    """
+    # Рядки розгортаються в один плоский масив без проміжних списків (швидше за np.array зі списку кортежів)
+    columns: np.ndarray = np.fromiter(chain.from_iterable(mastery_rows),
+                                      dtype=np.float64,
+                                      count=len(mastery_rows) * 5).reshape(-1, 5).T
+    wordpair_ids: np.ndarray = columns[0].astype(np.int64)
+    vocab_ids: np.ndarray = columns[1].astype(np.int64)
+    mastery: np.ndarray = calculate_mastery_scores(attempts=columns[2], failures=columns[3], days_since_seen=columns[4])
+
+    # Індекс словника кожної словникової пари у списку словників
+    sorted_vocab_ids: np.ndarray = np.array(sorted(vocab_data['id'] for vocab_data in vocabs_data), dtype=np.int64)
+    vocab_idxs: np.ndarray = np.searchsorted(sorted_vocab_ids, vocab_ids)
+
+    vocabs_count: int = len(sorted_vocab_ids)
+    mastery_sums: np.ndarray = np.bincount(vocab_idxs, weights=mastery, minlength=vocabs_count)
+    trained_counts: np.ndarray = np.bincount(vocab_idxs, minlength=vocabs_count)
+    weak_counts: np.ndarray = np.bincount(vocab_idxs, weights=mastery < MASTERY_WEAK_THRESHOLD, minlength=vocabs_count)
+
+    vocabs_mastery: list[VocabMasteryType] = []
+    for vocab_data in vocabs_data:
+        vocab_idx = int(np.searchsorted(sorted_vocab_ids, vocab_data['id']))
+        wordpairs_count: int = vocab_data['wordpairs_count']
+        vocabs_mastery.append({'vocab_id': vocab_data['id'],
+                               'name': vocab_data['name'],
+                               'wordpairs_count': wordpairs_count,
+                               'trained_count': int(trained_counts[vocab_idx]),
+                               'weak_count': int(weak_counts[vocab_idx]),
+                               'mastery': float(mastery_sums[vocab_idx]) / max(wordpairs_count, 1)})
+    vocabs_mastery.sort(key=lambda vocab_mastery: (vocab_mastery['mastery'], vocab_mastery['vocab_id']))
+
+    # Найслабші словникові пари: часткове впорядкування O(n) знаходить поріг, після чого сортуються лише пари
+    # з рівнем засвоєння не вище порогу (за однакового рівня засвоєння — за ID словникової пари)
+    weakest_count = min(weakest_count, len(mastery))
+    weakest_idxs: np.ndarray = np.arange(0)
+    if weakest_count:
+        threshold: float = np.partition(mastery, weakest_count - 1)[weakest_count - 1]
+        weakest_idxs = np.flatnonzero(mastery <= threshold)
+        weakest_idxs = weakest_idxs[np.lexsort((wordpair_ids[weakest_idxs], mastery[weakest_idxs]))][:weakest_count]
+
+    weakest_wordpairs: list[WordpairMasteryType] = [{'wordpair_id': int(wordpair_ids[idx]),
+                                                     'vocab_id': int(vocab_ids[idx]),
+                                                     'mastery': float(mastery[idx])}
+                                                    for idx in weakest_idxs]
+    return {'vocabs': vocabs_mastery, 'weakest_wordpairs': weakest_wordpairs}
+
+
+def format_mastery_overview(mastery_overview: MasteryOverviewType,
+                            vocab_names: dict[int, str],
+                            wordpair_words: dict[int, str],
+                            vocabs_limit: int) -> str:
+    """Повертає відформатований огляд засвоєння словників та найслабших словникових пар.
+
+    Args:
+        mastery_overview (MasteryOverviewType): Огляд засвоєння (див. build_mastery_overview).
+        vocab_names (dict[int, str]): Назви словників (ключ — ID словника).
+        wordpair_words (dict[int, str]): Відформатовані слова найслабших словникових пар (ключ — ID пари).
+        vocabs_limit (int): Максимальна кількість словників (з найменшим рівнем засвоєння).
+
+    Returns:
+        str: Відформатований огляд.
+    """
+    vocabs_lines: list[str] = [f'📗 {vocab_mastery["name"]}: {vocab_mastery["mastery"]:.0%} '
+                               f'(натреновано {vocab_mastery["trained_count"]}/{vocab_mastery["wordpairs_count"]}, '
+                               f'слабких {vocab_mastery["weak_count"]})'
+                               for vocab_mastery in mastery_overview['vocabs'][:vocabs_limit]]
+    weakest_lines: list[str] = [f'{num}. {wordpair_words[wordpair_mastery["wordpair_id"]]} '
+                                f'(📗 {vocab_names[wordpair_mastery["vocab_id"]]}) — {wordpair_mastery["mastery"]:.0%}'
+                                for num, wordpair_mastery in enumerate(mastery_overview['weakest_wordpairs'], start=1)]
+
+    formatted_vocabs: str = '\n'.join(vocabs_lines) or 'Немає словників'
+    formatted_weakest: str = '\n'.join(weakest_lines) or 'Немає натренованих словникових пар'
+
+    formatted_overview: str = (f'🧠 Рівень засвоєння словників\n\n'
+                               f'{formatted_vocabs}\n\n'
+                               f'🔻 Найслабші словникові пари:\n'
+                               f'{formatted_weakest}')
+    return formatted_overview
@@ -0,0 +1,97 @@
+import bisect
+import re
+from array import array
+
+from lingoro_bot.config import SEARCH_MAX_TERMS
+from lingoro_bot.custom_types.wordpair_types import WordpairSearchResultType
+from lingoro_bot.tools.answer_utils import normalize_answer
+
+
+def build_search_match_query(query: str) -> str | None:
+    """Повертає пошуковий запит у синтаксисі FTS5 з тексту користувача.
+
+    Notes:
+        З тексту беруться лише слова (літери та цифри), кожне з яких шукається за префіксом.
+        Спеціальні символи FTS5 (лапки, оператори тощо) не потрапляють до запиту.
+
+    Args:
+        query (str): Текст пошукового запиту користувача.
+
+    Returns:
+        str | None: Запит FTS5 або None, якщо у тексті немає жодного слова.
+
+    Examples:
+        >>> build_search_match_query('Кіт, "пес"')
+        '"кіт"* "пес"*'
+    """
+    terms: list[str] = re.findall(r'\w+', query.casefold())[:SEARCH_MAX_TERMS]
+    if not terms:
+        return None
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def format_search_results(search_results: list[WordpairSearchResultType]) -> str:
+    """Повертає відформатовані результати пошуку словникових пар"""
+    formatted_results: list[str] = []
+
+    for result in search_results:
+        formatted_result: str = f'▪️ {result['words']} ▪️ {result['translations']}\n📗 {result['vocab_name']}'
+        if result['annotation']:
+            formatted_result += f' ▪️ 💡 {result['annotation']}'
+        formatted_results.append(formatted_result)
+    return '\n\n'.join(formatted_results)
+
+
+class PrefixIndex:
+    """Індекс для пошуку словникових пар за початком слів чи перекладів (автодоповнення).
+
+    Notes:
+        Ключами індексу є нормалізовані слова та переклади словникових пар, а також окремі слова
+        в них (для пошуку за другим та наступними словами, наприклад "morning" у "good morning").
+        Ключі зберігаються у відсортованому списку, тому пошук за префіксом виконується бінарним
+        пошуком (bisect) першого ключа, що починається з префікса, та переглядом наступних ключів.
+
+    Args:
+        entries (list[WordpairSearchResultType]): Словникові пари, за якими будується індекс.
+    """
+
+    def __init__(self, entries: list[WordpairSearchResultType]) -> None:
+        self.entries: list[WordpairSearchResultType] = entries
+
+        index_items: set[tuple[str, int]] = set()
+        for entry_idx, entry in enumerate(entries):
+            for item in (*entry['words'].split(', '), *entry['translations'].split(', ')):
+                normalized_item: str = normalize_answer(item)
+                index_items.add((normalized_item, entry_idx))
+                index_items.update((term, entry_idx) for term in normalized_item.split(' ')[1:])
+
+        sorted_items: list[tuple[str, int]] = sorted(index_items)
+        self._keys: list[str] = [key for key, _ in sorted_items]
+        self._entry_idxs: array = array('I', (entry_idx for _, entry_idx in sorted_items))
+
+    def __len__(self) -> int:
+        """Повертає кількість ключів індексу (використовується як розмір індексу у кеші)"""
+        return len(self._keys)
+
+    def search(self, prefix: str, limit: int) -> list[WordpairSearchResultType]:
+        """Повертає словникові пари, слова чи переклади яких починаються з префікса.
+
+        Args:
+            prefix (str): Префікс (текст, введений користувачем).
+            limit (int): Максимальна кількість словникових пар.
+
+        Returns:
+            list[WordpairSearchResultType]: Знайдені словникові пари (без повторів) у порядку ключів.
+        """
+        normalized_prefix: str = normalize_answer(prefix)
+        if not normalized_prefix:
+            return []
+
+        found_entry_idxs: dict[int, None] = {}  # Впорядкована множина індексів знайдених словникових пар
+        key_idx: int = bisect.bisect_left(self._keys, normalized_prefix)
+
+        while (key_idx < len(self._keys) and len(found_entry_idxs) < limit
+               and self._keys[key_idx].startswith(normalized_prefix)):
+            found_entry_idxs[self._entry_idxs[key_idx]] = None
+            key_idx += 1
+        return [self.entries[entry_idx] for entry_idx in found_entry_idxs]
@@ -0,0 +1,60 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from lingoro_bot.tools.timer_wheel import TimerHandle, TimerWheel, timer_wheel
+
+
+class SpeedRoundTimers:
+    """Таймери тренувань "Швидкий раунд" користувачів: час на відповідь та завершення раунду.
+
+    Notes:
+        Кожен користувач має не більше одного таймера кожного виду, тому таймери зберігаються у Python-словниках
+        за ID користувача в БД, а їх скасування (наприклад, після відповіді) — O(1) без пошуку у колесі таймерів.
+
+    Args:
+        wheel (TimerWheel): Колесо таймерів, на якому плануються таймери.
+    """
+
+    def __init__(self, wheel: TimerWheel) -> None:
+        self._wheel: TimerWheel = wheel
+        self._question_timers: dict[int, TimerHandle] = {}  # Ключ — ID користувача в БД
+        self._round_timers: dict[int, TimerHandle] = {}  # Ключ — ID користувача в БД
+
+    def schedule_question(self,
+                          user_db_id: int,
+                          delay: float,
+                          callback: Callable[..., Awaitable[None]],
+                          *args: Any) -> None:
+        """Планує таймер часу на відповідь на поточну словникову пару (попередній таймер скасовується)"""
+        self.cancel_question(user_db_id)
+        self._question_timers[user_db_id] = self._wheel.schedule(delay, callback, *args)
+
+    def cancel_question(self, user_db_id: int) -> None:
+        """Скасовує таймер часу на відповідь на поточну словникову пару"""
+        timer_handle: TimerHandle | None = self._question_timers.pop(user_db_id, None)
+        if timer_handle is not None:
+            timer_handle.cancel()
+
+    def schedule_round_end(self,
+                           user_db_id: int,
+                           delay: float,
+                           callback: Callable[..., Awaitable[None]],
+                           *args: Any) -> None:
+        """Планує таймер завершення раунду (попередній таймер скасовується)"""
+        self.cancel_round_end(user_db_id)
+        self._round_timers[user_db_id] = self._wheel.schedule(delay, callback, *args)
+
+    def cancel_round_end(self, user_db_id: int) -> None:
+        """Скасовує таймер завершення раунду"""
+        timer_handle: TimerHandle | None = self._round_timers.pop(user_db_id, None)
+        if timer_handle is not None:
+            timer_handle.cancel()
+
+    def cancel_all(self, user_db_id: int) -> None:
+        """Скасовує всі таймери користувача (після завершення тренування)"""
+        self.cancel_question(user_db_id)
+        self.cancel_round_end(user_db_id)
+
+
+# Таймери тренувань "Швидкий раунд" всіх користувачів
+speed_round_timers = SpeedRoundTimers(timer_wheel)
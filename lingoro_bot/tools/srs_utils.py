@@ -0,0 +1,63 @@
+from lingoro_bot.config import SRS_MIN_EASE_FACTOR, SRS_PASSING_QUALITY
+
+
+def get_review_quality(session_error_count: int, is_translation_shown: bool) -> int:
+    """Повертає оцінку відповіді (за шкалою SM-2 від 0 до 5) на словникову пару за тренування.
+
+    Args:
+        session_error_count (int): Кількість помилок у словниковій парі за тренування.
+        is_translation_shown (bool): Прапор, чи був показаний переклад словникової пари.
+
+    Returns:
+        int: Оцінка відповіді.
+    """
+    if is_translation_shown:
+        return 1
+    if session_error_count == 0:
+        return 5
+    if session_error_count == 1:
+        return 3
+    return 2
+
+
+def calculate_next_review(ease_factor: float,
+                          interval_days: int,
+                          repetitions: int,
+                          quality: int) -> tuple[float, int, int]:
+    """Обчислює новий стан інтервального повторення словникової пари за алгоритмом SM-2.
+
+    Notes:
+        - Якщо оцінка нижча за прохідну, то серія повторень скидається і пара повторюється наступного дня.
+        - Інакше інтервал зростає: 1 день, 6 днів, далі попередній інтервал множиться на коефіцієнт легкості.
+        - Коефіцієнт легкості змінюється залежно від оцінки, але не опускається нижче мінімального.
+
+    Args:
+        ease_factor (float): Поточний коефіцієнт легкості.
+        interval_days (int): Поточний інтервал між повтореннями (у днях).
+        repetitions (int): Кількість успішних повторень поспіль.
+        quality (int): Оцінка відповіді від 0 до 5.
+
+    Returns:
+        tuple[float, int, int]: Новий коефіцієнт легкості, інтервал (у днях) та кількість повторень поспіль.
+
+    Examples:
+        >>> calculate_next_review(ease_factor=2.5, interval_days=6, repetitions=2, quality=5)
+        (2.6, 15, 3)
+    """
+    if quality < SRS_PASSING_QUALITY:
+        new_repetitions = 0
+        new_interval_days = 1
+    else:
+        if repetitions == 0:
+            new_interval_days = 1
+        elif repetitions == 1:
+            new_interval_days = 6
+        else:
+            new_interval_days = round(interval_days * ease_factor)
+        new_repetitions: int = repetitions + 1
+
+    quality_gap: int = 5 - quality
+    new_ease_factor: float = ease_factor + 0.1 - quality_gap * (0.08 + quality_gap * 0.02)
+    new_ease_factor = max(SRS_MIN_EASE_FACTOR, round(new_ease_factor, 2))
+
+    return new_ease_factor, new_interval_days, new_repetitions
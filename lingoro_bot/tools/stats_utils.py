@@ -0,0 +1,155 @@
+from datetime import date, datetime, timedelta
+
+from lingoro_bot.custom_types.stats_types import TrainingStatsType, VocabTrainingStatsType
+
+# Кількість днів у періодах статистики тренувань (період закінчується сьогоднішнім днем)
+STATS_PERIOD_DAYS: dict[str, int] = {'day': 1, 'week': 7, 'month': 30}
+# Назви періодів статистики тренувань
+STATS_PERIOD_NAMES: dict[str, str] = {'day': 'сьогодні', 'week': 'тиждень', 'month': 'місяць'}
+
+
+def get_training_duration_seconds(start_time: datetime, end_time: datetime) -> int:
+    """Повертає тривалість тренування в цілих секундах.
+
+    Notes:
+        Мікросекунди відкидаються так само, як у SQLite strftime('%s', ...) (див. TRAINING_DAILY_STATS_SELECT_SQL),
+        інакше денні підсумки після тренувань і після перебудови з історії відрізнялися б.
+    """
+    duration: timedelta = end_time.replace(microsecond=0) - start_time.replace(microsecond=0)
+    return int(duration.total_seconds())
+
+
+def get_period_bounds(period: str, today: date) -> tuple[date, date]:
+    """Повертає перший день періоду статистики та перший день попереднього періоду такої ж довжини.
+
+    Examples:
+        >>> get_period_bounds('week', date(2024, 5, 10))
+        (datetime.date(2024, 5, 4), datetime.date(2024, 4, 27))
+    """
+    period_days: int = STATS_PERIOD_DAYS[period]
+    start_day: date = today - timedelta(days=period_days - 1)
+    prev_start_day: date = start_day - timedelta(days=period_days)
+    return start_day, prev_start_day
+
+
+def calculate_streaks(training_days: list[date], today: date) -> tuple[int, int]:
+    """Обчислює поточну та найдовшу серії днів з тренуваннями поспіль.
+
+    Notes:
+        Поточна серія не переривається, якщо сьогодні ще не було тренувань, але вони були вчора.
+
+    Args:
+        training_days (list[date]): Дні з тренуваннями (без повторень, за зростанням).
+        today (date): Сьогоднішній день.
+
+    Returns:
+        tuple[int, int]: Поточна та найдовша серії (у днях).
+    """
+    best_streak: int = 0
+    streak: int = 0
+    prev_day: date | None = None
+
+    for day in training_days:
+        streak = streak + 1 if prev_day is not None and day - prev_day == timedelta(days=1) else 1
+        best_streak = max(best_streak, streak)
+        prev_day = day
+
+    is_streak_active: bool = prev_day is not None and today - prev_day <= timedelta(days=1)
+    current_streak: int = streak if is_streak_active else 0
+    return current_streak, best_streak
+
+
+def calculate_accuracy(number_correct_answers: int, number_wrong_answers: int) -> float | None:
+    """Повертає частку правильних відповідей або None, якщо відповідей не було"""
+    answers_count: int = number_correct_answers + number_wrong_answers
+    if answers_count == 0:
+        return None
+    return number_correct_answers / answers_count
+
+
+def format_duration(duration_seconds: int) -> str:
+    """Повертає відформатовану тривалість тренувань.
+
+    Examples:
+        >>> format_duration(3720)
+        '1 год 2 хв'
+        >>> format_duration(45)
+        '0 хв'
+    """
+    hours, minutes = divmod(duration_seconds // 60, 60)
+    if hours:
+        return f'{hours} год {minutes} хв'
+    return f'{minutes} хв'
+
+
+def format_accuracy_trend(accuracy: float | None, prev_accuracy: float | None) -> str:
+    """Повертає відформатовану точність та її зміну відносно попереднього періоду.
+    Якщо в одному з періодів не було відповідей, то зміна не виводиться.
+
+    Examples:
+        >>> format_accuracy_trend(0.8, 0.75)
+        '80% (↗️ +5%)'
+    """
+    if accuracy is None:
+        return 'Відсутня'
+    if prev_accuracy is None:
+        return f'{accuracy:.0%}'
+
+    difference: int = round((accuracy - prev_accuracy) * 100)
+    if difference > 0:
+        return f'{accuracy:.0%} (↗️ +{difference}%)'
+    if difference < 0:
+        return f'{accuracy:.0%} (↘️ {difference}%)'
+    return f'{accuracy:.0%} (➡️ 0%)'
+
+
+def format_vocabs_stats(vocabs_stats: list[VocabTrainingStatsType]) -> str:
+    """Повертає відформатовану статистику тренувань словників за період"""
+    if not vocabs_stats:
+        return 'Немає тренувань за цей період'
+
+    vocabs_lines: list[str] = []
+    for vocab_stats in vocabs_stats:
+        accuracy: float | None = calculate_accuracy(vocab_stats['number_correct_answers'],
+                                                    vocab_stats['number_wrong_answers'])
+        prev_accuracy: float | None = calculate_accuracy(vocab_stats['prev_number_correct_answers'],
+                                                         vocab_stats['prev_number_wrong_answers'])
+        vocabs_lines.append(f'📗 {vocab_stats["name"]}: тренувань {vocab_stats["sessions_count"]}, '
+                            f'точність {format_accuracy_trend(accuracy, prev_accuracy)}')
+    return '\n'.join(vocabs_lines)
+
+
+def format_stats_message(period: str,
+                         stats: TrainingStatsType,
+                         prev_stats: TrainingStatsType,
+                         current_streak: int,
+                         best_streak: int,
+                         vocabs_stats: list[VocabTrainingStatsType]) -> str:
+    """Повертає відформатовану статистику тренувань користувача за період.
+
+    Args:
+        period (str): Період статистики (див. STATS_PERIOD_DAYS).
+        stats (TrainingStatsType): Підсумки тренувань за період.
+        prev_stats (TrainingStatsType): Підсумки тренувань за попередній період такої ж довжини.
+        current_streak (int): Поточна серія днів з тренуваннями.
+        best_streak (int): Найдовша серія днів з тренуваннями.
+        vocabs_stats (list[VocabTrainingStatsType]): Статистика тренувань словників за період.
+
+    Returns:
+        str: Відформатована статистика.
+    """
+    accuracy: float | None = calculate_accuracy(stats['number_correct_answers'], stats['number_wrong_answers'])
+    prev_accuracy: float | None = calculate_accuracy(prev_stats['number_correct_answers'],
+                                                     prev_stats['number_wrong_answers'])
+
+    formatted_stats: str = (f'📊 Статистика тренувань за {STATS_PERIOD_NAMES[period]}\n\n'
+                            f'🏋️ Тренувань: {stats["sessions_count"]}\n'
+                            f'🎯 Точність: {format_accuracy_trend(accuracy, prev_accuracy)}\n'
+                            f'✅ Правильних відповідей: {stats["number_correct_answers"]}\n'
+                            f'❌ Неправильних відповідей: {stats["number_wrong_answers"]}\n'
+                            f'⏱ Час тренувань: {format_duration(stats["duration_seconds"])}\n\n'
+                            f'🔥 Поточна серія: {current_streak} дн.\n'
+                            f'🏆 Найдовша серія: {best_streak} дн.\n\n'
+                            f'Словники:\n'
+                            f'{format_vocabs_stats(vocabs_stats)}')
+    return formatted_stats
@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import math
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from lingoro_bot.config import TIMER_WHEEL_LEVELS, TIMER_WHEEL_RESOLUTION, TIMER_WHEEL_SLOT_BITS
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class TimerHandle:
+    """Таймер, запланований у колесі таймерів (див. TimerWheel.schedule)"""
+
+    __slots__ = ('expiry_tick', 'callback', 'args', '_slot')
+
+    def __init__(self, expiry_tick: int, callback: Callable[..., Awaitable[None]], args: tuple[Any, ...]) -> None:
+        self.expiry_tick: int = expiry_tick  # Такт колеса, на якому спрацьовує таймер
+        self.callback: Callable[..., Awaitable[None]] = callback
+        self.args: tuple[Any, ...] = args
+        self._slot: dict[TimerHandle, None] | None = None  # Слот колеса, в якому зараз знаходиться таймер
+
+    def cancel(self) -> None:
+        """Скасовує таймер за O(1): видаляє його зі слоту колеса (повторне скасування нічого не робить)"""
+        if self._slot is not None:
+            del self._slot[self]
+            self._slot = None
+
+    def is_active(self) -> bool:
+        """Повертає прапор, чи таймер ще не спрацював і не скасований"""
+        return self._slot is not None
+
+
+class TimerWheel:
+    """Ієрархічне колесо таймерів: одне фонове завдання обслуговує таймери всіх користувачів.
+
+    Notes:
+        Колесо має "levels" рівнів по 2^slot_bits слотів. Слот рівня L охоплює 2^(slot_bits * L) тактів,
+        тому таймер потрапляє на найнижчий рівень, діапазон якого вміщує його затримку. Коли молодший рівень
+        проходить повне коло, таймери відповідного слоту старшого рівня переносяться (каскадуються) нижче.
+        Додавання, скасування та спрацювання таймера — O(1), кожен такт обробляє лише один слот
+        (та рідкі каскади), незалежно від кількості запланованих таймерів.
+
+    Args:
+        resolution (float): Тривалість одного такту (у секундах).
+        slot_bits (int): Кількість біт номера слоту (на кожному рівні 2^slot_bits слотів).
+        levels (int): Кількість рівнів колеса.
+    """
+
+    def __init__(self, resolution: float, slot_bits: int, levels: int) -> None:
+        self.resolution: float = resolution
+        self.current_tick: int = 0  # Останній оброблений такт
+        self._slot_bits: int = slot_bits
+        self._slot_mask: int = (1 << slot_bits) - 1
+        self._max_ticks: int = 1 << (slot_bits * levels)  # Максимальна затримка (у тактах)
+        self._levels: list[list[dict[TimerHandle, None]]] = [[{} for _ in range(1 << slot_bits)]
+                                                              for _ in range(levels)]
+        self._callback_tasks: set[asyncio.Task] = set()  # Посилання на завдання, доки вони виконуються
+
+    def schedule(self, delay: float, callback: Callable[..., Awaitable[None]], *args: Any) -> TimerHandle:
+        """Планує виклик корутинної функції "callback" з аргументами "args" через "delay" секунд
+        (не раніше, але й не пізніше ніж на один такт). Якщо затримка більша за діапазон колеса, то викликає ValueError.
+        """
+        # Поточний такт вже частково минув, тому додається ще один такт, щоб таймер не спрацював раніше
+        ticks: int = math.ceil(delay / self.resolution) + 1
+        if ticks >= self._max_ticks:
+            raise ValueError(f'Затримка таймера перевищує діапазон колеса таймерів: {delay} с')
+
+        timer_handle = TimerHandle(self.current_tick + ticks, callback, args)
+        self._place(timer_handle)
+        return timer_handle
+
+    def _place(self, timer_handle: TimerHandle) -> None:
+        """Додає таймер у слот найнижчого рівня, діапазон якого вміщує час до його спрацювання"""
+        ticks_left: int = timer_handle.expiry_tick - self.current_tick
+        level: int = 0
+        while ticks_left >> (self._slot_bits * (level + 1)):
+            level += 1
+
+        slot_idx: int = (timer_handle.expiry_tick >> (self._slot_bits * level)) & self._slot_mask
+        slot: dict[TimerHandle, None] = self._levels[level][slot_idx]
+        slot[timer_handle] = None
+        timer_handle._slot = slot
+
+    def advance(self) -> list[TimerHandle]:
+        """Переводить колесо на один такт та повертає таймери, які спрацювали на ньому"""
+        self.current_tick += 1
+
+        # Каскадування старших рівнів, молодший рівень яких пройшов повне коло
+        level: int = 1
+        while level < len(self._levels) and not self.current_tick & ((1 << (self._slot_bits * level)) - 1):
+            self._cascade(level)
+            level += 1
+
+        slot: dict[TimerHandle, None] = self._levels[0][self.current_tick & self._slot_mask]
+        expired_handles: list[TimerHandle] = list(slot)
+        slot.clear()
+        for timer_handle in expired_handles:
+            timer_handle._slot = None
+        return expired_handles
+
+    def _cascade(self, level: int) -> None:
+        """Переносить таймери поточного слоту рівня "level" на молодші рівні"""
+        slot_idx: int = (self.current_tick >> (self._slot_bits * level)) & self._slot_mask
+        slot: dict[TimerHandle, None] = self._levels[level][slot_idx]
+        timer_handles: list[TimerHandle] = list(slot)
+        slot.clear()
+        for timer_handle in timer_handles:
+            self._place(timer_handle)
+
+    async def run(self) -> None:
+        """Фонове завдання, що переводить колесо з фіксованим кроком та запускає таймери, які спрацювали.
+
+        Notes:
+            Номер такту обчислюється від часу запуску, тому затримки event loop не накопичуються:
+            пропущені такти обробляються одразу.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        start_time: float = loop.time() - self.current_tick * self.resolution
+
+        while True:
+            target_tick: int = int((loop.time() - start_time) / self.resolution)
+            while self.current_tick < target_tick:
+                for timer_handle in self.advance():
+                    self._run_callback(timer_handle)
+
+            await asyncio.sleep(start_time + (self.current_tick + 1) * self.resolution - loop.time())
+
+    def _run_callback(self, timer_handle: TimerHandle) -> None:
+        """Запускає виклик таймера в окремому завданні (помилки логуються і не зупиняють колесо)"""
+        task: asyncio.Task = asyncio.create_task(timer_handle.callback(*timer_handle.args))
+        self._callback_tasks.add(task)
+        task.add_done_callback(self._on_callback_done)
+
+    def _on_callback_done(self, task: asyncio.Task) -> None:
+        self._callback_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error('Помилка під час виконання таймера', exc_info=task.exception())
+
+
+# Колесо таймерів тренувань "Швидкий раунд" (час на відповідь та завершення раунду всіх користувачів)
+timer_wheel = TimerWheel(TIMER_WHEEL_RESOLUTION, TIMER_WHEEL_SLOT_BITS, TIMER_WHEEL_LEVELS)
@@ -0,0 +1,110 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from datetime import datetime
+from typing import Any
+
+from lingoro_bot.config import DISTRACTOR_INDEX_CACHE_SIZE, MISTAKE_SAMPLER_CACHE_MAX_IDXS, WORDPAIR_RENDER_CACHE_SIZE
+from lingoro_bot.custom_types.wordpair_types import WordpairRenderType
+from lingoro_bot.tools.vocab_trainer_utils import DistractorIndex, WeightedSampler, render_wordpair
+
+
+class LRUCache:
+    """Кеш з обмеженим розміром, який видаляє найдавніше використані елементи.
+
+    Args:
+        max_size (int): Максимальний сумарний розмір елементів кешу.
+        get_item_size (Callable[[Any], int]): Функція, що повертає розмір елемента
+        (за замовчуванням кожен елемент має розмір 1, тобто обмежується кількість елементів).
+    """
+
+    def __init__(self, max_size: int, get_item_size: Callable[[Any], int] = lambda _: 1) -> None:
+        self.max_size: int = max_size
+        self.get_item_size: Callable[[Any], int] = get_item_size
+        self._items: OrderedDict[Hashable, Any] = OrderedDict()
+        self._items_size: int = 0  # Сумарний розмір елементів кешу
+
+    def get(self, key: Hashable) -> Any | None:
+        """Повертає значення з кешу або None, якщо його немає"""
+        if key not in self._items:
+            return None
+
+        self._items.move_to_end(key)
+        return self._items[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Додає значення до кешу"""
+        self.pop(key)
+        self._items[key] = value
+        self._items_size += self.get_item_size(value)
+
+        # Видалення найдавніше використаних елементів, поки кеш переповнено (крім щойно доданого)
+        while self._items_size > self.max_size and len(self._items) > 1:
+            _, evicted_value = self._items.popitem(last=False)
+            self._items_size -= self.get_item_size(evicted_value)
+
+    def get_or_create(self, key: Hashable, create_value: Callable[[], Any]) -> Any:
+        """Повертає значення з кешу, обчислюючи його функцією "create_value" при першому зверненні"""
+        value: Any | None = self.get(key)
+        if value is None:
+            value = create_value()
+            self.put(key, value)
+        return value
+
+    def pop(self, key: Hashable) -> None:
+        """Видаляє елемент з кешу (якщо він є)"""
+        if key in self._items:
+            self._items_size -= self.get_item_size(self._items.pop(key))
+
+    def pop_where(self, is_key_matched: Callable[[Hashable], bool]) -> None:
+        """Видаляє з кешу всі елементи, ключі яких відповідають умові (див. is_key_matched)"""
+        for key in [key for key in self._items if is_key_matched(key)]:
+            self.pop(key)
+
+
+# Слова, переклади та анотація словникової пари не змінюються після її створення
+# (словникові пари лише створюються та видаляються), як і склад словникових пар словника,
+# тому дані обчислюються один раз і використовуються у всіх тренуваннях
+wordpair_render_cache = LRUCache(WORDPAIR_RENDER_CACHE_SIZE)
+
+# Індекси варіантів відповіді словників (ключ — ID користувача в БД та ID словника). Індекс може містити
+# переклади з інших словників користувача, тому видаляється разом з іншими даними користувача,
+# які залежать від його словників (див. user_cache.reset_user_cache)
+distractor_index_cache = LRUCache(DISTRACTOR_INDEX_CACHE_SIZE)
+
+# Вибірки тренувань "Робота над помилками" (ключ — ID користувача в БД та час початку тренування).
+# Вага оновлюється після кожної відповіді, тому вибірка не серіалізується у FSM-Cache на кожному кроці.
+# Розміром вибірки є кількість її індексів, тому кеш обмежує сумарну памʼять усіх вибірок
+mistake_sampler_cache = LRUCache(MISTAKE_SAMPLER_CACHE_MAX_IDXS, get_item_size=len)
+
+
+def get_wordpair_render(wordpair_item: dict[str, Any]) -> WordpairRenderType:
+    """Повертає тексти словникової пари для тренування в обох напрямках перекладу (див. render_wordpair)"""
+    return wordpair_render_cache.get_or_create(wordpair_item.get('id'), lambda: render_wordpair(wordpair_item))
+
+
+def get_distractor_index(user_db_id: int,
+                         vocab_id: int,
+                         create_options: Callable[[], list[str]]) -> DistractorIndex:
+    """Повертає індекс варіантів відповіді словника.
+
+    Args:
+        user_db_id (int): ID користувача в БД.
+        vocab_id (int): ID словника.
+        create_options (Callable[[], list[str]]): Функція, що повертає варіанти відповіді
+        (викликається лише при першому зверненні до словника).
+    """
+    return distractor_index_cache.get_or_create((user_db_id, vocab_id), lambda: DistractorIndex(create_options()))
+
+
+def get_mistake_sampler(user_db_id: int,
+                        start_time_training: datetime,
+                        create_sampler: Callable[[], WeightedSampler]) -> WeightedSampler:
+    """Повертає вибірку тренування "Робота над помилками".
+
+    Args:
+        user_db_id (int): ID користувача в БД.
+        start_time_training (datetime): Час початку тренування.
+        create_sampler (Callable[[], WeightedSampler]): Функція, що будує вибірку
+        (викликається, якщо вибірки тренування ще немає у кеші або її було витіснено).
+    """
+    return mistake_sampler_cache.get_or_create((user_db_id, start_time_training), create_sampler)
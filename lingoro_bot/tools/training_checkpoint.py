@@ -0,0 +1,269 @@
+import asyncio
+import logging
+import struct
+from array import array
+from datetime import datetime, timedelta
+from itertools import chain
+from typing import Any
+
+from lingoro_bot.config import (
+    CHECKPOINT_ABANDON_TIMEOUT,
+    CHECKPOINT_PROGRESS_INTERVAL,
+    CHECKPOINT_SWEEP_BATCH_SIZE,
+    CHECKPOINT_SWEEP_INTERVAL,
+    CHECKPOINT_TIME_INTERVAL,
+)
+from lingoro_bot.custom_types.training_types import TrainingProgressType
+from lingoro_bot.custom_types.wordpair_types import WordpairStatType
+from lingoro_bot.db.crud import TrainingCheckpointCRUD, TrainingCRUD, TrainingStatsCRUD, WordpairStatCRUD
+from lingoro_bot.db.database import Session
+from lingoro_bot.db.models import TrainingCheckpoint
+from lingoro_bot.tools.stats_utils import get_training_duration_seconds
+from lingoro_bot.tools.vocab_trainer_utils import WeightedSampler, get_training_direction
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+CHECKPOINT_FORMAT_VERSION = 1  # Версія бінарного формату прогресу тренування
+# Заголовок: версія формату, лічильники тренування та індекс поточної словникової пари
+_PROGRESS_HEADER = struct.Struct('<B6I')
+_SECTION_SIZE = struct.Struct('<I')  # Розмір (у байтах) кожної наступної за заголовком частини
+# Лічильники статистики словникової пари за тренування (див. WordpairStatType)
+_WORDPAIR_STAT_COUNTERS: tuple[str, ...] = ('attempts', 'number_errors', 'number_hints', 'number_translation_shown')
+
+
+def encode_training_progress(data_fsm: dict[str, Any], mistake_sampler: WeightedSampler | None = None) -> bytes:
+    """Повертає прогрес тренування з FSM-Cache та вибірку "Роботи над помилками" у компактному бінарному вигляді.
+
+    Notes:
+        Після заголовка (_PROGRESS_HEADER) йдуть частини з розміром на початку: ID словникових пар тренування,
+        черга їх індексів, ID словників змішаного тренування, помилки та статистика словникових пар
+        за тренування (масиви uint32 та float64) і дерево вибірки "Роботи над помилками".
+    """
+    session_wordpair_errors: dict[int, int] = data_fsm.get('session_wordpair_errors', {})
+    session_wordpair_stats: dict[int, WordpairStatType] = data_fsm.get('session_wordpair_stats', {})
+
+    header: bytes = _PROGRESS_HEADER.pack(CHECKPOINT_FORMAT_VERSION,
+                                          data_fsm.get('correct_answer_count', 0),
+                                          data_fsm.get('wrong_answer_count', 0),
+                                          data_fsm.get('annotation_shown_count', 0),
+                                          data_fsm.get('translation_shown_count', 0),
+                                          data_fsm.get('training_streak_count', 1),
+                                          data_fsm.get('wordpair_idx', 0))
+
+    stat_counters: array = array('I', chain.from_iterable(
+        (wordpair_id, *(wordpair_stat[counter] for counter in _WORDPAIR_STAT_COUNTERS))
+        for wordpair_id, wordpair_stat in session_wordpair_stats.items()))
+    stat_seen_at: array = array('d', (wordpair_stat['last_seen_at'].timestamp()
+                                      for wordpair_stat in session_wordpair_stats.values()))
+
+    sections: list[bytes] = [array('I', data_fsm.get('training_wordpair_ids')).tobytes(),
+                             array('I', data_fsm.get('available_idxs')).tobytes(),
+                             array('I', data_fsm.get('mixed_vocab_ids') or []).tobytes(),
+                             array('I', chain.from_iterable(session_wordpair_errors.items())).tobytes(),
+                             stat_counters.tobytes(),
+                             stat_seen_at.tobytes(),
+                             mistake_sampler.serialize() if mistake_sampler is not None else b'']
+    return header + b''.join(_SECTION_SIZE.pack(len(section)) + section for section in sections)
+
+
+def decode_training_progress(progress: bytes) -> TrainingProgressType:
+    """Відновлює прогрес тренування, отриманий через encode_training_progress"""
+    (version,
+     correct_answer_count,
+     wrong_answer_count,
+     annotation_shown_count,
+     translation_shown_count,
+     training_streak_count,
+     wordpair_idx) = _PROGRESS_HEADER.unpack_from(progress)
+    if version != CHECKPOINT_FORMAT_VERSION:
+        raise ValueError(f'Невідома версія формату прогресу тренування: {version}')
+
+    sections: list[bytes] = []
+    offset: int = _PROGRESS_HEADER.size
+    while offset < len(progress):
+        (section_size,) = _SECTION_SIZE.unpack_from(progress, offset)
+        offset += _SECTION_SIZE.size
+        sections.append(progress[offset:offset + section_size])
+        offset += section_size
+    wordpair_ids, available_idxs, mixed_vocab_ids, wordpair_errors, stat_counters, stat_seen_at, sampler = sections
+
+    counters_count: int = len(_WORDPAIR_STAT_COUNTERS) + 1  # Разом з ID словникової пари
+    stat_counters_array: array = _to_array('I', stat_counters)
+    session_wordpair_stats: dict[int, WordpairStatType] = {}
+    for stat_idx, seen_timestamp in enumerate(_to_array('d', stat_seen_at)):
+        wordpair_id, *counters = stat_counters_array[stat_idx * counters_count:(stat_idx + 1) * counters_count]
+        session_wordpair_stats[wordpair_id] = {**dict(zip(_WORDPAIR_STAT_COUNTERS, counters, strict=False)),
+                                               'last_seen_at': datetime.fromtimestamp(seen_timestamp)}
+
+    wordpair_errors_array: array = _to_array('I', wordpair_errors)
+    return {'training_wordpair_ids': _to_array('I', wordpair_ids).tolist(),
+            'available_idxs': _to_array('I', available_idxs).tolist(),
+            'wordpair_idx': wordpair_idx,
+            'mixed_vocab_ids': _to_array('I', mixed_vocab_ids).tolist() or None,
+            'correct_answer_count': correct_answer_count,
+            'wrong_answer_count': wrong_answer_count,
+            'annotation_shown_count': annotation_shown_count,
+            'translation_shown_count': translation_shown_count,
+            'training_streak_count': training_streak_count,
+            'session_wordpair_errors': dict(zip(wordpair_errors_array[::2], wordpair_errors_array[1::2], strict=False)),
+            'session_wordpair_stats': session_wordpair_stats,
+            'mistake_sampler': sampler or None}
+
+
+def _to_array(typecode: str, data: bytes) -> array:
+    """Повертає масив з байтів, отриманих через array.tobytes"""
+    values = array(typecode)
+    values.frombytes(data)
+    return values
+
+
+def get_progress_count(data_fsm: dict[str, Any]) -> int:
+    """Повертає кількість відповідей та показів перекладу за тренування"""
+    return (data_fsm.get('correct_answer_count', 0)
+            + data_fsm.get('wrong_answer_count', 0)
+            + data_fsm.get('translation_shown_count', 0))
+
+
+def is_checkpoint_due(data_fsm: dict[str, Any], now: datetime) -> bool:
+    """Перевіряє, чи потрібно зберегти прогрес тренування до БД.
+
+    Notes:
+        Прогрес першого слова тренування зберігається одразу, а далі — після CHECKPOINT_PROGRESS_INTERVAL
+        відповідей або, якщо відповіді були, після CHECKPOINT_TIME_INTERVAL секунд від останнього збереження.
+        Прогрес тренування "Швидкий раунд" не зберігається, бо після перезапуску бота час раунду вже вичерпано.
+    """
+    if data_fsm.get('training_mode') == 'speed_round':
+        return False
+
+    checkpoint_at: datetime | None = data_fsm.get('checkpoint_at')
+    if checkpoint_at is None:
+        return True
+
+    new_progress_count: int = get_progress_count(data_fsm) - data_fsm.get('checkpoint_progress_count', 0)
+    if new_progress_count >= CHECKPOINT_PROGRESS_INTERVAL:
+        return True
+    return new_progress_count > 0 and now - checkpoint_at >= timedelta(seconds=CHECKPOINT_TIME_INTERVAL)
+
+
+def save_training_results(session: Session,
+                          user_db_id: int,
+                          vocab_id: int | None,
+                          training_mode: str,
+                          start_time: datetime,
+                          end_time: datetime,
+                          training_progress: dict[str, Any],
+                          is_completed: bool) -> None:
+    """Додає до БД сесію тренування та статистику словникових пар за тренування.
+
+    Notes:
+        Змішане тренування не належить одному словнику, тому його сесія та підсумки словників не зберігаються,
+        але результат додається до денних підсумків користувача (статистика, серії днів тренувань).
+
+    Args:
+        session (Session): Сесія БД.
+        user_db_id (int): ID користувача в БД.
+        vocab_id (int | None): ID словника тренування (None для змішаного тренування).
+        training_mode (str): Тип тренування.
+        start_time (datetime): Час початку тренування.
+        end_time (datetime): Час завершення тренування.
+        training_progress (dict[str, Any]): Лічильники та статистика словникових пар тренування
+        (FSM-Cache або TrainingProgressType).
+        is_completed (bool): Чи було тренування завершене.
+    """
+    if vocab_id is None:
+        stats_crud = TrainingStatsCRUD(session)
+        stats_crud.add_training_result(user_db_id=user_db_id,
+                                       vocab_id=None,
+                                       end_time=end_time,
+                                       number_correct_answers=training_progress.get('correct_answer_count', 0),
+                                       number_wrong_answers=training_progress.get('wrong_answer_count', 0),
+                                       duration_seconds=get_training_duration_seconds(start_time, end_time))
+        session.commit()
+        logger.info('В БД додано результат змішаного тренування до денних підсумків користувача')
+    else:
+        training_crud = TrainingCRUD(session)
+        training_crud.create_new_training_session(
+            user_db_id=user_db_id,
+            vocabulary_id=vocab_id,
+            training_mode=training_mode,
+            start_time=start_time,
+            end_time=end_time,
+            number_correct_answers=training_progress.get('correct_answer_count', 0),
+            number_wrong_answers=training_progress.get('wrong_answer_count', 0),
+            number_annotation_shown=training_progress.get('annotation_shown_count', 0),
+            number_translation_shown=training_progress.get('translation_shown_count', 0),
+            is_completed=is_completed)
+        logger.info('В БД додано інформацію про сесію тренування')
+
+    # Статистика словникових пар зберігається і для змішаного тренування (вона не залежить від словника)
+    wordpair_stat_crud = WordpairStatCRUD(session)
+    wordpair_stat_crud.add_session_stats(user_db_id=user_db_id,
+                                         direction=get_training_direction(training_mode),
+                                         session_wordpair_stats=training_progress.get('session_wordpair_stats', {}))
+    logger.info('В БД додано статистику словникових пар за тренування')
+
+
+def finalize_training_checkpoint(session: Session, checkpoint: TrainingCheckpoint) -> bool:
+    """Завершує незавершене тренування за його збереженим прогресом: додає до БД сесію тренування
+    (is_completed=False, час завершення — час останнього збереження прогресу) та видаляє прогрес.
+
+    Returns:
+        bool: Чи було завершене тренування (False, якщо його вже завершив обробник або інше фонове завдання).
+    """
+    # Дані читаються до видалення прогресу, бо після фіксації транзакції обʼєкт перечитується з БД
+    user_db_id: int = checkpoint.user_id
+    vocab_id: int | None = checkpoint.vocabulary_id
+    training_mode: str = checkpoint.training_mode
+    start_time: datetime = checkpoint.start_time
+    end_time: datetime = checkpoint.updated_at
+    training_progress: TrainingProgressType = decode_training_progress(checkpoint.progress)
+
+    checkpoint_crud = TrainingCheckpointCRUD(session)
+    if not checkpoint_crud.delete_checkpoint(user_db_id, start_time):
+        return False
+
+    save_training_results(session,
+                          user_db_id=user_db_id,
+                          vocab_id=vocab_id,
+                          training_mode=training_mode,
+                          start_time=start_time,
+                          end_time=end_time,
+                          training_progress=training_progress,
+                          is_completed=False)
+    return True
+
+
+def sweep_abandoned_checkpoints(now: datetime) -> int:
+    """Завершує тренування, прогрес яких не оновлювався більше CHECKPOINT_ABANDON_TIMEOUT секунд.
+    Виконується в окремому потоці, тому використовує власну сесію БД.
+
+    Returns:
+        int: Кількість завершених тренувань.
+    """
+    updated_before: datetime = now - timedelta(seconds=CHECKPOINT_ABANDON_TIMEOUT)
+    finalized_count: int = 0
+
+    with Session() as session:
+        checkpoint_crud = TrainingCheckpointCRUD(session)
+        while True:
+            checkpoints: list[TrainingCheckpoint] = checkpoint_crud.get_abandoned_checkpoints(
+                updated_before, CHECKPOINT_SWEEP_BATCH_SIZE)
+            for checkpoint in checkpoints:
+                finalized_count += finalize_training_checkpoint(session, checkpoint)
+
+            if len(checkpoints) < CHECKPOINT_SWEEP_BATCH_SIZE:
+                return finalized_count
+
+
+async def run_checkpoint_sweeper() -> None:
+    """Фонове завдання, що кожні CHECKPOINT_SWEEP_INTERVAL секунд завершує покинуті тренування"""
+    while True:
+        try:
+            finalized_count: int = await asyncio.to_thread(sweep_abandoned_checkpoints, datetime.now())
+        except Exception:
+            logger.exception('Не вдалося завершити покинуті тренування')
+        else:
+            if finalized_count:
+                logger.info(f'Завершено покинуті тренування. Кількість: {finalized_count}')
+
+        await asyncio.sleep(CHECKPOINT_SWEEP_INTERVAL)
@@ -0,0 +1,119 @@
+import time
+
+from lingoro_bot.config import (
+    KNOWN_USERS_CACHE_SIZE,
+    PREFIX_INDEX_CACHE_MAX_KEYS,
+    USER_PROFILES_BATCH_SIZE,
+    USER_PROFILES_FLUSH_INTERVAL,
+    VOCABS_PAGE_CACHE_SIZE,
+    VOCABS_PAGE_SIZE,
+)
+from lingoro_bot.custom_types.user_types import UserProfileType
+from lingoro_bot.custom_types.vocab_types import VocabsPageType
+from lingoro_bot.db.crud import VocabCRUD
+from lingoro_bot.tools.training_cache import LRUCache, distractor_index_cache
+
+# Індекси автодоповнення користувачів (ключ — ID користувача в БД). Розміром індексу є кількість його ключів,
+# тому кеш обмежує сумарну памʼять усіх індексів, а не їх кількість
+prefix_index_cache = LRUCache(PREFIX_INDEX_CACHE_MAX_KEYS, get_item_size=len)
+
+# Сторінки словників користувачів (ключ — ID користувача в БД, курсор та напрямок сторінки)
+vocabs_page_cache = LRUCache(VOCABS_PAGE_CACHE_SIZE)
+
+
+def get_vocabs_page(vocab_crud: VocabCRUD,
+                    user_db_id: int,
+                    cursor_id: int = 0,
+                    is_backward: bool = False) -> VocabsPageType:
+    """Повертає сторінку словників користувача (з БД завантажується лише, якщо сторінки немає у кеші).
+
+    Args:
+        vocab_crud (VocabCRUD): CRUD словників для завантаження сторінки з БД.
+        user_db_id (int): ID користувача в БД.
+        cursor_id (int): ID словника, після (або перед) якого починається сторінка. За замовчуванням 0 (перша).
+        is_backward (bool): Прапор, чи потрібна сторінка перед курсором. За замовчуванням False.
+    """
+    return vocabs_page_cache.get_or_create(
+        (user_db_id, cursor_id, is_backward),
+        lambda: vocab_crud.get_vocabs_page(user_db_id, cursor_id, is_backward, limit=VOCABS_PAGE_SIZE))
+
+
+def reset_user_cache(user_db_id: int) -> None:
+    """Видаляє з кешу всі дані користувача, які залежать від його словників.
+    Викликається після додавання чи видалення словників користувача.
+    """
+    prefix_index_cache.pop(user_db_id)
+    vocabs_page_cache.pop_where(lambda key: key[0] == user_db_id)
+    distractor_index_cache.pop_where(lambda key: key[0] == user_db_id)
+
+
+class KnownUsers:
+    """Кеш відповідності telegram ID користувачів їх ID в БД (users.id) з відкладеним оновленням профілів.
+
+    Notes:
+        Для користувача з кешу запит до БД не виконується. Якщо його профіль (username, імʼя чи прізвище)
+        змінився, то новий профіль накопичується і записується до БД разом з іншими (див. pop_pending_profiles).
+
+    Args:
+        max_size (int): Максимальна кількість користувачів у кеші.
+        batch_size (int): Кількість змінених профілів, після якої їх потрібно записати до БД.
+        flush_interval (float): Максимальний час (у секундах) між записами змінених профілів до БД.
+    """
+
+    def __init__(self, max_size: int, batch_size: int, flush_interval: float) -> None:
+        self.batch_size: int = batch_size
+        self.flush_interval: float = flush_interval
+        self._users = LRUCache(max_size)  # ID в БД та профіль користувачів (ключ — telegram ID користувача)
+        self._pending_profiles: dict[int, UserProfileType] = {}  # Змінені профілі, які ще не записані до БД
+        self._last_flush_time: float = time.monotonic()
+
+    def get_user_db_id(self, user_id: int, user_profile: UserProfileType) -> int | None:
+        """Повертає ID користувача в БД або None, якщо користувача немає у кеші.
+        Якщо профіль користувача змінився, то додає профіль до черги на запис.
+        """
+        known_user: tuple[int, UserProfileType] | None = self._users.get(user_id)
+        if known_user is None:
+            return None
+
+        user_db_id, known_profile = known_user
+        if known_profile != user_profile:
+            self._users.put(user_id, (user_db_id, user_profile))
+            self._pending_profiles[user_id] = user_profile
+        return user_db_id
+
+    def add_user(self,
+                 user_id: int,
+                 user_db_id: int,
+                 user_profile: UserProfileType,
+                 is_profile_changed: bool = False) -> None:
+        """Додає зареєстрованого користувача до кешу.
+
+        Args:
+            user_id (int): Telegram ID користувача.
+            user_db_id (int): ID користувача в БД.
+            user_profile (UserProfileType): Поточний профіль користувача.
+            is_profile_changed (bool): Прапор, чи може профіль у БД відрізнятися від поточного
+            (тоді профіль додається до черги на запис). За замовчуванням False.
+        """
+        self._users.put(user_id, (user_db_id, user_profile))
+        if is_profile_changed:
+            self._pending_profiles[user_id] = user_profile
+
+    def pop_pending_profiles(self) -> dict[int, UserProfileType]:
+        """Повертає змінені профілі для запису до БД, якщо їх накопичилося достатньо або минув інтервал запису.
+        Інакше повертає порожній словник.
+        """
+        is_batch_full: bool = len(self._pending_profiles) >= self.batch_size
+        is_interval_passed: bool = time.monotonic() - self._last_flush_time >= self.flush_interval
+
+        if not self._pending_profiles or not (is_batch_full or is_interval_passed):
+            return {}
+
+        pending_profiles: dict[int, UserProfileType] = self._pending_profiles
+        self._pending_profiles = {}
+        self._last_flush_time = time.monotonic()
+        return pending_profiles
+
+
+# Зареєстровані користувачі (щоб не звертатися до БД для визначення ID користувача в БД)
+known_users = KnownUsers(KNOWN_USERS_CACHE_SIZE, USER_PROFILES_BATCH_SIZE, USER_PROFILES_FLUSH_INTERVAL)
@@ -1,7 +1,35 @@
 import random
+import re
+from array import array
+from datetime import datetime
 from typing import Any
 
-from lingoro_bot.tools.wordpair_utils import format_word_items
+from lingoro_bot.config import (
+    CHOICE_LENGTH_BUCKET_SIZE,
+    CHOICE_SAMPLE_ATTEMPTS,
+    MISTAKE_SESSION_ERROR_WEIGHT,
+)
+from lingoro_bot.custom_types.wordpair_types import WordpairRenderType, WordpairStatType
+from lingoro_bot.tools.answer_utils import get_answer_keys, normalize_answer
+from lingoro_bot.tools.wordpair_utils import (
+    TRAINING_DIRECTION_DIRECT,
+    TRAINING_DIRECTION_REVERSE,
+    format_word_items,
+)
+
+# Назви типів тренування
+TRAINING_MODE_NAMES: dict[str, str] = {'direct_translation': 'Прямий переклад (W -> T)',
+                                       'reverse_translation': 'Зворотній переклад (T -> W)',
+                                       'review_due': 'Повторення (W -> T)',
+                                       'focus_mistakes': 'Робота над помилками (W -> T)',
+                                       'review_mistakes': 'Повторення помилок (W -> T)',
+                                       'multiple_choice': 'Вибір відповіді (W -> T)',
+                                       'speed_round': 'Швидкий раунд (W -> T)',
+                                       'quiz_sheet': 'Аркуш питань (W -> T)'}
+REVERSE_TRAINING_MODES: tuple[str, ...] = ('reverse_translation',)  # Типи тренування від перекладу до слова
+
+# Номер питання на початку рядка відповіді на аркуш питань (наприклад, "3. переклад" чи "3) переклад")
+QUIZ_SHEET_NUMBER_PATTERN: re.Pattern[str] = re.compile(r'^\s*(\d+)\s*[.)]\s*')
 
 
 def format_training_process_message(vocab_name: str,
@@ -66,78 +94,380 @@ def format_training_summary_message(vocab_name: str,
     return summary_message
 
 
-def get_random_wordpair_idx(available_idxs: list, preview_idx: int) -> int:
-    """Повертає випадковий індекс словникової пари із доступних.
+def get_next_wordpair_idx(available_idxs: list, preview_idx: int) -> int:
+    """Повертає наступний індекс словникової пари з черги доступних.
 
     Notes:
-        Якщо кількість доступних індексів більша за один, то обраний новий індекс не повинен збігатися з попереднім.
+        Черга доступних індексів перемішується на початку тренування, тому наступний індекс — випадковий,
+        але відомий заздалегідь (що дозволяє завантажувати дані наступних словникових пар наперед).
+        Якщо кількість доступних індексів більша за один, то новий індекс не повинен збігатися з попереднім.
 
     Args:
-        available_idxs (list): Список доступних індексів.
+        available_idxs (list): Черга доступних індексів.
         preview_idx (int): Попередній індекс.
 
     Returns:
-        int: Випадковий індекс.
+        int: Наступний індекс.
+    """
+    if len(available_idxs) > 1 and available_idxs[0] == preview_idx:
+        return available_idxs[1]
+    return available_idxs[0]
+
+
+def parse_quiz_sheet_answers(text: str, count: int) -> list[str]:
+    """Розбирає відповідь на аркуш питань, в якій кожен переклад написаний з нового рядка.
+
+    Notes:
+        Якщо кожен непорожній рядок починається з номера питання, то переклади зіставляються з питаннями
+        за номерами, інакше — за порядком рядків (номер, що збігається з порядком рядка, відкидається).
+        Питання, на яке немає перекладу (порожній рядок, рядків менше за питання), вважається пропущеним.
+
+    Args:
+        text (str): Текст відповіді користувача.
+        count (int): Кількість питань на аркуші.
+
+    Returns:
+        list[str]: Переклади за порядком питань (порожній рядок — питання пропущене).
+    """
+    lines: list[str] = text.splitlines()
+    answers: list[str] = [''] * count
+
+    number_matches: list[re.Match[str] | None] = [QUIZ_SHEET_NUMBER_PATTERN.match(line)
+                                                  for line in lines if line.strip()]
+    if number_matches and all(number_matches):
+        for number_match in number_matches:
+            question_num = int(number_match.group(1))
+            if 1 <= question_num <= count:
+                answers[question_num - 1] = number_match.string[number_match.end():].strip()
+        return answers
+
+    for question_idx, line in enumerate(lines[:count]):
+        number_match: re.Match[str] | None = QUIZ_SHEET_NUMBER_PATTERN.match(line)
+        if number_match is not None and int(number_match.group(1)) == question_idx + 1:
+            line = line[number_match.end():]
+        answers[question_idx] = line.strip()
+    return answers
+
+
+def requeue_wordpair_idx(available_idxs: list, wordpair_idx: int) -> None:
+    """Переміщує індекс словникової пари (наприклад, після помилки чи пропуску) на випадкове місце в черзі доступних.
+    Індекс не потрапляє на початок черги, щоб словникова пара не повторилась одразу.
     """
-    if len(available_idxs) == 1:
-        return available_idxs[0]
+    available_idxs.remove(wordpair_idx)
+    available_idxs.insert(random.randint(min(1, len(available_idxs)), len(available_idxs)), wordpair_idx)
+
 
-    # Якщо індексів більше одного, то обирається новий індекс
-    wordpair_idx: int = random.choice(available_idxs)
+def render_wordpair(wordpair_item: dict[str, Any]) -> WordpairRenderType:
+    """Повертає всі тексти словникової пари для тренування в обох напрямках перекладу.
 
-    while wordpair_idx == preview_idx:
-        wordpair_idx: int = random.choice(available_idxs)
+    Args:
+        wordpair_item (dict[str, Any]): Дані словникової пари (id, слова, переклади, анотація).
 
-    return wordpair_idx
+    Returns:
+        WordpairRenderType: Відформатовані слова та переклади, анотація та нормалізовані
+        слова і переклади (ключі для перевірки відповіді).
+    """
+    word_items: list[dict] = wordpair_item.get('words')
+    translation_items: list[dict] = wordpair_item.get('translations')
 
+    wordpair_render: WordpairRenderType = {
+        'formatted_words': format_word_items(word_items),
+        'formatted_translations': format_word_items(translation_items, is_translation_items=True),
+        'annotation': wordpair_item.get('annotation') or 'Відсутня',
+        'word_answer_keys': get_answer_keys([word_item.get('word') for word_item in word_items]),
+        'translation_answer_keys': get_answer_keys([translation_item.get('translation')
+                                                    for translation_item in translation_items])}
+    return wordpair_render
 
-def get_training_data(training_mode: str, word_items: list[dict], translation_items: list[dict]) -> dict[str, Any]:
+
+def get_training_data(training_mode: str, wordpair_render: WordpairRenderType) -> dict[str, Any]:
     """Повертає дані для тренування, виходячи із типу тренування.
 
     Args:
         training_mode (str): Тип тренування.
-        word_items (list[dict]): Список слів словникової пари з їх транскрипціями.
-        translation_items (list[dict]): Список перекладів словникової пари з їх транскрипціями.
+        wordpair_render (WordpairRenderType): Тексти словникової пари для тренування (див. render_wordpair).
 
     Returns:
         dict[str, Any]: Python-словник із даними:
-            training_mode_name (str): Назва тренування.
             formatted_words (str): Відформатовані слова словникової пари у вигляді рядка.
             formatted_translations (str): Відформатовані переклади словникової пари у вигляді рядка.
-            correct_translations (list[str]): Список коректних перекладів у нижньому регістрі.
+            annotation (str): Анотація словникової пари.
+            answer_keys (list[str]): Нормалізовані коректні переклади.
     """
-    if training_mode == 'direct_translation':
-        training_mode_name = 'Прямий переклад (W -> T)'
-        formatted_words: str = format_word_items(word_items)
-        formatted_translations: str = format_word_items(translation_items, is_translation_items=True)
-        correct_translations: list[str] = [translation.get('translation').lower() for translation in translation_items]
-    elif training_mode == 'reverse_translation':
-        training_mode_name = 'Зворотній переклад (T -> W)'
-        formatted_words: str = format_word_items(translation_items, is_translation_items=True)
-        formatted_translations: str = format_word_items(word_items)
-        correct_translations: list[str] = [translation.get('word').lower() for translation in word_items]
-
-    training_data: dict[str, Any] = {'training_mode_name': training_mode_name,
-                                     'formatted_words': formatted_words,
-                                     'formatted_translations': formatted_translations,
-                                     'correct_translations': correct_translations}
+    if training_mode in REVERSE_TRAINING_MODES:
+        training_data: dict[str, Any] = {'formatted_words': wordpair_render.get('formatted_translations'),
+                                         'formatted_translations': wordpair_render.get('formatted_words'),
+                                         'answer_keys': wordpair_render.get('word_answer_keys')}
+    else:
+        training_data: dict[str, Any] = {'formatted_words': wordpair_render.get('formatted_words'),
+                                         'formatted_translations': wordpair_render.get('formatted_translations'),
+                                         'answer_keys': wordpair_render.get('translation_answer_keys')}
+
+    training_data['annotation'] = wordpair_render.get('annotation')
     return training_data
 
 
-def get_wordpair_idx_for_training(available_idxs: list, preview_wordpair_idx: int, is_use_current_words: bool) -> int:
+def get_wordpair_idx_for_training(available_idxs: list,
+                                  preview_wordpair_idx: int,
+                                  is_use_current_words: bool,
+                                  sampler: 'WeightedSampler | None' = None,
+                                  predrawn_idx: int | None = None) -> int:
     """Повертає індекс словникової пари для тренування.
 
     Notes:
         Якщо is_use_current_words=True, то повертається попередній індекс,
-        в іншому разі випадковий із списку невикористаних.
+        в іншому разі наступний з черги невикористаних.
+        Якщо передано "sampler", то випадковий індекс обирається з імовірністю, пропорційною його вазі.
+        Заздалегідь обраний індекс ("predrawn_idx") повертається, якщо його досі можна обрати. Після відповіді
+        змінюється вага лише минулого індексу, який виключається з вибору, тому розподіл від цього не змінюється.
 
     Args:
-        available_idxs (list): Список індексів, які ще не були використані.
+        available_idxs (list): Черга індексів, які ще не були використані.
         preview_wordpair_idx (int): Минулий індекс.
         is_use_current_words (bool): Прапор, використовувати поточне слово(а) чи обрати нове.
+        sampler (WeightedSampler | None): Вибірка з вагами індексів (за замовчуванням None).
+        predrawn_idx (int | None): Індекс, заздалегідь обраний з вибірки (за замовчуванням None).
     """
     if is_use_current_words:
         return preview_wordpair_idx
 
-    # Вибір випадкового індексу з тих, що ще не були використані
-    return get_random_wordpair_idx(available_idxs, preview_wordpair_idx)
+    if sampler is not None:
+        is_predrawn_idx_valid: bool = (predrawn_idx is not None
+                                       and sampler.get_weight(predrawn_idx) > 0
+                                       and (predrawn_idx != preview_wordpair_idx or len(available_idxs) == 1))
+        if is_predrawn_idx_valid:
+            return predrawn_idx
+
+        # Минулий індекс виключається, якщо є інші (як і при рівноймовірному виборі)
+        excluded_idx: int | None = preview_wordpair_idx if len(available_idxs) > 1 else None
+        return sampler.sample(excluded_idx)
+
+    # Вибір наступного індексу з черги тих, що ще не були використані
+    return get_next_wordpair_idx(available_idxs, preview_wordpair_idx)
+
+
+def get_training_direction(training_mode: str) -> str:
+    """Повертає напрямок перекладу словникових пар у тренуванні обраного типу"""
+    if training_mode in REVERSE_TRAINING_MODES:
+        return TRAINING_DIRECTION_REVERSE
+    return TRAINING_DIRECTION_DIRECT
+
+
+def add_session_wordpair_stat(session_wordpair_stats: dict[int, WordpairStatType],
+                              wordpair_id: int,
+                              seen_at: datetime,
+                              attempts: int = 0,
+                              number_errors: int = 0,
+                              number_hints: int = 0,
+                              number_translation_shown: int = 0) -> None:
+    """Додає дію зі словниковою парою до її статистики за поточне тренування.
+    Статистика за тренування записується до БД пакетом після його завершення (див. WordpairStatCRUD).
+    """
+    wordpair_stat: WordpairStatType = session_wordpair_stats.setdefault(wordpair_id, {'attempts': 0,
+                                                                                      'number_errors': 0,
+                                                                                      'number_hints': 0,
+                                                                                      'number_translation_shown': 0,
+                                                                                      'last_seen_at': None})
+    wordpair_stat['attempts'] += attempts
+    wordpair_stat['number_errors'] += number_errors
+    wordpair_stat['number_hints'] += number_hints
+    wordpair_stat['number_translation_shown'] += number_translation_shown
+    wordpair_stat['last_seen_at'] = seen_at
+
+
+def get_answer_latency_ms(wordpair_shown_at: datetime | None,
+                          answered_at: datetime,
+                          answers_count: int = 1) -> int | None:
+    """Повертає час відповіді (у мс) на одну з "answers_count" словникових пар, показаних разом.
+    Якщо час показу невідомий або відповідей немає, то повертає None.
+    """
+    if wordpair_shown_at is None or not answers_count:
+        return None
+    return round((answered_at - wordpair_shown_at).total_seconds() * 1000 / answers_count)
+
+
+def get_mistake_weight(number_errors: int, session_error_count: int = 0) -> int:
+    """Повертає вагу словникової пари для тренування "Робота над помилками".
+
+    Args:
+        number_errors (int): Кількість всіх помилок словникової пари з БД.
+        session_error_count (int): Кількість помилок у словниковій парі за поточне тренування.
+
+    Returns:
+        int: Вага словникової пари (завжди додатна).
+    """
+    return 1 + number_errors + MISTAKE_SESSION_ERROR_WEIGHT * session_error_count
+
+
+class WeightedSampler:
+    """Вибірка індексів з імовірністю, пропорційною їх цілим вагам, на основі дерева Фенвіка.
+
+    Notes:
+        - Побудова — O(n), оновлення ваги та вибір індексу — O(log n).
+        - Під час тренування зберігається у кеші (див. training_cache.get_mistake_sampler), а серіалізується
+        (дерево у вигляді масиву uint32) лише для збереження прогресу тренування до БД.
+    """
+
+    def __init__(self, tree: array) -> None:
+        self._tree: array = tree  # Дерево Фенвіка (індексація з 1, елемент 0 не використовується)
+        self._size: int = len(tree) - 1
+
+    @classmethod
+    def from_weights(cls, weights: list[int]) -> 'WeightedSampler':
+        """Будує вибірку з ваг індексів за O(n)"""
+        size: int = len(weights)
+        tree = array('I', [0])
+        tree.extend(weights)
+
+        for idx in range(1, size + 1):
+            parent_idx: int = idx + (idx & -idx)
+            if parent_idx <= size:
+                tree[parent_idx] += tree[idx]
+        return cls(tree)
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> 'WeightedSampler':
+        """Відновлює вибірку з байтів, отриманих через метод serialize"""
+        tree = array('I')
+        tree.frombytes(data)
+        return cls(tree)
+
+    def serialize(self) -> bytes:
+        """Серіалізує вибірку в байти"""
+        return self._tree.tobytes()
+
+    def __len__(self) -> int:
+        """Кількість індексів вибірки"""
+        return self._size
+
+    @property
+    def total(self) -> int:
+        """Сума ваг усіх індексів"""
+        return self._get_prefix_sum(self._size)
+
+    def _get_prefix_sum(self, count: int) -> int:
+        """Повертає суму ваг перших "count" індексів"""
+        prefix_sum = 0
+        while count > 0:
+            prefix_sum += self._tree[count]
+            count -= count & -count
+        return prefix_sum
+
+    def get_weight(self, idx: int) -> int:
+        """Повертає вагу індексу"""
+        return self._get_prefix_sum(idx + 1) - self._get_prefix_sum(idx)
+
+    def update(self, idx: int, weight: int) -> None:
+        """Встановлює нову вагу індексу (0 — індекс більше не обирається)"""
+        delta: int = weight - self.get_weight(idx)
+
+        tree_idx: int = idx + 1
+        while tree_idx <= self._size:
+            self._tree[tree_idx] += delta
+            tree_idx += tree_idx & -tree_idx
+
+    def sample(self, excluded_idx: int | None = None) -> int:
+        """Повертає випадковий індекс з імовірністю, пропорційною його вазі.
+
+        Args:
+            excluded_idx (int | None): Індекс, який не може бути обраний (за замовчуванням None).
+            Ігнорується, якщо інших індексів з ненульовою вагою немає.
+
+        Returns:
+            int: Обраний індекс.
+        """
+        excluded_weight = 0
+        if excluded_idx is not None:
+            excluded_weight = self.get_weight(excluded_idx)
+            if excluded_weight == self.total:
+                return excluded_idx
+            self.update(excluded_idx, 0)
+
+        remainder: int = random.randrange(self.total)
+
+        # Спуск деревом: пошук найбільшої позиції, префіксна сума якої не перевищує "remainder"
+        position = 0
+        step: int = 1 << self._size.bit_length()
+        while step > 0:
+            next_position: int = position + step
+            if next_position <= self._size and self._tree[next_position] <= remainder:
+                position = next_position
+                remainder -= self._tree[next_position]
+            step >>= 1
+
+        if excluded_idx is not None:
+            self.update(excluded_idx, excluded_weight)
+        return position
+
+
+class DistractorIndex:
+    """Індекс варіантів відповіді для тренування "Вибір відповіді".
+
+    Notes:
+        - Варіанти групуються за діапазоном довжини та першою літерою, тому схожі на коректну відповідь
+        варіанти обираються за O(1) без перебору всіх словникових пар.
+        - Будується один раз для словника та оновлюється після зміни словників користувача
+        (див. training_cache.get_distractor_index).
+    """
+
+    def __init__(self, options: list[str]) -> None:
+        self.options: list[str] = []  # Унікальні (після нормалізації) варіанти відповіді
+        self._keys: list[str] = []  # Нормалізовані варіанти відповіді
+        self._length_buckets: dict[int, list[int]] = {}  # Індекси варіантів за діапазоном довжини
+        self._prefix_buckets: dict[str, list[int]] = {}  # Індекси варіантів за першою літерою
+
+        seen_keys: set[str] = set()
+        for option in options:
+            option_key: str = normalize_answer(option)
+            if not option_key or option_key in seen_keys:
+                continue
+            seen_keys.add(option_key)
+
+            option_idx: int = len(self.options)
+            self.options.append(option)
+            self._keys.append(option_key)
+            self._length_buckets.setdefault(self._get_length_bucket(option_key), []).append(option_idx)
+            self._prefix_buckets.setdefault(option_key[0], []).append(option_idx)
+
+    @staticmethod
+    def _get_length_bucket(option_key: str) -> int:
+        """Повертає номер діапазону довжини варіанту відповіді"""
+        return len(option_key) // CHOICE_LENGTH_BUCKET_SIZE
+
+    def __len__(self) -> int:
+        return len(self.options)
+
+    def sample(self, answer: str, answer_keys: list[str], count: int) -> list[str]:
+        """Повертає варіанти відповіді, схожі на коректну відповідь (за довжиною або першою літерою).
+
+        Notes:
+            Для кожного варіанту робиться обмежена кількість спроб вибору зі схожих,
+            після чого — з усіх варіантів. Якщо варіантів замало, то повертається менша кількість.
+
+        Args:
+            answer (str): Коректна відповідь.
+            answer_keys (list[str]): Нормалізовані коректні переклади (не можуть бути обрані як невірні варіанти).
+            count (int): Кількість варіантів.
+
+        Returns:
+            list[str]: Невірні варіанти відповіді.
+        """
+        answer_key: str = normalize_answer(answer)
+        similar_buckets: list[list[int]] = [bucket for bucket in (
+            self._length_buckets.get(self._get_length_bucket(answer_key)),
+            self._prefix_buckets.get(answer_key[:1])) if bucket]
+        all_idxs = range(len(self.options))
+
+        chosen_idxs: list[int] = []
+        for _ in range(count):
+            for attempt in range(2 * CHOICE_SAMPLE_ATTEMPTS):
+                # Спочатку спроби серед схожих варіантів, потім — серед усіх
+                if attempt < CHOICE_SAMPLE_ATTEMPTS and similar_buckets:
+                    option_idx: int = random.choice(similar_buckets[attempt % len(similar_buckets)])
+                else:
+                    option_idx: int = random.choice(all_idxs)
+
+                if option_idx not in chosen_idxs and self._keys[option_idx] not in answer_keys:
+                    chosen_idxs.append(option_idx)
+                    break
+        return [self.options[option_idx] for option_idx in chosen_idxs]
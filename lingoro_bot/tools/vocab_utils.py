@@ -1,3 +1,8 @@
+from datetime import datetime
+
+from lingoro_bot.config import VOCAB_DATETIME_FORMAT
+
+
 def check_vocab_name_duplicate(vocab_name: str, vocab_name_old: str) -> bool:
     """Перевіряє, чи збігається нова назва словника з поточною
 
@@ -25,19 +30,66 @@ def format_vocab_info(name: str,
                       description: str,
                       wordpairs_count: int,
                       number_errors: int,
-                      wordpairs: list[str]) -> str:
-    """Повертає відформатовану інформацію про користувацький словник та словникові пари"""
+                      last_trained_at: datetime | None,
+                      best_accuracy: float | None,
+                      wordpairs: list[str],
+                      weakest_wordpairs: dict[str, str] | None = None) -> str:
+    """Повертає відформатовану інформацію про користувацький словник та словникові пари.
+    Якщо словник ще не тренувався (або не було завершених тренувань), то замість часу тренування
+    та точності виводиться "Відсутній". Найслабші словникові пари (ключ — назва напрямку перекладу)
+    виводяться лише для напрямків, в яких були невдалі спроби.
+    """
     joined_wordpairs: str = '\n'.join(wordpairs)
+    formatted_weakest_wordpairs: str = ''.join(f'🔻 Найслабші ({direction_name}): {words}\n'
+                                               for direction_name, words in (weakest_wordpairs or {}).items())
+
+    formatted_last_trained_at: str = last_trained_at.strftime(VOCAB_DATETIME_FORMAT) if last_trained_at else 'Відсутній'
+    formatted_best_accuracy: str = f'{best_accuracy:.0%}' if best_accuracy is not None else 'Відсутній'
 
     formatted_vocab_info: str = (f'📗 Назва словника: {name}\n'
                                  f'📄 Опис: {description}\n\n'
                                  f'🔢 Кількість словникових пар: {wordpairs_count}\n'
-                                 f'⚠️ Загальна кількість помилок: {number_errors}\n\n'
+                                 f'⚠️ Загальна кількість помилок: {number_errors}\n'
+                                 f'🕒 Останнє тренування: {formatted_last_trained_at}\n'
+                                 f'🎯 Найкраща точність: {formatted_best_accuracy}\n'
+                                 f'{formatted_weakest_wordpairs}\n'
                                  f'Словникові пари:\n'
                                  f'{joined_wordpairs}')
     return formatted_vocab_info
 
 
+def get_message_length(text: str) -> int:
+    """Повертає довжину тексту повідомлення так, як її рахує Telegram (у UTF-16 кодових одиницях).
+
+    Examples:
+        >>> get_message_length('📗 cat')
+        6
+    """
+    return len(text.encode('utf-16-le')) // 2
+
+
+def count_fitting_lines(lines: list[str], max_length: int) -> int:
+    """Повертає кількість перших рядків, які разом (через перенесення рядка) не перевищують максимальну довжину.
+
+    Notes:
+        Повертається щонайменше 1 (якщо список не порожній), щоб сторінка ніколи не була порожньою.
+
+    Args:
+        lines (list[str]): Рядки, які потрібно вмістити.
+        max_length (int): Максимальна довжина (див. get_message_length).
+
+    Returns:
+        int: Кількість рядків, які вміщуються.
+    """
+    total_length: int = 0
+
+    for count, line in enumerate(lines):
+        total_length += get_message_length(line) + 1  # Разом з перенесенням рядка
+        if total_length > max_length:
+            return max(count, 1)
+    return len(lines)
+
+
 def add_vocab_data_to_message(vocab_name: str | None = None,
                               vocab_description: str | None = None,
                               message_text: str = '') -> str:
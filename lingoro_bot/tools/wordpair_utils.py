@@ -1,10 +1,22 @@
-from lingoro_bot.config import WORDPAIR_ITEM_SEPARATOR, WORDPAIR_SEPARATOR, WORDPAIR_TRANSCRIPTION_SEPARATOR
+from lingoro_bot.config import (
+    VOCAB_DATETIME_FORMAT,
+    WORDPAIR_ITEM_SEPARATOR,
+    WORDPAIR_SEPARATOR,
+    WORDPAIR_TRANSCRIPTION_SEPARATOR,
+)
 from lingoro_bot.custom_types.wordpair_types import (
     BaseWordpairTranslationType,
     BaseWordpairWordType,
     WordpairComponentsType,
+    WordpairStatType,
 )
 
+# Напрямки перекладу словникових пар під час тренування
+TRAINING_DIRECTION_DIRECT = 'direct'  # Від слова до перекладу
+TRAINING_DIRECTION_REVERSE = 'reverse'  # Від перекладу до слова
+TRAINING_DIRECTION_NAMES: dict[str, str] = {TRAINING_DIRECTION_DIRECT: 'W -> T',
+                                            TRAINING_DIRECTION_REVERSE: 'T -> W'}
+
 
 def format_valid_wordpairs(wordpairs: list[str] | None) -> str:
     """Повертає відформатовані валідні словникові пари"""
@@ -30,14 +42,47 @@ def format_wordpair_info(idx: int,
                          words: list[str],
                          translations: list[str],
                          annotation: str,
-                         number_errors: int) -> str:
-    """Повертає відформатовані не валідні словникові пари"""
+                         number_errors: int,
+                         direction_stats: dict[str, WordpairStatType] | None = None) -> str:
+    """Повертає відформатовану інформацію про словникову пару.
+    Якщо передано статистику за напрямками перекладу, то додає рядок для кожного напрямку.
+    """
     formatted_wordpair_info: str = (f'{idx}. {words} ▪️ {translations} ▪️ {annotation}\n'
                                     f'🔺 Помилки: {number_errors}\n')
 
+    for direction, direction_name in TRAINING_DIRECTION_NAMES.items():
+        if direction_stats and direction in direction_stats:
+            formatted_wordpair_info += format_wordpair_stat(direction_name, direction_stats[direction])
+
     return formatted_wordpair_info
 
 
+def format_wordpair_stat(direction_name: str, wordpair_stat: WordpairStatType) -> str:
+    """Повертає відформатовану статистику словникової пари за напрямком перекладу.
+
+    Examples:
+        >>> format_wordpair_stat('W -> T', {'attempts': 5, 'number_errors': 2, 'number_hints': 1,
+                                            'number_translation_shown': 0, 'last_seen_at': datetime(2024, 5, 10)})
+        "📈 W -> T: вірно 3/5, підказок 1, показів перекладу 0 (10.05.2024 00:00)\n"
+    """
+    correct_count: int = wordpair_stat['attempts'] - wordpair_stat['number_errors']
+    last_seen_at: str = wordpair_stat['last_seen_at'].strftime(VOCAB_DATETIME_FORMAT)
+
+    return (f'📈 {direction_name}: вірно {correct_count}/{wordpair_stat["attempts"]}, '
+            f'підказок {wordpair_stat["number_hints"]}, '
+            f'показів перекладу {wordpair_stat["number_translation_shown"]} ({last_seen_at})\n')
+
+
+def calculate_error_rate(attempts: int, number_errors: int, number_translation_shown: int) -> float:
+    """Повертає частку невдалих спроб словникової пари (неправильні відповіді та покази перекладу).
+
+    Notes:
+        Обчислюється так само, як у WordpairStatCRUD.add_session_stats (при оновленні наявної статистики).
+        Якщо спроб не було (лише покази анотації), то повертає 0.
+    """
+    return (number_errors + number_translation_shown) / max(attempts + number_translation_shown, 1)
+
+
 def parse_wordpair_components(wordpair: str) -> WordpairComponentsType:
     """Повертає розділену словникову пару на окремі компоненти:
     слова з транскрипціями, переклади з транскрипціями та анотацію.
@@ -167,22 +212,29 @@ def format_word_items(word_items: list[dict], is_translation_items: bool = False
     return joined_words
 
 
-def get_formatted_wordpairs_list(wordpair_items: list[dict]) -> list[str]:
+def get_formatted_wordpairs_list(wordpair_items: list[dict],
+                                 start_idx: int = 1,
+                                 wordpair_stats: dict[int, dict[str, WordpairStatType]] | None = None) -> list[str]:
     """Повертає список відформатованих словникових пар.
 
     Args:
         wordpair_items (list[dict]): Список словникових пар з інформацією про них.
+        start_idx (int): Порядковий номер першої словникової пари (за замовчуванням: 1).
+        wordpair_stats (dict[int, dict[str, WordpairStatType]] | None): Статистика словникових пар
+        за напрямками перекладу (ключ — ID словникової пари). За замовчуванням None (без статистики).
 
     Returns:
         list[str]: Список з відформатованими словниковими парами.
     """
     formatted_wordpairs: list[str] = []
+    wordpair_stats = wordpair_stats or {}
 
-    for idx, wordpair_item in enumerate(wordpair_items, start=1):
+    for idx, wordpair_item in enumerate(wordpair_items, start=start_idx):
         word_items: list[dict] = wordpair_item.get('words')
         translation_items: list[dict] = wordpair_item.get('translations')
         annotation: str = wordpair_item.get('annotation') or 'Немає анотації'
         wordpair_number_errors: int = wordpair_item.get('number_errors')
+        direction_stats: dict[str, WordpairStatType] | None = wordpair_stats.get(wordpair_item.get('id'))
 
         formatted_word_items: list[str] = format_word_items(word_items)
         formatted_translation_items: list[str] = format_word_items(translation_items, is_translation_items=True)
@@ -191,6 +243,7 @@ def get_formatted_wordpairs_list(wordpair_items: list[dict]) -> list[str]:
                                                        words=formatted_word_items,
                                                        translations=formatted_translation_items,
                                                        annotation=annotation,
-                                                       number_errors=wordpair_number_errors)
+                                                       number_errors=wordpair_number_errors,
+                                                       direction_stats=direction_stats)
         formatted_wordpairs.append(formatted_wordpair)
     return formatted_wordpairs
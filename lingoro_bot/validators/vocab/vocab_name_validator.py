@@ -17,20 +17,28 @@ from lingoro_bot.validators.base_validator import ValidatorBase
 class VocabNameValidator(ValidatorBase):
     """Валідатор для назви користувацького словника"""
 
-    def __init__(self, name: str, user_id: int, session: Session, errors: list[str] | None = None) -> None:
+    def __init__(self, name: str, user_db_id: int, session: Session, errors: list[str] | None = None) -> None:
         super().__init__(errors)
         self.logger: logging.Logger = logging.getLogger(f'{__name__}.{self.__class__.__name__}')
 
         self._name: str = name
-        self.user_id: int = user_id
+        self.user_db_id: int = user_db_id
         self.session: Session = session
 
     def _check_unique_name_per_user(self) -> bool:
-        """Перевіряє, чи вже не використовується назва користувацького словника в БД користувача"""
-        existing_vocab: Vocabulary | None = self.session.query(Vocabulary).filter(
-            Vocabulary.name.ilike(self._name), Vocabulary.user_id == self.user_id).first()
+        """Перевіряє, чи вже не використовується назва користувацького словника в БД користувача.
 
-        if existing_vocab is not None:
+        Notes:
+            Умова збігається з унікальним індексом "uq_vocabularies_user_id_normalized_name",
+            тому перевірка виконується одним пошуком за індексом. Назва нормалізується у Python (str.casefold),
+            бо "lower()" у SQLite не змінює регістр не-ASCII символів (наприклад, кирилиці).
+        """
+        existing_vocab_id: int | None = self.session.query(Vocabulary.id).filter(
+            Vocabulary.user_id == self.user_db_id,
+            Vocabulary.normalized_name == self._name.casefold(),
+            ~Vocabulary.is_deleted).first()
+
+        if existing_vocab_id is not None:
             self.logger.warning('Назва користувацького словника вже використовується в БД користувача')
             self.add_error(MSG_ERROR_VOCAB_NAME_UNIQUELY.format(name=self._name))
             return False
@@ -0,0 +1,39 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import Session
+
+from lingoro_bot.db import database
+from lingoro_bot.db.crud import UserCRUD
+
+
+@pytest.fixture
+def db_engine(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Engine]:
+    """Тимчасова БД з усіма таблицями та індексами (замість database.db)"""
+    original_engine: Engine = database.engine
+    test_engine: Engine = create_engine(f'sqlite:///{tmp_path / "test.db"}')
+    monkeypatch.setattr(database, 'engine', test_engine)
+    database.Session.configure(bind=test_engine)
+
+    database.create_database_tables()
+    yield test_engine
+
+    database.Session.configure(bind=original_engine)
+    test_engine.dispose()
+
+
+@pytest.fixture
+def db_session(db_engine: Engine) -> Iterator[Session]:
+    """Сесія тимчасової БД"""
+    with Session(db_engine) as session:
+        yield session
+
+
+@pytest.fixture
+def user_db_id(db_session: Session) -> int:
+    """ID в БД зареєстрованого тестового користувача"""
+    user_crud = UserCRUD(db_session)
+    user_crud.register_user(111, {'username': 'user', 'first_name': 'User', 'last_name': None})
+    return user_crud.get_user_db_id(111)
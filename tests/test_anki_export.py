@@ -0,0 +1,84 @@
+import sqlite3
+import zipfile
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from lingoro_bot.config import ANKI_EXPORT_COLLECTION_NAME, ANKI_FIELD_SEPARATOR
+from lingoro_bot.db import crud
+from lingoro_bot.db.crud import VocabCRUD
+from lingoro_bot.tools.anki_utils import iter_anki_notes
+from lingoro_bot.tools.wordpair_utils import parse_wordpair_components
+
+WORDPAIRS_COUNT = 7
+
+
+@pytest.fixture
+def vocab_id(db_session: Session, user_db_id: int) -> int:
+    """ID словника з WORDPAIRS_COUNT словникових пар (друга з них має транскрипцію та анотацію)"""
+    wordpairs = [parse_wordpair_components(f'word{i}:translation{i}') for i in range(WORDPAIRS_COUNT)]
+    wordpairs[1] = parse_wordpair_components('word1 | wɜːd, word1b:translation1:annotation1')
+    VocabCRUD(db_session).create_new_vocab(user_db_id, 'vocab', None, wordpairs)
+    return db_session.execute(text('SELECT id FROM vocabularies')).scalar()
+
+
+def read_apkg_collection(apkg_path: Path, extract_dir: Path) -> sqlite3.Connection:
+    """Розпаковує SQLite-колекцію Anki-пакета та відкриває її"""
+    with zipfile.ZipFile(apkg_path) as apkg:
+        assert set(apkg.namelist()) == {ANKI_EXPORT_COLLECTION_NAME, 'media'}
+        collection_path = Path(apkg.extract(ANKI_EXPORT_COLLECTION_NAME, extract_dir))
+    return sqlite3.connect(collection_path)
+
+
+def test_export_vocab_to_anki_writes_note_and_card_per_wordpair(db_session: Session,
+                                                                vocab_id: int,
+                                                                tmp_path: Path,
+                                                                monkeypatch: pytest.MonkeyPatch) -> None:
+    # Частини менші за кількість словникових пар, щоб перевірити межі частин
+    monkeypatch.setattr(crud, 'ANKI_EXPORT_CHUNK_SIZE', 3)
+    apkg_path: Path = tmp_path / 'vocab.apkg'
+
+    exported_count: int = VocabCRUD(db_session).export_vocab_to_anki(vocab_id, apkg_path)
+    assert exported_count == WORDPAIRS_COUNT
+
+    connection: sqlite3.Connection = read_apkg_collection(apkg_path, tmp_path / 'extracted')
+    try:
+        assert connection.execute('SELECT count(*) FROM notes').fetchone()[0] == WORDPAIRS_COUNT
+        assert connection.execute('SELECT count(*) FROM cards').fetchone()[0] == WORDPAIRS_COUNT
+        assert connection.execute(
+            'SELECT count(*) FROM cards JOIN notes ON notes.id = cards.nid').fetchone()[0] == WORDPAIRS_COUNT
+        note_fields: list[str] = [row[0] for row in connection.execute('SELECT flds FROM notes ORDER BY id')]
+    finally:
+        connection.close()
+
+    assert note_fields[0].split(ANKI_FIELD_SEPARATOR) == ['word0', 'translation0', '']
+    assert note_fields[1].split(ANKI_FIELD_SEPARATOR) == ['word1 | wɜːd, word1b', 'translation1', 'annotation1']
+
+
+def test_export_vocab_to_anki_can_be_imported_back(db_session: Session, vocab_id: int, tmp_path: Path) -> None:
+    apkg_path: Path = tmp_path / 'vocab.apkg'
+    VocabCRUD(db_session).export_vocab_to_anki(vocab_id, apkg_path)
+
+    imported_notes: list[list[str]] = [note for chunk in iter_anki_notes(apkg_path) for note in chunk]
+    assert len(imported_notes) == WORDPAIRS_COUNT
+
+
+def test_export_vocab_to_anki_keeps_note_guids_between_exports(db_session: Session,
+                                                               vocab_id: int,
+                                                               tmp_path: Path) -> None:
+    note_guids: list[list[str]] = []
+    for export_num in range(2):
+        apkg_path: Path = tmp_path / f'vocab{export_num}.apkg'
+        VocabCRUD(db_session).export_vocab_to_anki(vocab_id, apkg_path)
+
+        connection: sqlite3.Connection = read_apkg_collection(apkg_path, tmp_path / f'extracted{export_num}')
+        try:
+            note_guids.append([row[0] for row in connection.execute('SELECT guid FROM notes ORDER BY id')])
+        finally:
+            connection.close()
+
+    # Anki зіставляє нотатки за GUID, тому повторний імпорт оновлює нотатки, а не дублює їх
+    wordpair_ids: list[int] = list(db_session.execute(text('SELECT id FROM wordpairs ORDER BY id')).scalars())
+    assert note_guids[0] == note_guids[1] == [f'lingoro{wordpair_id}' for wordpair_id in wordpair_ids]
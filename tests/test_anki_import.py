@@ -0,0 +1,77 @@
+import zipfile
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from lingoro_bot.db.crud import VocabCRUD, WordpairCRUD
+from lingoro_bot.db.database import check_vocab_summaries
+from lingoro_bot.exceptions import AnkiPackageError
+from lingoro_bot.handlers.import_vocab import _import_anki_package
+from lingoro_bot.tools.anki_utils import write_anki_package
+from lingoro_bot.tools.wordpair_utils import parse_wordpair_components
+
+DECK_NOTES: list[list[str]] = [
+    ['<b>cat</b>', 'кіт', ''],
+    ['hello | хелоу, hi', 'привіт<br>вітаю', 'загальна&nbsp;форма вітання'],
+    ['', 'порожні слова', ''],  # Не валідна нотатка
+    ['dog[sound:dog.mp3]', 'пес', ''],
+    ['word:with:separator', 'переклад', ''],  # Не валідна нотатка
+]
+
+
+def write_deck(apkg_path: Path, notes: list[list[str]]) -> None:
+    """Створює Anki-пакет з нотатками "notes" (однією частиною)"""
+    write_anki_package(apkg_path, 'deck', [list(enumerate(notes, start=1))])
+
+
+def test_import_anki_package_adds_valid_notes_and_counts_skipped(db_session: Session,
+                                                                 user_db_id: int,
+                                                                 tmp_path: Path) -> None:
+    # Словник, створений раніше, щоб ID нових рядків не починалися з 1
+    VocabCRUD(db_session).create_new_vocab(user_db_id, 'existing', None,
+                                           [parse_wordpair_components('word:translation')])
+    apkg_path: Path = tmp_path / 'deck.apkg'
+    write_deck(apkg_path, DECK_NOTES)
+
+    imported_count, skipped_count = _import_anki_package(apkg_path, user_db_id, 'deck')
+    assert (imported_count, skipped_count) == (3, 2)
+
+    vocab_id: int = db_session.execute(text("SELECT id FROM vocabularies WHERE name = 'deck'")).scalar()
+    wordpairs = sorted(WordpairCRUD(db_session).get_wordpairs(vocab_id), key=lambda wordpair: wordpair['id'])
+    assert [[word['word'] for word in wordpair['words']] for wordpair in wordpairs] == [['cat'], ['hello', 'hi'],
+                                                                                        ['dog']]
+    assert [[translation['translation'] for translation in wordpair['translations']]
+            for wordpair in wordpairs] == [['кіт'], ['привіт вітаю'], ['пес']]
+    assert wordpairs[1]['words'][0]['transcription'] == 'хелоу'
+    assert wordpairs[1]['annotation'] == 'загальна форма вітання'
+
+    assert db_session.execute(text('SELECT count(*) FROM wordpair_search')).scalar() == 4
+    assert check_vocab_summaries() == 0
+
+
+def test_import_anki_package_without_valid_notes_creates_no_vocab(db_session: Session,
+                                                                  user_db_id: int,
+                                                                  tmp_path: Path) -> None:
+    apkg_path: Path = tmp_path / 'deck.apkg'
+    write_deck(apkg_path, [DECK_NOTES[2], DECK_NOTES[4]])
+
+    assert _import_anki_package(apkg_path, user_db_id, 'deck') == (0, 2)
+    assert db_session.execute(text('SELECT count(*) FROM vocabularies')).scalar() == 0
+
+
+def test_import_anki_package_rejects_corrupt_collection(user_db_id: int, tmp_path: Path) -> None:
+    apkg_path: Path = tmp_path / 'deck.apkg'
+    write_deck(apkg_path, DECK_NOTES)
+
+    # Обрізаний стиснутий вміст колоди (заголовки zip-архіву залишаються валідними)
+    with zipfile.ZipFile(apkg_path) as apkg:
+        collection_info: zipfile.ZipInfo = apkg.getinfo('collection.anki2')
+    apkg_bytes = bytearray(apkg_path.read_bytes())
+    data_start: int = collection_info.header_offset + 30 + len(collection_info.filename) + len(collection_info.extra)
+    apkg_bytes[data_start:data_start + collection_info.compress_size] = bytes(collection_info.compress_size)
+    apkg_path.write_bytes(apkg_bytes)
+
+    with pytest.raises(AnkiPackageError, match='пошкоджена'):
+        _import_anki_package(apkg_path, user_db_id, 'deck')
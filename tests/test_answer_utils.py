@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from lingoro_bot.tools.answer_utils import get_bounded_edit_distance
+
+
+def get_edit_distance(source: str, target: str) -> int:
+    """Повна (без обмеження) відстань Левенштейна між рядками — еталон для перевірки"""
+    previous_row: list[int] = list(range(len(target) + 1))
+    for source_idx, source_char in enumerate(source, start=1):
+        current_row: list[int] = [source_idx]
+        for target_idx, target_char in enumerate(target, start=1):
+            current_row.append(min(previous_row[target_idx] + 1,
+                                   current_row[target_idx - 1] + 1,
+                                   previous_row[target_idx - 1] + (source_char != target_char)))
+        previous_row = current_row
+    return previous_row[-1]
+
+
+def mutate(rnd: random.Random, text: str, edits_count: int, alphabet: str) -> str:
+    """Повертає рядок, отриманий з "text" випадковими вставками, видаленнями та замінами символів"""
+    chars: list[str] = list(text)
+    for _ in range(edits_count):
+        edit_kind: int = rnd.randrange(3)
+        if edit_kind == 0 or not chars:
+            chars.insert(rnd.randint(0, len(chars)), rnd.choice(alphabet))
+        elif edit_kind == 1:
+            del chars[rnd.randrange(len(chars))]
+        else:
+            chars[rnd.randrange(len(chars))] = rnd.choice(alphabet)
+    return ''.join(chars)
+
+
+@pytest.mark.parametrize('alphabet', ['ab', 'abcd', 'будинокш'])
+def test_bounded_edit_distance_matches_unbounded_reference(alphabet: str) -> None:
+    rnd = random.Random(alphabet)
+    for _ in range(3000):
+        source: str = ''.join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 12)))
+        # Більшість пар відрізняються на кількість правок поблизу межі, решта — випадкові рядки
+        if rnd.random() < 0.7:
+            target: str = mutate(rnd, source, rnd.randint(0, 6), alphabet)
+        else:
+            target = ''.join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 12)))
+
+        expected_distance: int = get_edit_distance(source, target)
+        for max_distance in range(6):
+            bounded_distance: int | None = get_bounded_edit_distance(source, target, max_distance)
+            if expected_distance <= max_distance:
+                assert bounded_distance == expected_distance, (source, target, max_distance)
+            else:
+                assert bounded_distance is None, (source, target, max_distance)
+
+
+@pytest.mark.parametrize(('source', 'target', 'max_distance', 'expected'), [
+    # Відстань дорівнює максимальній (значення на краю смуги)
+    ('abcdef', 'abc', 3, 3),
+    ('', 'abc', 3, 3),
+    ('abc', 'xbcy', 2, 2),
+    # Різниця довжин перевищує максимальну відстань
+    ('abcdef', 'ab', 3, None),
+    ('', 'abcd', 3, None),
+    # Усі значення рядка матриці перевищують максимальну відстань задовго до кінця рядків
+    ('a' * 50, 'b' * 50, 2, None),
+    ('abcdefgh', 'hgfedcba', 1, None),
+    ('будинок', 'будинк', 1, 1),
+    ('будинок', 'бутинк', 1, None),
+    ('', '', 0, 0),
+])
+def test_bounded_edit_distance_edge_cases(source: str, target: str, max_distance: int, expected: int | None) -> None:
+    assert get_bounded_edit_distance(source, target, max_distance) == expected
+    assert get_bounded_edit_distance(target, source, max_distance) == expected
+
+
+class CountingStr(str):
+    """Рядок, що рахує звернення до своїх символів за індексом"""
+
+    reads_count: int = 0
+
+    def __getitem__(self, key: int | slice) -> str:
+        self.reads_count += 1
+        return super().__getitem__(key)
+
+
+def test_bounded_edit_distance_stops_once_row_exceeds_max_distance() -> None:
+    source = CountingStr('a' * 50)
+
+    assert get_bounded_edit_distance(source, 'b' * 50, max_distance=2) is None
+    # Символ джерела читається один раз на рядок матриці: у рядку 3 всі значення вже більші за 2
+    assert source.reads_count == 3
@@ -0,0 +1,109 @@
+import asyncio
+import time
+
+import pytest
+
+from lingoro_bot.tools.timer_wheel import TimerHandle, TimerWheel
+
+SLOT_BITS = 6  # 64 слоти на рівні: межі рівнів — 64 та 4096 тактів
+LEVELS = 3
+
+
+async def noop() -> None:
+    """Виклик таймера, який нічого не робить"""
+
+
+def make_wheel(current_tick: int = 0) -> TimerWheel:
+    """Колесо з тактом в 1 секунду, переведене на такт "current_tick" (без таймерів)"""
+    wheel = TimerWheel(resolution=1.0, slot_bits=SLOT_BITS, levels=LEVELS)
+    for _ in range(current_tick):
+        wheel.advance()
+    return wheel
+
+
+def schedule_in_ticks(wheel: TimerWheel, ticks: int) -> TimerHandle:
+    """Планує таймер, який має спрацювати рівно через "ticks" тактів колеса"""
+    # schedule додає один такт, щоб таймер не спрацював раніше затримки
+    return wheel.schedule(ticks - 1, noop)
+
+
+def advance_until_fired(wheel: TimerWheel, timer_handle: TimerHandle, max_ticks: int) -> int | None:
+    """Переводить колесо, доки таймер не спрацює, та повертає такт спрацювання (None, якщо не спрацював)"""
+    for _ in range(max_ticks):
+        if timer_handle in wheel.advance():
+            return wheel.current_tick
+    return None
+
+
+@pytest.mark.parametrize('ticks', [1, 2, 63, 64, 65, 4095, 4096, 4096 + 1, 2 * 4096 + 65])
+@pytest.mark.parametrize('start_tick', [0, 1, 37, 4095])
+def test_timer_fires_exactly_on_expiry_tick(ticks: int, start_tick: int) -> None:
+    wheel: TimerWheel = make_wheel(start_tick)
+    timer_handle: TimerHandle = schedule_in_ticks(wheel, ticks)
+
+    assert advance_until_fired(wheel, timer_handle, ticks + 10) == start_tick + ticks
+    assert not timer_handle.is_active()
+
+
+def test_timers_on_all_levels_fire_in_order() -> None:
+    wheel: TimerWheel = make_wheel(5)
+    ticks_list: list[int] = [4096 + 1, 1, 64, 4096, 65, 63]
+    timer_handles: dict[TimerHandle, int] = {schedule_in_ticks(wheel, ticks): ticks for ticks in ticks_list}
+
+    fired: list[tuple[int, int]] = []
+    for _ in range(max(ticks_list)):
+        fired.extend((wheel.current_tick, timer_handles[timer_handle]) for timer_handle in wheel.advance())
+
+    assert fired == [(5 + ticks, ticks) for ticks in sorted(ticks_list)]
+
+
+def test_cancel_after_cascade() -> None:
+    wheel: TimerWheel = make_wheel()
+    timer_handle: TimerHandle = schedule_in_ticks(wheel, 4096 + 70)
+    other_handle: TimerHandle = schedule_in_ticks(wheel, 4096 + 70)
+
+    # На такті 4096 таймери переносяться з другого рівня на перший, на такті 4096 + 64 — на нульовий
+    for _ in range(4096 + 64):
+        assert not wheel.advance()
+    assert timer_handle.is_active()
+
+    timer_handle.cancel()
+    timer_handle.cancel()  # Повторне скасування нічого не робить
+    assert not timer_handle.is_active()
+
+    assert advance_until_fired(wheel, other_handle, 10) == 4096 + 70
+    assert not any(wheel.advance() for _ in range(4096))
+
+
+def test_schedule_rejects_delay_beyond_wheel_range() -> None:
+    wheel: TimerWheel = make_wheel()
+    with pytest.raises(ValueError):
+        schedule_in_ticks(wheel, 1 << (SLOT_BITS * LEVELS))
+
+
+def test_run_catches_up_skipped_ticks() -> None:
+    async def run_blocked_wheel() -> tuple[TimerWheel, list[int]]:
+        wheel = TimerWheel(resolution=0.01, slot_bits=SLOT_BITS, levels=LEVELS)
+        fired: list[int] = []
+
+        async def on_timer(timer_num: int) -> None:
+            await asyncio.sleep(0)
+            fired.append(timer_num)
+
+        for timer_num, delay in enumerate((0.02, 0.05, 0.1, 0.7)):
+            wheel.schedule(delay, on_timer, timer_num)
+
+        wheel_task: asyncio.Task = asyncio.create_task(wheel.run())
+        await asyncio.sleep(0)
+
+        # Event loop заблоковано довше, ніж затримки всіх таймерів (пропущено більше повного кола нульового рівня)
+        time.sleep(0.8)
+        await asyncio.sleep(0.05)
+
+        wheel_task.cancel()
+        return wheel, fired
+
+    wheel, fired = asyncio.run(run_blocked_wheel())
+
+    assert sorted(fired) == [0, 1, 2, 3]
+    assert wheel.current_tick >= 80
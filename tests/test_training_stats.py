@@ -0,0 +1,42 @@
+from datetime import date, datetime
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from lingoro_bot.db.crud import TrainingStatsCRUD, VocabCRUD
+from lingoro_bot.tools.training_checkpoint import save_training_results
+from lingoro_bot.tools.wordpair_utils import parse_wordpair_components
+
+TRAINING_DAY = date(2024, 11, 18)
+
+
+def save_training(session: Session, user_db_id: int, vocab_id: int | None, correct_count: int) -> None:
+    """Зберігає тренування тривалістю 90 секунд з "correct_count" правильними та однією неправильною відповіддю"""
+    save_training_results(session,
+                          user_db_id=user_db_id,
+                          vocab_id=vocab_id,
+                          training_mode='direct_translation',
+                          start_time=datetime(2024, 11, 18, 10, 0, 0),
+                          end_time=datetime(2024, 11, 18, 10, 1, 30),
+                          training_progress={'correct_answer_count': correct_count, 'wrong_answer_count': 1},
+                          is_completed=True)
+
+
+def test_mixed_training_counts_only_in_user_daily_stats(db_session: Session, user_db_id: int) -> None:
+    VocabCRUD(db_session).create_new_vocab(user_db_id, 'vocab', None, [parse_wordpair_components('word:translation')])
+    vocab_id: int = db_session.execute(text('SELECT id FROM vocabularies')).scalar()
+
+    save_training(db_session, user_db_id, vocab_id, correct_count=3)
+    save_training(db_session, user_db_id, None, correct_count=5)
+
+    stats_crud = TrainingStatsCRUD(db_session)
+    assert stats_crud.get_user_stats(user_db_id, TRAINING_DAY, TRAINING_DAY) == {'sessions_count': 2,
+                                                                                'number_correct_answers': 8,
+                                                                                'number_wrong_answers': 2,
+                                                                                'duration_seconds': 180}
+    assert stats_crud.get_user_training_days(user_db_id) == [TRAINING_DAY]
+
+    # Змішане тренування не належить словнику, тому сесії та підсумки словника містять лише тренування словника
+    assert db_session.execute(text('SELECT count(*) FROM training_sessions')).scalar() == 1
+    assert db_session.execute(text(
+        'SELECT sessions_count, number_correct_answers FROM vocab_daily_stats')).one() == (1, 3)
@@ -0,0 +1,21 @@
+from lingoro_bot.tools.training_cache import get_distractor_index
+from lingoro_bot.tools.user_cache import reset_user_cache
+
+
+def test_reset_user_cache_rebuilds_only_user_distractor_indexes() -> None:
+    create_calls: list[int] = []
+
+    def create_options(user_db_id: int) -> list[str]:
+        create_calls.append(user_db_id)
+        return ['a', 'b', 'c', 'd']
+
+    get_distractor_index(1, 10, lambda: create_options(1))
+    get_distractor_index(2, 10, lambda: create_options(2))
+    get_distractor_index(1, 10, lambda: create_options(1))
+    assert create_calls == [1, 2]
+
+    # Після створення чи видалення словників користувача його індекси будуються знову
+    reset_user_cache(1)
+    get_distractor_index(1, 10, lambda: create_options(1))
+    get_distractor_index(2, 10, lambda: create_options(2))
+    assert create_calls == [1, 2, 1]
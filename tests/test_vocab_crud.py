@@ -0,0 +1,110 @@
+import pytest
+from sqlalchemy import Engine, text
+from sqlalchemy.orm import Session
+
+from lingoro_bot.db.crud import VocabCRUD
+from lingoro_bot.db.database import (
+    VOCAB_NAMES_MIGRATION_VERSION,
+    check_vocab_summaries,
+    create_database_tables,
+)
+from lingoro_bot.exceptions import VocabNameNotUniqueError
+from lingoro_bot.tools.wordpair_utils import parse_wordpair_components
+from lingoro_bot.validators.vocab.vocab_name_validator import VocabNameValidator
+
+
+def test_create_new_vocab_adds_summary_and_search_rows(db_session: Session, user_db_id: int) -> None:
+    wordpairs = [parse_wordpair_components(f'word{i}:translation{i}') for i in range(3)]
+    VocabCRUD(db_session).create_new_vocab(user_db_id, 'vocab', None, wordpairs)
+
+    assert db_session.execute(text('SELECT wordpairs_count FROM vocab_summaries')).scalar() == 3
+    assert db_session.execute(text('SELECT count(*) FROM wordpair_search')).scalar() == 3
+    assert check_vocab_summaries() == 0
+
+
+def test_create_new_vocab_rolls_back_on_invalid_wordpair(db_session: Session, user_db_id: int) -> None:
+    wordpairs = [parse_wordpair_components('word:translation'), {'words': None, 'translations': [], 'annotation': None}]
+
+    with pytest.raises(ValueError):
+        VocabCRUD(db_session).create_new_vocab(user_db_id, 'vocab', None, wordpairs)
+
+    for table_name in ('vocabularies', 'wordpairs', 'words', 'vocab_summaries', 'wordpair_search'):
+        assert db_session.execute(text(f'SELECT count(*) FROM {table_name}')).scalar() == 0
+
+    # Назва словника не залишається зайнятою
+    VocabCRUD(db_session).create_new_vocab(user_db_id, 'vocab', None, wordpairs[:1])
+    assert db_session.execute(text('SELECT count(*) FROM vocab_summaries')).scalar() == 1
+
+
+def test_vocab_summaries_are_checked_only_by_maintenance_command(db_engine: Engine,
+                                                                  db_session: Session,
+                                                                  user_db_id: int) -> None:
+    wordpairs = [parse_wordpair_components('word:translation')]
+    VocabCRUD(db_session).create_new_vocab(user_db_id, 'vocab', None, wordpairs)
+    db_session.execute(text('DELETE FROM vocab_summaries'))
+    db_session.commit()
+
+    # Повторний запуск бота не перевіряє зведені дані (міграцію вже виконано)
+    create_database_tables()
+    with db_engine.connect() as connection:
+        assert connection.execute(text('PRAGMA user_version')).scalar() == VOCAB_NAMES_MIGRATION_VERSION
+        assert connection.execute(text('SELECT count(*) FROM vocab_summaries')).scalar() == 0
+
+    assert check_vocab_summaries() == 1
+    with db_engine.connect() as connection:
+        assert connection.execute(text('SELECT wordpairs_count FROM vocab_summaries')).scalar() == 1
+
+
+def test_get_vocab_ids_skips_deleted_vocabs(db_session: Session, user_db_id: int) -> None:
+    vocab_crud = VocabCRUD(db_session)
+    wordpairs = [parse_wordpair_components('word:translation')]
+    for vocab_name in ('first', 'second', 'third'):
+        vocab_crud.create_new_vocab(user_db_id, vocab_name, None, wordpairs)
+    vocab_ids: list[int] = list(db_session.execute(text('SELECT id FROM vocabularies ORDER BY id')).scalars())
+
+    vocab_crud.soft_delete_vocab(vocab_ids[1])
+    db_session.commit()
+
+    assert vocab_crud.get_vocab_ids(user_db_id) == [vocab_ids[0], vocab_ids[2]]
+    assert vocab_crud.get_vocab_ids(user_db_id + 1) == []
+
+
+def test_vocab_names_are_unique_regardless_of_cyrillic_case(db_session: Session, user_db_id: int) -> None:
+    vocab_crud = VocabCRUD(db_session)
+    wordpairs = [parse_wordpair_components('word:translation')]
+    vocab_crud.create_new_vocab(user_db_id, 'Слова', None, wordpairs)
+
+    assert not VocabNameValidator('слова', user_db_id, db_session).is_valid()
+    assert VocabNameValidator('слова', user_db_id + 1, db_session).is_valid()
+
+    # Унікальний індекс відхиляє назву, навіть якщо перевірку назви було пройдено раніше
+    with pytest.raises(VocabNameNotUniqueError):
+        vocab_crud.create_new_vocab(user_db_id, 'СЛОВА', None, wordpairs)
+
+
+def test_migrate_vocab_names_fills_normalized_names(db_engine: Engine, user_db_id: int) -> None:
+    # БД до міграції: без нормалізованої назви, з індексом за "lower(name)", який не враховує регістр кирилиці
+    with db_engine.begin() as connection:
+        connection.execute(text('DROP INDEX uq_vocabularies_user_id_normalized_name'))
+        connection.execute(text('ALTER TABLE vocabularies DROP COLUMN normalized_name'))
+        connection.execute(text('CREATE UNIQUE INDEX uq_vocabularies_user_id_lower_name '
+                                'ON vocabularies (user_id, lower(name)) WHERE is_deleted = 0'))
+        for name, is_deleted in (('Слова', 0), ('слова', 0), ('СЛОВА', 1), ('Words', 0)):
+            connection.execute(text('INSERT INTO vocabularies (name, is_deleted, user_id) '
+                                    'VALUES (:name, :is_deleted, :user_id)'),
+                               {'name': name, 'is_deleted': is_deleted, 'user_id': user_db_id})
+        connection.execute(text('PRAGMA user_version = 3'))
+
+    create_database_tables()
+
+    with db_engine.connect() as connection:
+        assert connection.execute(text('PRAGMA user_version')).scalar() == VOCAB_NAMES_MIGRATION_VERSION
+        normalized_names: list[str] = list(connection.execute(text(
+            'SELECT normalized_name FROM vocabularies ORDER BY id')).scalars())
+        index_names: set[str] = set(connection.execute(text(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'vocabularies'")).scalars())
+
+    # Наявні словники з однаковою назвою не перейменовуються, але не порушують унікальний індекс
+    assert normalized_names == ['слова', 'слова#2', 'слова', 'words']
+    assert 'uq_vocabularies_user_id_normalized_name' in index_names
+    assert 'uq_vocabularies_user_id_lower_name' not in index_names
@@ -0,0 +1,102 @@
+import math
+import random
+from collections import Counter
+from datetime import datetime
+
+from lingoro_bot.tools.training_cache import get_mistake_sampler, mistake_sampler_cache
+from lingoro_bot.tools.training_checkpoint import decode_training_progress, encode_training_progress
+from lingoro_bot.tools.vocab_trainer_utils import WeightedSampler, get_wordpair_idx_for_training
+
+DRAWS_COUNT = 200_000
+
+
+def assert_frequencies_match_weights(sampler: WeightedSampler,
+                                     weights: list[int],
+                                     excluded_idx: int | None = None) -> None:
+    """Перевіряє, що частота вибору кожного індексу відповідає його вазі (в межах 5 стандартних відхилень)"""
+    draws: Counter[int] = Counter(sampler.sample(excluded_idx) for _ in range(DRAWS_COUNT))
+    total_weight: int = sum(weights)
+
+    for idx, weight in enumerate(weights):
+        probability: float = weight / total_weight
+        tolerance: float = 5 * math.sqrt(probability * (1 - probability) / DRAWS_COUNT)
+        assert abs(draws[idx] / DRAWS_COUNT - probability) <= tolerance, (idx, draws[idx], weight)
+
+
+def test_weighted_sampler_draws_indexes_proportionally_to_weights() -> None:
+    random.seed(0)
+    weights: list[int] = [0, 1, 2, 5, 10, 0, 3, 20, 1, 7]
+    sampler: WeightedSampler = WeightedSampler.from_weights(weights)
+    assert sampler.total == sum(weights)
+    assert_frequencies_match_weights(sampler, weights)
+
+    # Після оновлення ваг (як після відповідей у тренуванні) частоти відповідають новим вагам
+    weights[7] = 0
+    weights[0] = 4
+    weights[4] = 1
+    for idx in (7, 0, 4):
+        sampler.update(idx, weights[idx])
+    assert [sampler.get_weight(idx) for idx in range(len(weights))] == weights
+    assert_frequencies_match_weights(sampler, weights)
+
+    # Виключений індекс не обирається, а інші — пропорційно вагам
+    excluded_weights: list[int] = weights.copy()
+    excluded_weights[3] = 0
+    assert_frequencies_match_weights(sampler, excluded_weights, excluded_idx=3)
+    assert sampler.get_weight(3) == weights[3]
+
+
+def test_weighted_sampler_returns_excluded_index_if_no_other_weights() -> None:
+    sampler: WeightedSampler = WeightedSampler.from_weights([0, 0, 3, 0])
+    assert {sampler.sample(excluded_idx=2) for _ in range(100)} == {2}
+
+
+def test_predrawn_wordpair_idx_is_used_while_it_can_be_drawn() -> None:
+    sampler: WeightedSampler = WeightedSampler.from_weights([2, 0, 5, 1])
+    available_idxs: list[int] = [0, 2, 3]
+
+    assert get_wordpair_idx_for_training(available_idxs, 0, False, sampler, predrawn_idx=3) == 3
+    # Повторний показ поточної словникової пари не використовує заздалегідь обраний індекс
+    assert get_wordpair_idx_for_training(available_idxs, 0, True, sampler, predrawn_idx=3) == 0
+
+    # Індекс з нульовою вагою (словникова пара вже пройдена) або минулий індекс обираються заново
+    for predrawn_idx in (1, 2):
+        assert {get_wordpair_idx_for_training(available_idxs, 2, False, sampler, predrawn_idx)
+                for _ in range(200)} == {0, 3}
+
+
+def test_weighted_sampler_survives_checkpoint() -> None:
+    weights: list[int] = [random.randint(0, 50) for _ in range(1000)]
+    sampler: WeightedSampler = WeightedSampler.from_weights(weights)
+
+    data_fsm: dict[str, object] = {'training_wordpair_ids': list(range(1, 1001)),
+                                   'available_idxs': list(range(1000)),
+                                   'mixed_vocab_ids': None}
+    progress: bytes = encode_training_progress(data_fsm, sampler)
+    serialized_sampler: bytes = decode_training_progress(progress)['mistake_sampler']
+    restored_sampler: WeightedSampler = WeightedSampler.deserialize(serialized_sampler)
+
+    assert [restored_sampler.get_weight(idx) for idx in range(len(weights))] == weights
+    assert decode_training_progress(encode_training_progress(data_fsm))['mistake_sampler'] is None
+
+
+def test_mistake_sampler_is_cached_per_training() -> None:
+    create_calls: list[datetime] = []
+
+    def create_sampler(start_time_training: datetime) -> WeightedSampler:
+        create_calls.append(start_time_training)
+        return WeightedSampler.from_weights([1, 2, 3])
+
+    first_start, second_start = datetime(2024, 1, 1, 10), datetime(2024, 1, 1, 11)
+    sampler: WeightedSampler = get_mistake_sampler(1, first_start, lambda: create_sampler(first_start))
+    sampler.update(0, 0)
+
+    # Оновлена вибірка повертається з кешу без повторної побудови (до завершення тренування)
+    assert get_mistake_sampler(1, first_start, lambda: create_sampler(first_start)) is sampler
+    assert sampler.get_weight(0) == 0
+    get_mistake_sampler(1, second_start, lambda: create_sampler(second_start))
+    assert create_calls == [first_start, second_start]
+
+    mistake_sampler_cache.pop((1, first_start))
+    assert get_mistake_sampler(1, first_start, lambda: create_sampler(first_start)).get_weight(0) == 1
+    assert create_calls == [first_start, second_start, first_start]
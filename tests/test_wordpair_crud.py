@@ -0,0 +1,56 @@
+import random
+
+from sqlalchemy import Engine, event, text
+from sqlalchemy.orm import Session
+
+from lingoro_bot.db.crud import VocabCRUD, WordpairCRUD
+from lingoro_bot.tools.wordpair_utils import parse_wordpair_components
+
+
+def create_vocabs(db_session: Session, user_db_id: int, wordpairs_counts: list[int]) -> list[int]:
+    """Створює словники з вказаною кількістю словникових пар та повертає їх ID"""
+    for vocab_num, wordpairs_count in enumerate(wordpairs_counts):
+        wordpairs = [parse_wordpair_components(f'word{vocab_num}x{i}:translation{i}') for i in range(wordpairs_count)]
+        VocabCRUD(db_session).create_new_vocab(user_db_id, f'vocab{vocab_num}', None, wordpairs)
+    return list(db_session.execute(text('SELECT id FROM vocabularies ORDER BY id')).scalars())
+
+
+def get_vocab_wordpair_ids(db_session: Session, vocab_ids: list[int]) -> set[int]:
+    """Повертає ID всіх словникових пар словників"""
+    wordpair_crud = WordpairCRUD(db_session)
+    return {wordpair_id for vocab_id in vocab_ids for wordpair_id in wordpair_crud.get_wordpair_ids(vocab_id)}
+
+
+def test_sample_wordpair_ids_returns_distinct_ids_of_selected_vocabs(db_engine: Engine,
+                                                                     db_session: Session,
+                                                                     user_db_id: int) -> None:
+    vocab_ids: list[int] = create_vocabs(db_session, user_db_id, [7, 1, 12, 5])
+    selected_vocab_ids: list[int] = [vocab_ids[0], vocab_ids[1], vocab_ids[3]]
+    selected_wordpair_ids: set[int] = get_vocab_wordpair_ids(db_session, selected_vocab_ids)
+
+    statements: list[str] = []
+    event.listen(db_engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+    random.seed(0)
+    sampled_ids: list[int] = WordpairCRUD(db_session).sample_wordpair_ids(selected_vocab_ids, limit=10)
+
+    assert len(sampled_ids) == len(set(sampled_ids)) == 10
+    assert set(sampled_ids) <= selected_wordpair_ids
+    # Кількість словникових пар та ID на всіх обраних позиціях — по одному запиту
+    assert len(statements) == 2
+
+
+def test_sample_wordpair_ids_covers_every_position(db_session: Session, user_db_id: int) -> None:
+    vocab_ids: list[int] = create_vocabs(db_session, user_db_id, [3, 4, 2])
+    wordpair_crud = WordpairCRUD(db_session)
+
+    # Якщо словникових пар менше за "limit", то повертаються всі
+    assert set(wordpair_crud.sample_wordpair_ids(vocab_ids, limit=100)) == get_vocab_wordpair_ids(db_session, vocab_ids)
+
+    random.seed(1)
+    sampled_ids: set[int] = set()
+    for _ in range(200):
+        sampled_ids.update(wordpair_crud.sample_wordpair_ids(vocab_ids, limit=1))
+    assert sampled_ids == get_vocab_wordpair_ids(db_session, vocab_ids)
+
+    assert wordpair_crud.sample_wordpair_ids([], limit=5) == []